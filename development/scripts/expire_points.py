@@ -0,0 +1,29 @@
+"""
+포인트 소멸 야간 배치
+
+실행 방법:
+  python scripts/expire_points.py --dry-run      # 소멸 예정 내역만 출력
+  python scripts/expire_points.py                # 실제 소멸 처리
+  python scripts/expire_points.py --store 1 --days 730
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.commerce.services.point_expiry import PointExpiryJob, EXPIRY_DAYS, CHUNK_SIZE
+
+def main():
+    parser = argparse.ArgumentParser(description="Expire points older than the validity period")
+    parser.add_argument("--dry-run", action="store_true", help="report only, no DB changes")
+    parser.add_argument("--store", type=int, default=None, help="limit to a single store")
+    parser.add_argument("--days", type=int, default=EXPIRY_DAYS, help="validity period in days")
+    parser.add_argument("--chunk", type=int, default=CHUNK_SIZE, help="members per transaction")
+    args = parser.parse_args()
+
+    report = PointExpiryJob(expiry_days=args.days, chunk_size=args.chunk).run(dry_run=args.dry_run, store_id=args.store)
+    print(json.dumps(report, ensure_ascii=False, indent=2, default=str))
+
+if __name__ == "__main__":
+    main()
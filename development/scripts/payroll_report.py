@@ -0,0 +1,50 @@
+"""
+월간 급여/근태 리포트 배치
+
+실행 방법:
+  python scripts/payroll_report.py --month 2025-03 --stores 1,2,3
+  python scripts/payroll_report.py --month 2025-03 --stores 1 --holidays 2025-03-01,2025-03-03 --out payroll.csv
+"""
+import argparse
+import json
+import sys
+from datetime import date
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy.orm import Session
+from src.database.engine import engine
+from src.commerce.domain.models import Store
+from src.commerce.services.payroll_engine import PayrollEngine, MINIMUM_WAGE, to_csv, month_range
+
+def main():
+    parser = argparse.ArgumentParser(description="Monthly payroll/attendance report")
+    parser.add_argument("--month", required=True, help="YYYY-MM")
+    parser.add_argument("--stores", default=None, help="comma separated store ids (default: all active stores)")
+    parser.add_argument("--wage", type=int, default=MINIMUM_WAGE, help="hourly wage")
+    parser.add_argument("--holidays", default="", help="comma separated YYYY-MM-DD")
+    parser.add_argument("--out", default=None, help="CSV output path (default: JSON to stdout)")
+    args = parser.parse_args()
+
+    start, end = month_range(args.month)
+    holidays = [date.fromisoformat(d) for d in args.holidays.split(",") if d]
+
+    session = Session(engine)
+    try:
+        if args.stores:
+            store_ids = [int(s) for s in args.stores.split(",")]
+        else:
+            store_ids = [sid for (sid,) in session.query(Store.id).filter(Store.is_active == True)]
+
+        report = PayrollEngine(hourly_wage=args.wage, holidays=holidays).report(session, store_ids, start, end)
+    finally:
+        session.close()
+
+    if args.out:
+        Path(args.out).write_text(to_csv(report["employees"]), encoding="utf-8")
+        print(f"[SUCCESS] {len(report['employees'])} employees → {args.out}")
+    else:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""
+연동 로그(SyncLog) 보존기간 정리 야간 배치
+
+실행 방법:
+  python scripts/sync_log_retention.py --dry-run       # 정리 대상 건수만 출력
+  python scripts/sync_log_retention.py                 # 월별 아카이브로 이동 후 삭제
+  python scripts/sync_log_retention.py --days 30 --mode DELETE
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.commerce.services.sync_log_retention import SyncLogRetention, RETENTION_DAYS, RETENTION_MODE, BATCH_SIZE
+
+def main():
+    parser = argparse.ArgumentParser(description="Archive or delete sync logs older than the retention period")
+    parser.add_argument("--dry-run", action="store_true", help="report only, no DB changes")
+    parser.add_argument("--days", type=int, default=RETENTION_DAYS, help="retention period in days")
+    parser.add_argument("--mode", choices=["ARCHIVE", "DELETE"], default=RETENTION_MODE, help="archive tables or delete only")
+    parser.add_argument("--batch", type=int, default=BATCH_SIZE, help="rows per transaction")
+    args = parser.parse_args()
+
+    job = SyncLogRetention(retention_days=args.days, batch_size=args.batch, mode=args.mode)
+    report = job.run(dry_run=args.dry_run)
+    print(json.dumps(report, ensure_ascii=False, indent=2, default=str))
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ from sqlalchemy import select
 from src.database.engine import get_db
 from src.database.models import Deployment, ServiceCatalog, User
 from src.api.schemas import DeploymentCreate, DeploymentResponse
+from src.services.deployment.notify import notify_deployment_pending
 
 router = APIRouter(prefix="/deployments", tags=["Deployments"])
 
@@ -40,6 +41,9 @@ def create_deployment(request: DeploymentCreate, db: Session = Depends(get_db)):
     db.commit()
     db.refresh(new_deployment)
     
+    # 4. 대기 중인 배포 워커 깨우기
+    notify_deployment_pending(db, deployment_id)
+    
     return new_deployment
 
 @router.get("/{deployment_id}", response_model=DeploymentResponse)
@@ -1,12 +1,14 @@
 import uuid
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from typing import Dict, Any
 
 from src.database.engine import get_db
-from src.core.database.v3_schema import ExecutionRequest, FunctionCatalog, MasterUser, AuditLog
-from src.core.kernel import SystemKernel
+from src.core.config import settings
+from src.core.database.v3_schema import ExecutionRequest, MasterUser, AuditLog
+from src.core.registry import handler_registry
+from src.services.execution.executor import ExecutorFull, ExecutorStopped, execution_executor
 from src.api.deps import get_current_user # 보안 의존성
 
 router = APIRouter(prefix="/v3", tags=["V3 Serverless API"])
@@ -21,17 +23,9 @@ class ExecutionResponse(BaseModel):
     status: str
     message: str
 
-def run_kernel_background(req_id: str, db: Session):
-    kernel = SystemKernel(db)
-    try:
-        kernel.invoke_function(req_id)
-    except Exception as e:
-        print(f"Background Task Error: {e}")
-
 @router.post("/run", response_model=ExecutionResponse)
 def execute_function(
     req: RunFunctionRequest, 
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: MasterUser = Depends(get_current_user) # <--- 보안 적용 완료
 ):
@@ -40,10 +34,13 @@ def execute_function(
     Requires: Bearer Token
     """
     # 1. 함수 존재 확인
-    fn = db.query(FunctionCatalog).filter_by(function_code=req.function_code).first()
-    if not fn:
+    if not handler_registry.get(db, req.function_code):
         raise HTTPException(status_code=404, detail="Function Code not found")
 
+    in_process = settings.EXECUTION_BACKEND != "worker"
+    if in_process and execution_executor.is_full():
+        raise HTTPException(status_code=429, detail="Execution queue is full", headers={"Retry-After": "5"})
+
     # 2. 요청 기록 (Pending) - 호출한 사용자 ID(current_user.user_id) 자동 주입
     req_id = f"req-{uuid.uuid4()}"
     new_request = ExecutionRequest(
@@ -56,8 +53,16 @@ def execute_function(
     db.add(new_request)
     db.commit()
 
-    # 3. 비동기 실행 트리거
-    background_tasks.add_task(run_kernel_background, req_id, db)
+    # 3. 비동기 실행 트리거 (worker 모드에서는 별도 실행 워커가 QUEUED 요청을 점유하여 실행)
+    if in_process:
+        try:
+            execution_executor.submit(req_id)
+        except (ExecutorFull, ExecutorStopped) as e:
+            # 사전 확인 이후 대기열이 찬 경우: 요청을 실패로 남기고 재시도 유도
+            new_request.status = "FAILED"
+            new_request.result_output = {"error": str(e)}
+            db.commit()
+            raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "5"})
 
     return ExecutionResponse(
         req_id=req_id,
@@ -1,4 +1,5 @@
-from typing import Dict
+import asyncio
+from typing import Dict, List
 from src.application.interfaces import ISenderService
 from src.domain.schemas import MessageRequest, SendResult, ChannelType
 from src.core.logger import logger
@@ -31,4 +32,26 @@ class SendingService:
         # 전송 실행
         logger.info(f"Dispatching message via {request.channel.value.upper()}...")
         result = await adapter.send(request)
-        return result
\ No newline at end of file
+        return result
+
+    async def dispatch_batch(self, requests: List[MessageRequest], concurrency: int = 10) -> List[SendResult]:
+        """
+        여러 요청을 동시에 전송합니다. (요청 순서대로 결과 반환)
+        어댑터별 동시성 상한(예: SMTP 연결 풀 크기)은 어댑터가 별도로 적용합니다.
+        """
+        slots = asyncio.Semaphore(concurrency)
+
+        async def _one(request: MessageRequest) -> SendResult:
+            async with slots:
+                try:
+                    return await self.dispatch(request)
+                except Exception as e:
+                    logger.exception(f"Dispatch failed. Request ID: {request.request_id}")
+                    return SendResult(
+                        success=False,
+                        request_id=request.request_id,
+                        error_code="UNKNOWN_ERROR",
+                        message=str(e)
+                    )
+
+        return await asyncio.gather(*(_one(request) for request in requests))
\ No newline at end of file
@@ -1,12 +1,16 @@
-import uuid
-from datetime import datetime, timedelta
+from datetime import datetime, date, time
+from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
 from src.database.engine import get_db
-from src.commerce.domain.models_phase2 import Reservation, ReservationStatus
+from src.commerce.domain.models_phase2 import Reservation, ReservationStatus, BookingResource, ResourceType
 from src.commerce.auth.security import get_current_user
+from src.commerce.services.booking_engine import (
+    BookingEngine, SlotConflictError, InvalidBookingTimeError, ResourceNotFoundError, ResourceCapacityError
+)
+from src.commerce.services.reminder_scheduler import reminder_scheduler
 
 router = APIRouter(prefix="/booking", tags=["Commerce: Booking"])
 
@@ -17,53 +21,126 @@ class BookingRequest(BaseModel):
     guest_count: int
     reserved_at: datetime
     duration_min: int = 60 # 기본 1시간
+    resource_id: Optional[int] = None # 미지정 시 빈 자원 자동 배정
+    resource_type: Optional[ResourceType] = None
+
+class ResourceCreate(BaseModel):
+    store_id: int
+    name: str
+    resource_type: ResourceType = ResourceType.TABLE
+    capacity: int = 1
 
 @router.post("/reserve")
 def create_reservation(req: BookingRequest, db: Session = Depends(get_db)):
     """
-    [예약 엔진] 시간 중복 체크 및 예약 생성
+    [예약 엔진] 자원별 시간 중복 체크 및 예약 생성
+    슬롯 점유 테이블의 유니크 제약으로 동시 요청에도 이중 예약이 발생하지 않습니다.
     """
-    end_at = req.reserved_at + timedelta(minutes=req.duration_min)
-    
-    # 1. 중복 예약 체크 (단순화된 로직: 해당 매장의 같은 시간에 예약이 있는지 확인)
-    # 실제로는 '테이블/룸' 리소스 관리가 필요하지만 Phase 2 초기엔 매장 단위로 처리
-    conflict = db.query(Reservation).filter(
-        Reservation.store_id == req.store_id,
-        Reservation.status.in_([ReservationStatus.CONFIRMED, ReservationStatus.PENDING]),
-        Reservation.reserved_at < end_at,
-        Reservation.end_at > req.reserved_at
-    ).first()
-    
-    if conflict:
+    engine = BookingEngine(db)
+    try:
+        reservation = engine.reserve(
+            store_id=req.store_id,
+            guest_name=req.guest_name,
+            guest_phone=req.guest_phone,
+            guest_count=req.guest_count,
+            reserved_at=req.reserved_at,
+            duration_min=req.duration_min,
+            resource_id=req.resource_id,
+            resource_type=req.resource_type,
+            status=ReservationStatus.CONFIRMED, # 데모용으로 즉시 확정 (PG 연동 시 PENDING)
+            deposit_amount=10000 # 노쇼 방지 보증금 예시
+        )
+    except InvalidBookingTimeError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ResourceNotFoundError:
+        raise HTTPException(status_code=404, detail="Resource not found in this store.")
+    except ResourceCapacityError:
+        raise HTTPException(status_code=409, detail="Resource capacity is smaller than guest count.")
+    except SlotConflictError:
         raise HTTPException(status_code=409, detail="Time slot already booked.")
-    
-    # 2. 예약 생성
-    res_id = str(uuid.uuid4())
-    reservation = Reservation(
-        id=res_id,
+
+    # 리마인더 예약 (예약 시작 1시간 전 발송)
+    reminder_scheduler.schedule(reservation.id, reservation.reserved_at)
+
+    # 알림 발송 (Mock)
+    # 실제로는 여기서 TG_SENDER_V1 함수를 호출하여 텔레그램 알림을 보냄
+    print(f"[ALIMTALK] Reservation Confirmed for {req.guest_name} at {req.reserved_at}")
+
+    return {
+        "reservation_id": reservation.id,
+        "resource_id": reservation.resource_id,
+        "status": "CONFIRMED",
+        "message": "Reservation successful"
+    }
+
+@router.post("/cancel/{reservation_id}")
+def cancel_reservation(reservation_id: str, db: Session = Depends(get_db), user: dict = Depends(get_current_user)):
+    """예약 취소 (점유 슬롯 반환, 해당 매장 직원/점주 전용)"""
+    reservation = db.get(Reservation, reservation_id)
+    if not reservation:
+        raise HTTPException(status_code=404, detail="Reservation not found")
+    if str(user["store_id"]) != str(reservation.store_id) and user["role"] != "admin":
+        raise HTTPException(status_code=403, detail="Unauthorized")
+    if reservation.status == ReservationStatus.CANCELED:
+        raise HTTPException(status_code=400, detail="Already canceled")
+
+    BookingEngine(db).cancel(reservation)
+    return {"reservation_id": reservation_id, "status": "CANCELED"}
+
+@router.get("/availability")
+def get_availability(
+    store_id: int,
+    date: date,
+    duration_min: int = 60,
+    resource_type: Optional[ResourceType] = None,
+    guest_count: Optional[int] = None,
+    open_time: time = time(9, 0),
+    close_time: time = time(22, 0),
+    db: Session = Depends(get_db)
+):
+    """[예약 엔진] 하루 동안 자원별 예약 가능 시간 일괄 조회"""
+    if duration_min <= 0:
+        raise HTTPException(status_code=400, detail="duration_min must be positive")
+
+    resources = BookingEngine(db).availability(
+        store_id=store_id,
+        day=date,
+        duration_min=duration_min,
+        open_at=open_time,
+        close_at=close_time,
+        resource_type=resource_type,
+        guest_count=guest_count
+    )
+    return {"store_id": store_id, "date": str(date), "duration_min": duration_min, "resources": resources}
+
+@router.post("/resources")
+def create_resource(req: ResourceCreate, db: Session = Depends(get_db), user: dict = Depends(get_current_user)):
+    """예약 자원 등록 (점주 전용)"""
+    if user["role"] not in ["owner", "admin"]:
+        raise HTTPException(status_code=403, detail="Only Owners can register resources")
+    if str(user["store_id"]) != str(req.store_id) and user["role"] != "admin":
+        raise HTTPException(status_code=403, detail="Unauthorized")
+
+    resource = BookingResource(
         store_id=req.store_id,
-        guest_name=req.guest_name,
-        guest_phone=req.guest_phone,
-        guest_count=req.guest_count,
-        reserved_at=req.reserved_at,
-        end_at=end_at,
-        status=ReservationStatus.CONFIRMED, # 데모용으로 즉시 확정 (PG 연동 시 PENDING)
-        deposit_amount=10000 # 노쇼 방지 보증금 예시
+        name=req.name,
+        resource_type=req.resource_type,
+        capacity=req.capacity,
+        is_active=True
     )
-    
-    db.add(reservation)
+    db.add(resource)
     db.commit()
-    
-    # 3. 알림 발송 (Mock)
-    # 실제로는 여기서 TG_SENDER_V1 함수를 호출하여 텔레그램 알림을 보냄
-    print(f"[ALIMTALK] Reservation Confirmed for {req.guest_name} at {req.reserved_at}")
-    
-    return {"reservation_id": res_id, "status": "CONFIRMED", "message": "Reservation successful"}
+    return resource
+
+@router.get("/resources/{store_id}")
+def list_resources(store_id: int, db: Session = Depends(get_db)):
+    """매장 예약 자원 목록"""
+    return BookingEngine(db).get_resources(store_id)
 
 @router.get("/list/{store_id}")
 def get_reservations(store_id: int, db: Session = Depends(get_db), user: dict = Depends(get_current_user)):
     """매장 예약 현황 조회 (직원/점주 전용)"""
     if str(user["store_id"]) != str(store_id) and user["role"] != "admin":
          raise HTTPException(status_code=403, detail="Unauthorized")
-         
-    return db.query(Reservation).filter_by(store_id=store_id).order_by(Reservation.reserved_at).all()
\ No newline at end of file
+
+    return db.query(Reservation).filter_by(store_id=store_id).order_by(Reservation.reserved_at).all()
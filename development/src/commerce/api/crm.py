@@ -1,12 +1,12 @@
 from datetime import datetime
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 from pydantic import BaseModel
 from typing import Optional
 
 from src.database.engine import get_db
 from src.commerce.domain.models_gap import CustomerSurvey
+from src.commerce.services.survey_stats import SurveyStatsService
 
 router = APIRouter(prefix="/crm", tags=["Commerce: CRM & Survey"])
 
@@ -19,7 +19,7 @@ class SurveySubmit(BaseModel):
 
 @router.post("/survey")
 def submit_survey(req: SurveySubmit, db: Session = Depends(get_db)):
-    """[CRM] 고객 만족도 제출"""
+    """[CRM] 고객 만족도 제출 (집계/태그 색인 동시 갱신)"""
     survey = CustomerSurvey(
         store_id=req.store_id,
         order_id=req.order_id,
@@ -29,20 +29,36 @@ def submit_survey(req: SurveySubmit, db: Session = Depends(get_db)):
         created_at=datetime.now()
     )
     db.add(survey)
+    db.flush()
+    SurveyStatsService(db).record(survey)
     db.commit()
     return {"status": "success", "message": "소중한 의견 감사합니다."}
 
 @router.get("/stats/{store_id}")
 def get_satisfaction_stats(store_id: int, db: Session = Depends(get_db)):
     """[CRM] 매장 평점 통계"""
-    avg_rating = db.query(func.avg(CustomerSurvey.rating)).filter_by(store_id=store_id).scalar() or 0.0
-    count = db.query(func.count(CustomerSurvey.id)).filter_by(store_id=store_id).scalar() or 0
+    stats = SurveyStatsService(db).summary(store_id)
     
     # 최근 리뷰 5개
     recent = db.query(CustomerSurvey).filter_by(store_id=store_id).order_by(CustomerSurvey.created_at.desc()).limit(5).all()
     
     return {
-        "average_rating": round(avg_rating, 1),
-        "total_reviews": count,
+        **stats,
         "recent_reviews": [{"rating": r.rating, "comment": r.comment} for r in recent]
-    }
\ No newline at end of file
+    }
+
+@router.get("/stats/{store_id}/trend")
+def get_satisfaction_trend(store_id: int, days: int = 30, db: Session = Depends(get_db)):
+    """[CRM] 일별 평점 추이"""
+    days = max(1, min(days, 365))
+    return {"store_id": store_id, "days": SurveyStatsService(db).trend(store_id, days)}
+
+@router.get("/stats/{store_id}/tags")
+def get_top_tags(store_id: int, limit: int = 10, db: Session = Depends(get_db)):
+    """[CRM] 많이 언급된 태그"""
+    return {"store_id": store_id, "tags": SurveyStatsService(db).top_tags(store_id, limit)}
+
+@router.get("/stats/{store_id}/tags/{tag}")
+def get_tag_rating(store_id: int, tag: str, since: Optional[datetime] = None, db: Session = Depends(get_db)):
+    """[CRM] 태그별 평점"""
+    return {"store_id": store_id, **SurveyStatsService(db).rating_by_tag(store_id, tag, since)}
@@ -1,12 +1,18 @@
+import asyncio
 import uuid
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Header
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
-from src.database.engine import get_db
-from src.commerce.domain.models_gap_v2 import DeliveryCall
+from src.database.engine import get_db, SessionLocal
+from src.commerce.domain.models_gap_v2 import DeliveryCall, DeliveryEvent
 from src.commerce.domain.models import Order
+from src.commerce.services.delivery_tracker import (
+    DeliveryTracker, InvalidStageError, STAGES, delivery_broker, event_to_dict
+)
 
 router = APIRouter(prefix="/delivery", tags=["Commerce: Delivery (TG-Linker)"])
 
@@ -24,31 +30,83 @@ def call_rider(req: DeliveryRequest, db: Session = Depends(get_db)):
 
     # 배달 건 생성
     call_id = str(uuid.uuid4())
+    now = datetime.now()
     delivery = DeliveryCall(
         id=call_id,
         order_id=req.order_id,
+        store_id=order.store_id,
         dest_address=req.dest_address,
         status="REQUESTED",
-        requested_at=datetime.now(),
+        requested_at=now,
         delivery_fee=3500 # 기본요금
     )
     db.add(delivery)
+    event = DeliveryTracker(db).record(delivery, "REQUESTED", occurred_at=now)
     db.commit()
+
+    delivery_broker.publish(delivery.store_id, event_to_dict(event))
     
     return {"status": "success", "call_id": call_id, "message": "Rider requested"}
 
 @router.patch("/status/{call_id}")
-def update_delivery_status(call_id: str, status: str, rider_name: str = None, db: Session = Depends(get_db)):
-    """[Webhook] 라이더 배차/픽업/완료 상태 업데이트"""
+def update_delivery_status(
+    call_id: str,
+    status: str,
+    rider_name: str = None,
+    occurred_at: Optional[datetime] = None,
+    db: Session = Depends(get_db)
+):
+    """[Webhook] 라이더 배차/픽업/완료 상태 업데이트 (이벤트 로그 기록 + SLA 집계)"""
     delivery = db.get(DeliveryCall, call_id)
     if not delivery:
         raise HTTPException(status_code=404, detail="Call not found")
-        
-    delivery.status = status
-    if rider_name:
-        delivery.rider_name = rider_name
-    if status == "DELIVERED":
-        delivery.delivered_at = datetime.now()
+
+    try:
+        event = DeliveryTracker(db).record(delivery, status, rider_name=rider_name, occurred_at=occurred_at)
+    except InvalidStageError:
+        raise HTTPException(status_code=400, detail=f"Invalid status. Use one of {STAGES}")
         
     db.commit()
-    return {"status": "updated", "current_state": status}
\ No newline at end of file
+
+    if delivery.store_id is not None:
+        delivery_broker.publish(delivery.store_id, event_to_dict(event))
+    return {"status": "updated", "current_state": delivery.status}
+
+@router.get("/history/{call_id}")
+def get_delivery_history(call_id: str, db: Session = Depends(get_db)):
+    """배달 단계별 이력"""
+    delivery = db.get(DeliveryCall, call_id)
+    if not delivery:
+        raise HTTPException(status_code=404, detail="Call not found")
+
+    events = db.query(DeliveryEvent).filter(DeliveryEvent.delivery_id == call_id).order_by(DeliveryEvent.occurred_at, DeliveryEvent.id).all()
+    return {"call_id": call_id, "current_state": delivery.status, "events": [event_to_dict(e) for e in events]}
+
+@router.get("/sla/{store_id}")
+def get_delivery_sla(store_id: int, db: Session = Depends(get_db)):
+    """매장 배달 SLA (배차/완료 소요시간 p50·p90, 시간대별)"""
+    return DeliveryTracker(db).sla(store_id)
+
+@router.get("/events/{store_id}/stream")
+async def stream_delivery_events(store_id: int, last_event_id: Optional[int] = Header(None)):
+    """
+    [POS] 배달 상태 실시간 피드 (Server-Sent Events)
+    재접속 시 Last-Event-ID 헤더 이후의 이벤트를 먼저 전송합니다.
+    """
+    def _load_missed():
+        db = SessionLocal()
+        try:
+            return DeliveryTracker(db).events_after(store_id, last_event_id)
+        finally:
+            db.close()
+
+    async def replay():
+        if last_event_id is None:
+            return []
+        return await asyncio.to_thread(_load_missed)
+
+    return StreamingResponse(
+        delivery_broker.stream(store_id, "delivery", replay=replay),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
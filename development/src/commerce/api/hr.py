@@ -1,11 +1,14 @@
-from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime, date
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
 from src.database.engine import get_db
+from src.commerce.domain.models import UserStoreAccess, UserRole
 from src.commerce.domain.models_gap import AttendanceLog
 from src.commerce.auth.security import get_current_user
+from src.commerce.services.payroll_engine import PayrollEngine, MINIMUM_WAGE, to_csv, month_range
 
 router = APIRouter(prefix="/hr", tags=["Commerce: HR & Attendance"])
 
@@ -14,19 +17,17 @@ def clock_in(db: Session = Depends(get_db), user: dict = Depends(get_current_use
     """[HR] 출근 체크"""
     # 이미 출근 중인지 확인
     active = db.query(AttendanceLog).filter(
-        AttendanceLog.user_id == user["id"] if "id" in user else None, # JWT 로직에 id 추가 필요하나 여기선 store_id로 대체
+        AttendanceLog.store_id == user["store_id"],
+        AttendanceLog.user_id == user["id"],
         AttendanceLog.status == "WORKING"
     ).first()
     
     if active:
         raise HTTPException(status_code=400, detail="Already clocked in.")
-        
-    # user_id는 실제 구현 시 JWT payload에서 추출해야 함. 여기서는 데모를 위해 store_id의 첫 번째 직원으로 가정하거나 user 딕셔너리 확장 필요.
-    # 편의상 auth.security.get_current_user가 id를 반환한다고 가정.
     
     log = AttendanceLog(
         store_id=user["store_id"],
-        user_id=1, # Mock User ID (실제로는 user['id'])
+        user_id=user["id"],
         clock_in=datetime.now(),
         status="WORKING"
     )
@@ -39,6 +40,7 @@ def clock_out(db: Session = Depends(get_db), user: dict = Depends(get_current_us
     """[HR] 퇴근 체크 및 근무시간 계산"""
     log = db.query(AttendanceLog).filter(
         AttendanceLog.store_id == user["store_id"],
+        AttendanceLog.user_id == user["id"],
         AttendanceLog.status == "WORKING"
     ).order_by(AttendanceLog.clock_in.desc()).first()
     
@@ -53,4 +55,57 @@ def clock_out(db: Session = Depends(get_db), user: dict = Depends(get_current_us
     log.status = "FINISHED"
     
     db.commit()
-    return {"status": "success", "work_hours": log.work_hours, "message": "퇴근 처리되었습니다."}
\ No newline at end of file
+    return {"status": "success", "work_hours": log.work_hours, "message": "퇴근 처리되었습니다."}
+
+def _payroll_store_ids(db: Session, user: dict, store_id: Optional[int]) -> list:
+    """리포트 대상 매장 (점주/매니저 권한이 있는 매장 전체 또는 지정 매장)"""
+    if user["role"] == UserRole.ADMIN:
+        if store_id is None:
+            raise HTTPException(status_code=400, detail="store_id is required for admin")
+        return [store_id]
+
+    store_ids = [
+        sid for (sid,) in db.query(UserStoreAccess.store_id).filter(
+            UserStoreAccess.user_id == user["id"],
+            UserStoreAccess.role.in_([UserRole.OWNER, UserRole.MANAGER])
+        )
+    ]
+    if store_id is not None:
+        if store_id not in store_ids:
+            raise HTTPException(status_code=403, detail="Unauthorized")
+        return [store_id]
+    if not store_ids:
+        raise HTTPException(status_code=403, detail="Only Owners can view payroll")
+    return store_ids
+
+@router.get("/payroll")
+def get_payroll_report(
+    month: str,
+    store_id: Optional[int] = None,
+    hourly_wage: int = MINIMUM_WAGE,
+    holidays: Optional[str] = None,
+    format: str = "json",
+    db: Session = Depends(get_db),
+    user: dict = Depends(get_current_user)
+):
+    """
+    [HR] 월간 급여/근태 리포트
+    store_id 미지정 시 점주가 관리하는 모든 매장을 한 번에 계산합니다.
+    holidays: 휴일 목록 (예: "2025-03-01,2025-03-03"), format=csv 이면 엑셀용 CSV 반환
+    """
+    try:
+        start, end = month_range(month)
+        holiday_dates = [date.fromisoformat(d.strip()) for d in holidays.split(",") if d.strip()] if holidays else []
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid month (YYYY-MM) or holiday date (YYYY-MM-DD)")
+
+    store_ids = _payroll_store_ids(db, user, store_id)
+    report = PayrollEngine(hourly_wage=hourly_wage, holidays=holiday_dates).report(db, store_ids, start, end)
+
+    if format == "csv":
+        return Response(
+            content=to_csv(report["employees"]),
+            media_type="text/csv",
+            headers={"Content-Disposition": f'attachment; filename="payroll_{month}.csv"'}
+        )
+    return report
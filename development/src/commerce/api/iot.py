@@ -1,13 +1,16 @@
 import uuid
-import random
 from datetime import datetime
+from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
 from src.database.engine import get_db
-from src.commerce.domain.models_phase2 import IoTDevice, DeviceType
+from src.commerce.domain.models_phase2 import IoTDevice, IoTCommand, DeviceType
 from src.commerce.auth.security import get_current_user
+from src.commerce.services.device_state import device_state
+from src.commerce.services.command_dispatcher import command_dispatcher, create_command, command_to_dict
 
 router = APIRouter(prefix="/iot", tags=["Commerce: IoT Control"])
 
@@ -20,6 +23,17 @@ class DeviceRegister(BaseModel):
 class DeviceCommand(BaseModel):
     command: str # OPEN, CLOSE, RESTART, ON, OFF
 
+class Heartbeat(BaseModel):
+    device_id: str
+    token: Optional[str] = None # 장비 접속 토큰 (등록 시 설정된 경우 필수)
+    status: Optional[str] = None # 장비가 보고하는 상태 (미지정 시 ONLINE 유지)
+    telemetry: Optional[Dict[str, Any]] = None # 센서값 (온도, 출입 횟수 등)
+    sent_at: Optional[datetime] = None
+
+class HeartbeatBatch(BaseModel):
+    store_id: int
+    heartbeats: List[Heartbeat]
+
 @router.post("/device")
 def register_device(req: DeviceRegister, db: Session = Depends(get_db), user: dict = Depends(get_current_user)):
     """IoT 장비 등록 (점주 전용)"""
@@ -38,13 +52,31 @@ def register_device(req: DeviceRegister, db: Session = Depends(get_db), user: di
     )
     db.add(device)
     db.commit()
+    device_state.register(device.id, device.store_id, device.auth_token)
     return device
 
-@router.post("/control/{device_id}")
+@router.post("/heartbeat")
+def ingest_heartbeats(req: HeartbeatBatch, db: Session = Depends(get_db)):
+    """
+    [IoT] 장비 하트비트/센서값 일괄 수신 (매장 게이트웨이 → 서버)
+    메모리 상태만 갱신하고 DB에는 주기적으로 일괄 반영됩니다.
+    """
+    result = device_state.ingest(db, req.store_id, [hb.model_dump() for hb in req.heartbeats])
+    return {"status": "OK", **result}
+
+@router.get("/state/{store_id}")
+def get_device_states(store_id: int, user: dict = Depends(get_current_user)):
+    """매장 장비 실시간 상태 (메모리 기준)"""
+    if str(user["store_id"]) != str(store_id) and user["role"] != "admin":
+        raise HTTPException(status_code=403, detail="Unauthorized")
+    return {"store_id": store_id, "devices": device_state.snapshot(store_id)}
+
+@router.post("/control/{device_id}", status_code=202)
 def control_device(device_id: str, cmd: DeviceCommand, db: Session = Depends(get_db), user: dict = Depends(get_current_user)):
     """
     [IoT 엔진] 장치 원격 제어
-    실제 하드웨어 통신 대신 Mock Response를 반환합니다.
+    명령을 장비별 큐에 접수하고 즉시 command_id를 반환합니다.
+    실행 결과는 GET /iot/commands/{command_id} 또는 /iot/commands/stream/{store_id} (SSE)로 확인합니다.
     """
     device = db.get(IoTDevice, device_id)
     if not device:
@@ -54,17 +86,34 @@ def control_device(device_id: str, cmd: DeviceCommand, db: Session = Depends(get
     if str(user["store_id"]) != str(device.store_id) and user["role"] != "admin":
          raise HTTPException(status_code=403, detail="Unauthorized access to device")
 
-    # Command Execution Simulation
-    success = random.choice([True, True, True, False]) # 25% 확률로 실패 시뮬레이션
-    
-    if success:
-        # 상태 업데이트 로직 (가정)
-        if cmd.command == "OPEN" and device.device_type == DeviceType.DOOR_LOCK:
-            device.status = "UNLOCKED"
-        elif cmd.command == "ON":
-            device.status = "ACTIVE"
-            
-        db.commit()
-        return {"status": "SUCCESS", "device": device.name, "executed_command": cmd.command}
-    else:
-        return {"status": "FAILED", "device": device.name, "error": "Device timeout or unreachable"}
\ No newline at end of file
+    command = create_command(db, device, cmd.command.upper(), requested_by=user["username"])
+    command_dispatcher.submit(device.id, command.id)
+
+    return {
+        "status": command.status,
+        "command_id": command.id,
+        "seq": command.seq,
+        "device": device.name,
+        "poll_url": f"/iot/commands/{command.id}"
+    }
+
+@router.get("/commands/{command_id}")
+def get_command_status(command_id: str, db: Session = Depends(get_db), user: dict = Depends(get_current_user)):
+    """명령 처리 상태 조회 (폴링용)"""
+    command = db.get(IoTCommand, command_id)
+    if not command:
+        raise HTTPException(status_code=404, detail="Command not found")
+    if str(user["store_id"]) != str(command.store_id) and user["role"] != "admin":
+        raise HTTPException(status_code=403, detail="Unauthorized")
+    return command_to_dict(command)
+
+@router.get("/commands/stream/{store_id}")
+async def stream_command_events(store_id: int, user: dict = Depends(get_current_user)):
+    """[POS] 명령 처리 결과 실시간 피드 (Server-Sent Events)"""
+    if str(user["store_id"]) != str(store_id) and user["role"] != "admin":
+        raise HTTPException(status_code=403, detail="Unauthorized")
+    return StreamingResponse(
+        command_dispatcher.broker.stream(store_id, "command"),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -1,11 +1,17 @@
 from datetime import datetime
+from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
 from src.database.engine import get_db
-from src.commerce.domain.models_gap_v2 import MemberPoint, PointHistory
+from src.commerce.domain.models import SyncLog
+from src.commerce.domain.models_gap_v2 import MemberPoint
 from src.commerce.services.webhook_sender import webhook_sender
+from src.commerce.services.membership_service import MembershipService, DuplicateBatchError
+from src.commerce.services.point_expiry import PointExpiryJob
+from src.commerce.auth.security import get_current_user
 
 router = APIRouter(prefix="/membership", tags=["Commerce: Loyalty & Points"])
 
@@ -14,54 +20,95 @@ class PointRequest(BaseModel):
     user_phone: str
     amount: int # 적립할 금액 (결제금액의 N%)
 
+class BulkEarnEntry(BaseModel):
+    store_id: int
+    user_phone: str
+    amount: int
+    occurred_at: Optional[datetime] = None # 단말 거래 시각
+
+class BulkEarnRequest(BaseModel):
+    terminal_id: str
+    idempotency_key: str # 단말 정산 배치 고유키 (재전송 시 중복 적립 방지)
+    entries: List[BulkEarnEntry]
+
 @router.post("/earn")
-async def earn_points(
+def earn_points(
     req: PointRequest,
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
-    """[Loyalty] 포인트 적립"""
-    member = db.query(MemberPoint).filter_by(store_id=req.store_id, user_phone=req.user_phone).first()
-    is_new_member = False
+    """[Loyalty] 포인트 적립 (원자적 UPSERT)"""
+    result = MembershipService(db).earn(req.store_id, req.user_phone, req.amount)
 
-    if not member:
-        is_new_member = True
-        member = MemberPoint(
+    # 신규 회원이면 TgMain에 MEMBER_CREATED Webhook 발송
+    if result["is_new_member"]:
+        background_tasks.add_task(
+            webhook_sender.send_member_created,
             store_id=req.store_id,
-            user_phone=req.user_phone,
-            current_points=0,
-            total_accumulated=0
+            member_id=result["member_id"],
+            phone=req.user_phone,
+            name=None
         )
-        db.add(member)
-        db.flush()  # ID 생성
 
-    # 포인트 계산 (예: 결제액의 3% 적립)
-    points_to_add = int(req.amount * 0.03)
+    return {"phone": req.user_phone, "earned": result["earned"], "total": result["total"]}
 
-    member.current_points += points_to_add
-    member.total_accumulated += points_to_add
-    member.last_visit = datetime.now()
+@router.post("/earn/bulk")
+def earn_points_bulk(
+    req: BulkEarnRequest,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db)
+):
+    """[Loyalty] 포인트 일괄 적립 (오프라인 단말 일마감 정산)"""
+    existing = db.query(SyncLog).filter(
+        SyncLog.idempotency_key == req.idempotency_key,
+        SyncLog.status == "SUCCESS"
+    ).first()
+    if existing:
+        return {"success": True, "message": "Already processed", "sync_log_id": existing.id}
 
-    history = PointHistory(
-        member_id=member.id,
-        amount=points_to_add,
-        reason="ORDER_REWARD",
-        created_at=datetime.now()
-    )
-    db.add(history)
-    db.commit()
+    try:
+        summary = MembershipService(db).earn_bulk(
+            [e.model_dump() for e in req.entries],
+            idempotency_key=req.idempotency_key,
+            source=req.terminal_id
+        )
+    except DuplicateBatchError:
+        return {"success": True, "message": "Already processed"}
+    except IntegrityError:
+        # 배치 전체 롤백됨 (적립 없음) → 단말이 재전송하도록 실패 응답
+        raise HTTPException(status_code=409, detail="Batch rejected by constraint check; nothing was applied")
 
-    # 신규 회원이면 TgMain에 MEMBER_CREATED Webhook 발송
-    if is_new_member:
+    for member in summary["new_members"]:
         background_tasks.add_task(
             webhook_sender.send_member_created,
-            store_id=req.store_id,
-            member_id=member.id,
-            phone=req.user_phone,
+            store_id=member["store_id"],
+            member_id=member["member_id"],
+            phone=member["phone"],
             name=None
         )
 
-    return {"phone": req.user_phone, "earned": points_to_add, "total": member.current_points}
+    return {
+        "success": True,
+        "members": summary["members"],
+        "entries": summary["entries"],
+        "earned": summary["earned"],
+        "new_members": len(summary["new_members"])
+    }
+
+@router.post("/expire")
+def expire_points(
+    dry_run: bool = True,
+    store_id: Optional[int] = None,
+    user: dict = Depends(get_current_user)
+):
+    """[Loyalty] 유효기간 경과 포인트 소멸 (기본값: 드라이런 리포트)"""
+    if user["role"] not in ["owner", "admin"]:
+        raise HTTPException(status_code=403, detail="Only Owners can expire points")
+    if user["role"] != "admin":
+        # 점주는 자기 매장만 처리 가능
+        store_id = int(user["store_id"])
+
+    return PointExpiryJob().run(dry_run=dry_run, store_id=store_id)
 
 @router.get("/check/{store_id}/{phone}")
 def check_points(store_id: int, phone: str, db: Session = Depends(get_db)):
@@ -7,6 +7,7 @@ from pydantic import BaseModel
 
 from src.database.engine import get_db
 from src.commerce.domain.models_gap import WaitingTicket
+from src.commerce.services.queue_estimator import queue_estimator
 
 router = APIRouter(prefix="/queue", tags=["Commerce: Waiting Service"])
 
@@ -49,14 +50,38 @@ def register_waiting(req: WaitingRegister, db: Session = Depends(get_db)):
         WaitingTicket.status == "WAITING",
         WaitingTicket.queue_number < next_num
     ).count()
+
+    # 4. 예상 대기시간 (매장별 누적 통계 기반)
+    queue_estimator.ensure_seeded(db, req.store_id)
+    estimated = queue_estimator.estimate_wait_min(req.store_id, waiting_count, req.head_count)
     
     return {
         "ticket_id": ticket.id,
         "queue_number": next_num,
         "ahead_teams": waiting_count,
+        "estimated_wait_min": estimated,
         "message": f"대기 접수 완료. 고객님 번호는 {next_num}번 입니다."
     }
 
+@router.post("/call/{ticket_id}")
+def call_waiting(ticket_id: str, db: Session = Depends(get_db)):
+    """[대기] 고객 호출 (호출 시각을 대기시간 통계에 반영)"""
+    ticket = db.get(WaitingTicket, ticket_id)
+    if not ticket:
+        raise HTTPException(status_code=404, detail="Ticket not found")
+    if ticket.status != "WAITING":
+        raise HTTPException(status_code=400, detail=f"Ticket is already {ticket.status}")
+
+    queue_estimator.ensure_seeded(db, ticket.store_id)
+
+    ticket.status = "CALLED"
+    ticket.called_at = datetime.now()
+    db.commit()
+
+    queue_estimator.observe_call(ticket.store_id, ticket.created_at, ticket.called_at, ticket.head_count)
+
+    return {"ticket_id": ticket.id, "queue_number": ticket.queue_number, "status": "CALLED"}
+
 @router.get("/status/{store_id}")
 def get_waiting_status(store_id: int, db: Session = Depends(get_db)):
     """현재 대기 현황 (전광판용)"""
@@ -64,9 +89,19 @@ def get_waiting_status(store_id: int, db: Session = Depends(get_db)):
         WaitingTicket.store_id == store_id,
         WaitingTicket.status == "WAITING"
     ).order_by(WaitingTicket.queue_number).all()
+
+    queue_estimator.ensure_seeded(db, store_id)
     
     return {
         "total_waiting": len(waiting_list),
         "current_call": waiting_list[0].queue_number if waiting_list else None,
-        "list": [{"num": t.queue_number, "phone": t.phone_number[-4:]} for t in waiting_list]
+        "estimated_wait_min": queue_estimator.estimate_wait_min(store_id, len(waiting_list)),
+        "list": [
+            {
+                "num": t.queue_number,
+                "phone": t.phone_number[-4:],
+                "estimated_wait_min": queue_estimator.estimate_wait_min(store_id, idx, t.head_count)
+            }
+            for idx, t in enumerate(waiting_list)
+        ]
     }
\ No newline at end of file
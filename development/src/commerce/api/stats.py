@@ -1,11 +1,11 @@
 from datetime import datetime, timedelta
-from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Dict, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, and_, extract
+from sqlalchemy import func, desc, and_, extract, case
 
 from src.database.engine import get_db
-from src.commerce.domain.models import Order, Payment, OrderItem, OrderStatus
+from src.commerce.domain.models import Order, Payment, OrderItem, OrderStatus, Store, UserStoreAccess, UserRole
 from src.commerce.auth.security import get_current_user
 
 router = APIRouter(prefix="/stats", tags=["Commerce: ERP & Analytics"])
@@ -290,6 +290,91 @@ def get_hourly_trend(
 # Dashboard Summary
 # =====================================================
 
+def _store_summaries(db: Session, store_ids: List[int]) -> Dict[int, dict]:
+    """
+    매장별 오늘/어제 매출, 주문 수, 대기 주문 (매장 수와 무관하게 집계 쿼리 2회)
+    날짜 비교는 func.date() 대신 구간 조건을 사용하여 paid_at/created_at 인덱스를 탈 수 있도록 합니다.
+    """
+    today = datetime.combine(datetime.now().date(), datetime.min.time())
+    yesterday = today - timedelta(days=1)
+    tomorrow = today + timedelta(days=1)
+
+    summaries = {
+        sid: {"store_id": sid, "today_revenue": 0, "yesterday_revenue": 0, "today_orders": 0, "pending_orders": 0}
+        for sid in store_ids
+    }
+
+    revenue_rows = db.query(
+        Order.store_id,
+        func.sum(case((Payment.paid_at >= today, Payment.amount), else_=0)).label("today_revenue"),
+        func.sum(case((Payment.paid_at < today, Payment.amount), else_=0)).label("yesterday_revenue")
+    ).join(Order, Order.id == Payment.order_id).filter(
+        Order.store_id.in_(store_ids),
+        Payment.paid_at >= yesterday,
+        Payment.paid_at < tomorrow,
+        Payment.status == "PAID"
+    ).group_by(Order.store_id).all()
+
+    for row in revenue_rows:
+        summaries[row.store_id]["today_revenue"] = int(row.today_revenue or 0)
+        summaries[row.store_id]["yesterday_revenue"] = int(row.yesterday_revenue or 0)
+
+    completed = [OrderStatus.PAID, OrderStatus.COMPLETED]
+    pending = [OrderStatus.PENDING, OrderStatus.PREPARING]
+    is_today_completed = and_(Order.status.in_(completed), Order.created_at >= today, Order.created_at < tomorrow)
+    order_rows = db.query(
+        Order.store_id,
+        func.sum(case((is_today_completed, 1), else_=0)).label("today_orders"),
+        func.sum(case((Order.status.in_(pending), 1), else_=0)).label("pending_orders")
+    ).filter(
+        Order.store_id.in_(store_ids),
+        is_today_completed | Order.status.in_(pending)
+    ).group_by(Order.store_id).all()
+
+    for row in order_rows:
+        summaries[row.store_id]["today_orders"] = int(row.today_orders or 0)
+        summaries[row.store_id]["pending_orders"] = int(row.pending_orders or 0)
+
+    for summary in summaries.values():
+        _add_ratios(summary)
+    return summaries
+
+
+def _add_ratios(summary: dict) -> dict:
+    """성장률 / 객단가"""
+    growth = 0
+    if summary["yesterday_revenue"] > 0:
+        growth = round((summary["today_revenue"] - summary["yesterday_revenue"]) / summary["yesterday_revenue"] * 100, 1)
+    summary["growth_rate"] = growth
+    summary["average_order"] = summary["today_revenue"] // summary["today_orders"] if summary["today_orders"] > 0 else 0
+    return summary
+
+
+def _accessible_store_ids(db: Session, user: dict, requested: Optional[List[int]]) -> List[int]:
+    """대시보드 대상 매장 (UserStoreAccess 점주/매니저 매장 + 로그인 매장, 지정 시 그 중 일부)"""
+    if user["role"] == UserRole.ADMIN:
+        if not requested:
+            raise HTTPException(status_code=400, detail="store_ids is required for admin")
+        return sorted(set(requested))
+
+    store_ids = {
+        sid for (sid,) in db.query(UserStoreAccess.store_id).filter(
+            UserStoreAccess.user_id == user["id"],
+            UserStoreAccess.role.in_([UserRole.OWNER, UserRole.MANAGER])
+        )
+    }
+    if user.get("store_id") is not None:
+        store_ids.add(int(user["store_id"]))
+
+    if requested:
+        if not set(requested) <= store_ids:
+            raise HTTPException(status_code=403, detail="Unauthorized")
+        store_ids = set(requested)
+    if not store_ids:
+        raise HTTPException(status_code=403, detail="No accessible stores")
+    return sorted(store_ids)
+
+
 @router.get("/summary")
 def get_dashboard_summary(
     store_id: int,
@@ -297,48 +382,36 @@ def get_dashboard_summary(
     user: dict = Depends(get_current_user)
 ):
     """[Dashboard] 실시간 매장 현황"""
-    today = datetime.now().date()
-    yesterday = today - timedelta(days=1)
-
-    # Today's revenue
-    today_revenue = db.query(func.sum(Payment.amount)).join(Order).filter(
-        Order.store_id == store_id,
-        func.date(Payment.paid_at) == today,
-        Payment.status == "PAID"
-    ).scalar() or 0
+    summary = _store_summaries(db, [store_id])[store_id]
+    summary.pop("store_id")
+    summary["system_status"] = "ONLINE"
+    return summary
 
-    # Yesterday's revenue (for comparison)
-    yesterday_revenue = db.query(func.sum(Payment.amount)).join(Order).filter(
-        Order.store_id == store_id,
-        func.date(Payment.paid_at) == yesterday,
-        Payment.status == "PAID"
-    ).scalar() or 0
-
-    # Today's order count
-    today_orders = db.query(func.count(Order.id)).filter(
-        Order.store_id == store_id,
-        func.date(Order.created_at) == today,
-        Order.status.in_([OrderStatus.PAID, OrderStatus.COMPLETED])
-    ).scalar() or 0
-
-    # Pending orders
-    pending_orders = db.query(func.count(Order.id)).filter(
-        Order.store_id == store_id,
-        Order.status.in_([OrderStatus.PENDING, OrderStatus.PREPARING])
-    ).scalar() or 0
-
-    # Growth rate
-    growth = 0
-    if yesterday_revenue > 0:
-        growth = round((today_revenue - yesterday_revenue) / yesterday_revenue * 100, 1)
 
+@router.get("/summary/multi")
+def get_multi_store_summary(
+    store_ids: Optional[List[int]] = Query(None),
+    db: Session = Depends(get_db),
+    user: dict = Depends(get_current_user)
+):
+    """[Dashboard] 다매장 점주용 전체 매장 현황 (매장별 + 합계)"""
+    target_ids = _accessible_store_ids(db, user, store_ids)
+    summaries = _store_summaries(db, target_ids)
+    names = dict(db.query(Store.id, Store.name).filter(Store.id.in_(target_ids)).all())
+
+    stores = []
+    for sid in target_ids:
+        summary = summaries[sid]
+        summary["store_name"] = names.get(sid)
+        stores.append(summary)
+
+    total = {
+        key: sum(s[key] for s in stores)
+        for key in ("today_revenue", "yesterday_revenue", "today_orders", "pending_orders")
+    }
     return {
-        "today_revenue": today_revenue,
-        "yesterday_revenue": yesterday_revenue,
-        "growth_rate": growth,
-        "today_orders": today_orders,
-        "pending_orders": pending_orders,
-        "average_order": today_revenue // today_orders if today_orders > 0 else 0,
+        "stores": stores,
+        "total": _add_ratios(total),
         "system_status": "ONLINE"
     }
 
@@ -1,16 +1,15 @@
 """
 TgMain 연동 API - 외부 시스템과의 데이터 동기화
 """
-import os
-import hmac
-import hashlib
 import json
 import logging
 from datetime import datetime
 from typing import Optional, List
 from pydantic import BaseModel
-from fastapi import APIRouter, Depends, HTTPException, Header, Request
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
 
 from src.database.engine import get_db
 from src.commerce.domain.models import (
@@ -18,11 +17,19 @@ from src.commerce.domain.models import (
     SyncLog, SyncDirection, Vendor, Product, Category
 )
 from src.commerce.auth.security import get_current_user
+from src.commerce.auth.signature import require_signature
+from src.commerce.services.sync_batch import BulkSyncService, MAX_BATCH_SIZE, PROCESSED
+from src.commerce.services.sync_log_retention import SyncLogRetention
+from src.commerce.services.receiving_service import ReceivingService, AlreadyReceivedError
+from src.commerce.services.webhook_sender import webhook_sender
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/sync", tags=["External Sync"])
 
+# TgMain → World 수신 API (HMAC 서명 검증 대상, 본문 해시는 BodyDigestMiddleware가 수신 중 계산)
+inbound_router = APIRouter(dependencies=[Depends(require_signature)])
+
 
 # =====================================================
 # Pydantic Models
@@ -85,39 +92,46 @@ class InventoryItemSync(BaseModel):
     idempotency_key: str
 
 
-class SyncResponse(BaseModel):
-    success: bool
-    message: str
-    data: Optional[dict] = None
+class PurchaseOrderElement(BaseModel):
+    purchase_order: PurchaseOrderData
+    idempotency_key: str
 
 
-# =====================================================
-# Signature Verification
-# =====================================================
+class VendorElement(BaseModel):
+    vendor: VendorInfo
+    idempotency_key: str
 
-def verify_signature(
-    api_key: str,
-    signature: str,
-    timestamp: str,
-    body: bytes,
-    secret_key: Optional[str] = None
-) -> bool:
-    """HMAC-SHA256 서명 검증"""
-    secret = secret_key or os.getenv("WORLD_SECRET_KEY", "")
-    expected_api_key = os.getenv("WORLD_API_KEY", "")
 
-    if api_key != expected_api_key:
-        return False
+class InventoryItemElement(BaseModel):
+    item: InventoryItemData
+    idempotency_key: str
 
-    body_hash = hashlib.sha256(body).hexdigest()
-    message = f"POST\n/api/v1/sync\n{timestamp}\n{body_hash}"
-    expected_signature = hmac.new(
-        secret.encode(),
-        message.encode(),
-        hashlib.sha256
-    ).hexdigest()
 
-    return hmac.compare_digest(signature, expected_signature)
+class PurchaseOrderBatchSync(BaseModel):
+    source_system: str
+    tenant_id: str
+    target_store_id: int
+    purchase_orders: List[PurchaseOrderElement]
+
+
+class VendorBatchSync(BaseModel):
+    source_system: str
+    tenant_id: str
+    target_store_id: int
+    vendors: List[VendorElement]
+
+
+class InventoryItemBatchSync(BaseModel):
+    source_system: str
+    tenant_id: str
+    target_store_id: int
+    items: List[InventoryItemElement]
+
+
+class SyncResponse(BaseModel):
+    success: bool
+    message: str
+    data: Optional[dict] = None
 
 
 def check_idempotency(db: Session, idempotency_key: str) -> Optional[SyncLog]:
@@ -160,13 +174,9 @@ def log_sync(
 # Inbound APIs (TgMain → World)
 # =====================================================
 
-@router.post("/purchase-order", response_model=SyncResponse)
+@inbound_router.post("/purchase-order", response_model=SyncResponse)
 async def receive_purchase_order(
-    request: Request,
     req: PurchaseOrderSync,
-    x_api_key: str = Header(None, alias="X-API-Key"),
-    x_signature: str = Header(None, alias="X-Signature"),
-    x_timestamp: str = Header(None, alias="X-Timestamp"),
     db: Session = Depends(get_db)
 ):
     """
@@ -175,10 +185,7 @@ async def receive_purchase_order(
     TgMain에서 발주 생성 시 World POS로 자동 전송되어
     매장에서 입고 예정 목록으로 확인 가능
     """
-    # 1. Signature 검증 (프로덕션 환경에서 활성화)
-    # body = await request.body()
-    # if not verify_signature(x_api_key, x_signature, x_timestamp, body):
-    #     raise HTTPException(status_code=401, detail="Invalid signature")
+    # 1. Signature 검증은 inbound_router Dependency에서 처리 (SYNC_SIGNATURE_REQUIRED=true)
 
     # 2. Idempotency 체크
     existing = check_idempotency(db, req.idempotency_key)
@@ -269,7 +276,7 @@ async def receive_purchase_order(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/vendor", response_model=SyncResponse)
+@inbound_router.post("/vendor", response_model=SyncResponse)
 async def sync_vendor(
     req: VendorSync,
     db: Session = Depends(get_db)
@@ -338,7 +345,7 @@ async def sync_vendor(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/inventory-item", response_model=SyncResponse)
+@inbound_router.post("/inventory-item", response_model=SyncResponse)
 async def sync_inventory_item(
     req: InventoryItemSync,
     db: Session = Depends(get_db)
@@ -416,6 +423,58 @@ async def sync_inventory_item(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# =====================================================
+# Batch Inbound APIs (초기 온보딩 / 대량 동기화)
+# =====================================================
+
+def _run_batch(db: Session, elements: list, handler) -> SyncResponse:
+    """일괄 동기화 공통 처리 (요소별 결과 반환)"""
+    if len(elements) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=413, detail=f"Too many elements (max {MAX_BATCH_SIZE})")
+
+    try:
+        results = handler([e.model_dump() for e in elements])
+    except IntegrityError:
+        db.rollback()
+        # 같은 키를 포함한 배치가 동시에 처리됨 → 재전송 시 이미 처리된 요소는 건너뜀
+        raise HTTPException(status_code=409, detail="Concurrent batch with overlapping keys, retry")
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Batch sync failed: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    processed = sum(1 for r in results if r["status"] == PROCESSED)
+    return SyncResponse(
+        success=True,
+        message=f"{processed}/{len(elements)} processed",
+        data={"processed": processed, "results": results}
+    )
+
+
+@inbound_router.post("/purchase-orders/batch", response_model=SyncResponse)
+def receive_purchase_orders_batch(req: PurchaseOrderBatchSync, db: Session = Depends(get_db)):
+    """TgMain 발주서 일괄 수신 → 입고 예정 등록"""
+    service = BulkSyncService(db, req.target_store_id, req.source_system)
+    return _run_batch(db, req.purchase_orders, service.sync_purchase_orders)
+
+
+@inbound_router.post("/vendors/batch", response_model=SyncResponse)
+def sync_vendors_batch(req: VendorBatchSync, db: Session = Depends(get_db)):
+    """TgMain 거래처 일괄 동기화 (UPSERT)"""
+    service = BulkSyncService(db, req.target_store_id, req.source_system)
+    return _run_batch(db, req.vendors, service.sync_vendors)
+
+
+@inbound_router.post("/inventory-items/batch", response_model=SyncResponse)
+def sync_inventory_items_batch(req: InventoryItemBatchSync, db: Session = Depends(get_db)):
+    """TgMain 품목 마스터 일괄 동기화 (UPSERT)"""
+    service = BulkSyncService(db, req.target_store_id, req.source_system)
+    return _run_batch(db, req.items, service.sync_items)
+
+
+router.include_router(inbound_router)
+
+
 # =====================================================
 # Expected Deliveries Management
 # =====================================================
@@ -424,19 +483,35 @@ async def sync_inventory_item(
 def list_expected_deliveries(
     store_id: int,
     status: Optional[str] = None,
+    limit: int = 50,
+    offset: int = 0,
     db: Session = Depends(get_db),
     user: dict = Depends(get_current_user)
 ):
-    """입고 예정 목록 조회"""
+    """입고 예정 목록 조회 (품목 수는 집계 서브쿼리로 함께 조회)"""
     if str(user["store_id"]) != str(store_id) and user["role"] != "admin":
         raise HTTPException(status_code=403, detail="Unauthorized")
 
-    query = db.query(ExpectedDelivery).filter(ExpectedDelivery.store_id == store_id)
+    item_counts = (
+        db.query(ExpectedDeliveryItem.delivery_id, func.count(ExpectedDeliveryItem.id).label("item_count"))
+        .group_by(ExpectedDeliveryItem.delivery_id)
+        .subquery()
+    )
+    query = (
+        db.query(ExpectedDelivery, func.coalesce(item_counts.c.item_count, 0))
+        .outerjoin(item_counts, item_counts.c.delivery_id == ExpectedDelivery.id)
+        .filter(ExpectedDelivery.store_id == store_id)
+    )
 
     if status:
         query = query.filter(ExpectedDelivery.status == status)
 
-    deliveries = query.order_by(ExpectedDelivery.expected_date.desc()).all()
+    rows = (
+        query.order_by(ExpectedDelivery.expected_date.desc(), ExpectedDelivery.id.desc())
+        .offset(max(offset, 0))
+        .limit(min(max(limit, 1), 200))
+        .all()
+    )
 
     return [
         {
@@ -446,10 +521,10 @@ def list_expected_deliveries(
             "expected_date": str(d.expected_date) if d.expected_date else None,
             "status": d.status,
             "total_amount": d.total_amount,
-            "item_count": len(d.items),
+            "item_count": item_count,
             "created_at": str(d.created_at)
         }
-        for d in deliveries
+        for d, item_count in rows
     ]
 
 
@@ -460,7 +535,12 @@ def get_expected_delivery(
     user: dict = Depends(get_current_user)
 ):
     """입고 예정 상세 조회"""
-    delivery = db.query(ExpectedDelivery).filter(ExpectedDelivery.id == delivery_id).first()
+    delivery = (
+        db.query(ExpectedDelivery)
+        .options(selectinload(ExpectedDelivery.items))
+        .filter(ExpectedDelivery.id == delivery_id)
+        .first()
+    )
 
     if not delivery:
         raise HTTPException(status_code=404, detail="Delivery not found")
@@ -494,14 +574,13 @@ def get_expected_delivery(
 
 
 @router.post("/deliveries/{delivery_id}/receive")
-async def confirm_delivery_received(
+def confirm_delivery_received(
     delivery_id: int,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     user: dict = Depends(get_current_user)
 ):
-    """입고 확인 처리"""
-    from src.commerce.services.webhook_sender import webhook_sender
-
+    """입고 확인 처리 (품목/재고 일괄 반영, TgMain 통지는 백그라운드)"""
     delivery = db.query(ExpectedDelivery).filter(ExpectedDelivery.id == delivery_id).first()
 
     if not delivery:
@@ -513,30 +592,21 @@ async def confirm_delivery_received(
     if delivery.status == ExpectedDeliveryStatus.RECEIVED:
         raise HTTPException(status_code=400, detail="Already received")
 
-    # 상태 업데이트
-    delivery.status = ExpectedDeliveryStatus.RECEIVED
-    delivery.received_at = datetime.now()
-
-    # 품목 수량 업데이트
-    for item in delivery.items:
-        item.received_qty = item.quantity
-
-    db.commit()
+    try:
+        items = ReceivingService(db).receive(delivery)
+    except AlreadyReceivedError:
+        raise HTTPException(status_code=400, detail="Already received")
 
-    # TgMain에 입고 완료 이벤트 발송
-    await webhook_sender.send_delivery_received(
+    # TgMain에 입고 완료 이벤트 발송 (응답 후 백그라운드)
+    background_tasks.add_task(
+        webhook_sender.send_delivery_received,
         store_id=delivery.store_id,
         po_number=delivery.po_number,
         vendor_name=delivery.vendor_name,
-        items=[
-            {"item_code": i.item_code, "item_name": i.item_name, "quantity": i.received_qty}
-            for i in delivery.items
-        ],
+        items=items,
         received_by=user.get("username")
     )
 
-    logger.info(f"Delivery received: {delivery.po_number}")
-
     return {
         "success": True,
         "message": "Delivery confirmed",
@@ -553,22 +623,29 @@ async def confirm_delivery_received(
 def list_sync_logs(
     direction: Optional[str] = None,
     event_type: Optional[str] = None,
+    before: Optional[datetime] = None,
     limit: int = 50,
     db: Session = Depends(get_db),
     user: dict = Depends(get_current_user)
 ):
-    """동기화 로그 조회 (관리자용)"""
+    """동기화 로그 조회 (관리자용, before=이전 페이지 마지막 created_at)"""
     if user["role"] not in ["admin", "owner"]:
         raise HTTPException(status_code=403, detail="Admin access required")
 
-    query = db.query(SyncLog)
+    # 목록에는 payload/response가 필요 없으므로 메타 컬럼만 조회 (압축 해제 생략)
+    query = db.query(
+        SyncLog.id, SyncLog.idempotency_key, SyncLog.direction, SyncLog.event_type, SyncLog.status,
+        SyncLog.retry_count, SyncLog.error_message, SyncLog.created_at, SyncLog.processed_at
+    )
 
     if direction:
         query = query.filter(SyncLog.direction == direction)
     if event_type:
         query = query.filter(SyncLog.event_type == event_type)
+    if before:
+        query = query.filter(SyncLog.created_at < before)
 
-    logs = query.order_by(SyncLog.created_at.desc()).limit(limit).all()
+    logs = query.order_by(SyncLog.created_at.desc()).limit(min(limit, 500)).all()
 
     return [
         {
@@ -584,3 +661,46 @@ def list_sync_logs(
         }
         for log in logs
     ]
+
+
+@router.get("/logs/{log_id}")
+def get_sync_log(
+    log_id: int,
+    db: Session = Depends(get_db),
+    user: dict = Depends(get_current_user)
+):
+    """동기화 로그 상세 (payload/response 포함)"""
+    if user["role"] not in ["admin", "owner"]:
+        raise HTTPException(status_code=403, detail="Admin access required")
+
+    log = db.query(SyncLog).filter(SyncLog.id == log_id).first()
+    if not log:
+        raise HTTPException(status_code=404, detail="Sync log not found")
+
+    return {
+        "id": log.id,
+        "idempotency_key": log.idempotency_key,
+        "direction": log.direction,
+        "event_type": log.event_type,
+        "endpoint": log.endpoint,
+        "status": log.status,
+        "payload": json.loads(log.payload) if log.payload else None,
+        "response": json.loads(log.response) if log.response else None,
+        "error_message": log.error_message,
+        "created_at": str(log.created_at),
+        "processed_at": str(log.processed_at) if log.processed_at else None
+    }
+
+
+@router.post("/logs/retention")
+def apply_sync_log_retention(
+    dry_run: bool = True,
+    retention_days: Optional[int] = None,
+    user: dict = Depends(get_current_user)
+):
+    """보존기간 경과 로그 아카이브/삭제 (관리자 전용, 기본값: 드라이런)"""
+    if user["role"] != "admin":
+        raise HTTPException(status_code=403, detail="Admin access required")
+
+    job = SyncLogRetention(retention_days=retention_days) if retention_days else SyncLogRetention()
+    return job.run(dry_run=dry_run)
@@ -42,8 +42,9 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
         username: str = payload.get("sub")
         role: str = payload.get("role")
         store_id: int = payload.get("store_id")
+        user_id: int = payload.get("user_id")
         if username is None:
             raise credentials_exception
-        return {"username": username, "role": role, "store_id": store_id}
+        return {"id": user_id, "username": username, "role": role, "store_id": store_id}
     except JWTError:
         raise credentials_exception
\ No newline at end of file
@@ -0,0 +1,185 @@
+"""
+외부 시스템(TgMain) 요청 HMAC-SHA256 서명 검증
+
+- BodyDigestMiddleware: 요청 본문을 수신하는 그대로 SHA-256에 누적 (별도 버퍼/재수신 없음)
+- require_signature: 라우터 dependencies에 지정하는 검증 Dependency
+  (FastAPI는 본문 파싱 후 Dependency를 실행하므로 이 시점에는 해시가 완성되어 있음)
+
+서명 메시지: "{METHOD}\n{PATH}\n{X-Timestamp}\n{sha256(body) hex}" (WebhookSender와 같은 규칙)
+"""
+import hashlib
+import hmac
+import logging
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Optional, Sequence
+
+from fastapi import Header, HTTPException, Request
+
+logger = logging.getLogger(__name__)
+
+# 타임스탬프 허용 오차 (초). 이 범위를 벗어난 요청은 재전송 공격으로 간주
+REPLAY_WINDOW_SEC = 300
+
+# 재사용 검사용 서명 캐시 최대 크기 (허용 오차 내 요청 수보다 커야 함)
+NONCE_CACHE_SIZE = 100_000
+
+
+class BodyDigest:
+    """요청 본문 스트리밍 해시"""
+
+    __slots__ = ("_hash", "complete")
+
+    def __init__(self):
+        self._hash = hashlib.sha256()
+        self.complete = False
+
+    def update(self, chunk: bytes):
+        self._hash.update(chunk)
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+
+class BodyDigestMiddleware:
+    """
+    지정 경로 요청의 receive 채널을 감싸 본문 청크를 해시에 누적하는 순수 ASGI 미들웨어
+    결과는 request.state.body_digest로 조회합니다.
+    """
+
+    def __init__(self, app, prefixes: Sequence[str] = ("/api/v1/sync",)):
+        self.app = app
+        self.prefixes = tuple(prefixes)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        digest = BodyDigest()
+        scope.setdefault("state", {})["body_digest"] = digest
+
+        async def hashing_receive():
+            message = await receive()
+            if message["type"] == "http.request":
+                digest.update(message.get("body", b""))
+                if not message.get("more_body", False):
+                    digest.complete = True
+            return message
+
+        await self.app(scope, hashing_receive, send)
+
+
+def compute_signature(secret: str, method: str, path: str, timestamp: str, body_hash: str) -> str:
+    message = f"{method}\n{path}\n{timestamp}\n{body_hash}"
+    return hmac.new(secret.encode(), message.encode(), hashlib.sha256).hexdigest()
+
+
+def parse_timestamp(value: str) -> Optional[float]:
+    """X-Timestamp → epoch 초 (ISO 8601 'Z' 표기 또는 epoch 초 모두 허용)"""
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+class SignatureVerifier:
+    """
+    API Key / 서명 / 타임스탬프 검증과 재사용(replay) 차단
+
+    허용 오차 내에서 이미 사용된 서명은 거부합니다. 캐시는 프로세스 메모리에 있으므로
+    여러 워커 사이의 재사용은 SyncLog idempotency 체크가 최종적으로 막습니다.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        secret_key: Optional[str] = None,
+        enabled: Optional[bool] = None,
+        window_sec: int = REPLAY_WINDOW_SEC,
+        cache_size: int = NONCE_CACHE_SIZE
+    ):
+        self.api_key = api_key if api_key is not None else os.getenv("WORLD_API_KEY", "")
+        self.secret_key = secret_key if secret_key is not None else os.getenv("WORLD_SECRET_KEY", "")
+        self.enabled = enabled if enabled is not None else os.getenv("SYNC_SIGNATURE_REQUIRED", "false").lower() == "true"
+        self.window_sec = window_sec
+        self.cache_size = cache_size
+        self._seen: "OrderedDict[str, float]" = OrderedDict()  # signature → 만료 시각
+
+    def _remember(self, signature: str, now: float) -> bool:
+        """처음 본 서명이면 기록 후 True"""
+        while self._seen:
+            expires_at = next(iter(self._seen.values()))
+            if expires_at > now and len(self._seen) < self.cache_size:
+                break
+            self._seen.popitem(last=False)
+        if signature in self._seen:
+            return False
+        self._seen[signature] = now + self.window_sec * 2
+        return True
+
+    def verify(
+        self,
+        method: str,
+        path: str,
+        api_key: Optional[str],
+        signature: Optional[str],
+        timestamp: Optional[str],
+        body_hash: str,
+        now: Optional[float] = None
+    ) -> Optional[str]:
+        """검증 실패 사유 (성공 시 None)"""
+        now = time.time() if now is None else now
+        if not api_key or not signature or not timestamp:
+            return "Missing signature headers"
+        if not hmac.compare_digest(api_key.encode(), self.api_key.encode()):
+            return "Invalid API key"
+
+        sent_at = parse_timestamp(timestamp)
+        if sent_at is None or abs(now - sent_at) > self.window_sec:
+            return "Timestamp outside allowed window"
+
+        expected = compute_signature(self.secret_key, method, path, timestamp, body_hash)
+        if not hmac.compare_digest(signature.encode(), expected.encode()):
+            return "Invalid signature"
+        if not self._remember(signature, now):
+            return "Replayed request"
+        return None
+
+
+async def require_signature(
+    request: Request,
+    x_api_key: Optional[str] = Header(None, alias="X-API-Key"),
+    x_signature: Optional[str] = Header(None, alias="X-Signature"),
+    x_timestamp: Optional[str] = Header(None, alias="X-Timestamp")
+):
+    """서명 검증 Dependency (SYNC_SIGNATURE_REQUIRED=true 일 때만 동작)"""
+    if not signature_verifier.enabled:
+        return
+
+    digest: Optional[BodyDigest] = getattr(request.state, "body_digest", None)
+    if digest is None or not digest.complete:
+        # 미들웨어 미설치 또는 본문 파라미터가 없는 엔드포인트 (본문을 직접 읽어 해시)
+        body_hash = hashlib.sha256(await request.body()).hexdigest()
+    else:
+        body_hash = digest.hexdigest()
+
+    reason = signature_verifier.verify(
+        request.method, request.url.path, x_api_key, x_signature, x_timestamp, body_hash
+    )
+    if reason:
+        logger.warning(f"[Sync] Signature rejected for {request.url.path}: {reason}")
+        raise HTTPException(status_code=401, detail=reason)
+
+
+# 싱글톤 인스턴스
+signature_verifier = SignatureVerifier()
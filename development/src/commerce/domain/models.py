@@ -1,8 +1,9 @@
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Boolean, Text, Enum, Float
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Boolean, Text, Enum, Float, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
 from src.core.database.v3_schema import Base  # 기존 Base 재사용
+from src.database.compression import CompressedText
 
 # --- Enums ---
 class UserRole(str, enum.Enum):
@@ -134,6 +135,10 @@ class Product(Base):
 # --- 3. Order & Payment (주문/결제) ---
 class Order(Base):
     __tablename__ = 'com_orders'
+    __table_args__ = (
+        Index('ix_orders_store_created', 'store_id', 'created_at'),
+        Index('ix_orders_store_status', 'store_id', 'status'),
+    )
 
     id = Column(String(50), primary_key=True)  # UUID (Order Number)
     store_id = Column(Integer, ForeignKey('com_stores.id'))
@@ -165,6 +170,10 @@ class OrderItem(Base):
 
 class Payment(Base):
     __tablename__ = 'com_payments'
+    __table_args__ = (
+        Index('ix_payments_paid_at', 'paid_at'),
+        Index('ix_payments_order', 'order_id'),
+    )
 
     id = Column(String(50), primary_key=True)  # Transaction ID
     order_id = Column(String(50), ForeignKey('com_orders.id'))
@@ -230,16 +239,20 @@ class SyncDirection(str, enum.Enum):
 
 
 class SyncLog(Base):
-    """연동 로그 (Idempotency 포함)"""
+    """연동 로그 (Idempotency 포함, 보존기간 경과분은 월별 아카이브로 이동)"""
     __tablename__ = 'sync_logs'
+    __table_args__ = (
+        Index('ix_sync_logs_created_at', 'created_at'),
+        Index('ix_sync_logs_event_created', 'event_type', 'created_at'),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     idempotency_key = Column(String(100), unique=True, index=True)
     direction = Column(String(10))  # IN, OUT
     event_type = Column(String(50))  # ORDER_PAID, STOCK_LOW, PURCHASE_ORDER 등
     endpoint = Column(String(255), nullable=True)
-    payload = Column(Text, nullable=True)  # JSON string
-    response = Column(Text, nullable=True)  # JSON string
+    payload = Column(CompressedText, nullable=True)  # JSON string (저장 시 압축)
+    response = Column(CompressedText, nullable=True)  # JSON string (저장 시 압축)
     status = Column(String(20), default="PENDING")  # PENDING, SUCCESS, FAILED, RETRYING
     retry_count = Column(Integer, default=0)
     error_message = Column(Text, nullable=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Boolean, Text, Float
+from sqlalchemy import Column, String, Integer, DateTime, Date, ForeignKey, Boolean, Text, Float, Index
 from sqlalchemy.orm import relationship
 from src.core.database.v3_schema import Base
 
@@ -21,6 +21,9 @@ class WaitingTicket(Base):
 # --- 2. 만족도 조사 (CRM/Survey) ---
 class CustomerSurvey(Base):
     __tablename__ = 'com_customer_surveys'
+    __table_args__ = (
+        Index('ix_survey_store_created', 'store_id', 'created_at'), # 최근 리뷰 조회
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     store_id = Column(Integer, ForeignKey('com_stores.id'))
@@ -32,6 +35,56 @@ class CustomerSurvey(Base):
     
     created_at = Column(DateTime(timezone=True))
 
+# 만족도 집계 (제출 시 증분 갱신 - 조회 시 전체 스캔 방지)
+class SurveyStat(Base):
+    __tablename__ = 'com_survey_stats'
+    
+    store_id = Column(Integer, ForeignKey('com_stores.id'), primary_key=True)
+    
+    review_count = Column(Integer, default=0)
+    rating_sum = Column(Float, default=0.0)
+    
+    # 평점 분포 (반올림 기준 1~5점)
+    rating_1 = Column(Integer, default=0)
+    rating_2 = Column(Integer, default=0)
+    rating_3 = Column(Integer, default=0)
+    rating_4 = Column(Integer, default=0)
+    rating_5 = Column(Integer, default=0)
+    
+    updated_at = Column(DateTime(timezone=True))
+
+class SurveyDailyStat(Base):
+    __tablename__ = 'com_survey_daily_stats'
+    
+    store_id = Column(Integer, ForeignKey('com_stores.id'), primary_key=True)
+    day = Column(Date, primary_key=True) # 제출일 (추이 그래프용)
+    
+    review_count = Column(Integer, default=0)
+    rating_sum = Column(Float, default=0.0)
+
+class SurveyTag(Base):
+    __tablename__ = 'com_survey_tags'
+    __table_args__ = (
+        Index('ix_survey_tag_store_tag', 'store_id', 'tag', 'created_at'),
+    )
+    
+    # CSV tags 컬럼을 설문 1건 x 태그 1개 단위로 정규화
+    survey_id = Column(Integer, ForeignKey('com_customer_surveys.id'), primary_key=True)
+    tag = Column(String(50), primary_key=True)
+    
+    store_id = Column(Integer, ForeignKey('com_stores.id'))
+    rating = Column(Float)
+    created_at = Column(DateTime(timezone=True))
+
+class SurveyTagStat(Base):
+    __tablename__ = 'com_survey_tag_stats'
+    
+    store_id = Column(Integer, ForeignKey('com_stores.id'), primary_key=True)
+    tag = Column(String(50), primary_key=True)
+    
+    tag_count = Column(Integer, default=0)
+    rating_sum = Column(Float, default=0.0)
+
 # --- 3. 근태 관리 (HR/Attendance) ---
 class AttendanceLog(Base):
     __tablename__ = 'com_hr_attendance'
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Boolean, Text, Float
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Boolean, Text, Float, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from src.core.database.v3_schema import Base
 
@@ -8,6 +8,7 @@ class DeliveryCall(Base):
     
     id = Column(String(50), primary_key=True) # UUID
     order_id = Column(String(50), ForeignKey('com_orders.id'))
+    store_id = Column(Integer, ForeignKey('com_stores.id'), nullable=True, index=True) # 주문 매장 (집계/피드용)
     
     dest_address = Column(String(255))
     rider_name = Column(String(50), nullable=True)
@@ -16,13 +17,48 @@ class DeliveryCall(Base):
     status = Column(String(20), default="REQUESTED") # REQUESTED, ASSIGNED, PICKED_UP, DELIVERED
     
     requested_at = Column(DateTime(timezone=True))
+    assigned_at = Column(DateTime(timezone=True), nullable=True)
+    picked_up_at = Column(DateTime(timezone=True), nullable=True)
     delivered_at = Column(DateTime(timezone=True), nullable=True)
     
     delivery_fee = Column(Integer, default=3000)
 
+class DeliveryEvent(Base):
+    __tablename__ = 'com_delivery_events'
+    __table_args__ = (
+        Index('ix_delivery_event_store_id', 'store_id', 'id'), # 매장 피드 재전송 (Last-Event-ID 이후)
+    )
+    
+    # 배달 상태 변경 이력 (추가 전용)
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    delivery_id = Column(String(50), ForeignKey('com_deliveries.id'), index=True)
+    store_id = Column(Integer, ForeignKey('com_stores.id'), nullable=True)
+    
+    status = Column(String(20)) # REQUESTED, ASSIGNED, PICKED_UP, DELIVERED
+    rider_name = Column(String(50), nullable=True)
+    
+    occurred_at = Column(DateTime(timezone=True)) # 배달 대행사 기준 발생 시각
+    created_at = Column(DateTime(timezone=True))
+
+class DeliverySlaStat(Base):
+    __tablename__ = 'com_delivery_sla_stats'
+    
+    # 소요시간 히스토그램 (매장 x 요청 시간대 x 지표 x 구간)
+    store_id = Column(Integer, ForeignKey('com_stores.id'), primary_key=True)
+    hour = Column(Integer, primary_key=True) # 배달 요청 시각 (0~23)
+    metric = Column(String(20), primary_key=True) # ASSIGN (요청→배차), DELIVER (요청→완료)
+    bucket = Column(Integer, primary_key=True) # SLA_BUCKET_EDGES_MIN 구간 번호
+    
+    count = Column(Integer, default=0)
+    total_sec = Column(Float, default=0.0)
+
 # --- 2. 멤버십 (Membership / Loyalty) ---
 class MemberPoint(Base):
     __tablename__ = 'com_member_points'
+    __table_args__ = (
+        # 매장별 전화번호 1건 보장 (INSERT ... ON CONFLICT 기준 키)
+        UniqueConstraint('store_id', 'user_phone', name='uq_member_store_phone'),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     store_id = Column(Integer, ForeignKey('com_stores.id'))
@@ -35,6 +71,10 @@ class MemberPoint(Base):
 
 class PointHistory(Base):
     __tablename__ = 'com_point_history'
+    __table_args__ = (
+        # 회원별 원장 집계 (포인트 소멸 배치)
+        Index('ix_point_history_member_created', 'member_id', 'created_at'),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     member_id = Column(Integer, ForeignKey('com_member_points.id'))
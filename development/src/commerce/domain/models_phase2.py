@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Boolean, Text, Enum
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Boolean, Text, Enum, UniqueConstraint
 from sqlalchemy.orm import relationship
 from src.core.database.v3_schema import Base
 import enum
@@ -30,6 +30,42 @@ class Reservation(Base):
     # 알림 발송 여부
     is_notified = Column(Boolean, default=False)
 
+    # 예약 자원 (테이블/룸/트레이너). NULL이면 매장 단위 예약
+    resource_id = Column(Integer, ForeignKey('com_booking_resources.id'), nullable=True)
+
+class ResourceType(str, enum.Enum):
+    TABLE = "table"
+    ROOM = "room"
+    TRAINER = "trainer"
+
+class BookingResource(Base):
+    """예약 가능한 자원 (테이블, 룸, 트레이너 등)"""
+    __tablename__ = 'com_booking_resources'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    store_id = Column(Integer, ForeignKey('com_stores.id'), index=True)
+    name = Column(String(50)) # "2번 룸", "김코치"
+    resource_type = Column(String(20), default=ResourceType.TABLE)
+    capacity = Column(Integer, default=1) # 최대 수용 인원
+    is_active = Column(Boolean, default=True)
+
+class ReservationSlot(Base):
+    """
+    예약 슬롯 점유 내역
+    (store_id, resource_id, slot_start) 유니크 제약으로 동시 요청 시에도 이중 예약을 DB 레벨에서 차단합니다.
+    resource_id = 0 은 자원이 지정되지 않은 매장 단위 예약입니다.
+    """
+    __tablename__ = 'com_reservation_slots'
+    __table_args__ = (
+        UniqueConstraint('store_id', 'resource_id', 'slot_start', name='uq_reservation_slot'),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    reservation_id = Column(String(50), ForeignKey('com_reservations.id'), index=True)
+    store_id = Column(Integer, ForeignKey('com_stores.id'))
+    resource_id = Column(Integer, default=0)
+    slot_start = Column(DateTime)
+
 class DeviceType(str, enum.Enum):
     DOOR_LOCK = "door_lock"
     PRINTER = "printer"
@@ -48,4 +84,33 @@ class IoTDevice(Base):
     auth_token = Column(String(100), nullable=True) # 장치 접속 토큰
     status = Column(String(20), default="OFFLINE")
     
-    last_heartbeat = Column(DateTime(timezone=True), nullable=True)
\ No newline at end of file
+    last_heartbeat = Column(DateTime(timezone=True), nullable=True)
+    telemetry = Column(Text, nullable=True) # 마지막 보고 센서값 (JSON)
+class CommandStatus(str, enum.Enum):
+    QUEUED = "QUEUED"     # 접수 (장비별 큐 대기)
+    SENT = "SENT"         # 장비로 전송, 응답 대기
+    ACKED = "ACKED"       # 장비 실행 완료
+    FAILED = "FAILED"     # 장비 오류 응답 / 연결 실패
+    TIMEOUT = "TIMEOUT"   # 응답 제한시간 초과
+    EXPIRED = "EXPIRED"   # 큐 대기 중 유효시간 경과 (미전송)
+
+class IoTCommand(Base):
+    __tablename__ = 'com_iot_commands'
+    __table_args__ = (
+        UniqueConstraint('device_id', 'seq', name='uq_iot_command_seq'),
+    )
+
+    id = Column(String(50), primary_key=True) # UUID
+    device_id = Column(String(50), ForeignKey('com_iot_devices.id'), index=True)
+    store_id = Column(Integer, ForeignKey('com_stores.id'))
+    seq = Column(Integer) # 장비별 명령 순번 (장비는 이전 순번 이하 명령을 무시)
+
+    command = Column(String(20)) # OPEN, CLOSE, RESTART, ON, OFF
+    status = Column(String(20), default=CommandStatus.QUEUED)
+    result = Column(Text, nullable=True) # 장비 응답 (JSON)
+    error = Column(String(255), nullable=True)
+
+    requested_by = Column(String(50), nullable=True)
+    created_at = Column(DateTime(timezone=True))
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
@@ -0,0 +1,330 @@
+"""
+BookingEngine - 자원(테이블/룸/트레이너)별 예약 가용성 엔진
+"""
+import bisect
+import logging
+import uuid
+from datetime import datetime, date, time, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from src.commerce.domain.models_phase2 import (
+    Reservation, ReservationStatus, BookingResource, ReservationSlot
+)
+
+logger = logging.getLogger(__name__)
+
+# 슬롯 점유 단위 (분). 예약 시작 시각과 길이는 이 단위의 배수여야 합니다.
+SLOT_GRANULARITY_MIN = 15
+
+# 매장 단위 예약(자원 미지정)의 슬롯 키
+STORE_LEVEL_RESOURCE = 0
+
+ACTIVE_STATUSES = [ReservationStatus.CONFIRMED, ReservationStatus.PENDING]
+
+
+class SlotConflictError(Exception):
+    """요청한 시간대가 이미 점유됨"""
+    pass
+
+
+class InvalidBookingTimeError(ValueError):
+    """예약 시작 시각/길이가 슬롯 단위에 맞지 않음"""
+    pass
+
+
+class ResourceNotFoundError(Exception):
+    """지정한 자원이 해당 매장에 없거나 비활성 상태"""
+    pass
+
+
+class ResourceCapacityError(Exception):
+    """지정한 자원의 수용 인원 초과"""
+    pass
+
+
+def validate_slot_alignment(start: datetime, duration_min: int, granularity_min: int = SLOT_GRANULARITY_MIN):
+    """
+    슬롯 격자 정렬 검사
+    격자에 맞지 않는 구간은 슬롯 점유 시 바깥쪽으로 넓어져 맞닿은 예약끼리 같은 슬롯을 두고 충돌하므로 거부합니다.
+    """
+    if duration_min <= 0 or duration_min % granularity_min:
+        raise InvalidBookingTimeError(f"duration_min must be a positive multiple of {granularity_min}")
+    if start.minute % granularity_min or start.second or start.microsecond:
+        raise InvalidBookingTimeError(f"reserved_at must be aligned to {granularity_min}-minute slots")
+
+
+def to_local_naive(dt: datetime) -> datetime:
+    """타임존이 포함된 시각은 로컬 시각으로 변환 후 tzinfo 제거"""
+    if dt.tzinfo is not None:
+        return dt.astimezone().replace(tzinfo=None)
+    return dt
+
+
+def slot_starts(start: datetime, end: datetime, granularity_min: int = SLOT_GRANULARITY_MIN) -> List[datetime]:
+    """[start, end) 구간이 걸치는 모든 슬롯의 시작 시각"""
+    step = timedelta(minutes=granularity_min)
+    day_start = datetime.combine(start.date(), time.min)
+    offset = (start - day_start) // step
+    cursor = day_start + offset * step
+    slots = []
+    while cursor < end:
+        slots.append(cursor)
+        cursor += step
+    return slots
+
+
+class IntervalIndex:
+    """
+    한 자원의 점유 구간 인덱스.
+    겹치는 구간은 병합되어 시작 시각 순으로 정렬 보관되며, 겹침 검사는 bisect로 O(log n)에 처리합니다.
+    """
+
+    def __init__(self, intervals: Iterable[Tuple[datetime, datetime]] = ()):
+        self._starts: List[datetime] = []
+        self._ends: List[datetime] = []
+        for start, end in sorted(intervals):
+            if start >= end:
+                continue
+            if self._ends and start <= self._ends[-1]:
+                self._ends[-1] = max(self._ends[-1], end)
+            else:
+                self._starts.append(start)
+                self._ends.append(end)
+
+    def __len__(self):
+        return len(self._starts)
+
+    def overlaps(self, start: datetime, end: datetime) -> bool:
+        """[start, end)와 겹치는 점유 구간이 있는지 확인"""
+        i = bisect.bisect_left(self._starts, end)
+        return i > 0 and self._ends[i - 1] > start
+
+    def add(self, start: datetime, end: datetime):
+        """구간 추가 (병합 유지)"""
+        i = bisect.bisect_left(self._starts, start)
+        lo, hi = i, i
+        if lo > 0 and self._ends[lo - 1] >= start:
+            lo -= 1
+        while hi < len(self._starts) and self._starts[hi] <= end:
+            hi += 1
+        if lo < hi:
+            start = min(start, self._starts[lo])
+            end = max(end, self._ends[hi - 1])
+        self._starts[lo:hi] = [start]
+        self._ends[lo:hi] = [end]
+
+    def free_windows(self, window_start: datetime, window_end: datetime) -> List[Tuple[datetime, datetime]]:
+        """영업 시간 내 비어있는 구간 목록"""
+        free = []
+        cursor = window_start
+        i = max(bisect.bisect_right(self._starts, window_start) - 1, 0)
+        while i < len(self._starts) and self._starts[i] < window_end:
+            if self._ends[i] > cursor:
+                if self._starts[i] > cursor:
+                    free.append((cursor, self._starts[i]))
+                cursor = max(cursor, self._ends[i])
+            i += 1
+        if cursor < window_end:
+            free.append((cursor, window_end))
+        return free
+
+    def available_starts(self, window_start: datetime, window_end: datetime, duration: timedelta,
+                         step: timedelta) -> List[datetime]:
+        """duration 길이의 예약을 시작할 수 있는 시각 목록 (step 격자 기준)"""
+        starts = []
+        day_start = datetime.combine(window_start.date(), time.min)
+        for free_start, free_end in self.free_windows(window_start, window_end):
+            # 격자에 맞춰 올림 정렬
+            offset = -((day_start - free_start) // step)
+            cursor = day_start + offset * step
+            while cursor + duration <= free_end:
+                starts.append(cursor)
+                cursor += step
+        return starts
+
+
+class BookingEngine:
+    """자원별 예약 가용성 계산 및 원자적 예약 생성"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    # -------------------------------------------------
+    # 조회
+    # -------------------------------------------------
+
+    def get_resources(self, store_id: int, resource_type: Optional[str] = None,
+                      guest_count: Optional[int] = None) -> List[BookingResource]:
+        query = self.db.query(BookingResource).filter(
+            BookingResource.store_id == store_id,
+            BookingResource.is_active == True
+        )
+        if resource_type:
+            query = query.filter(BookingResource.resource_type == resource_type)
+        if guest_count:
+            query = query.filter(BookingResource.capacity >= guest_count)
+        return query.order_by(BookingResource.id).all()
+
+    def load_indexes(self, store_id: int, range_start: datetime, range_end: datetime) -> Dict[int, IntervalIndex]:
+        """
+        기간 내 매장의 모든 활성 예약을 한 번의 쿼리로 읽어 자원별 인덱스를 구성
+        (키: resource_id, 매장 단위 예약은 STORE_LEVEL_RESOURCE)
+        """
+        rows = self.db.query(
+            Reservation.resource_id, Reservation.reserved_at, Reservation.end_at
+        ).filter(
+            Reservation.store_id == store_id,
+            Reservation.status.in_(ACTIVE_STATUSES),
+            Reservation.reserved_at < range_end,
+            Reservation.end_at > range_start
+        ).all()
+
+        grouped: Dict[int, List[Tuple[datetime, datetime]]] = {}
+        for resource_id, start, end in rows:
+            key = resource_id or STORE_LEVEL_RESOURCE
+            grouped.setdefault(key, []).append((to_local_naive(start), to_local_naive(end)))
+
+        return {key: IntervalIndex(intervals) for key, intervals in grouped.items()}
+
+    def availability(
+        self,
+        store_id: int,
+        day: date,
+        duration_min: int,
+        open_at: time,
+        close_at: time,
+        resource_type: Optional[str] = None,
+        guest_count: Optional[int] = None
+    ) -> List[dict]:
+        """하루 동안 자원별 예약 가능 시작 시각 및 빈 구간"""
+        window_start = datetime.combine(day, open_at)
+        window_end = datetime.combine(day, close_at)
+        if window_end <= window_start:
+            window_end += timedelta(days=1)  # 자정 넘어 영업
+
+        indexes = self.load_indexes(store_id, window_start, window_end)
+        duration = timedelta(minutes=duration_min)
+        step = timedelta(minutes=SLOT_GRANULARITY_MIN)
+
+        resources = self.get_resources(store_id, resource_type, guest_count)
+        targets = [(r.id, r.name, r.resource_type) for r in resources]
+        if not targets and not resource_type:
+            targets = [(STORE_LEVEL_RESOURCE, None, None)]
+
+        result = []
+        for resource_id, name, rtype in targets:
+            index = indexes.get(resource_id) or IntervalIndex()
+            result.append({
+                "resource_id": resource_id or None,
+                "resource_name": name,
+                "resource_type": rtype,
+                "free_windows": [
+                    {"start": s.isoformat(), "end": e.isoformat()}
+                    for s, e in index.free_windows(window_start, window_end)
+                ],
+                "available_starts": [
+                    s.strftime("%H:%M") for s in index.available_starts(window_start, window_end, duration, step)
+                ]
+            })
+        return result
+
+    # -------------------------------------------------
+    # 예약 생성
+    # -------------------------------------------------
+
+    def _claim(self, reservation: Reservation, resource_key: int):
+        """예약 + 슬롯 점유를 하나의 트랜잭션으로 저장. 충돌 시 SlotConflictError"""
+        slots = slot_starts(reservation.reserved_at, reservation.end_at)
+        try:
+            self.db.add(reservation)
+            self.db.flush()
+            self.db.execute(insert(ReservationSlot), [
+                {
+                    "reservation_id": reservation.id,
+                    "store_id": reservation.store_id,
+                    "resource_id": resource_key,
+                    "slot_start": slot
+                }
+                for slot in slots
+            ])
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            raise SlotConflictError()
+
+    def reserve(
+        self,
+        store_id: int,
+        guest_name: str,
+        guest_phone: str,
+        guest_count: int,
+        reserved_at: datetime,
+        duration_min: int,
+        resource_id: Optional[int] = None,
+        resource_type: Optional[str] = None,
+        status: str = ReservationStatus.CONFIRMED,
+        deposit_amount: int = 0
+    ) -> Reservation:
+        """
+        예약 생성
+        - resource_id 지정: 해당 자원만 시도
+        - 미지정 + 매장에 자원 등록: 인원/유형이 맞는 빈 자원 자동 배정
+        - 매장에 자원 없음: 매장 단위 예약 (기존 동작)
+        """
+        start = to_local_naive(reserved_at)
+        validate_slot_alignment(start, duration_min)
+        end = start + timedelta(minutes=duration_min)
+
+        if resource_id:
+            resource = self.db.get(BookingResource, resource_id)
+            if resource is None or resource.store_id != store_id or not resource.is_active:
+                raise ResourceNotFoundError()
+            if guest_count and (resource.capacity or 0) < guest_count:
+                raise ResourceCapacityError()
+            candidates = [resource_id]
+        else:
+            resources = self.get_resources(store_id, resource_type, guest_count)
+            if resources:
+                candidates = [r.id for r in resources]
+            elif resource_type:
+                raise SlotConflictError()
+            else:
+                candidates = [STORE_LEVEL_RESOURCE]
+
+        # 인덱스로 빈 자원을 먼저 거른 뒤, 슬롯 유니크 제약으로 최종 확정
+        indexes = self.load_indexes(store_id, start, end)
+        free = [c for c in candidates if not (indexes.get(c) and indexes[c].overlaps(start, end))]
+
+        for candidate in free:
+            reservation = Reservation(
+                id=str(uuid.uuid4()),
+                store_id=store_id,
+                resource_id=candidate or None,
+                guest_name=guest_name,
+                guest_phone=guest_phone,
+                guest_count=guest_count,
+                reserved_at=start,
+                end_at=end,
+                status=status,
+                deposit_amount=deposit_amount
+            )
+            try:
+                self._claim(reservation, candidate)
+                return reservation
+            except SlotConflictError:
+                logger.info(f"Slot race lost: store {store_id}, resource {candidate}, {start}")
+                continue
+
+        raise SlotConflictError()
+
+    def cancel(self, reservation: Reservation):
+        """예약 취소 및 슬롯 반환"""
+        reservation.status = ReservationStatus.CANCELED
+        self.db.query(ReservationSlot).filter(
+            ReservationSlot.reservation_id == reservation.id
+        ).delete(synchronize_session=False)
+        self.db.commit()
@@ -0,0 +1,254 @@
+"""
+CommandDispatcher - IoT 장비 명령 비동기 전송 및 응답(ack) 추적
+"""
+import asyncio
+import json
+import logging
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from sqlalchemy import func, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from src.database.engine import SessionLocal
+from src.commerce.domain.models_phase2 import IoTDevice, IoTCommand, CommandStatus
+from src.commerce.services.device_state import DeviceStateStore, device_state
+from src.commerce.services.event_broker import EventBroker
+from src.commerce.services.iot_transport import IDeviceTransport, DeviceTransportError, DEVICE_TIMEOUT_SEC
+
+logger = logging.getLogger(__name__)
+
+# 큐 대기 후 이 시간이 지난 명령은 전송하지 않음 (예: 늦게 열리는 도어락 방지)
+COMMAND_TTL_SEC = 30
+
+# 동시에 통신 중인 장비 수 상한
+MAX_CONCURRENT_DEVICES = 50
+
+# 장비별 워커가 할 일이 없을 때 종료하기까지의 시간
+WORKER_IDLE_SEC = 60
+
+# 순번 충돌(동시 접수) 재시도 횟수
+SEQ_RETRY = 3
+
+
+def command_to_dict(cmd: IoTCommand) -> dict:
+    return {
+        "command_id": cmd.id,
+        "device_id": cmd.device_id,
+        "store_id": cmd.store_id,
+        "seq": cmd.seq,
+        "command": cmd.command,
+        "status": cmd.status.value if isinstance(cmd.status, CommandStatus) else cmd.status,
+        "result": json.loads(cmd.result) if cmd.result else None,
+        "error": cmd.error,
+        "created_at": cmd.created_at.isoformat() if cmd.created_at else None,
+        "completed_at": cmd.completed_at.isoformat() if cmd.completed_at else None
+    }
+
+
+def create_command(db: Session, device: IoTDevice, command: str, requested_by: Optional[str] = None) -> IoTCommand:
+    """명령 접수 (장비별 순번 부여, 커밋 포함)"""
+    for attempt in range(SEQ_RETRY):
+        seq = (db.query(func.max(IoTCommand.seq)).filter(IoTCommand.device_id == device.id).scalar() or 0) + 1
+        cmd = IoTCommand(
+            id=str(uuid.uuid4()),
+            device_id=device.id,
+            store_id=device.store_id,
+            seq=seq,
+            command=command,
+            status=CommandStatus.QUEUED,
+            requested_by=requested_by,
+            created_at=datetime.now()
+        )
+        db.add(cmd)
+        try:
+            db.commit()
+            return cmd
+        except IntegrityError:
+            db.rollback()  # 같은 장비에 동시 접수 → 다음 순번으로 재시도
+    raise RuntimeError(f"Could not allocate command sequence for {device.id}")
+
+
+class CommandDispatcher:
+    """
+    장비별 큐로 명령 순서를 보장하면서 여러 장비에는 동시에 전송합니다.
+
+    - submit(): 요청 스레드에서 호출, 명령 ID만 큐에 넣고 즉시 반환
+    - 장비별 워커가 순번대로 전송하며, 전체 동시 통신 수는 세마포어로 제한
+    - 응답/실패/시간초과 결과를 IoTCommand와 장비 상태에 기록하고 command_broker로 전파
+    - 재기동 시 QUEUED 명령은 다시 큐에 넣고, 응답을 받지 못한 SENT 명령은 TIMEOUT 처리
+    """
+
+    def __init__(
+        self,
+        transport: Optional[IDeviceTransport] = None,
+        session_factory=SessionLocal,
+        ack_timeout: float = DEVICE_TIMEOUT_SEC,
+        ttl_sec: float = COMMAND_TTL_SEC,
+        max_concurrency: int = MAX_CONCURRENT_DEVICES,
+        broker: Optional[EventBroker] = None,
+        state_store: DeviceStateStore = device_state
+    ):
+        self.transport = transport
+        self.session_factory = session_factory
+        self.ack_timeout = ack_timeout
+        self.ttl_sec = ttl_sec
+        self.max_concurrency = max_concurrency
+        self.broker = broker or EventBroker()
+        self.state_store = state_store
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._workers: Dict[str, asyncio.Task] = {}
+
+    # -------------------------------------------------
+    # 접수
+    # -------------------------------------------------
+
+    def submit(self, device_id: str, command_id: str):
+        """명령 전송 예약 (스레드 안전). 디스패처 미기동 시 기동 시점에 복구됨"""
+        if self._loop is None:
+            logger.warning(f"[IoT] Dispatcher not running, command {command_id} stays QUEUED")
+            return
+        self._loop.call_soon_threadsafe(self._enqueue, device_id, command_id)
+
+    def _enqueue(self, device_id: str, command_id: str):
+        queue = self._queues.get(device_id)
+        if queue is None:
+            queue = self._queues[device_id] = asyncio.Queue()
+        queue.put_nowait(command_id)
+        worker = self._workers.get(device_id)
+        if worker is None or worker.done():
+            self._workers[device_id] = asyncio.create_task(self._device_worker(device_id, queue))
+
+    async def _device_worker(self, device_id: str, queue: asyncio.Queue):
+        while True:
+            try:
+                command_id = await asyncio.wait_for(queue.get(), timeout=WORKER_IDLE_SEC)
+            except asyncio.TimeoutError:
+                if queue.empty():
+                    self._workers.pop(device_id, None)
+                    self._queues.pop(device_id, None)
+                    return
+                continue
+            try:
+                async with self._semaphore:
+                    await self._deliver(command_id)
+            except Exception as e:
+                logger.error(f"[IoT] Command {command_id} dispatch error: {e}")
+
+    # -------------------------------------------------
+    # 전송
+    # -------------------------------------------------
+
+    def _load_sync(self, command_id: str):
+        db: Session = self.session_factory()
+        try:
+            cmd = db.get(IoTCommand, command_id)
+            if cmd is None:
+                return None, None
+            device = db.get(IoTDevice, cmd.device_id)
+            payload = {"command_id": cmd.id, "seq": cmd.seq, "command": cmd.command}
+            device_info = {"id": device.id, "ip_address": device.ip_address, "auth_token": device.auth_token}
+            return (cmd.status, cmd.created_at, payload), device_info
+        finally:
+            db.close()
+
+    def _update_sync(self, command_id: str, values: dict, device_status: Optional[str] = None) -> dict:
+        db: Session = self.session_factory()
+        try:
+            cmd = db.get(IoTCommand, command_id)
+            for key, value in values.items():
+                setattr(cmd, key, value)
+            if device_status:
+                # 하트비트 메모리 상태와 함께 갱신 (DB만 바꾸면 이후 하트비트가 ONLINE으로 복구하지 못함)
+                self.state_store.set_status(db, cmd.device_id, device_status)
+            db.commit()
+            return command_to_dict(cmd)
+        finally:
+            db.close()
+
+    async def _finish(self, command_id: str, values: dict, device_status: Optional[str] = None):
+        event = await asyncio.to_thread(self._update_sync, command_id, values, device_status)
+        self.broker.publish(event["store_id"], event)
+        return event
+
+    async def _deliver(self, command_id: str) -> Optional[dict]:
+        loaded, device = await asyncio.to_thread(self._load_sync, command_id)
+        if loaded is None:
+            return None
+        status, created_at, payload = loaded
+        if status != CommandStatus.QUEUED:
+            return None  # 이미 처리됨 (중복 접수/복구)
+
+        now = datetime.now()
+        if created_at and now - created_at.replace(tzinfo=None) > timedelta(seconds=self.ttl_sec):
+            return await self._finish(command_id, {"status": CommandStatus.EXPIRED, "completed_at": now,
+                                                   "error": "Expired before dispatch"})
+
+        await self._finish(command_id, {"status": CommandStatus.SENT, "sent_at": now})
+        try:
+            ack = await asyncio.wait_for(self.transport.send(device, payload), timeout=self.ack_timeout)
+        except asyncio.TimeoutError:
+            return await self._finish(command_id, {"status": CommandStatus.TIMEOUT, "completed_at": datetime.now(),
+                                                   "error": f"No ack within {self.ack_timeout}s"}, device_status="OFFLINE")
+        except DeviceTransportError as e:
+            return await self._finish(command_id, {"status": CommandStatus.FAILED, "completed_at": datetime.now(),
+                                                   "error": str(e)[:255]})
+
+        if not isinstance(ack, dict):
+            # 규격 외 응답은 실행 여부를 확인할 수 없으므로 실패 처리 (SENT로 방치하지 않음)
+            return await self._finish(command_id, {"status": CommandStatus.FAILED, "completed_at": datetime.now(),
+                                                   "error": f"Invalid ack payload: {type(ack).__name__}"})
+
+        return await self._finish(
+            command_id,
+            {"status": CommandStatus.ACKED, "completed_at": datetime.now(), "result": json.dumps(ack, ensure_ascii=False)},
+            device_status=ack.get("state")
+        )
+
+    # -------------------------------------------------
+    # 기동 / 복구
+    # -------------------------------------------------
+
+    def _recover_sync(self) -> list:
+        db: Session = self.session_factory()
+        try:
+            # 전송 후 응답을 받지 못한 명령은 실행 여부를 알 수 없으므로 재전송하지 않음
+            db.execute(update(IoTCommand).where(IoTCommand.status == CommandStatus.SENT).values(
+                status=CommandStatus.TIMEOUT, completed_at=datetime.now(), error="Dispatcher restarted"
+            ))
+            db.commit()
+            return db.query(IoTCommand.device_id, IoTCommand.id).filter(
+                IoTCommand.status == CommandStatus.QUEUED
+            ).order_by(IoTCommand.device_id, IoTCommand.seq).all()
+        finally:
+            db.close()
+
+    async def start(self, transport: Optional[IDeviceTransport] = None):
+        if transport:
+            self.transport = transport
+        self._loop = asyncio.get_running_loop()
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        pending = await asyncio.to_thread(self._recover_sync)
+        for device_id, command_id in pending:
+            self._enqueue(device_id, command_id)
+        logger.info(f"[IoT] Command dispatcher started ({len(pending)} queued commands recovered).")
+
+    async def stop(self):
+        self._loop = None
+        workers = list(self._workers.values())
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._workers.clear()
+        self._queues.clear()
+        if self.transport:
+            await self.transport.close()
+
+
+# 싱글톤 인스턴스
+command_dispatcher = CommandDispatcher()
@@ -0,0 +1,189 @@
+"""
+DeliveryTracker - 배달 상태 이벤트 기록 및 SLA 집계
+"""
+import bisect
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from src.commerce.domain.models_gap_v2 import DeliveryCall, DeliveryEvent, DeliverySlaStat
+from src.commerce.services.event_broker import EventBroker
+from src.database.upsert import dialect_insert
+
+logger = logging.getLogger(__name__)
+
+# 배달 단계 (순서대로 진행)
+STAGES = ["REQUESTED", "ASSIGNED", "PICKED_UP", "DELIVERED"]
+
+# 단계별 DeliveryCall 시각 컬럼
+STAGE_COLUMNS = {
+    "REQUESTED": "requested_at",
+    "ASSIGNED": "assigned_at",
+    "PICKED_UP": "picked_up_at",
+    "DELIVERED": "delivered_at",
+}
+
+# SLA 지표: 단계 도달 시 요청 시각 기준 소요시간을 집계
+SLA_METRICS = {"ASSIGNED": "ASSIGN", "DELIVERED": "DELIVER"}
+
+# 소요시간 히스토그램 구간 경계 (분). 마지막 구간은 상한 없음
+SLA_BUCKET_EDGES_MIN = [1, 2, 3, 5, 7, 10, 15, 20, 25, 30, 35, 40, 50, 60, 75, 90, 120]
+
+
+class InvalidStageError(Exception):
+    """알 수 없는 배달 상태"""
+    pass
+
+
+def _local_naive(dt: datetime) -> datetime:
+    return dt.astimezone().replace(tzinfo=None) if dt.tzinfo else dt
+
+
+def bucket_of(minutes: float) -> int:
+    """소요시간(분) → 히스토그램 구간 번호"""
+    return bisect.bisect_right(SLA_BUCKET_EDGES_MIN, minutes)
+
+
+def percentile_from_histogram(counts: Dict[int, int], q: float) -> Optional[float]:
+    """구간별 건수에서 분위수(분) 추정 (구간 내 선형 보간)"""
+    total = sum(counts.values())
+    if not total:
+        return None
+    rank = q * total
+    cumulative = 0
+    for bucket in sorted(counts):
+        count = counts[bucket]
+        if count and cumulative + count >= rank:
+            lower = SLA_BUCKET_EDGES_MIN[bucket - 1] if bucket > 0 else 0
+            if bucket >= len(SLA_BUCKET_EDGES_MIN):
+                return float(lower)  # 상한 없는 구간
+            upper = SLA_BUCKET_EDGES_MIN[bucket]
+            return round(lower + (upper - lower) * (rank - cumulative) / count, 1)
+        cumulative += count
+    return float(SLA_BUCKET_EDGES_MIN[-1])
+
+
+def event_to_dict(event: DeliveryEvent) -> dict:
+    return {
+        "id": event.id,
+        "delivery_id": event.delivery_id,
+        "store_id": event.store_id,
+        "status": event.status,
+        "rider_name": event.rider_name,
+        "occurred_at": event.occurred_at.isoformat() if event.occurred_at else None
+    }
+
+
+class DeliveryTracker:
+    """
+    배달 상태 변경을 이벤트 로그로 남기고 SLA 히스토그램을 증분 갱신합니다.
+
+    - 모든 상태 변경은 DeliveryEvent에 추가만 합니다 (덮어쓰지 않음).
+    - 단계 시각(assigned_at 등)은 처음 도달했을 때만 기록하므로 중복 웹훅이 와도 집계가 한 번만 반영됩니다.
+    - 늦게 도착한 이전 단계 이벤트는 기록하되 현재 상태를 되돌리지 않습니다.
+    record()는 커밋하지 않으므로 호출 측에서 커밋 후 publish()로 피드에 전파합니다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def record(self, delivery: DeliveryCall, status: str, rider_name: Optional[str] = None,
+               occurred_at: Optional[datetime] = None) -> DeliveryEvent:
+        if status not in STAGES:
+            raise InvalidStageError(status)
+
+        now = datetime.now()
+        occurred_at = _local_naive(occurred_at) if occurred_at else now
+
+        event = DeliveryEvent(
+            delivery_id=delivery.id,
+            store_id=delivery.store_id,
+            status=status,
+            rider_name=rider_name,
+            occurred_at=occurred_at,
+            created_at=now
+        )
+        self.db.add(event)
+
+        if rider_name:
+            delivery.rider_name = rider_name
+
+        column = STAGE_COLUMNS[status]
+        first_reach = getattr(delivery, column) is None
+        if first_reach:
+            setattr(delivery, column, occurred_at)
+        if STAGES.index(status) >= STAGES.index(delivery.status or "REQUESTED"):
+            delivery.status = status
+
+        if first_reach and status in SLA_METRICS and delivery.requested_at and delivery.store_id is not None:
+            self._observe(delivery.store_id, SLA_METRICS[status], _local_naive(delivery.requested_at), occurred_at)
+
+        self.db.flush()
+        return event
+
+    def _observe(self, store_id: int, metric: str, requested_at: datetime, reached_at: datetime):
+        seconds = max((reached_at - requested_at).total_seconds(), 0.0)
+        stmt = dialect_insert(self.db, DeliverySlaStat).values(
+            store_id=store_id, hour=requested_at.hour, metric=metric,
+            bucket=bucket_of(seconds / 60), count=1, total_sec=seconds
+        )
+        self.db.execute(stmt.on_conflict_do_update(
+            index_elements=[DeliverySlaStat.store_id, DeliverySlaStat.hour, DeliverySlaStat.metric, DeliverySlaStat.bucket],
+            set_={
+                "count": DeliverySlaStat.count + stmt.excluded.count,
+                "total_sec": DeliverySlaStat.total_sec + stmt.excluded.total_sec
+            }
+        ))
+
+    # -------------------------------------------------
+    # 조회
+    # -------------------------------------------------
+
+    def sla(self, store_id: int) -> dict:
+        """매장 SLA 요약 (전체 및 요청 시간대별 p50/p90, 분 단위)"""
+        rows = self.db.query(DeliverySlaStat).filter(DeliverySlaStat.store_id == store_id).all()
+
+        overall: Dict[str, Dict[int, int]] = {}
+        hourly: Dict[int, Dict[str, Dict[int, int]]] = {}
+        sums: Dict[str, List[float]] = {}
+        for r in rows:
+            overall.setdefault(r.metric, {}).setdefault(r.bucket, 0)
+            overall[r.metric][r.bucket] += r.count
+            hourly.setdefault(r.hour, {}).setdefault(r.metric, {})[r.bucket] = r.count
+            agg = sums.setdefault(r.metric, [0, 0.0])
+            agg[0] += r.count
+            agg[1] += r.total_sec
+
+        def summarize(metric_counts: Dict[str, Dict[int, int]]) -> dict:
+            return {
+                metric.lower(): {
+                    "count": sum(counts.values()),
+                    "p50_min": percentile_from_histogram(counts, 0.5),
+                    "p90_min": percentile_from_histogram(counts, 0.9)
+                }
+                for metric, counts in metric_counts.items()
+            }
+
+        result = summarize(overall)
+        for metric, (count, total_sec) in sums.items():
+            result[metric.lower()]["avg_min"] = round(total_sec / count / 60, 1) if count else None
+
+        return {
+            "store_id": store_id,
+            "overall": result,
+            "by_hour": [{"hour": hour, **summarize(hourly[hour])} for hour in sorted(hourly)]
+        }
+
+    def events_after(self, store_id: int, last_id: int, limit: int = 500) -> List[dict]:
+        """피드 재접속 시 놓친 이벤트"""
+        events = self.db.query(DeliveryEvent).filter(
+            DeliveryEvent.store_id == store_id,
+            DeliveryEvent.id > last_id
+        ).order_by(DeliveryEvent.id).limit(limit).all()
+        return [event_to_dict(e) for e in events]
+
+
+# 매장별 배달 이벤트 피드
+delivery_broker = EventBroker()
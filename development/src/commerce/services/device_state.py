@@ -0,0 +1,318 @@
+"""
+DeviceStateStore - IoT 장비 하트비트 수집 (메모리 상태 + 주기적 일괄 반영)
+"""
+import asyncio
+import json
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Hashable, Iterable, List, Optional, Set
+
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.orm import Session
+
+from src.database.engine import SessionLocal
+from src.commerce.domain.models_phase2 import IoTDevice
+
+logger = logging.getLogger(__name__)
+
+# 마지막 하트비트 후 OFFLINE 판정까지의 시간 (장비 전송 주기 30초 x 3)
+HEARTBEAT_TIMEOUT_SEC = 90
+
+# DB 반영 주기
+FLUSH_INTERVAL_SEC = 5.0
+
+# 타이머 휠 해상도 / 슬롯 수
+WHEEL_TICK_SEC = 1.0
+WHEEL_SLOTS = 128
+
+ONLINE = "ONLINE"
+OFFLINE = "OFFLINE"
+
+
+class TimerWheel:
+    """
+    해시드 타이머 휠
+
+    만료 시각을 tick 단위 슬롯에 넣고, advance() 시 지나간 슬롯만 확인합니다.
+    재등록은 기존 항목을 지우지 않고 새 슬롯에 추가하며(지연 삭제), 슬롯을 꺼낼 때
+    최신 만료 tick과 다른 항목은 버립니다. 전체 장비를 주기적으로 스캔하지 않습니다.
+    """
+
+    def __init__(self, tick_sec: float = WHEEL_TICK_SEC, slots: int = WHEEL_SLOTS, now: Optional[float] = None):
+        self.tick_sec = tick_sec
+        self._slots: List[Set[Hashable]] = [set() for _ in range(slots)]
+        self._deadline: Dict[Hashable, int] = {}
+        self._current = self._tick_of(time.monotonic() if now is None else now)
+
+    def _tick_of(self, t: float) -> int:
+        return int(t // self.tick_sec)
+
+    def __len__(self):
+        return len(self._deadline)
+
+    def schedule(self, key: Hashable, expires_at: float):
+        tick = max(self._tick_of(expires_at), self._current + 1)
+        self._deadline[key] = tick
+        self._slots[tick % len(self._slots)].add(key)
+
+    def cancel(self, key: Hashable):
+        self._deadline.pop(key, None)
+
+    def advance(self, now: float) -> List[Hashable]:
+        """now까지 만료된 키 목록"""
+        target = self._tick_of(now)
+        expired = []
+        # 한 바퀴 이상 밀렸으면 모든 슬롯을 한 번씩만 확인
+        start = max(self._current + 1, target - len(self._slots) + 1)
+        for tick in range(start, target + 1):
+            slot = self._slots[tick % len(self._slots)]
+            if not slot:
+                continue
+            keep = set()
+            for key in slot:
+                deadline = self._deadline.get(key)
+                if deadline is None or deadline % len(self._slots) != tick % len(self._slots):
+                    continue  # 취소됨 또는 다른 슬롯으로 재등록됨
+                if deadline <= target:
+                    del self._deadline[key]
+                    expired.append(key)
+                else:
+                    keep.add(key)  # 다음 바퀴 이후 만료
+            self._slots[tick % len(self._slots)] = keep
+        self._current = max(self._current, target)
+        return expired
+
+
+class DeviceStateStore:
+    """
+    장비 현재 상태를 메모리에 보관하고 변경분만 주기적으로 com_iot_devices에 반영합니다 (write-behind).
+
+    - ingest(): 여러 장비의 하트비트를 한 번에 받아 메모리 상태만 갱신하고 타이머를 재설정
+    - flush(): 변경된 장비만 executemany UPDATE로 일괄 반영
+    - 하트비트가 HEARTBEAT_TIMEOUT_SEC 동안 없으면 타이머 휠 만료로 OFFLINE 처리
+    """
+
+    def __init__(
+        self,
+        session_factory=SessionLocal,
+        timeout_sec: float = HEARTBEAT_TIMEOUT_SEC,
+        flush_interval_sec: float = FLUSH_INTERVAL_SEC
+    ):
+        self.session_factory = session_factory
+        self.timeout_sec = timeout_sec
+        self.flush_interval_sec = flush_interval_sec
+
+        self._lock = threading.Lock()
+        self._devices: Dict[str, dict] = {}  # device_id → {store_id, auth_token, status, last_heartbeat, telemetry}
+        self._dirty: Set[str] = set()         # last_heartbeat/telemetry 변경
+        self._status_dirty: Set[str] = set()  # status 변경 (ONLINE/OFFLINE 전환 또는 장비 보고)
+        self._wheel = TimerWheel()
+        self._task: Optional[asyncio.Task] = None
+
+    # -------------------------------------------------
+    # 장비 정보
+    # -------------------------------------------------
+
+    def _load_devices(self, db: Session, device_ids: Optional[Iterable[str]] = None):
+        query = select(IoTDevice.id, IoTDevice.store_id, IoTDevice.auth_token, IoTDevice.status, IoTDevice.last_heartbeat)
+        if device_ids is not None:
+            query = query.where(IoTDevice.id.in_(list(device_ids)))
+        for device_id, store_id, auth_token, status, last_heartbeat in db.execute(query):
+            self._devices.setdefault(device_id, {
+                "store_id": store_id,
+                "auth_token": auth_token,
+                "status": status,
+                "last_heartbeat": last_heartbeat,
+                "telemetry": None
+            })
+
+    def warm(self):
+        """기동 시 전체 장비 적재 (ONLINE 장비는 타임아웃 타이머부터 시작)"""
+        db: Session = self.session_factory()
+        try:
+            with self._lock:
+                self._load_devices(db)
+                now = time.monotonic()
+                for device_id, state in self._devices.items():
+                    if state["status"] != OFFLINE:
+                        self._wheel.schedule(device_id, now + self.timeout_sec)
+        finally:
+            db.close()
+
+    def register(self, device_id: str, store_id: int, auth_token: Optional[str] = None):
+        """신규 장비 등록 시 캐시 반영"""
+        with self._lock:
+            self._devices[device_id] = {
+                "store_id": store_id, "auth_token": auth_token, "status": ONLINE,
+                "last_heartbeat": datetime.now(), "telemetry": None
+            }
+            self._wheel.schedule(device_id, time.monotonic() + self.timeout_sec)
+
+    # -------------------------------------------------
+    # 수집
+    # -------------------------------------------------
+
+    def ingest(self, db: Session, store_id: int, heartbeats: List[dict], now: Optional[float] = None) -> dict:
+        """
+        하트비트 일괄 수신
+        heartbeats: [{"device_id": "...", "token": "...", "status": "ACTIVE"|None, "telemetry": {...}|None, "sent_at": datetime|None}]
+        """
+        now = time.monotonic() if now is None else now
+        received_at = datetime.now()
+
+        unknown = {hb["device_id"] for hb in heartbeats if hb["device_id"] not in self._devices}
+        if unknown:
+            # 캐시에 없는 장비만 1회 조회 (다른 워커에서 등록된 장비)
+            with self._lock:
+                self._load_devices(db, unknown)
+
+        accepted, rejected = [], []
+        with self._lock:
+            for hb in heartbeats:
+                device_id = hb["device_id"]
+                state = self._devices.get(device_id)
+                if state is None or state["store_id"] != store_id:
+                    rejected.append({"device_id": device_id, "reason": "UNKNOWN_DEVICE"})
+                    continue
+                if state["auth_token"] and hb.get("token") != state["auth_token"]:
+                    rejected.append({"device_id": device_id, "reason": "INVALID_TOKEN"})
+                    continue
+
+                status = hb.get("status") or (ONLINE if state["status"] in (None, OFFLINE) else state["status"])
+                if status != state["status"]:
+                    state["status"] = status
+                    self._status_dirty.add(device_id)
+                state["last_heartbeat"] = hb.get("sent_at") or received_at
+                if hb.get("telemetry") is not None:
+                    state["telemetry"] = hb["telemetry"]
+                self._dirty.add(device_id)
+                self._wheel.schedule(device_id, now + self.timeout_sec)
+                accepted.append(device_id)
+
+        return {"accepted": len(accepted), "rejected": rejected}
+
+    def expire(self, now: Optional[float] = None) -> List[str]:
+        """타이머 만료 장비 OFFLINE 처리"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            expired = self._wheel.advance(now)
+            for device_id in expired:
+                state = self._devices.get(device_id)
+                if state and state["status"] != OFFLINE:
+                    state["status"] = OFFLINE
+                    self._status_dirty.add(device_id)
+        if expired:
+            logger.warning(f"[IoT] {len(expired)} devices went OFFLINE: {expired[:10]}")
+        return expired
+
+    def set_status(self, db: Session, device_id: str, status: str):
+        """
+        명령 응답/시간초과에 따른 상태 즉시 변경
+        메모리 상태와 DB를 함께 갱신하므로 이후 하트비트가 상태를 정상 복구합니다. (커밋은 호출자)
+        """
+        with self._lock:
+            if device_id not in self._devices:
+                self._load_devices(db, [device_id])
+            state = self._devices.get(device_id)
+            if state is not None:
+                state["status"] = status
+                # 진행 중인 flush가 이전 상태로 덮어쓰더라도 다음 주기에 바로잡힘
+                self._status_dirty.add(device_id)
+                if status == OFFLINE:
+                    self._wheel.cancel(device_id)
+        db.execute(update(IoTDevice).where(IoTDevice.id == device_id).values(status=status))
+
+    def snapshot(self, store_id: int) -> List[dict]:
+        with self._lock:
+            return [
+                {"device_id": device_id, "status": s["status"], "last_heartbeat": s["last_heartbeat"], "telemetry": s["telemetry"]}
+                for device_id, s in self._devices.items() if s["store_id"] == store_id
+            ]
+
+    # -------------------------------------------------
+    # DB 반영
+    # -------------------------------------------------
+
+    def flush(self) -> int:
+        """변경된 장비 상태를 executemany로 일괄 UPDATE (반영 건수 반환)"""
+        with self._lock:
+            dirty, status_dirty = self._dirty | self._status_dirty, set(self._status_dirty)
+            self._dirty.clear()
+            self._status_dirty.clear()
+            heartbeat_rows, status_rows = [], []
+            for device_id in dirty:
+                state = self._devices[device_id]
+                row = {
+                    "b_id": device_id,
+                    "b_last_heartbeat": state["last_heartbeat"],
+                    "b_telemetry": json.dumps(state["telemetry"], ensure_ascii=False) if state["telemetry"] is not None else None
+                }
+                if device_id in status_dirty:
+                    row["b_status"] = state["status"]
+                    status_rows.append(row)
+                else:
+                    heartbeat_rows.append(row)
+
+        if not dirty:
+            return 0
+
+        table = IoTDevice.__table__
+        values = {"last_heartbeat": bindparam("b_last_heartbeat"), "telemetry": bindparam("b_telemetry")}
+        db: Session = self.session_factory()
+        try:
+            if heartbeat_rows:
+                db.execute(update(table).where(table.c.id == bindparam("b_id")).values(**values), heartbeat_rows)
+            if status_rows:
+                db.execute(
+                    update(table).where(table.c.id == bindparam("b_id")).values(**values, status=bindparam("b_status")),
+                    status_rows
+                )
+            db.commit()
+        except Exception:
+            db.rollback()
+            # 실패분은 다음 주기에 재시도
+            with self._lock:
+                self._dirty |= dirty
+                self._status_dirty |= status_dirty
+            raise
+        finally:
+            db.close()
+        return len(dirty)
+
+    # -------------------------------------------------
+    # 백그라운드 루프
+    # -------------------------------------------------
+
+    async def run(self):
+        logger.info("[IoT] Device state store started.")
+        await asyncio.to_thread(self.warm)
+        last_flush = time.monotonic()
+        while True:
+            await asyncio.sleep(WHEEL_TICK_SEC)
+            try:
+                self.expire()
+                if time.monotonic() - last_flush >= self.flush_interval_sec:
+                    last_flush = time.monotonic()
+                    await asyncio.to_thread(self.flush)
+            except Exception as e:
+                logger.error(f"[IoT] Device state error: {e}")
+
+    def start(self) -> asyncio.Task:
+        self._task = asyncio.create_task(self.run())
+        return self._task
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await asyncio.to_thread(self.flush)
+
+
+# 싱글톤 인스턴스
+device_state = DeviceStateStore()
@@ -0,0 +1,122 @@
+"""
+EventBroker - 매장 단위 실시간 이벤트 전파 (SSE 피드용)
+"""
+import asyncio
+import json
+import logging
+import threading
+from typing import AsyncIterator, Awaitable, Callable, Dict, Hashable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# 구독자별 미전송 이벤트 한도 (초과 시 연결을 끊고 클라이언트가 Last-Event-ID로 재동기화)
+SUBSCRIBER_QUEUE_SIZE = 100
+
+# SSE 연결 유지용 주석 전송 주기 (초)
+HEARTBEAT_SEC = 15.0
+
+
+class _Subscriber:
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self.overflowed = False
+
+    def offer(self, event: dict):
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True  # 남은 이벤트 전송 후 스트림 종료
+
+
+class EventBroker:
+    """
+    토픽(보통 store_id)별 구독자에게 이벤트를 전파합니다.
+
+    publish()는 동기 API 핸들러(스레드풀)에서도 호출할 수 있으며, 각 구독자의 이벤트 루프로
+    call_soon_threadsafe를 통해 전달합니다. 느린 구독자는 큐가 가득 차면 연결이 종료되고,
+    재접속 시 Last-Event-ID 이후 이벤트를 DB에서 다시 받습니다.
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[Hashable, Set[_Subscriber]] = {}
+        self._lock = threading.Lock()
+
+    def subscriber_count(self, topic: Hashable) -> int:
+        with self._lock:
+            return len(self._subscribers.get(topic, ()))
+
+    def publish(self, topic: Hashable, event: dict):
+        """이벤트 전파 (event["id"]가 있으면 SSE id로 사용)"""
+        with self._lock:
+            subscribers = list(self._subscribers.get(topic, ()))
+        for sub in subscribers:
+            try:
+                sub.loop.call_soon_threadsafe(sub.offer, event)
+            except RuntimeError:
+                self._unsubscribe(topic, sub)  # 이벤트 루프가 이미 종료됨
+
+    def _subscribe(self, topic: Hashable) -> _Subscriber:
+        sub = _Subscriber(asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers.setdefault(topic, set()).add(sub)
+        return sub
+
+    def _unsubscribe(self, topic: Hashable, sub: _Subscriber):
+        with self._lock:
+            subs = self._subscribers.get(topic)
+            if subs:
+                subs.discard(sub)
+                if not subs:
+                    del self._subscribers[topic]
+
+    async def stream(
+        self,
+        topic: Hashable,
+        event_name: str,
+        replay: Optional[Callable[[], Awaitable[List[dict]]]] = None,
+        heartbeat_sec: float = HEARTBEAT_SEC
+    ) -> AsyncIterator[str]:
+        """
+        SSE 본문 생성기
+
+        구독을 먼저 등록한 뒤 replay()로 놓친 이벤트를 보내므로 그 사이 발생한 이벤트도 유실되지 않습니다.
+        (replay 결과와 실시간 이벤트가 겹치면 id 기준으로 건너뜀)
+        """
+        sub = self._subscribe(topic)
+        last_id = None
+        try:
+            if replay:
+                for event in await replay():
+                    last_id = event.get("id", last_id)
+                    yield format_sse(event, event_name)
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(sub.queue.get(), timeout=heartbeat_sec)
+                except asyncio.TimeoutError:
+                    if sub.overflowed:
+                        break
+                    yield ": keep-alive\n\n"
+                    continue
+
+                if last_id is not None and event.get("id") is not None and event["id"] <= last_id:
+                    continue
+                yield format_sse(event, event_name)
+                if sub.overflowed and sub.queue.empty():
+                    logger.warning(f"[EventBroker] Subscriber on {topic} overflowed, closing stream")
+                    break
+        finally:
+            self._unsubscribe(topic, sub)
+
+
+def format_sse(event: dict, event_name: str) -> str:
+    """dict → SSE 메시지"""
+    lines = []
+    if event.get("id") is not None:
+        lines.append(f"id: {event['id']}")
+    lines.append(f"event: {event_name}")
+    lines.append(f"data: {json.dumps(event, ensure_ascii=False, default=str)}")
+    return "\n".join(lines) + "\n\n"
@@ -0,0 +1,140 @@
+"""
+IoT 장비 통신 (Transport Port/Adapter)
+"""
+import asyncio
+import logging
+import random
+from abc import ABC, abstractmethod
+from typing import Optional, Set
+
+import httpx
+from fastapi import FastAPI, HTTPException, Request
+
+logger = logging.getLogger(__name__)
+
+# 장비 응답 제한시간 (초)
+DEVICE_TIMEOUT_SEC = 5.0
+
+# 명령 → 실행 후 장비 상태
+COMMAND_STATES = {
+    "OPEN": "UNLOCKED",
+    "CLOSE": "LOCKED",
+    "ON": "ACTIVE",
+    "OFF": "IDLE",
+    "RESTART": "ONLINE",
+}
+
+
+class DeviceTransportError(Exception):
+    """장비 연결 실패 또는 오류 응답"""
+    pass
+
+
+class IDeviceTransport(ABC):
+    """
+    장비 명령 전송 인터페이스 (Port)
+    """
+
+    @abstractmethod
+    async def send(self, device: dict, payload: dict) -> dict:
+        """
+        명령을 전송하고 장비 응답(ack)을 반환합니다.
+
+        Args:
+            device (dict): {"id", "ip_address", "auth_token"}
+            payload (dict): {"command_id", "seq", "command"}
+
+        Returns:
+            dict: 장비 응답 (예: {"ok": True, "state": "UNLOCKED"})
+
+        Raises:
+            DeviceTransportError: 연결 실패 또는 장비 오류
+        """
+        pass
+
+    async def close(self):
+        pass
+
+
+class HttpDeviceTransport(IDeviceTransport):
+    """
+    장비 내장 HTTP 서버로 명령 전송 (POST http://{ip}/command)
+    AsyncClient 하나를 공유하여 장비별 연결을 재사용합니다.
+    """
+
+    def __init__(self, client: Optional[httpx.AsyncClient] = None, timeout: float = DEVICE_TIMEOUT_SEC):
+        self.client = client or httpx.AsyncClient(timeout=timeout)
+
+    def _url(self, device: dict) -> str:
+        return f"http://{device['ip_address']}/command"
+
+    def _headers(self, device: dict) -> dict:
+        return {"Authorization": f"Bearer {device['auth_token']}"} if device.get("auth_token") else {}
+
+    async def send(self, device: dict, payload: dict) -> dict:
+        try:
+            response = await self.client.post(self._url(device), json=payload, headers=self._headers(device))
+        except httpx.TimeoutException:
+            raise asyncio.TimeoutError()
+        except httpx.HTTPError as e:
+            raise DeviceTransportError(f"Connection failed: {e}")
+
+        if response.status_code >= 400:
+            raise DeviceTransportError(f"Device error {response.status_code}: {response.text[:100]}")
+        try:
+            return response.json()
+        except ValueError:
+            raise DeviceTransportError(f"Invalid ack body: {response.text[:100]}")
+
+    async def close(self):
+        await self.client.aclose()
+
+
+def create_simulated_device_app(
+    latency_sec: float = 0.05,
+    failure_rate: float = 0.0,
+    offline_devices: Optional[Set[str]] = None
+) -> FastAPI:
+    """
+    로컬 시뮬레이션 장비 서버 (테스트 전용, 운영 앱에서는 사용하지 않음)
+    실제 장비와 같은 /command 규격으로 응답하며, 장비 ID는 X-Device-Id 헤더로 구분합니다.
+    """
+    app = FastAPI(title="Simulated IoT Device")
+    app.state.last_seq = {}
+    app.state.received = []
+    offline = offline_devices or set()
+
+    @app.post("/command")
+    async def command(request: Request):
+        payload = await request.json()
+        device_id = request.headers.get("X-Device-Id", "unknown")
+        if device_id in offline:
+            await asyncio.sleep(3600)  # 응답 없음
+
+        await asyncio.sleep(latency_sec)
+        if payload["seq"] <= app.state.last_seq.get(device_id, 0):
+            raise HTTPException(status_code=409, detail="Stale sequence")
+        if random.random() < failure_rate:
+            raise HTTPException(status_code=500, detail="Actuator jammed")
+
+        app.state.last_seq[device_id] = payload["seq"]
+        app.state.received.append((device_id, payload["seq"], payload["command"]))
+        return {"ok": True, "seq": payload["seq"], "state": COMMAND_STATES.get(payload["command"], "ONLINE")}
+
+    return app
+
+
+class SimulatedDeviceTransport(HttpDeviceTransport):
+    """시뮬레이션 장비 서버로 전송 (네트워크 없이 ASGI 직접 호출, 테스트 전용)"""
+
+    def __init__(self, app: Optional[FastAPI] = None, timeout: float = DEVICE_TIMEOUT_SEC):
+        self.app = app or create_simulated_device_app()
+        super().__init__(
+            client=httpx.AsyncClient(transport=httpx.ASGITransport(app=self.app), base_url="http://simulated", timeout=timeout)
+        )
+
+    def _url(self, device: dict) -> str:
+        return "/command"
+
+    def _headers(self, device: dict) -> dict:
+        return {"X-Device-Id": device["id"]}
@@ -0,0 +1,203 @@
+"""
+MembershipService - 포인트 적립 서비스 (원자적 UPSERT + 원장 일괄 기록)
+"""
+import json
+import logging
+from collections import OrderedDict
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import bindparam, case, insert, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from src.commerce.domain.models import SyncLog, SyncDirection
+from src.commerce.domain.models_gap_v2 import MemberPoint, PointHistory
+from src.database.upsert import dialect_insert
+
+logger = logging.getLogger(__name__)
+
+# 결제액 대비 적립률
+EARN_RATE = 0.03
+
+# 원장(PointHistory) executemany 배치 크기
+LEDGER_BATCH_SIZE = 500
+
+
+class DuplicateBatchError(Exception):
+    """이미 처리된 일괄 적립 요청 (idempotency_key 중복)"""
+    pass
+
+
+def calc_points(amount: int) -> int:
+    """결제액 → 적립 포인트"""
+    return int(amount * EARN_RATE)
+
+
+def _local_naive(dt: datetime) -> datetime:
+    """타임존 포함 시각은 로컬 시각으로 변환 (DB 저장 기준과 일치)"""
+    return dt.astimezone().replace(tzinfo=None) if dt.tzinfo else dt
+
+
+class MembershipService:
+    """
+    포인트 적립 서비스
+
+    회원 행은 (store_id, user_phone) 유니크 키 기준 INSERT ... ON CONFLICT DO NOTHING으로 보장하고,
+    잔액은 current_points = current_points + :points 형태의 단일 UPDATE로 증가시키므로
+    같은 전화번호로 동시에 적립해도 포인트가 유실되지 않습니다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _ensure_members(self, keys: List[Tuple[int, str]], now: datetime):
+        """회원 행이 없으면 생성 (이미 있으면 무시)"""
+        stmt = dialect_insert(self.db, MemberPoint).on_conflict_do_nothing(
+            index_elements=[MemberPoint.store_id, MemberPoint.user_phone]
+        )
+        self.db.execute(stmt, [
+            {"store_id": store_id, "user_phone": phone, "current_points": 0,
+             "total_accumulated": 0, "last_visit": now}
+            for store_id, phone in keys
+        ])
+
+    def _write_ledger(self, rows: List[dict]):
+        """PointHistory 일괄 기록"""
+        for i in range(0, len(rows), LEDGER_BATCH_SIZE):
+            self.db.execute(insert(PointHistory), rows[i:i + LEDGER_BATCH_SIZE])
+
+    def earn(self, store_id: int, user_phone: str, amount: int) -> dict:
+        """단건 적립 (결제액 기준)"""
+        now = datetime.now()
+        points = calc_points(amount)
+
+        created = self.db.execute(
+            dialect_insert(self.db, MemberPoint).values(
+                store_id=store_id, user_phone=user_phone, current_points=0,
+                total_accumulated=0, last_visit=now
+            ).on_conflict_do_nothing(
+                index_elements=[MemberPoint.store_id, MemberPoint.user_phone]
+            ).returning(MemberPoint.id)
+        ).first() is not None
+
+        member_id, current_points = self.db.execute(
+            update(MemberPoint).where(
+                MemberPoint.store_id == store_id,
+                MemberPoint.user_phone == user_phone
+            ).values(
+                current_points=MemberPoint.current_points + points,
+                total_accumulated=MemberPoint.total_accumulated + points,
+                last_visit=now
+            ).returning(MemberPoint.id, MemberPoint.current_points)
+            .execution_options(synchronize_session=False)
+        ).one()
+
+        self._write_ledger([{"member_id": member_id, "amount": points, "reason": "ORDER_REWARD", "created_at": now}])
+        self.db.commit()
+
+        return {"member_id": member_id, "earned": points, "total": current_points, "is_new_member": created}
+
+    def earn_bulk(self, entries: List[dict], idempotency_key: Optional[str] = None,
+                  source: Optional[str] = None) -> dict:
+        """
+        일괄 적립 (오프라인 단말 일마감 정산용)
+
+        entries: [{"store_id": 1, "user_phone": "010...", "amount": 12000, "occurred_at": datetime|None}, ...]
+        idempotency_key가 주어지면 같은 트랜잭션에 SyncLog를 기록하여 재전송 시 중복 적립을 막습니다.
+        """
+        now = datetime.now()
+
+        # 1. 회원별 합산
+        totals: "OrderedDict[Tuple[int, str], dict]" = OrderedDict()
+        entry_points = [calc_points(e["amount"]) for e in entries]
+        entry_times = [_local_naive(e.get("occurred_at") or now) for e in entries]
+        for e, points, occurred_at in zip(entries, entry_points, entry_times):
+            key = (e["store_id"], e["user_phone"])
+            agg = totals.setdefault(key, {"points": 0, "last_visit": None})
+            agg["points"] += points
+            if agg["last_visit"] is None or occurred_at > agg["last_visit"]:
+                agg["last_visit"] = occurred_at
+        keys = list(totals.keys())
+        if not keys:
+            return {"members": 0, "entries": 0, "earned": 0, "new_members": []}
+
+        key_filter = tuple_(MemberPoint.store_id, MemberPoint.user_phone).in_(keys)
+
+        try:
+            # 2. 신규 회원 식별 후 누락분만 생성
+            existing = set(self.db.execute(select(MemberPoint.store_id, MemberPoint.user_phone).where(key_filter)).all())
+            self._ensure_members(keys, now)
+
+            # 3. 잔액 증가 (executemany 단일 UPDATE 구문)
+            table = MemberPoint.__table__
+            self.db.execute(
+                update(table).where(
+                    table.c.store_id == bindparam("b_store_id"),
+                    table.c.user_phone == bindparam("b_user_phone")
+                ).values(
+                    current_points=table.c.current_points + bindparam("b_points"),
+                    total_accumulated=table.c.total_accumulated + bindparam("b_points"),
+                    # 오프라인 단말 거래가 더 최근 방문 기록을 덮어쓰지 않도록 최신값 유지
+                    last_visit=case(
+                        (table.c.last_visit > bindparam("b_last_visit"), table.c.last_visit),
+                        else_=bindparam("b_last_visit")
+                    )
+                ),
+                [
+                    {"b_store_id": store_id, "b_user_phone": phone,
+                     "b_points": agg["points"], "b_last_visit": agg["last_visit"]}
+                    for (store_id, phone), agg in totals.items()
+                ]
+            )
+
+            # 4. 원장 일괄 기록 (단말 거래 1건당 1행)
+            member_ids = {
+                (store_id, phone): member_id
+                for member_id, store_id, phone in self.db.execute(
+                    select(MemberPoint.id, MemberPoint.store_id, MemberPoint.user_phone).where(key_filter)
+                )
+            }
+            self._write_ledger([
+                {
+                    "member_id": member_ids[(e["store_id"], e["user_phone"])],
+                    "amount": points,
+                    "reason": "ORDER_REWARD",
+                    "created_at": occurred_at
+                }
+                for e, points, occurred_at in zip(entries, entry_points, entry_times)
+            ])
+
+            summary = {
+                "members": len(keys),
+                "entries": len(entries),
+                "earned": sum(agg["points"] for agg in totals.values()),
+                "new_members": [
+                    {"store_id": k[0], "member_id": member_ids[k], "phone": k[1]}
+                    for k in keys if k not in existing
+                ]
+            }
+
+            # 5. Idempotency 기록 (같은 트랜잭션)
+            if idempotency_key:
+                self.db.add(SyncLog(
+                    idempotency_key=idempotency_key,
+                    direction=SyncDirection.INBOUND,
+                    event_type="POINT_BULK_EARN",
+                    endpoint="/membership/earn/bulk",
+                    payload=json.dumps({"source": source, "entries": len(entries)}, ensure_ascii=False),
+                    response=json.dumps({k: v for k, v in summary.items() if k != "new_members"}),
+                    status="SUCCESS",
+                    processed_at=now
+                ))
+
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            # 같은 키가 이미 반영된 경우만 중복으로 처리 (그 외 제약조건 위반은 호출자에 전파)
+            if idempotency_key and self.db.query(SyncLog.id).filter(SyncLog.idempotency_key == idempotency_key).first():
+                raise DuplicateBatchError(idempotency_key)
+            raise
+
+        logger.info(f"Bulk earn: {summary['entries']} entries, {summary['members']} members, +{summary['earned']}P")
+        return summary
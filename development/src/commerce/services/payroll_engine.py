@@ -0,0 +1,249 @@
+"""
+PayrollEngine - 근태 기반 급여/근무 리포트 (NumPy 벡터 연산)
+"""
+import csv
+import io
+import logging
+from datetime import date, datetime, time
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.commerce.domain.models import CommerceUser
+from src.commerce.domain.models_gap import AttendanceLog
+
+logger = logging.getLogger(__name__)
+
+# 최저시급 (원)
+MINIMUM_WAGE = 10030
+
+# 1일 소정근로시간 (초과분은 연장근로)
+DAILY_REGULAR_HOURS = 8.0
+
+# 가산율 (통상임금 대비)
+OVERTIME_RATE = 0.5
+NIGHT_RATE = 0.5
+HOLIDAY_RATE = 0.5
+
+# 야간근로 구간 22:00 ~ 익일 06:00
+NIGHT_START_HOUR = 22
+NIGHT_HOURS = 8
+
+# 지각 판정 기준
+SHIFT_START = time(9, 0)
+LATE_GRACE_MIN = 5
+
+REPORT_FIELDS = [
+    "store_id", "user_id", "username", "shifts", "days_worked", "total_hours", "regular_hours",
+    "overtime_hours", "night_hours", "holiday_hours", "late_count",
+    "base_pay", "overtime_pay", "night_pay", "holiday_pay", "gross_pay"
+]
+
+_DAY = np.timedelta64(1, "D")
+_HOUR = np.timedelta64(1, "h")
+
+
+def _local_naive(dt: datetime) -> datetime:
+    return dt.astimezone().replace(tzinfo=None) if dt.tzinfo else dt
+
+
+def _overlap_hours(start, end, win_start, win_end) -> np.ndarray:
+    """[start, end) 와 [win_start, win_end) 겹치는 시간 (브로드캐스팅)"""
+    overlap = np.minimum(end, win_end) - np.maximum(start, win_start)
+    return np.clip(overlap / _HOUR, 0.0, None)
+
+
+class PayrollEngine:
+    """
+    기간 내 AttendanceLog를 열(column) 단위 배열로 읽어 직원별 근무/급여를 계산합니다.
+
+    - 연장근로: 직원별 근무일(출근일 기준) 합계에서 DAILY_REGULAR_HOURS 초과분
+    - 야간근로: 근무 구간과 22:00~06:00 구간의 겹침 (출근일 전날/당일/다음날 구간을 한 번에 계산)
+    - 휴일근로: 근무 구간 중 휴일 날짜(자정 기준 분할)에 속한 시간
+    - 지각: 출근 시각이 SHIFT_START + LATE_GRACE_MIN 이후인 근무 건수
+    모든 계산은 행 단위 루프 없이 배열 연산과 bincount 집계로 수행합니다.
+    """
+
+    def __init__(
+        self,
+        hourly_wage: int = MINIMUM_WAGE,
+        wages: Optional[Dict[int, int]] = None,
+        holidays: Iterable[date] = (),
+        shift_start: time = SHIFT_START,
+        late_grace_min: int = LATE_GRACE_MIN
+    ):
+        self.hourly_wage = hourly_wage
+        self.wages = wages or {}  # user_id → 시급 (개별 계약)
+        self.holidays = np.array(sorted(set(holidays)), dtype="datetime64[D]")
+        self.shift_start = shift_start
+        self.late_grace_min = late_grace_min
+
+    # -------------------------------------------------
+    # 적재
+    # -------------------------------------------------
+
+    def load(self, db: Session, store_ids: List[int], start: datetime, end: datetime) -> dict:
+        """기간 내 종료된 근무 기록을 열 배열로 적재 (쿼리 1회)"""
+        rows = db.execute(
+            select(AttendanceLog.store_id, AttendanceLog.user_id, AttendanceLog.clock_in, AttendanceLog.clock_out)
+            .where(
+                AttendanceLog.store_id.in_(store_ids),
+                AttendanceLog.clock_in >= start,
+                AttendanceLog.clock_in < end,
+                AttendanceLog.clock_out.isnot(None)
+            )
+        ).all()
+
+        if not rows:
+            return {
+                "store_id": np.empty(0, dtype=np.int64), "user_id": np.empty(0, dtype=np.int64),
+                "clock_in": np.empty(0, dtype="datetime64[s]"), "clock_out": np.empty(0, dtype="datetime64[s]")
+            }
+
+        store_col, user_col, in_col, out_col = zip(*rows)
+        return {
+            "store_id": np.array(store_col, dtype=np.int64),
+            "user_id": np.array([u or 0 for u in user_col], dtype=np.int64),
+            "clock_in": np.array([_local_naive(t) for t in in_col], dtype="datetime64[s]"),
+            "clock_out": np.array([_local_naive(t) for t in out_col], dtype="datetime64[s]")
+        }
+
+    # -------------------------------------------------
+    # 계산
+    # -------------------------------------------------
+
+    def compute(self, cols: dict) -> List[dict]:
+        """열 배열 → (매장, 직원)별 리포트 행"""
+        clock_in, clock_out = cols["clock_in"], cols["clock_out"]
+        if clock_in.size == 0:
+            return []
+
+        # 비정상 기록(퇴근 < 출근) 제외
+        valid = clock_out > clock_in
+        clock_in, clock_out = clock_in[valid], clock_out[valid]
+        store_id, user_id = cols["store_id"][valid], cols["user_id"][valid]
+        if clock_in.size == 0:
+            return []
+
+        hours = (clock_out - clock_in) / _HOUR
+        work_day = clock_in.astype("datetime64[D]")
+
+        # (매장, 직원) 그룹 인덱스
+        pairs, group = np.unique(np.stack([store_id, user_id], axis=1), axis=0, return_inverse=True)
+        group = group.ravel()
+        n = len(pairs)
+
+        # 연장근로: (그룹, 근무일) 단위 합계 후 초과분
+        day_keys, day_group = np.unique(
+            np.stack([group, work_day.astype(np.int64)], axis=1), axis=0, return_inverse=True
+        )
+        day_hours = np.bincount(day_group.ravel(), weights=hours)
+        day_overtime = np.clip(day_hours - DAILY_REGULAR_HOURS, 0.0, None)
+        overtime = np.bincount(day_keys[:, 0], weights=day_overtime, minlength=n)
+        days_worked = np.bincount(day_keys[:, 0], minlength=n)
+
+        # 야간근로: 출근일 기준 -1/0/+1일의 야간 구간과 겹침
+        offsets = np.arange(-1, 2)[:, None] * _DAY
+        night_start = work_day[None, :] + offsets + np.timedelta64(NIGHT_START_HOUR, "h")
+        night_end = night_start + np.timedelta64(NIGHT_HOURS, "h")
+        night = _overlap_hours(clock_in[None, :], clock_out[None, :], night_start, night_end).sum(axis=0)
+
+        # 휴일근로: 출근일/다음날 중 휴일에 속한 시간 (자정 기준 분할)
+        if self.holidays.size:
+            days = work_day[None, :] + np.arange(0, 2)[:, None] * _DAY
+            is_holiday = np.isin(days, self.holidays)
+            holiday = (_overlap_hours(clock_in[None, :], clock_out[None, :], days, days + _DAY) * is_holiday).sum(axis=0)
+        else:
+            holiday = np.zeros_like(hours)
+
+        # 지각: 근무일의 첫 출근 시각(하루 중 초)이 기준 + 유예 이후 (휴게 후 재출근은 제외)
+        late_after = self.shift_start.hour * 3600 + self.shift_start.minute * 60 + self.late_grace_min * 60
+        seconds_of_day = (clock_in - work_day).astype("timedelta64[s]").astype(np.int64)
+        first_in = np.full(len(day_keys), np.iinfo(np.int64).max)
+        np.minimum.at(first_in, day_group.ravel(), seconds_of_day)
+        late_count = np.bincount(day_keys[:, 0], weights=(first_in > late_after).astype(np.float64), minlength=n).astype(np.int64)
+
+        total = np.bincount(group, weights=hours, minlength=n)
+        night_sum = np.bincount(group, weights=night, minlength=n)
+        holiday_sum = np.bincount(group, weights=holiday, minlength=n)
+        shifts = np.bincount(group, minlength=n)
+
+        wage = np.array([self.wages.get(int(u), self.hourly_wage) for u in pairs[:, 1]], dtype=np.float64)
+        base_pay = np.round(total * wage)
+        overtime_pay = np.round(overtime * wage * OVERTIME_RATE)
+        night_pay = np.round(night_sum * wage * NIGHT_RATE)
+        holiday_pay = np.round(holiday_sum * wage * HOLIDAY_RATE)
+        gross = base_pay + overtime_pay + night_pay + holiday_pay
+
+        return [
+            {
+                "store_id": int(pairs[i, 0]),
+                "user_id": int(pairs[i, 1]),
+                "shifts": int(shifts[i]),
+                "days_worked": int(days_worked[i]),
+                "total_hours": round(float(total[i]), 2),
+                "regular_hours": round(float(total[i] - overtime[i]), 2),
+                "overtime_hours": round(float(overtime[i]), 2),
+                "night_hours": round(float(night_sum[i]), 2),
+                "holiday_hours": round(float(holiday_sum[i]), 2),
+                "late_count": int(late_count[i]),
+                "base_pay": int(base_pay[i]),
+                "overtime_pay": int(overtime_pay[i]),
+                "night_pay": int(night_pay[i]),
+                "holiday_pay": int(holiday_pay[i]),
+                "gross_pay": int(gross[i])
+            }
+            for i in range(n)
+        ]
+
+    # -------------------------------------------------
+    # 리포트
+    # -------------------------------------------------
+
+    def report(self, db: Session, store_ids: List[int], start: datetime, end: datetime) -> dict:
+        rows = self.compute(self.load(db, store_ids, start, end))
+
+        user_ids = {r["user_id"] for r in rows}
+        names = dict(db.execute(
+            select(CommerceUser.id, CommerceUser.username).where(CommerceUser.id.in_(user_ids))
+        ).all()) if user_ids else {}
+        for r in rows:
+            r["username"] = names.get(r["user_id"])
+
+        open_shifts = db.query(AttendanceLog).filter(
+            AttendanceLog.store_id.in_(store_ids),
+            AttendanceLog.clock_in >= start,
+            AttendanceLog.clock_in < end,
+            AttendanceLog.clock_out.is_(None)
+        ).count()
+
+        logger.info(f"Payroll report: {len(store_ids)} stores, {len(rows)} employees ({start:%Y-%m-%d} ~ {end:%Y-%m-%d})")
+        return {
+            "period": {"start": start.isoformat(), "end": end.isoformat()},
+            "stores": sorted(store_ids),
+            "employees": rows,
+            "open_shifts": open_shifts,  # 퇴근 미처리 건 (계산 제외)
+            "totals": {
+                "total_hours": round(sum(r["total_hours"] for r in rows), 2),
+                "gross_pay": sum(r["gross_pay"] for r in rows)
+            }
+        }
+
+
+def to_csv(rows: List[dict]) -> str:
+    """리포트 행 → CSV (엑셀 호환 BOM 포함)"""
+    buf = io.StringIO()
+    buf.write("\ufeff")
+    writer = csv.DictWriter(buf, fieldnames=REPORT_FIELDS, extrasaction="ignore")
+    writer.writeheader()
+    writer.writerows(rows)
+    return buf.getvalue()
+
+
+def month_range(month: str) -> tuple:
+    """'2025-03' → (2025-03-01 00:00, 2025-04-01 00:00)"""
+    start = datetime.strptime(month, "%Y-%m")
+    end = start.replace(year=start.year + 1, month=1) if start.month == 12 else start.replace(month=start.month + 1)
+    return start, end
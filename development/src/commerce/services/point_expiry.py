@@ -0,0 +1,150 @@
+"""
+PointExpiryJob - 포인트 소멸 배치 (야간 일괄 처리)
+"""
+import logging
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import bindparam, case, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from src.database.engine import SessionLocal
+from src.commerce.domain.models_gap_v2 import MemberPoint, PointHistory
+
+logger = logging.getLogger(__name__)
+
+# 적립 후 소멸까지의 유효기간
+EXPIRY_DAYS = 365
+
+# 한 트랜잭션에서 처리할 회원 수
+CHUNK_SIZE = 1000
+
+# 드라이런 리포트에 포함할 회원 상세 최대 건수
+REPORT_SAMPLE_SIZE = 100
+
+EXPIRE_REASON = "EXPIRE"
+
+
+class PointExpiryJob:
+    """
+    유효기간이 지난 적립 포인트를 소멸시킵니다.
+
+    소멸 대상은 선입선출 기준으로 계산합니다. 사용/소멸된 포인트는 오래된 적립분부터 차감된 것으로 보므로
+    회원별 소멸액 = min(잔액, max(0, 기준일 이전 적립 합계 - 전체 차감 합계)) 입니다.
+    이 값은 회원 id 구간(keyset) 단위의 GROUP BY 한 번으로 구하고, EXPIRE 원장 기록과 잔액 차감은
+    같은 트랜잭션에서 executemany로 반영합니다. 이미 기록된 EXPIRE 행도 차감으로 집계되므로 재실행해도 중복 소멸되지 않습니다.
+    """
+
+    def __init__(self, session_factory=SessionLocal, expiry_days: int = EXPIRY_DAYS, chunk_size: int = CHUNK_SIZE):
+        self.session_factory = session_factory
+        self.expiry_days = expiry_days
+        self.chunk_size = chunk_size
+
+    def _next_chunk(self, db: Session, after_id: int, store_id: Optional[int], lock: bool) -> List[int]:
+        """잔액이 남은 다음 회원 id 구간 (실행 모드에서는 행 잠금)"""
+        query = select(MemberPoint.id).where(
+            MemberPoint.id > after_id,
+            MemberPoint.current_points > 0
+        )
+        if store_id is not None:
+            query = query.where(MemberPoint.store_id == store_id)
+        query = query.order_by(MemberPoint.id).limit(self.chunk_size)
+        if lock:
+            query = query.with_for_update()
+        return list(db.execute(query).scalars())
+
+    def _expiring(self, db: Session, member_ids: List[int], cutoff: datetime) -> List[dict]:
+        """구간 내 회원별 소멸 예정 포인트 (집계 쿼리 1회)"""
+        earned_before_cutoff = func.coalesce(func.sum(case(
+            ((PointHistory.amount > 0) & (PointHistory.created_at < cutoff), PointHistory.amount),
+            else_=0
+        )), 0)
+        debited = func.coalesce(func.sum(case(
+            (PointHistory.amount < 0, -PointHistory.amount),
+            else_=0
+        )), 0)
+
+        rows = db.execute(
+            select(
+                MemberPoint.id, MemberPoint.store_id, MemberPoint.user_phone, MemberPoint.current_points,
+                (earned_before_cutoff - debited).label("expirable")
+            )
+            .join(PointHistory, PointHistory.member_id == MemberPoint.id)
+            .where(MemberPoint.id.in_(member_ids))
+            .group_by(MemberPoint.id, MemberPoint.store_id, MemberPoint.user_phone, MemberPoint.current_points)
+            .having(earned_before_cutoff > debited)
+        ).all()
+
+        return [
+            {"member_id": r.id, "store_id": r.store_id, "phone": r.user_phone,
+             "current_points": r.current_points, "expire": min(r.current_points, int(r.expirable))}
+            for r in rows
+        ]
+
+    def _apply(self, db: Session, targets: List[dict], now: datetime):
+        """EXPIRE 원장 기록 + 잔액 차감 (executemany)"""
+        db.execute(insert(PointHistory), [
+            {"member_id": t["member_id"], "amount": -t["expire"], "reason": EXPIRE_REASON, "created_at": now}
+            for t in targets
+        ])
+        table = MemberPoint.__table__
+        db.execute(
+            update(table).where(table.c.id == bindparam("b_id")).values(
+                current_points=table.c.current_points - bindparam("b_expire")
+            ),
+            [{"b_id": t["member_id"], "b_expire": t["expire"]} for t in targets]
+        )
+
+    def run(self, dry_run: bool = False, store_id: Optional[int] = None, now: Optional[datetime] = None) -> dict:
+        """
+        소멸 배치 실행
+
+        dry_run=True이면 DB를 변경하지 않고 소멸 예정 내역만 리포트합니다.
+        실행 모드에서는 회원 구간마다 커밋하므로 중단되더라도 처리된 구간은 유지됩니다.
+        """
+        now = now or datetime.now()
+        cutoff = now - timedelta(days=self.expiry_days)
+
+        report = {
+            "dry_run": dry_run,
+            "cutoff": cutoff.isoformat(),
+            "members_scanned": 0,
+            "members_expired": 0,
+            "points_expired": 0,
+            "chunks": 0,
+            "details": []
+        }
+
+        db: Session = self.session_factory()
+        try:
+            last_id = 0
+            while True:
+                member_ids = self._next_chunk(db, last_id, store_id, lock=not dry_run)
+                if not member_ids:
+                    break
+                last_id = member_ids[-1]
+
+                targets = [t for t in self._expiring(db, member_ids, cutoff) if t["expire"] > 0]
+                if targets and not dry_run:
+                    self._apply(db, targets, now)
+                if not dry_run:
+                    db.commit()
+
+                report["chunks"] += 1
+                report["members_scanned"] += len(member_ids)
+                report["members_expired"] += len(targets)
+                report["points_expired"] += sum(t["expire"] for t in targets)
+                room = REPORT_SAMPLE_SIZE - len(report["details"])
+                if room > 0:
+                    report["details"].extend(targets[:room])
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        logger.info(
+            f"Point expiry{' (dry-run)' if dry_run else ''}: "
+            f"{report['members_expired']}/{report['members_scanned']} members, -{report['points_expired']}P"
+        )
+        return report
@@ -0,0 +1,157 @@
+"""
+QueueWaitEstimator - 웨이팅 예상 대기시간 추정 서비스
+"""
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from src.commerce.domain.models_gap import WaitingTicket
+
+logger = logging.getLogger(__name__)
+
+
+class QueueWaitEstimator:
+    """
+    매장별 호출 이력으로 예상 대기시간을 계산합니다.
+
+    통계는 호출(CALLED) 이벤트가 들어올 때마다 지수가중이동평균(EWMA)으로
+    누적되므로, 웨이팅 등록 시 과거 이력을 다시 조회하지 않습니다.
+      - 매장별 처리 간격 (연속 호출 사이의 분) → 서비스 속도 = 1 / 간격
+      - (매장, 시간대, 인원 구간)별 created_at → called_at 대기시간
+    """
+
+    def __init__(self, alpha: float = 0.2, max_gap_min: float = 60.0, seed_limit: int = 50):
+        self.alpha = alpha
+        self.max_gap_min = max_gap_min  # 영업 공백 등 비정상 간격은 학습에서 제외
+        self.seed_limit = seed_limit
+
+        self._lock = threading.Lock()
+        self._gap: Dict[int, float] = {}                       # store_id → 팀당 처리 간격(분)
+        self._last_call: Dict[int, datetime] = {}              # store_id → 마지막 호출 시각
+        self._store_wait: Dict[int, float] = {}                # store_id → 평균 대기시간(분)
+        self._bucket_wait: Dict[Tuple[int, int, int], float] = {}  # (store, hour, size) → 평균 대기시간(분)
+        self._seeded = set()
+
+    # -------------------------------------------------
+    # 내부 유틸
+    # -------------------------------------------------
+
+    @staticmethod
+    def size_bucket(head_count: Optional[int]) -> int:
+        """인원 구간: 0 = 1~2명, 1 = 3~4명, 2 = 5명 이상"""
+        n = head_count or 1
+        if n <= 2:
+            return 0
+        if n <= 4:
+            return 1
+        return 2
+
+    def _ewma(self, prev: Optional[float], value: float) -> float:
+        if prev is None:
+            return value
+        return prev + self.alpha * (value - prev)
+
+    @staticmethod
+    def _naive(dt: datetime) -> datetime:
+        return dt.replace(tzinfo=None) if dt.tzinfo else dt
+
+    # -------------------------------------------------
+    # 학습 (증분 갱신)
+    # -------------------------------------------------
+
+    def _observe_locked(self, store_id: int, created_at: datetime, called_at: datetime, head_count: Optional[int]):
+        created_at = self._naive(created_at)
+        called_at = self._naive(called_at)
+
+        # 1. 처리 간격 → 서비스 속도
+        last = self._last_call.get(store_id)
+        if last is not None and called_at > last:
+            gap_min = (called_at - last).total_seconds() / 60.0
+            if gap_min <= self.max_gap_min:
+                self._gap[store_id] = self._ewma(self._gap.get(store_id), gap_min)
+        if last is None or called_at > last:
+            self._last_call[store_id] = called_at
+
+        # 2. 시간대/인원별 대기시간
+        wait_min = (called_at - created_at).total_seconds() / 60.0
+        if wait_min < 0:
+            return
+        key = (store_id, created_at.hour, self.size_bucket(head_count))
+        self._bucket_wait[key] = self._ewma(self._bucket_wait.get(key), wait_min)
+        self._store_wait[store_id] = self._ewma(self._store_wait.get(store_id), wait_min)
+
+    def observe_call(self, store_id: int, created_at: datetime, called_at: datetime, head_count: Optional[int] = None):
+        """호출 1건을 통계에 반영"""
+        with self._lock:
+            self._observe_locked(store_id, created_at, called_at, head_count)
+
+    def ensure_seeded(self, db: Session, store_id: int):
+        """
+        프로세스 기동 후 매장별 최초 1회만 최근 호출 이력으로 통계를 채웁니다.
+        """
+        if store_id in self._seeded:
+            return
+
+        recent = db.query(
+            WaitingTicket.created_at, WaitingTicket.called_at, WaitingTicket.head_count
+        ).filter(
+            WaitingTicket.store_id == store_id,
+            WaitingTicket.called_at.isnot(None)
+        ).order_by(WaitingTicket.called_at.desc()).limit(self.seed_limit).all()
+
+        with self._lock:
+            if store_id in self._seeded:
+                return
+            for created_at, called_at, head_count in reversed(recent):
+                if created_at and called_at:
+                    self._observe_locked(store_id, created_at, called_at, head_count)
+            self._seeded.add(store_id)
+
+        logger.info(f"Queue stats seeded: store {store_id} ({len(recent)} calls)")
+
+    # -------------------------------------------------
+    # 추정
+    # -------------------------------------------------
+
+    def service_rate(self, store_id: int) -> Optional[float]:
+        """분당 처리 팀 수 (데이터가 없으면 None)"""
+        gap = self._gap.get(store_id)
+        if not gap:
+            return None
+        return 1.0 / gap
+
+    def estimate_wait_min(self, store_id: int, ahead_teams: int, head_count: Optional[int] = None,
+                          at: Optional[datetime] = None) -> Optional[int]:
+        """
+        예상 대기시간(분)
+
+        (앞 팀 수 + 1) × 팀당 처리 간격을 기본값으로 하고,
+        시간대/인원 구간의 평균 대기시간이 매장 평균 대비 길거나 짧으면 보정합니다.
+        학습 데이터가 전혀 없으면 None을 반환합니다.
+        """
+        at = at or datetime.now()
+        with self._lock:
+            gap = self._gap.get(store_id)
+            bucket = self._bucket_wait.get((store_id, at.hour, self.size_bucket(head_count)))
+            store_avg = self._store_wait.get(store_id)
+
+        if gap:
+            estimate = (ahead_teams + 1) * gap
+            if bucket is not None and store_avg:
+                factor = min(max(bucket / store_avg, 0.5), 2.0)
+                estimate *= factor
+        elif bucket is not None:
+            estimate = bucket
+        elif store_avg is not None:
+            estimate = store_avg
+        else:
+            return None
+
+        return max(1, round(estimate))
+
+
+# 싱글톤 인스턴스
+queue_estimator = QueueWaitEstimator()
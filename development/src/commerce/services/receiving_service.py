@@ -0,0 +1,97 @@
+"""
+ReceivingService - 입고 예정(발주) 입고 확정 및 재고 반영
+"""
+import logging
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import exists, func, insert, literal, select, update
+from sqlalchemy.orm import Session
+
+from src.commerce.domain.models import ExpectedDelivery, ExpectedDeliveryItem, ExpectedDeliveryStatus
+from src.commerce.domain.models_gap_v2 import InventoryItem
+
+logger = logging.getLogger(__name__)
+
+
+class AlreadyReceivedError(Exception):
+    """이미 입고 확정된 발주"""
+    pass
+
+
+class ReceivingService:
+    """
+    입고 확정을 품목 수와 무관하게 고정된 수의 SQL 문으로 처리합니다.
+
+    1. 상태 전환: status != RECEIVED 조건부 UPDATE (동시 확정 시 한 요청만 성공)
+    2. 품목 received_qty = quantity 일괄 UPDATE
+    3. 재고: 매장 내 같은 item_name의 InventoryItem.current_qty에 입고 수량 합계를 더하는 UPDATE 1회,
+       재고 마스터에 없는 품목은 INSERT ... SELECT 1회로 신규 등록 (재고 수동 입고 API와 같은 매칭 규칙)
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def receive(self, delivery: ExpectedDelivery, now: Optional[datetime] = None) -> List[dict]:
+        """입고 확정 (커밋 포함). 반환값은 Webhook용 품목 목록"""
+        now = now or datetime.now()
+
+        transitioned = self.db.execute(
+            update(ExpectedDelivery)
+            .where(ExpectedDelivery.id == delivery.id, ExpectedDelivery.status != ExpectedDeliveryStatus.RECEIVED)
+            .values(status=ExpectedDeliveryStatus.RECEIVED, received_at=now)
+        ).rowcount
+        if not transitioned:
+            self.db.rollback()
+            raise AlreadyReceivedError(delivery.po_number)
+
+        self.db.execute(
+            update(ExpectedDeliveryItem)
+            .where(ExpectedDeliveryItem.delivery_id == delivery.id)
+            .values(received_qty=ExpectedDeliveryItem.quantity)
+        )
+
+        received_qty = (
+            select(func.coalesce(func.sum(ExpectedDeliveryItem.quantity), 0))
+            .where(
+                ExpectedDeliveryItem.delivery_id == delivery.id,
+                ExpectedDeliveryItem.item_name == InventoryItem.item_name
+            )
+            .scalar_subquery()
+        )
+        delivery_item_names = select(ExpectedDeliveryItem.item_name).where(ExpectedDeliveryItem.delivery_id == delivery.id)
+        self.db.execute(
+            update(InventoryItem)
+            .where(InventoryItem.store_id == delivery.store_id, InventoryItem.item_name.in_(delivery_item_names))
+            .values(current_qty=InventoryItem.current_qty + received_qty, last_updated=now)
+            .execution_options(synchronize_session=False)
+        )
+
+        not_stocked = (
+            select(
+                literal(delivery.store_id), ExpectedDeliveryItem.item_name,
+                func.sum(ExpectedDeliveryItem.quantity), func.lower(func.min(ExpectedDeliveryItem.unit)), literal(now)
+            )
+            .where(
+                ExpectedDeliveryItem.delivery_id == delivery.id,
+                ~exists().where(
+                    InventoryItem.store_id == delivery.store_id,
+                    InventoryItem.item_name == ExpectedDeliveryItem.item_name
+                )
+            )
+            .group_by(ExpectedDeliveryItem.item_name)
+        )
+        self.db.execute(
+            insert(InventoryItem).from_select(
+                ["store_id", "item_name", "current_qty", "unit", "last_updated"], not_stocked
+            )
+        )
+        self.db.commit()
+
+        items = self.db.execute(
+            select(ExpectedDeliveryItem.item_code, ExpectedDeliveryItem.item_name, ExpectedDeliveryItem.received_qty)
+            .where(ExpectedDeliveryItem.delivery_id == delivery.id)
+            .order_by(ExpectedDeliveryItem.id)
+        ).all()
+        logger.info(f"Delivery received: {delivery.po_number} ({len(items)} items)")
+        return [{"item_code": code, "item_name": name, "quantity": qty} for code, name, qty in items]
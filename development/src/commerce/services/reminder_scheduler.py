@@ -0,0 +1,279 @@
+"""
+ReminderScheduler - 예약 리마인더 발송 스케줄러
+"""
+import asyncio
+import heapq
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from src.database.engine import SessionLocal
+from src.commerce.domain.models_phase2 import Reservation, ReservationStatus
+from src.application.sending_service import SendingService
+from src.domain.schemas import MessageRequest, Recipient, ChannelType, ContentType
+
+logger = logging.getLogger(__name__)
+
+# 발송 실패 시 재시도 (지수 백오프, 예약 시작 전까지만)
+MAX_SEND_ATTEMPTS = 5
+RETRY_BACKOFF = timedelta(seconds=30)
+MAX_RETRY_BACKOFF = timedelta(minutes=10)
+
+
+class ReminderScheduler:
+    """
+    예약 시작 lead 전에 리마인더를 발송합니다.
+
+    - 발송 예정 건은 (due_at, reservation_id) 최소 힙에 보관하고, 가장 이른 due_at까지만 잠듭니다.
+    - 새 예약이 들어오면 schedule()이 힙에 넣고 스케줄러를 깨웁니다.
+    - 재기동 시에는 앞으로 window(기본 24시간) 안의 미발송 예약만 다시 적재합니다.
+    - 발송 성공 건의 is_notified는 배치 단위 UPDATE 한 번으로 기록합니다.
+    - 발송 실패 건은 백오프 후 힙에 다시 넣고, MAX_SEND_ATTEMPTS회 또는 예약 시작 시각을 넘기면 포기합니다.
+    """
+
+    def __init__(
+        self,
+        sending_service: Optional[SendingService] = None,
+        session_factory=SessionLocal,
+        lead: timedelta = timedelta(hours=1),
+        window: timedelta = timedelta(hours=24),
+        batch_size: int = 100,
+        channel: ChannelType = ChannelType.SMS
+    ):
+        self.sending_service = sending_service
+        self.session_factory = session_factory
+        self.lead = lead
+        self.window = window
+        self.batch_size = batch_size
+        self.channel = channel
+
+        self._heap: List[Tuple[datetime, str]] = []
+        self._scheduled: Dict[str, datetime] = {}  # reservation_id → due_at (중복/변경 감지)
+        self._attempts: Dict[str, int] = {}        # reservation_id → 실패 횟수
+        self._lock = threading.Lock()
+        self._horizon: Optional[datetime] = None   # 적재 완료된 구간의 끝 (예약 시각 기준)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    # -------------------------------------------------
+    # 적재
+    # -------------------------------------------------
+
+    def _push(self, reservation_id: str, reserved_at: datetime) -> bool:
+        return self._push_due(reservation_id, reserved_at - self.lead)
+
+    def _push_due(self, reservation_id: str, due_at: datetime) -> bool:
+        with self._lock:
+            if self._scheduled.get(reservation_id) == due_at:
+                return False
+            self._scheduled[reservation_id] = due_at
+            heapq.heappush(self._heap, (due_at, reservation_id))
+            return True
+
+    def schedule(self, reservation_id: str, reserved_at: datetime):
+        """
+        신규/변경 예약 등록 (요청 스레드에서 호출 가능)
+        적재 구간 밖의 예약은 다음 구간 적재 시 자동으로 포함됩니다.
+        스케줄러가 동작 중이 아니면 무시합니다. (기동 시 구간 적재로 포함되며, 미기동 시 힙이 계속 커지지 않도록)
+        """
+        if self._loop is None or self._horizon is None or reserved_at > self._horizon:
+            return
+        if self._push(reservation_id, reserved_at):
+            self._wake()
+
+    def _wake(self):
+        if self._loop and self._wakeup:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def _load_window_sync(self, now: datetime) -> int:
+        horizon = now + self.window
+        db: Session = self.session_factory()
+        try:
+            rows = db.query(Reservation.id, Reservation.reserved_at).filter(
+                Reservation.status == ReservationStatus.CONFIRMED,
+                Reservation.is_notified == False,
+                Reservation.reserved_at > now,
+                Reservation.reserved_at <= horizon
+            ).all()
+        finally:
+            db.close()
+
+        for reservation_id, reserved_at in rows:
+            if reservation_id in self._attempts:
+                continue  # 재시도 대기 중 (백오프 시각 유지)
+            self._push(reservation_id, reserved_at.replace(tzinfo=None))
+        self._horizon = horizon
+        return len(rows)
+
+    async def load_window(self, now: Optional[datetime] = None) -> int:
+        """앞으로 window 안의 미발송 예약 적재"""
+        count = await asyncio.to_thread(self._load_window_sync, now or datetime.now())
+        logger.info(f"[Reminder] Loaded {count} reservations until {self._horizon}")
+        return count
+
+    # -------------------------------------------------
+    # 발송
+    # -------------------------------------------------
+
+    def _pop_due(self, now: datetime) -> List[str]:
+        due = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now and len(due) < self.batch_size:
+                due_at, reservation_id = heapq.heappop(self._heap)
+                if self._scheduled.get(reservation_id) != due_at:
+                    continue  # 예약 시각이 변경되어 새 항목으로 대체됨
+                del self._scheduled[reservation_id]
+                due.append(reservation_id)
+        return due
+
+    def _fetch_sync(self, ids: List[str]) -> List[Reservation]:
+        db: Session = self.session_factory()
+        try:
+            return db.query(Reservation).filter(
+                Reservation.id.in_(ids),
+                Reservation.status == ReservationStatus.CONFIRMED,
+                Reservation.is_notified == False
+            ).all()
+        finally:
+            db.close()
+
+    def _mark_notified_sync(self, ids: List[str]):
+        db: Session = self.session_factory()
+        try:
+            db.execute(update(Reservation).where(Reservation.id.in_(ids)).values(is_notified=True))
+            db.commit()
+        finally:
+            db.close()
+
+    def _build_message(self, reservation: Reservation) -> MessageRequest:
+        reserved_at = reservation.reserved_at.strftime("%m/%d %H:%M")
+        return MessageRequest(
+            request_id=f"rsv-remind-{reservation.id}",
+            channel=self.channel,
+            recipients=[Recipient(name=reservation.guest_name, phone=reservation.guest_phone)],
+            subject="예약 알림",
+            body=f"{reservation.guest_name}님, {reserved_at} 예약({reservation.guest_count}명)이 곧 시작됩니다.",
+            content_type=ContentType.TEXT,
+            metadata={"reservation_id": reservation.id, "store_id": reservation.store_id}
+        )
+
+    async def fire_due(self, now: Optional[datetime] = None) -> int:
+        """due_at이 지난 리마인더를 배치로 발송하고 성공 건수를 반환"""
+        now = now or datetime.now()
+        sent_total = 0
+
+        while True:
+            ids = self._pop_due(now)
+            if not ids:
+                break
+
+            reservations = await asyncio.to_thread(self._fetch_sync, ids)
+            targets = []
+            for r in reservations:
+                reserved_at = r.reserved_at.replace(tzinfo=None)
+                if reserved_at - self.lead > now:
+                    self._push(r.id, reserved_at)  # DB상 예약 시각이 뒤로 변경됨
+                else:
+                    targets.append(r)
+
+            if not targets:
+                continue
+
+            results = await asyncio.gather(
+                *(self.sending_service.dispatch(self._build_message(r)) for r in targets),
+                return_exceptions=True
+            )
+            sent_ids, failed = [], []
+            for r, res in zip(targets, results):
+                if not isinstance(res, Exception) and res.success:
+                    sent_ids.append(r.id)
+                    self._attempts.pop(r.id, None)
+                else:
+                    failed.append(r)
+            if failed:
+                self._retry_later(failed, now)
+
+            if sent_ids:
+                await asyncio.to_thread(self._mark_notified_sync, sent_ids)
+                sent_total += len(sent_ids)
+
+        return sent_total
+
+    def _retry_later(self, failed: List[Reservation], now: datetime):
+        retried, dropped = 0, []
+        for r in failed:
+            attempts = self._attempts.get(r.id, 0) + 1
+            retry_at = now + min(RETRY_BACKOFF * (2 ** (attempts - 1)), MAX_RETRY_BACKOFF)
+            if attempts >= MAX_SEND_ATTEMPTS or retry_at >= r.reserved_at.replace(tzinfo=None):
+                self._attempts.pop(r.id, None)
+                dropped.append(r.id)
+                continue
+            self._attempts[r.id] = attempts
+            self._push_due(r.id, retry_at)
+            retried += 1
+        if retried:
+            logger.warning(f"[Reminder] {retried} reminders failed, retrying with backoff")
+        if dropped:
+            logger.error(f"[Reminder] Giving up on {len(dropped)} reminders: {dropped[:10]}")
+
+    # -------------------------------------------------
+    # 메인 루프
+    # -------------------------------------------------
+
+    def _next_wakeup(self, now: datetime) -> float:
+        """다음 due_at 또는 다음 구간 적재 시각 중 빠른 쪽까지 남은 초"""
+        # 구간 끝에서 lead만큼 당겨야 경계의 예약도 제때 발송됨
+        candidates = [self._horizon - self.window / 2] if self._horizon else []
+        with self._lock:
+            if self._heap:
+                candidates.append(self._heap[0][0])
+        if not candidates:
+            return self.window.total_seconds()
+        return max((min(candidates) - now).total_seconds(), 0.0)
+
+    async def run(self):
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        logger.info("[Reminder] Scheduler Started.")
+
+        await self.load_window()
+        while True:
+            try:
+                now = datetime.now()
+                if self._horizon and now >= self._horizon - self.window / 2:
+                    await self.load_window(now)
+                await self.fire_due(now)
+            except Exception as e:
+                logger.error(f"[Reminder] Error: {e}")
+
+            self._wakeup.clear()
+            timeout = self._next_wakeup(datetime.now())
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self, sending_service: Optional[SendingService] = None) -> asyncio.Task:
+        if sending_service:
+            self.sending_service = sending_service
+        self._task = asyncio.create_task(self.run())
+        return self._task
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._loop = None
+
+
+# 싱글톤 인스턴스
+reminder_scheduler = ReminderScheduler()
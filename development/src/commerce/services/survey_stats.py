@@ -0,0 +1,226 @@
+"""
+SurveyStatsService - 만족도 집계 (증분 갱신 + 태그 색인)
+"""
+import logging
+from datetime import date, datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from src.commerce.domain.models_gap import (
+    CustomerSurvey, SurveyStat, SurveyDailyStat, SurveyTag, SurveyTagStat
+)
+from src.database.upsert import dialect_insert
+
+logger = logging.getLogger(__name__)
+
+# 태그 최대 길이 (SurveyTag.tag 컬럼 크기)
+MAX_TAG_LENGTH = 50
+
+# 재집계 시 설문 조회 배치 크기
+REBUILD_BATCH_SIZE = 1000
+
+
+def parse_tags(tags: Optional[str]) -> List[str]:
+    """CSV 태그 문자열 → 정규화된 태그 목록 (공백 정리, 중복 제거, 입력 순서 유지)"""
+    if not tags:
+        return []
+    result = []
+    for raw in tags.split(","):
+        tag = " ".join(raw.split())[:MAX_TAG_LENGTH]
+        if tag and tag not in result:
+            result.append(tag)
+    return result
+
+
+def rating_bucket(rating: float) -> int:
+    """평점 → 분포 구간 (1~5)"""
+    return min(5, max(1, int(rating + 0.5)))
+
+
+def _day_of(dt: datetime) -> date:
+    return (dt.astimezone().replace(tzinfo=None) if dt.tzinfo else dt).date()
+
+
+class SurveyStatsService:
+    """
+    매장별 만족도 집계
+
+    submit 시점에 누적 집계(건수/합계/분포), 일별 집계, 태그 색인을 UPSERT로 갱신하므로
+    통계 조회는 전체 설문을 스캔하지 않고 집계 행만 읽습니다.
+    record()는 커밋하지 않으므로 설문 저장과 같은 트랜잭션으로 묶을 수 있습니다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _upsert_add(self, model, keys: dict, increments: dict, extra: Optional[dict] = None):
+        """키 행이 없으면 생성, 있으면 값 누적 (INSERT ... ON CONFLICT DO UPDATE)"""
+        stmt = dialect_insert(self.db, model).values(**keys, **increments, **(extra or {}))
+        set_ = {col: getattr(model, col) + getattr(stmt.excluded, col) for col in increments}
+        set_.update({col: getattr(stmt.excluded, col) for col in (extra or {})})
+        self.db.execute(stmt.on_conflict_do_update(
+            index_elements=[getattr(model, k) for k in keys],
+            set_=set_
+        ))
+
+    def record(self, survey: CustomerSurvey):
+        """신규 설문 1건을 집계에 반영 (survey.id가 할당된 상태여야 함)"""
+        bucket = f"rating_{rating_bucket(survey.rating)}"
+        self._upsert_add(
+            SurveyStat,
+            {"store_id": survey.store_id},
+            {"review_count": 1, "rating_sum": survey.rating, bucket: 1},
+            {"updated_at": survey.created_at}
+        )
+        self._upsert_add(
+            SurveyDailyStat,
+            {"store_id": survey.store_id, "day": _day_of(survey.created_at)},
+            {"review_count": 1, "rating_sum": survey.rating}
+        )
+
+        tags = parse_tags(survey.tags)
+        if tags:
+            self.db.execute(insert(SurveyTag), [
+                {"survey_id": survey.id, "tag": tag, "store_id": survey.store_id,
+                 "rating": survey.rating, "created_at": survey.created_at}
+                for tag in tags
+            ])
+            for tag in tags:
+                self._upsert_add(
+                    SurveyTagStat,
+                    {"store_id": survey.store_id, "tag": tag},
+                    {"tag_count": 1, "rating_sum": survey.rating}
+                )
+
+    # -------------------------------------------------
+    # 조회
+    # -------------------------------------------------
+
+    def summary(self, store_id: int) -> dict:
+        stat = self.db.get(SurveyStat, store_id)
+        if not stat or not stat.review_count:
+            return {"average_rating": 0.0, "total_reviews": 0, "distribution": {str(i): 0 for i in range(1, 6)}}
+        return {
+            "average_rating": round(stat.rating_sum / stat.review_count, 1),
+            "total_reviews": stat.review_count,
+            "distribution": {str(i): getattr(stat, f"rating_{i}") or 0 for i in range(1, 6)}
+        }
+
+    def trend(self, store_id: int, days: int = 30, today: Optional[date] = None) -> List[dict]:
+        """최근 N일 일별 평점 추이 (설문 없는 날은 0건으로 채움)"""
+        today = today or date.today()
+        start = today - timedelta(days=days - 1)
+        rows = {
+            r.day: r for r in self.db.query(SurveyDailyStat).filter(
+                SurveyDailyStat.store_id == store_id,
+                SurveyDailyStat.day >= start,
+                SurveyDailyStat.day <= today
+            )
+        }
+        result = []
+        for i in range(days):
+            day = start + timedelta(days=i)
+            r = rows.get(day)
+            count = r.review_count if r else 0
+            result.append({
+                "date": str(day),
+                "reviews": count,
+                "average_rating": round(r.rating_sum / count, 2) if count else None
+            })
+        return result
+
+    def top_tags(self, store_id: int, limit: int = 10) -> List[dict]:
+        rows = self.db.query(SurveyTagStat).filter(
+            SurveyTagStat.store_id == store_id
+        ).order_by(SurveyTagStat.tag_count.desc(), SurveyTagStat.tag).limit(limit).all()
+        return [
+            {"tag": r.tag, "count": r.tag_count, "average_rating": round(r.rating_sum / r.tag_count, 2)}
+            for r in rows if r.tag_count
+        ]
+
+    def rating_by_tag(self, store_id: int, tag: str, since: Optional[datetime] = None) -> dict:
+        """태그별 평점 (기간 지정 시 태그 색인에서 범위 집계)"""
+        if since is None:
+            stat = self.db.get(SurveyTagStat, (store_id, tag))
+            count, total = (stat.tag_count, stat.rating_sum) if stat else (0, 0.0)
+        else:
+            count, total = self.db.execute(
+                select(func.count(), func.coalesce(func.sum(SurveyTag.rating), 0.0)).where(
+                    SurveyTag.store_id == store_id,
+                    SurveyTag.tag == tag,
+                    SurveyTag.created_at >= since
+                )
+            ).one()
+        return {
+            "tag": tag,
+            "count": count,
+            "average_rating": round(total / count, 2) if count else None
+        }
+
+    # -------------------------------------------------
+    # 재집계 (기존 데이터 백필 / 정합성 복구)
+    # -------------------------------------------------
+
+    def rebuild(self, store_id: Optional[int] = None) -> int:
+        """집계/태그 색인을 원본 설문에서 다시 생성하고 처리한 설문 수를 반환"""
+        def scoped(model):
+            return delete(model).where(model.store_id == store_id) if store_id is not None else delete(model)
+
+        for model in (SurveyTagStat, SurveyTag, SurveyDailyStat, SurveyStat):
+            self.db.execute(scoped(model))
+
+        stats = {}
+        daily = {}
+        tag_stats = {}
+        processed = 0
+
+        query = select(
+            CustomerSurvey.id, CustomerSurvey.store_id, CustomerSurvey.rating,
+            CustomerSurvey.tags, CustomerSurvey.created_at
+        ).where(CustomerSurvey.rating.isnot(None)).order_by(CustomerSurvey.id)
+        if store_id is not None:
+            query = query.where(CustomerSurvey.store_id == store_id)
+
+        for batch in self.db.execute(query.execution_options(yield_per=REBUILD_BATCH_SIZE)).partitions():
+            tag_rows = []
+            for survey_id, sid, rating, tags, created_at in batch:
+                processed += 1
+                stat = stats.setdefault(sid, {"store_id": sid, "review_count": 0, "rating_sum": 0.0,
+                                              "rating_1": 0, "rating_2": 0, "rating_3": 0, "rating_4": 0,
+                                              "rating_5": 0, "updated_at": created_at})
+                stat["review_count"] += 1
+                stat["rating_sum"] += rating
+                stat[f"rating_{rating_bucket(rating)}"] += 1
+                if created_at and (stat["updated_at"] is None or created_at > stat["updated_at"]):
+                    stat["updated_at"] = created_at
+
+                if created_at:
+                    day = daily.setdefault((sid, _day_of(created_at)), {"review_count": 0, "rating_sum": 0.0})
+                    day["review_count"] += 1
+                    day["rating_sum"] += rating
+
+                for tag in parse_tags(tags):
+                    tag_rows.append({"survey_id": survey_id, "tag": tag, "store_id": sid,
+                                     "rating": rating, "created_at": created_at})
+                    agg = tag_stats.setdefault((sid, tag), {"tag_count": 0, "rating_sum": 0.0})
+                    agg["tag_count"] += 1
+                    agg["rating_sum"] += rating
+            if tag_rows:
+                self.db.execute(insert(SurveyTag), tag_rows)
+
+        if stats:
+            self.db.execute(insert(SurveyStat), list(stats.values()))
+        if daily:
+            self.db.execute(insert(SurveyDailyStat), [
+                {"store_id": sid, "day": day, **agg} for (sid, day), agg in daily.items()
+            ])
+        if tag_stats:
+            self.db.execute(insert(SurveyTagStat), [
+                {"store_id": sid, "tag": tag, **agg} for (sid, tag), agg in tag_stats.items()
+            ])
+        self.db.commit()
+
+        logger.info(f"Survey stats rebuilt: {processed} surveys, {len(stats)} stores, {len(tag_stats)} tags")
+        return processed
@@ -0,0 +1,356 @@
+"""
+BulkSyncService - TgMain 일괄 동기화 (발주서 / 거래처 / 품목)
+"""
+import json
+import logging
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import and_, bindparam, insert, or_, select, tuple_, update
+from sqlalchemy.orm import Session
+
+from src.commerce.domain.models import (
+    ExpectedDelivery, ExpectedDeliveryItem, ExpectedDeliveryStatus,
+    SyncLog, SyncDirection, Vendor, Product, Category
+)
+
+logger = logging.getLogger(__name__)
+
+# IN 조회 1회당 키 수 (DB 바인드 변수 제한 대응)
+IN_CHUNK_SIZE = 500
+
+# 요청 1건당 최대 요소 수
+MAX_BATCH_SIZE = 5000
+
+PROCESSED = "processed"
+ALREADY_PROCESSED = "already_processed"
+SKIPPED = "skipped"
+
+
+def _chunks(values: List, size: int = IN_CHUNK_SIZE) -> Iterable[List]:
+    for i in range(0, len(values), size):
+        yield values[i:i + size]
+
+
+def _parse_date(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        return None
+
+
+class _BatchResults:
+    """요소 순서대로의 처리 결과"""
+
+    def __init__(self, size: int):
+        self.items: List[Optional[dict]] = [None] * size
+        self.positions: Dict[str, int] = {}  # 신규 요소 idempotency_key → 요청 내 위치
+
+    def set(self, element: dict, result: dict):
+        self.items[self.positions[element["idempotency_key"]]] = {"idempotency_key": element["idempotency_key"], **result}
+
+
+class BulkSyncService:
+    """
+    배열로 받은 동기화 요소를 한 트랜잭션에서 일괄 처리합니다.
+
+    - Idempotency: 요소별 키를 IN 조회 한 번으로 확인하여 이미 처리된 요소는 건너뜀
+    - Upsert: 기존 행을 IN 조회로 찾은 뒤 갱신분은 executemany UPDATE, 신규분은 executemany INSERT
+    - SyncLog: 처리된 요소별 로그를 executemany INSERT 한 번으로 기록
+    호출 측에서 elements의 각 항목은 {"idempotency_key": ..., <데이터>: dict} 형태로 전달합니다.
+    """
+
+    def __init__(self, db: Session, store_id: int, source_system: str):
+        self.db = db
+        self.store_id = store_id
+        self.source_system = source_system
+
+    # -------------------------------------------------
+    # 공통
+    # -------------------------------------------------
+
+    def processed_keys(self, keys: List[str]) -> Set[str]:
+        """이미 성공 처리된 idempotency_key"""
+        done = set()
+        for chunk in _chunks(list(set(keys))):
+            done.update(self.db.execute(
+                select(SyncLog.idempotency_key).where(
+                    SyncLog.idempotency_key.in_(chunk),
+                    SyncLog.status == "SUCCESS"
+                )
+            ).scalars())
+        return done
+
+    def _split(self, elements: List[dict]) -> Tuple[List[dict], "_BatchResults"]:
+        """(신규 요소, 결과) - 이미 처리된 키와 배치 내 중복 키는 결과를 미리 채움"""
+        done = self.processed_keys([e["idempotency_key"] for e in elements])
+        fresh, results = [], _BatchResults(len(elements))
+        for i, e in enumerate(elements):
+            key = e["idempotency_key"]
+            if key in done or key in results.positions:
+                results.items[i] = {"idempotency_key": key, "status": ALREADY_PROCESSED}
+                continue
+            results.positions[key] = i
+            fresh.append(e)
+        return fresh, results
+
+    def _write_logs(self, event_type: str, endpoint: str, entries: List[Tuple[dict, dict]]):
+        """SyncLog 일괄 기록 (executemany)"""
+        if not entries:
+            return
+        now = datetime.now()
+        self.db.execute(insert(SyncLog), [
+            {
+                "idempotency_key": element["idempotency_key"],
+                "direction": SyncDirection.INBOUND,
+                "event_type": event_type,
+                "endpoint": endpoint,
+                "payload": json.dumps(
+                    {"source_system": self.source_system, "target_store_id": self.store_id, **element},
+                    ensure_ascii=False
+                ),
+                "response": json.dumps(response, ensure_ascii=False),
+                "status": "SUCCESS",
+                "processed_at": now
+            }
+            for element, response in entries
+        ])
+
+    # -------------------------------------------------
+    # 거래처
+    # -------------------------------------------------
+
+    def _upsert_vendors(self, vendors: Dict[int, dict]) -> Dict[int, Tuple[int, str]]:
+        """external_id → (vendor.id, action)"""
+        now = datetime.now()
+        external_ids = list(vendors)
+        existing = {}
+        for chunk in _chunks(external_ids):
+            existing.update(self.db.execute(
+                select(Vendor.external_id, Vendor.id).where(
+                    Vendor.store_id == self.store_id,
+                    Vendor.external_id.in_(chunk)
+                )
+            ).all())
+
+        updates = [
+            {"b_id": existing[ext_id], "b_name": v["vendor_name"], "b_phone": v.get("vendor_phone"),
+             "b_email": v.get("vendor_email"), "b_address": v.get("vendor_address"), "b_updated_at": now}
+            for ext_id, v in vendors.items() if ext_id in existing
+        ]
+        if updates:
+            table = Vendor.__table__
+            self.db.execute(
+                update(table).where(table.c.id == bindparam("b_id")).values(
+                    name=bindparam("b_name"), phone=bindparam("b_phone"), email=bindparam("b_email"),
+                    address=bindparam("b_address"), updated_at=bindparam("b_updated_at")
+                ),
+                updates
+            )
+
+        new_ids = [ext_id for ext_id in external_ids if ext_id not in existing]
+        if new_ids:
+            self.db.execute(insert(Vendor), [
+                {"store_id": self.store_id, "external_id": ext_id, "name": vendors[ext_id]["vendor_name"],
+                 "phone": vendors[ext_id].get("vendor_phone"), "email": vendors[ext_id].get("vendor_email"),
+                 "address": vendors[ext_id].get("vendor_address"), "is_active": True}
+                for ext_id in new_ids
+            ])
+            for chunk in _chunks(new_ids):
+                for ext_id, vendor_id in self.db.execute(
+                    select(Vendor.external_id, Vendor.id).where(
+                        Vendor.store_id == self.store_id,
+                        Vendor.external_id.in_(chunk)
+                    )
+                ):
+                    existing.setdefault(ext_id, vendor_id)
+
+        return {ext_id: (existing[ext_id], "created" if ext_id in new_ids else "updated") for ext_id in external_ids}
+
+    def sync_vendors(self, elements: List[dict]) -> List[dict]:
+        """elements: [{"idempotency_key", "vendor": VendorInfo dict}]"""
+        fresh, results = self._split(elements)
+        if not fresh:
+            return results.items
+
+        # 배치 내 같은 거래처는 마지막 값 기준
+        vendors = {e["vendor"]["vendor_id"]: e["vendor"] for e in fresh}
+        upserted = self._upsert_vendors(vendors)
+
+        logs = []
+        for e in fresh:
+            vendor_id, action = upserted[e["vendor"]["vendor_id"]]
+            response = {"vendor_id": vendor_id, "action": action}
+            logs.append((e, response))
+            results.set(e, {"status": PROCESSED, **response})
+
+        self._write_logs("VENDOR_SYNC", "/api/v1/sync/vendors/batch", logs)
+        self.db.commit()
+        logger.info(f"Bulk vendor sync: {len(fresh)} processed, {len(elements) - len(fresh)} skipped")
+        return results.items
+
+    # -------------------------------------------------
+    # 품목
+    # -------------------------------------------------
+
+    def _ensure_categories(self, names: Set[str]) -> Dict[str, int]:
+        names = list(names)
+        found: Dict[str, int] = {}
+
+        def load(chunk):
+            for name, category_id in self.db.execute(
+                select(Category.name, Category.id).where(
+                    Category.store_id == self.store_id,
+                    Category.name.in_(chunk)
+                ).order_by(Category.id)
+            ):
+                found.setdefault(name, category_id)
+
+        for chunk in _chunks(names):
+            load(chunk)
+        missing = [n for n in names if n not in found]
+        if missing:
+            self.db.execute(insert(Category), [
+                {"store_id": self.store_id, "name": n, "display_order": 0} for n in missing
+            ])
+            for chunk in _chunks(missing):
+                load(chunk)
+        return found
+
+    def sync_items(self, elements: List[dict]) -> List[dict]:
+        """elements: [{"idempotency_key", "item": InventoryItemData dict}]"""
+        fresh, results = self._split(elements)
+        if not fresh:
+            return results.items
+
+        categories = self._ensure_categories({e["item"]["category_name"] for e in fresh if e["item"].get("category_name")})
+
+        # (상품명, 카테고리) 기준 매칭 - 단건 API와 동일한 규칙
+        items: Dict[Tuple[str, Optional[int]], dict] = {}
+        for e in fresh:
+            item = e["item"]
+            items[(item["item_name"], categories.get(item.get("category_name")))] = item
+
+        keys = list(items)
+        existing: Dict[Tuple[str, Optional[int]], int] = {}
+
+        def load(chunk):
+            with_category = [k for k in chunk if k[1] is not None]
+            without_category = [k[0] for k in chunk if k[1] is None]
+            conditions = []
+            if with_category:
+                conditions.append(tuple_(Product.name, Product.category_id).in_(with_category))
+            if without_category:
+                conditions.append(and_(Product.name.in_(without_category), Product.category_id.is_(None)))
+            for name, category_id, product_id in self.db.execute(
+                select(Product.name, Product.category_id, Product.id).where(or_(*conditions)).order_by(Product.id)
+            ):
+                existing.setdefault((name, category_id), product_id)
+
+        for chunk in _chunks(keys):
+            load(chunk)
+
+        updates = [{"b_id": existing[k], "b_price": items[k]["unit_price"]} for k in keys if k in existing]
+        if updates:
+            table = Product.__table__
+            self.db.execute(update(table).where(table.c.id == bindparam("b_id")).values(price=bindparam("b_price")), updates)
+
+        new_keys = [k for k in keys if k not in existing]
+        if new_keys:
+            self.db.execute(insert(Product), [
+                {"category_id": k[1], "name": k[0], "price": items[k]["unit_price"],
+                 "description": f"[TgMain] {items[k]['item_code']}", "is_soldout": False}
+                for k in new_keys
+            ])
+            for chunk in _chunks(new_keys):
+                load(chunk)
+
+        new_set = set(new_keys)
+        logs = []
+        for e in fresh:
+            key = (e["item"]["item_name"], categories.get(e["item"].get("category_name")))
+            response = {"product_id": existing[key], "action": "created" if key in new_set else "updated"}
+            logs.append((e, response))
+            results.set(e, {"status": PROCESSED, **response})
+
+        self._write_logs("INVENTORY_ITEM_SYNC", "/api/v1/sync/inventory-items/batch", logs)
+        self.db.commit()
+        logger.info(f"Bulk item sync: {len(fresh)} processed, {len(categories)} categories")
+        return results.items
+
+    # -------------------------------------------------
+    # 발주서
+    # -------------------------------------------------
+
+    def sync_purchase_orders(self, elements: List[dict]) -> List[dict]:
+        """elements: [{"idempotency_key", "purchase_order": PurchaseOrderData dict}]"""
+        fresh, results = self._split(elements)
+        if not fresh:
+            return results.items
+
+        # 이미 등록된 발주번호(다른 키로 수신) 및 배치 내 중복 발주번호는 건너뜀
+        po_numbers = [e["purchase_order"]["po_number"] for e in fresh]
+        registered = set()
+        for chunk in _chunks(list(set(po_numbers))):
+            registered.update(self.db.execute(
+                select(ExpectedDelivery.po_number).where(ExpectedDelivery.po_number.in_(chunk))
+            ).scalars())
+
+        accepted, seen = [], set()
+        for e in fresh:
+            po_number = e["purchase_order"]["po_number"]
+            if po_number in registered or po_number in seen:
+                results.set(e, {"status": SKIPPED, "reason": "PO already registered", "po_number": po_number})
+                continue
+            seen.add(po_number)
+            accepted.append(e)
+
+        if accepted:
+            self.db.execute(insert(ExpectedDelivery), [
+                {
+                    "store_id": self.store_id,
+                    "po_number": e["purchase_order"]["po_number"],
+                    "vendor_id": e["purchase_order"]["vendor"]["vendor_id"],
+                    "vendor_name": e["purchase_order"]["vendor"]["vendor_name"],
+                    "expected_date": _parse_date(e["purchase_order"].get("delivery_date")),
+                    "status": ExpectedDeliveryStatus.PENDING,
+                    "total_amount": e["purchase_order"].get("total_amount", 0),
+                    "notes": e["purchase_order"].get("notes"),
+                }
+                for e in accepted
+            ])
+
+            delivery_ids: Dict[str, int] = {}
+            for chunk in _chunks([e["purchase_order"]["po_number"] for e in accepted]):
+                delivery_ids.update(self.db.execute(
+                    select(ExpectedDelivery.po_number, ExpectedDelivery.id).where(ExpectedDelivery.po_number.in_(chunk))
+                ).all())
+
+            item_rows = [
+                {
+                    "delivery_id": delivery_ids[e["purchase_order"]["po_number"]],
+                    "item_code": item["item_code"],
+                    "item_name": item["item_name"],
+                    "quantity": item["quantity"],
+                    "unit": item.get("unit", "EA"),
+                    "unit_price": int(item.get("unit_price", 0)),
+                    "received_qty": 0
+                }
+                for e in accepted for item in e["purchase_order"]["items"]
+            ]
+            if item_rows:
+                self.db.execute(insert(ExpectedDeliveryItem), item_rows)
+
+        logs = []
+        for e in accepted:
+            po_number = e["purchase_order"]["po_number"]
+            response = {"expected_delivery_id": delivery_ids[po_number]}
+            logs.append((e, response))
+            results.set(e, {"status": PROCESSED, "po_number": po_number, **response})
+
+        self._write_logs("PURCHASE_ORDER", "/api/v1/sync/purchase-orders/batch", logs)
+        self.db.commit()
+        logger.info(f"Bulk purchase order sync: {len(accepted)} registered, {len(elements) - len(accepted)} skipped")
+        return results.items
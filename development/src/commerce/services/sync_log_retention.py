@@ -0,0 +1,193 @@
+"""
+SyncLogRetention - 연동 로그 보존기간 관리 (월별 아카이브 / 일괄 삭제)
+"""
+import logging
+import os
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import (
+    Column, DateTime, Integer, MetaData, String, Table, Text, bindparam, delete, insert, select, type_coerce, update
+)
+from sqlalchemy.orm import Session
+
+from src.database.engine import SessionLocal
+from src.database.compression import compress_text, is_compressed
+from src.commerce.domain.models import SyncLog
+
+logger = logging.getLogger(__name__)
+
+# 라이브 테이블 보존기간 (이 기간 동안은 idempotency 중복 체크가 보장됨)
+RETENTION_DAYS = int(os.getenv("SYNC_LOG_RETENTION_DAYS", "90"))
+
+# ARCHIVE: 월별 아카이브 테이블로 이동 후 삭제 / DELETE: 삭제만
+RETENTION_MODE = os.getenv("SYNC_LOG_RETENTION_MODE", "ARCHIVE").upper()
+
+# 한 트랜잭션에서 이동/삭제할 행 수
+BATCH_SIZE = 5000
+
+# 처리 중인 로그는 보존기간이 지나도 유지 (재시도 대상)
+IN_FLIGHT_STATUSES = ("PENDING", "RETRYING")
+
+ARCHIVE_PREFIX = "sync_logs_archive_"
+
+# 아카이브 테이블은 create_all 대상이 아니므로 별도 MetaData에 둠
+archive_metadata = MetaData()
+
+_COLUMNS = [
+    "id", "idempotency_key", "direction", "event_type", "endpoint", "payload", "response",
+    "status", "retry_count", "error_message", "created_at", "processed_at"
+]
+
+
+def archive_table(month: str) -> Table:
+    """월별 아카이브 테이블 정의 (month: 'YYYYMM'). payload/response는 압축된 원문 그대로 보관"""
+    name = f"{ARCHIVE_PREFIX}{month}"
+    if name in archive_metadata.tables:
+        return archive_metadata.tables[name]
+    return Table(
+        name, archive_metadata,
+        Column("id", Integer, primary_key=True),
+        Column("idempotency_key", String(100), index=True),
+        Column("direction", String(10)),
+        Column("event_type", String(50)),
+        Column("endpoint", String(255)),
+        Column("payload", Text),
+        Column("response", Text),
+        Column("status", String(20)),
+        Column("retry_count", Integer),
+        Column("error_message", Text),
+        Column("created_at", DateTime(timezone=True)),
+        Column("processed_at", DateTime),
+    )
+
+
+def _compress_raw(value: Optional[str]) -> Optional[str]:
+    if not value or is_compressed(value):
+        return value
+    return compress_text(value)
+
+
+class SyncLogRetention:
+    """
+    보존기간이 지난 SyncLog를 id 순 배치로 월별 아카이브 테이블(sync_logs_archive_YYYYMM)에 옮기고 삭제합니다.
+
+    - 조회는 created_at 인덱스를 사용하고, 배치마다 커밋하므로 긴 잠금이 생기지 않음
+    - payload/response는 압축 해제 없이 원문 그대로 복사
+    - 라이브 테이블에는 retention_days 이내 로그가 항상 남으므로 그 기간의 idempotency 체크는 그대로 동작
+    """
+
+    def __init__(
+        self,
+        session_factory=SessionLocal,
+        retention_days: int = RETENTION_DAYS,
+        batch_size: int = BATCH_SIZE,
+        mode: str = RETENTION_MODE
+    ):
+        if mode not in ("ARCHIVE", "DELETE"):
+            raise ValueError(f"Unknown retention mode: {mode}")
+        self.session_factory = session_factory
+        self.retention_days = retention_days
+        self.batch_size = batch_size
+        self.mode = mode
+
+    def _expired_filter(self, cutoff: datetime):
+        return (SyncLog.created_at < cutoff) & SyncLog.status.notin_(IN_FLIGHT_STATUSES)
+
+    def _next_batch(self, db: Session, cutoff: datetime) -> List[dict]:
+        table = SyncLog.__table__
+        columns = [
+            type_coerce(table.c[name], Text).label(name) if name in ("payload", "response") else table.c[name]
+            for name in _COLUMNS
+        ]
+        rows = db.execute(
+            select(*columns).where(self._expired_filter(cutoff)).order_by(table.c.id).limit(self.batch_size)
+        ).mappings().all()
+        return [dict(row) for row in rows]
+
+    def _archive(self, db: Session, rows: List[dict]) -> Dict[str, int]:
+        by_month: Dict[str, List[dict]] = defaultdict(list)
+        for row in rows:
+            by_month[row["created_at"].strftime("%Y%m")].append(row)
+
+        bind = db.get_bind()
+        for month, month_rows in by_month.items():
+            table = archive_table(month)
+            table.create(bind, checkfirst=True)
+            db.execute(insert(table), month_rows)
+        return {month: len(month_rows) for month, month_rows in by_month.items()}
+
+    def run(self, dry_run: bool = False, now: Optional[datetime] = None) -> dict:
+        now = now or datetime.now()
+        cutoff = now - timedelta(days=self.retention_days)
+        report = {
+            "cutoff": cutoff.isoformat(),
+            "mode": self.mode,
+            "dry_run": dry_run,
+            "batches": 0,
+            "removed": 0,
+            "archived": defaultdict(int)
+        }
+
+        db: Session = self.session_factory()
+        try:
+            if dry_run:
+                report["removed"] = db.query(SyncLog).filter(self._expired_filter(cutoff)).count()
+            else:
+                while True:
+                    rows = self._next_batch(db, cutoff)
+                    if not rows:
+                        break
+                    if self.mode == "ARCHIVE":
+                        for month, count in self._archive(db, rows).items():
+                            report["archived"][month] += count
+                    db.execute(delete(SyncLog).where(SyncLog.id.in_([row["id"] for row in rows])))
+                    db.commit()
+                    report["batches"] += 1
+                    report["removed"] += len(rows)
+                    if len(rows) < self.batch_size:
+                        break
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        report["archived"] = dict(report["archived"])
+        logger.info(f"[Sync] Log retention done: {report['removed']} rows older than {cutoff:%Y-%m-%d} ({self.mode})")
+        return report
+
+    def compress_legacy(self) -> int:
+        """압축 도입 이전에 평문으로 저장된 payload/response를 id 순 배치로 압축 (변경 행 수 반환)"""
+        table = SyncLog.__table__
+        raw_payload = type_coerce(table.c.payload, Text)
+        raw_response = type_coerce(table.c.response, Text)
+        stmt = update(table).where(table.c.id == bindparam("b_id")).values(
+            payload=type_coerce(bindparam("b_payload"), Text),
+            response=type_coerce(bindparam("b_response"), Text)
+        )
+
+        converted, last_id = 0, 0
+        db: Session = self.session_factory()
+        try:
+            while True:
+                rows = db.execute(
+                    select(table.c.id, raw_payload.label("payload"), raw_response.label("response"))
+                    .where(table.c.id > last_id).order_by(table.c.id).limit(self.batch_size)
+                ).all()
+                if not rows:
+                    break
+                last_id = rows[-1].id
+                params = []
+                for row in rows:
+                    payload, response = _compress_raw(row.payload), _compress_raw(row.response)
+                    if payload != row.payload or response != row.response:
+                        params.append({"b_id": row.id, "b_payload": payload, "b_response": response})
+                if params:
+                    db.execute(stmt, params)
+                    db.commit()
+                    converted += len(params)
+        finally:
+            db.close()
+        return converted
@@ -0,0 +1,243 @@
+import atexit
+import hashlib
+import json
+import threading
+import uuid
+from collections import deque
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.orm import Session
+
+from src.database.engine import SessionLocal
+from src.core.database.v3_schema import AuditLog
+from src.core.logger import logger
+
+# 버퍼가 이 건수에 도달하면 즉시 반영
+AUDIT_BATCH_SIZE = 200
+
+# 버퍼 최대 체류 시간 (초)
+AUDIT_FLUSH_INTERVAL_SEC = 1.0
+
+# 반영 실패가 이어질 때 버퍼 상한 (초과 시 오래된 항목부터 폐기, 해시 체인 검증에서 누락으로 드러남)
+AUDIT_MAX_BUFFER = 10000
+
+# 반영 불가로 격리한 항목 보관 수 (조회/수동 복구용)
+AUDIT_QUARANTINE_SIZE = 1000
+
+# 기록 즉시 커밋까지 보장해야 하는 법적 증빙 액션
+CRITICAL_ACTIONS = frozenset({"EXECUTION_DENIED", "EXECUTION_ERROR", "EXECUTION_END"})
+
+GENESIS_HASH = ""
+
+
+def _utc_naive(value: datetime) -> datetime:
+    """DB 종류에 따라 aware/naive로 돌아오는 시각을 UTC naive로 통일"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def entry_hash(prev_hash: str, entry: dict) -> str:
+    """이전 해시 + 항목 내용 → SHA-256 (체인 검증용)"""
+    body = json.dumps(
+        [entry["req_id"], entry["actor_id"], entry["action"], entry["ip_address"],
+         entry["snapshot_data"], _utc_naive(entry["created_at"]).isoformat(timespec="microseconds")],
+        ensure_ascii=False
+    )
+    return hashlib.sha256(f"{prev_hash}|{body}".encode("utf-8")).hexdigest()
+
+
+class AuditWriter:
+    """
+    감사 로그 버퍼 기록기
+
+    log_action() 호출마다 커밋하지 않고 메모리에 모았다가 건수(batch_size) 또는 시간(flush_interval_sec)
+    기준으로 executemany INSERT + 커밋 1회로 반영합니다. CRITICAL_ACTIONS는 반환 전에 버퍼 전체를 동기 반영합니다.
+
+    제약조건 위반(IntegrityError/DataError)처럼 재시도해도 실패하는 항목은 행 단위로 다시 반영해 골라낸 뒤
+    quarantine으로 격리하므로, 잘못된 한 건이 이후의 모든 반영을 막지 않습니다.
+
+    각 항목은 같은 기록기(chain_id)의 직전 항목 해시를 포함하는 해시 체인으로 연결되므로,
+    행 단위 커밋 없이도 verify_chain()으로 누락/변조를 확인할 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        session_factory=SessionLocal,
+        batch_size: int = AUDIT_BATCH_SIZE,
+        flush_interval_sec: float = AUDIT_FLUSH_INTERVAL_SEC,
+        max_buffer: int = AUDIT_MAX_BUFFER
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval_sec = flush_interval_sec
+        self.max_buffer = max_buffer
+        self.chain_id = uuid.uuid4().hex[:16]
+
+        self._lock = threading.Lock()          # 버퍼/체인 상태
+        self._flush_lock = threading.Lock()    # DB 반영 순서 보장
+        self._buffer: List[dict] = []
+        self._last_hash = GENESIS_HASH
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.quarantine: "deque[dict]" = deque(maxlen=AUDIT_QUARANTINE_SIZE)
+        self.quarantined = 0
+        self.dropped = 0
+
+    def append(
+        self,
+        req_id: Optional[str],
+        actor_id: str,
+        action: str,
+        details: str,
+        ip_addr: Optional[str] = None,
+        sync: bool = False
+    ):
+        entry = {
+            "req_id": req_id,
+            "actor_id": actor_id,
+            "action": action,
+            "snapshot_data": details,
+            "ip_address": ip_addr or "127.0.0.1",
+            "created_at": datetime.now(timezone.utc),
+            "chain_id": self.chain_id,
+        }
+        with self._lock:
+            entry["prev_hash"] = self._last_hash
+            entry["entry_hash"] = self._last_hash = entry_hash(self._last_hash, entry)
+            self._buffer.append(entry)
+            overflow = len(self._buffer) - self.max_buffer
+            if overflow > 0:
+                del self._buffer[:overflow]
+                self.dropped += overflow
+            full = len(self._buffer) >= self.batch_size
+
+        if overflow > 0:
+            logger.error(f"[Audit] Buffer full ({self.max_buffer}), dropped {overflow} oldest entries")
+
+        if sync or full:
+            self.flush()
+        else:
+            self._ensure_thread()
+
+    def flush(self) -> int:
+        """
+        버퍼 반영 (반영 건수 반환)
+        제약조건 위반은 행 단위로 재시도해 위반 항목만 격리하고, 그 외 실패(연결 오류 등)는
+        항목을 버퍼 앞쪽에 되돌리고 예외 전파
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._buffer = self._buffer, []
+            if not batch:
+                return 0
+
+            db: Optional[Session] = None
+            try:
+                db = self.session_factory()
+                try:
+                    db.execute(insert(AuditLog), batch)
+                    db.commit()
+                    return len(batch)
+                except (IntegrityError, DataError):
+                    db.rollback()
+                return self._flush_rows(db, batch)
+            except Exception:
+                if db is not None:
+                    db.rollback()
+                with self._lock:
+                    self._buffer[:0] = batch
+                raise
+            finally:
+                if db is not None:
+                    db.close()
+
+    def _flush_rows(self, db: Session, batch: List[dict]) -> int:
+        """행 단위 반영 (SAVEPOINT), 제약조건 위반 항목은 격리"""
+        bad = []
+        for entry in batch:
+            try:
+                with db.begin_nested():
+                    db.execute(insert(AuditLog), [entry])
+            except (IntegrityError, DataError) as e:
+                bad.append((entry, e))
+        db.commit()
+
+        for entry, error in bad:
+            self.quarantine.append(entry)
+            logger.error(
+                f"[Audit] Quarantined entry (action={entry['action']}, actor={entry['actor_id']}, "
+                f"req_id={entry['req_id']}, hash={entry['entry_hash']}): {error.orig}"
+            )
+        with self._lock:
+            self.quarantined += len(bad)
+        return len(batch) - len(bad)
+
+    # -------------------------------------------------
+    # 주기 반영 스레드
+    # -------------------------------------------------
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            with self._lock:
+                if self._thread is None or not self._thread.is_alive():
+                    self._stopped.clear()
+                    self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+                    self._thread.start()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.flush_interval_sec)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"[Audit] Flush failed, will retry: {e}")
+
+    def close(self):
+        """종료 시 잔여 버퍼 반영"""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.flush()
+
+
+def verify_chain(db: Session, chain_id: Optional[str] = None) -> Dict[str, dict]:
+    """
+    체인별 해시 재계산 검증
+    반환: {chain_id: {"entries": n, "valid": bool, "broken_at": log_id|None}}
+    """
+    query = db.query(AuditLog).filter(AuditLog.chain_id.isnot(None))
+    if chain_id:
+        query = query.filter(AuditLog.chain_id == chain_id)
+
+    report: Dict[str, dict] = {}
+    last_hash: Dict[str, str] = {}
+    for log in query.order_by(AuditLog.chain_id, AuditLog.log_id).yield_per(1000):
+        state = report.setdefault(log.chain_id, {"entries": 0, "valid": True, "broken_at": None})
+        state["entries"] += 1
+        if not state["valid"]:
+            continue
+        expected_prev = last_hash.get(log.chain_id, GENESIS_HASH)
+        entry = {
+            "req_id": log.req_id, "actor_id": log.actor_id, "action": log.action,
+            "ip_address": log.ip_address, "snapshot_data": log.snapshot_data,
+            "created_at": log.created_at
+        }
+        if log.prev_hash != expected_prev or log.entry_hash != entry_hash(expected_prev, entry):
+            state["valid"] = False
+            state["broken_at"] = log.log_id
+        last_hash[log.chain_id] = log.entry_hash
+    return report
+
+
+# 싱글톤 인스턴스
+audit_writer = AuditWriter()
+atexit.register(audit_writer.close)
@@ -20,6 +20,26 @@ class SystemSettings(BaseSettings):
     
     # Serverless / Docker Config
     DOCKER_SOCKET: str = "unix:///var/run/docker.sock"
+
+    # Execution (background: API 프로세스 내 실행기 / worker: 큐 등록만, 별도 워커 프로세스가 실행)
+    EXECUTION_BACKEND: str = "background"
+    EXECUTOR_WORKERS: int = 4
+    EXECUTOR_MAX_QUEUE: int = 256
+    EXECUTOR_DRAIN_TIMEOUT_SEC: float = 30.0
+
+    # Email (SMTP) - 587: STARTTLS, 465: 암묵적 TLS
+    SMTP_HOST: str = "localhost"
+    SMTP_PORT: int = 587
+    SMTP_USER: str = ""
+    SMTP_PASSWORD: str = ""
+    DEFAULT_SENDER: str = "noreply@localhost"
+    SMTP_POOL_SIZE: int = 4
+    SMTP_TIMEOUT_SEC: float = 10.0
+    SMTP_MAX_RETRIES: int = 3
+    SMTP_RETRY_BACKOFF_SEC: float = 0.5
+
+    # Core API 주소 (CLI 대시보드의 /metrics/summary 조회용)
+    CORE_API_URL: str = "http://localhost:8000"
     
     class Config:
         env_file = "config/.env"
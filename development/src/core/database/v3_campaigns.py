@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, JSON, Text
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, JSON, Text, Index
 from src.core.database.v3_schema import V3ModelBase
 
 class Campaign(V3ModelBase):
@@ -25,4 +25,8 @@ class Campaign(V3ModelBase):
     # 통계
     total_targets = Column(Integer, default=0)
     sent_count = Column(Integer, default=0)
-    fail_count = Column(Integer, default=0)
\ No newline at end of file
+    fail_count = Column(Integer, default=0)
+
+    __table_args__ = (
+        Index('ix_campaigns_status_scheduled', 'status', 'scheduled_at'),
+    )
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, JSON, Boolean, Text
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, JSON, Boolean, Text, Index
 from sqlalchemy.orm import declarative_base, relationship
 from sqlalchemy.sql import func
 
@@ -57,6 +57,15 @@ class ExecutionRequest(V3ModelBase):
     result_output = Column(JSON, nullable=True)
     execution_time_ms = Column(Integer, nullable=True)
 
+    # 실행 워커 점유 정보 (lease 만료 시 다른 워커가 회수)
+    claimed_by = Column(String(64), nullable=True)
+    lease_expires_at = Column(DateTime, nullable=True)
+    attempts = Column(Integer, default=0)
+
+    __table_args__ = (
+        Index('ix_execution_requests_status_created', 'status', 'created_at'),
+    )
+
 # [Legal Audit]
 class AuditLog(V3ModelBase):
     __tablename__ = 'audit_logs'
@@ -67,5 +76,18 @@ class AuditLog(V3ModelBase):
     action = Column(String(50))
     ip_address = Column(String(45))
     snapshot_data = Column(Text)
+
+    # 해시 체인 (기록기별 chain_id 내에서 직전 항목 해시를 연결)
+    chain_id = Column(String(16), nullable=True, index=True)
+    prev_hash = Column(String(64), nullable=True)
+    entry_hash = Column(String(64), nullable=True)
     
-    actor = relationship("MasterUser", back_populates="audit_logs")
\ No newline at end of file
+    actor = relationship("MasterUser", back_populates="audit_logs")
+# [Leader Election]
+class SchedulerLease(Base):
+    """다중 인스턴스 중 하나만 스케줄러를 실행하기 위한 리더 lease (이름당 1행)"""
+    __tablename__ = 'scheduler_leases'
+
+    name = Column(String(50), primary_key=True)
+    holder = Column(String(100), nullable=True)
+    expires_at = Column(DateTime, nullable=True)
@@ -1,6 +1,8 @@
 from sqlalchemy.orm import Session
-from src.core.database.v3_schema import MasterUser, Subscription, AuditLog
+from src.core.database.v3_schema import MasterUser, Subscription
+from src.core.audit_writer import AuditWriter, audit_writer, CRITICAL_ACTIONS
 from datetime import datetime
+from src.core.registry import billing_cache
 
 class ERPService:
     def __init__(self, db: Session):
@@ -9,21 +11,30 @@ class ERPService:
     def check_billing_eligibility(self, user_id: str, service_cost: int) -> bool:
         """
         [ERP] 실행 전 과금 가능 여부 확인
-        (구독 상태 확인 및 잔액 조회)
+        (구독 상태 확인 및 잔액 조회, 결과는 짧은 TTL로 캐시)
         """
-        user = self.db.query(MasterUser).filter_by(user_id=user_id).first()
-        if not user:
+        cached = billing_cache.get(user_id)
+        if cached is not None:
+            return cached
+
+        eligible = self._load_billing_eligibility(user_id)
+        billing_cache.set(user_id, eligible)
+        return eligible
+
+    def _load_billing_eligibility(self, user_id: str) -> bool:
+        # 사용자 티어와 활성 구독 여부를 쿼리 1회로 조회
+        row = self.db.query(MasterUser.tier_level, Subscription.sub_id).outerjoin(
+            Subscription, (Subscription.user_id == MasterUser.user_id) & (Subscription.status == "ACTIVE")
+        ).filter(MasterUser.user_id == user_id).first()
+        if not row:
             return False
-            
+
         # 간단한 로직: ENTERPRISE 티어는 무제한, 그 외는 포인트 체크 로직 필요
         # 여기서는 데모를 위해 Subscription이 ACTIVE 상태면 통과
-        active_sub = self.db.query(Subscription).filter_by(
-            user_id=user_id, status="ACTIVE"
-        ).first()
-        
-        if not active_sub and user.tier_level != "ENTERPRISE":
+        tier_level, active_sub = row
+        if not active_sub and tier_level != "ENTERPRISE":
             return False
-            
+
         return True
 
     def process_billing(self, user_id: str, service_code: str, amount: int):
@@ -34,19 +45,16 @@ class ERPService:
         pass
 
 class LegalAuditService:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, writer: AuditWriter = None):
         self.db = db
+        self.writer = writer or audit_writer
 
     def log_action(self, req_id: str, actor_id: str, action_type: str, details: str, ip_addr: str = None):
         """
         [Legal] 법적 증빙을 위한 불변 로그 기록
+        (버퍼 기록 후 일괄 반영, CRITICAL_ACTIONS는 반환 전 커밋 보장)
         """
-        audit = AuditLog(
-            req_id=req_id,
-            actor_id=actor_id,
-            action=action_type,
-            snapshot_data=details,
-            ip_address=ip_addr or "127.0.0.1"
+        self.writer.append(
+            req_id, actor_id, action_type, details, ip_addr,
+            sync=action_type in CRITICAL_ACTIONS
         )
-        self.db.add(audit)
-        self.db.commit()
\ No newline at end of file
@@ -1,10 +1,12 @@
-import importlib
 import traceback
 from datetime import datetime
 from sqlalchemy.orm import Session
-from src.core.database.v3_schema import ExecutionRequest, FunctionCatalog
+from src.core.database.v3_schema import ExecutionRequest
 from src.core.serverless.handler import ServerlessContext
+from src.core.serverless.runtime import handler_runtime
 from src.core.erp_service import ERPService, LegalAuditService
+from src.core.registry import handler_registry
+from src.core.metrics import kernel_metrics, queue_wait_seconds
 
 class SystemKernel:
     """
@@ -32,33 +34,34 @@ class SystemKernel:
             request.result_output = {"error": "Insufficient balance or invalid subscription"}
             self.legal.log_action(req_id, user_id, "EXECUTION_DENIED", "Billing check failed")
             self.db.commit()
+            kernel_metrics.execution_rejected(fn_code, request.status)
             return
 
-        # 3. 메타데이터 로드
-        function_meta = self.db.query(FunctionCatalog).filter_by(function_code=fn_code).first()
-        if not function_meta:
+        # 3. 핸들러 조회 (기동 시 적재된 레지스트리)
+        entry = handler_registry.get(self.db, fn_code)
+        if not entry:
             request.status = "FAILED"
+            request.result_output = {"error": handler_registry.errors.get(fn_code, "Function not available")}
             self.db.commit()
+            kernel_metrics.execution_rejected(fn_code, request.status)
             return
 
         # 4. 상태 업데이트 및 감사 로그 시작
+        created_at = request.created_at
         request.status = "PROCESSING"
         self.db.commit()
         self.legal.log_action(req_id, user_id, "EXECUTION_START", f"Function: {fn_code}")
 
         start_time = datetime.now()
+        kernel_metrics.execution_started(fn_code, queue_wait_seconds(created_at, start_time))
         
         try:
-            # 5. 동적 모듈 실행
-            module_name, class_name = function_meta.handler_path.rsplit(".", 1)
-            module = importlib.import_module(module_name)
-            HandlerClass = getattr(module, class_name)
-            
+            # 5. 핸들러 실행
             context = ServerlessContext(req_id=req_id, user_id=user_id)
-            handler = HandlerClass(context)
+            handler = entry.handler_class(context)
             
-            # 실행
-            result = handler.handle(request.input_payload)
+            # 실행 (async 핸들러는 공용 루프, sync 핸들러는 스레드 풀)
+            result = handler_runtime.run(handler, request.input_payload)
             
             # 6. 성공 처리
             request.status = "COMPLETED"
@@ -77,5 +80,6 @@ class SystemKernel:
         finally:
             end_time = datetime.now()
             request.execution_time_ms = int((end_time - start_time).total_seconds() * 1000)
+            kernel_metrics.execution_finished(fn_code, request.status, (end_time - start_time).total_seconds())
             self.legal.log_action(req_id, user_id, "EXECUTION_END", f"Status: {request.status}")
             self.db.commit()
\ No newline at end of file
@@ -0,0 +1,235 @@
+import bisect
+import threading
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+# 실행 시간 히스토그램 버킷 (초)
+DURATION_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+# 대기 시간(QUEUED → PROCESSING) 히스토그램 버킷 (초)
+QUEUE_WAIT_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 300, 900)
+
+# 실패로 집계하는 종료 상태
+ERROR_STATUSES = frozenset({"FAILED", "DENIED_BILLING"})
+
+
+class Histogram:
+    """누적 버킷 히스토그램 (Prometheus histogram과 같은 le 규칙)"""
+
+    __slots__ = ("bounds", "counts", "total", "count")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # 마지막 칸 = +Inf
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        result, running = [], 0
+        for bound, count in zip(list(self.bounds) + ["+Inf"], self.counts):
+            running += count
+            result.append((str(bound), running))
+        return result
+
+    def quantile(self, q: float) -> Optional[float]:
+        """버킷 상한 기준 근사 분위수 (+Inf 버킷이면 마지막 상한 반환)"""
+        if not self.count:
+            return None
+        rank, running = q * self.count, 0
+        for i, count in enumerate(self.counts):
+            running += count
+            if running >= rank:
+                return self.bounds[min(i, len(self.bounds) - 1)]
+        return self.bounds[-1]
+
+
+def queue_wait_seconds(created_at: Optional[datetime], started_at: datetime) -> Optional[float]:
+    """
+    요청 생성 → 실행 시작 대기 시간
+    created_at은 DB server_default(now)로 기록되므로 naive 값은 UTC(SQLite CURRENT_TIMESTAMP)로 간주
+    """
+    if created_at is None:
+        return None
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    if started_at.tzinfo is None:
+        started_at = started_at.astimezone(timezone.utc)
+    return max((started_at - created_at).total_seconds(), 0.0)
+
+
+class KernelMetrics:
+    """
+    커널 실행 지표 (프로세스 메모리 집계)
+
+    function_code별 종료 상태 카운터, 실행 시간/대기 시간 히스토그램, 실행 중 건수를 보관하며
+    Prometheus 텍스트(render_prometheus)와 JSON 요약(summary)으로 내보냅니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._results: Dict[Tuple[str, str], int] = defaultdict(int)  # (function_code, status) → 건수
+        self._durations: Dict[str, Histogram] = {}
+        self._queue_waits: Dict[str, Histogram] = {}
+        self._in_progress: Dict[str, int] = defaultdict(int)
+        self._gauges: Dict[str, Tuple[str, Callable[[], float]]] = {}
+        self._histograms: Dict[str, Tuple[str, Histogram]] = {}
+        self.started_at = datetime.now()
+
+    # -------------------------------------------------
+    # 기록
+    # -------------------------------------------------
+
+    def execution_started(self, function_code: str, queue_wait_sec: Optional[float] = None):
+        with self._lock:
+            self._in_progress[function_code] += 1
+            if queue_wait_sec is not None:
+                self._queue_waits.setdefault(function_code, Histogram(QUEUE_WAIT_BUCKETS)).observe(queue_wait_sec)
+
+    def execution_finished(self, function_code: str, status: str, duration_sec: float):
+        with self._lock:
+            self._in_progress[function_code] = max(self._in_progress[function_code] - 1, 0)
+            self._results[(function_code, status)] += 1
+            self._durations.setdefault(function_code, Histogram(DURATION_BUCKETS)).observe(duration_sec)
+
+    def execution_rejected(self, function_code: str, status: str):
+        """핸들러 실행 전 종료 (과금 거부, 핸들러 없음)"""
+        with self._lock:
+            self._results[(function_code, status)] += 1
+
+    def register_gauge(self, name: str, help_text: str, getter: Callable[[], float]):
+        """외부 구성요소의 순간값 지표 등록 (렌더링 시점에 getter 호출)"""
+        with self._lock:
+            self._gauges[name] = (help_text, getter)
+
+    def register_histogram(self, name: str, help_text: str, bounds: Tuple[float, ...]):
+        """외부 구성요소의 레이블 없는 히스토그램 등록 (값은 observe()로 기록)"""
+        with self._lock:
+            self._histograms.setdefault(name, (help_text, Histogram(bounds)))
+
+    def observe(self, name: str, value: float):
+        with self._lock:
+            self._histograms[name][1].observe(value)
+
+    def reset(self):
+        with self._lock:
+            self._results.clear()
+            self._durations.clear()
+            self._queue_waits.clear()
+            self._in_progress.clear()
+            for name, (help_text, hist) in self._histograms.items():
+                self._histograms[name] = (help_text, Histogram(hist.bounds))
+            self.started_at = datetime.now()
+
+    # -------------------------------------------------
+    # 내보내기
+    # -------------------------------------------------
+
+    def summary(self) -> dict:
+        """function_code별 JSON 요약 (실행 시간 합계 내림차순)"""
+        with self._lock:
+            codes = {code for code, _ in self._results} | set(self._in_progress)
+            functions = []
+            for code in codes:
+                statuses = {status: n for (c, status), n in self._results.items() if c == code}
+                total = sum(statuses.values())
+                errors = sum(n for status, n in statuses.items() if status in ERROR_STATUSES)
+                duration = self._durations.get(code)
+                wait = self._queue_waits.get(code)
+                functions.append({
+                    "function_code": code,
+                    "total": total,
+                    "statuses": statuses,
+                    "in_progress": self._in_progress.get(code, 0),
+                    "error_rate": round(errors / total, 4) if total else 0.0,
+                    "busy_sec": round(duration.total, 3) if duration else 0.0,
+                    "avg_ms": round(duration.total / duration.count * 1000, 1) if duration and duration.count else None,
+                    "p95_ms": duration.quantile(0.95) * 1000 if duration and duration.count else None,
+                    "avg_queue_wait_ms": round(wait.total / wait.count * 1000, 1) if wait and wait.count else None,
+                })
+            gauges = dict(self._gauges)
+            histograms = {
+                name: {
+                    "count": hist.count,
+                    "avg_ms": round(hist.total / hist.count * 1000, 1) if hist.count else None,
+                    "p95_ms": hist.quantile(0.95) * 1000 if hist.count else None,
+                }
+                for name, (_, hist) in self._histograms.items()
+            }
+
+        functions.sort(key=lambda f: (f["busy_sec"], f["total"]), reverse=True)
+        busy_total = sum(f["busy_sec"] for f in functions)
+        for f in functions:
+            f["busy_share"] = round(f["busy_sec"] / busy_total, 4) if busy_total else 0.0
+        return {
+            "since": self.started_at.isoformat(),
+            "functions": functions,
+            "gauges": {name: _safe_call(getter) for name, (_, getter) in gauges.items()},
+            "histograms": histograms,
+        }
+
+    def render_prometheus(self) -> str:
+        lines: List[str] = []
+        with self._lock:
+            lines += [
+                "# HELP tg_kernel_executions_total Finished executions by function and final status.",
+                "# TYPE tg_kernel_executions_total counter",
+            ]
+            for (code, status), n in sorted(self._results.items()):
+                lines.append(f'tg_kernel_executions_total{{function="{_escape(code)}",status="{_escape(status)}"}} {n}')
+
+            lines += [
+                "# HELP tg_kernel_executions_in_progress Executions currently running.",
+                "# TYPE tg_kernel_executions_in_progress gauge",
+            ]
+            for code, n in sorted(self._in_progress.items()):
+                lines.append(f'tg_kernel_executions_in_progress{{function="{_escape(code)}"}} {n}')
+
+            _render_histograms(
+                lines, "tg_kernel_execution_duration_seconds",
+                "Handler execution time.", self._durations
+            )
+            _render_histograms(
+                lines, "tg_kernel_queue_wait_seconds",
+                "Time from request creation to execution start.", self._queue_waits
+            )
+            for name, (help_text, hist) in sorted(self._histograms.items()):
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+                for bound, count in hist.cumulative():
+                    lines.append(f'{name}_bucket{{le="{bound}"}} {count}')
+                lines += [f"{name}_sum {hist.total}", f"{name}_count {hist.count}"]
+            gauges = dict(self._gauges)
+
+        for name, (help_text, getter) in sorted(gauges.items()):
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge", f"{name} {_safe_call(getter)}"]
+        return "\n".join(lines) + "\n"
+
+
+def _render_histograms(lines: List[str], name: str, help_text: str, histograms: Dict[str, Histogram]):
+    lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    for code, hist in sorted(histograms.items()):
+        label = f'function="{_escape(code)}"'
+        for bound, count in hist.cumulative():
+            lines.append(f'{name}_bucket{{{label},le="{bound}"}} {count}')
+        lines.append(f"{name}_sum{{{label}}} {hist.total}")
+        lines.append(f"{name}_count{{{label}}} {hist.count}")
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _safe_call(getter: Callable[[], float]) -> float:
+    try:
+        return float(getter())
+    except Exception:
+        return float("nan")
+
+
+# 싱글톤 인스턴스
+kernel_metrics = KernelMetrics()
@@ -0,0 +1,181 @@
+import hashlib
+import importlib
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple, Type
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.core.database.v3_schema import FunctionCatalog, MasterUser, Subscription
+from src.core.serverless.handler import BaseFunction
+from src.core.logger import logger
+
+# 다른 프로세스(마이그레이션 스크립트 등)의 카탈로그 변경을 확인하는 주기
+CATALOG_REFRESH_SEC = 60
+
+# 캐시에 없는 함수 코드 요청 시 재조회 최소 간격 (존재하지 않는 코드로 인한 반복 조회 방지)
+MISS_RELOAD_MIN_SEC = 5
+
+# 과금 자격 캐시 유효시간
+BILLING_CACHE_TTL_SEC = 30
+
+
+@dataclass(frozen=True)
+class HandlerEntry:
+    """해석이 끝난 카탈로그 항목"""
+    function_code: str
+    function_name: str
+    handler_path: str
+    handler_class: Type[BaseFunction]
+    resource_spec: Dict[str, Any] = field(default_factory=dict)
+
+
+def resolve_handler(handler_path: str) -> Type[BaseFunction]:
+    """'package.module.ClassName' → BaseFunction 하위 클래스"""
+    module_name, class_name = handler_path.rsplit(".", 1)
+    handler_class = getattr(importlib.import_module(module_name), class_name)
+    if not (isinstance(handler_class, type) and issubclass(handler_class, BaseFunction)):
+        raise TypeError(f"{handler_path} is not a BaseFunction subclass")
+    return handler_class
+
+
+def catalog_fingerprint(rows) -> str:
+    """카탈로그 변경 감지용 해시 (code, handler_path, is_active, resource_spec)"""
+    digest = hashlib.sha256()
+    for code, path, active, spec in sorted(rows, key=lambda r: r[0]):
+        digest.update(json.dumps([code, path, bool(active), spec], sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+class HandlerRegistry:
+    """
+    FunctionCatalog 핸들러 레지스트리
+
+    - preload(): 기동 시 활성 카탈로그 전체를 import/검증하여 캐시 (실패 항목은 errors에 기록)
+    - get(): 요청마다 딕셔너리 조회만 수행
+    - 같은 프로세스의 카탈로그 변경은 ORM 이벤트로 즉시 무효화, 외부 변경은 refresh_sec 주기의 지문 비교로 반영
+    """
+
+    def __init__(self, refresh_sec: float = CATALOG_REFRESH_SEC):
+        self.refresh_sec = refresh_sec
+        self._lock = threading.Lock()
+        self._entries: Dict[str, HandlerEntry] = {}
+        self._classes: Dict[str, Type[BaseFunction]] = {}  # handler_path → class (재적재 시 재사용)
+        self.errors: Dict[str, str] = {}
+        self.fingerprint: Optional[str] = None
+        self._loaded_at: Optional[float] = None
+        self._checked_at = 0.0
+        self._dirty = True
+
+    def invalidate(self):
+        self._dirty = True
+
+    def _catalog_rows(self, db: Session):
+        return db.query(
+            FunctionCatalog.function_code, FunctionCatalog.handler_path,
+            FunctionCatalog.is_active, FunctionCatalog.resource_spec
+        ).all()
+
+    def preload(self, db: Session) -> Dict[str, HandlerEntry]:
+        """활성 카탈로그 전체 해석 및 캐시 교체"""
+        with self._lock:
+            rows = db.query(FunctionCatalog).filter(FunctionCatalog.is_active == True).all()
+            entries, errors = {}, {}
+            for fn in rows:
+                try:
+                    handler_class = self._classes.get(fn.handler_path) or resolve_handler(fn.handler_path)
+                except Exception as e:
+                    errors[fn.function_code] = f"{type(e).__name__}: {e}"
+                    logger.error(f"[Registry] {fn.function_code} ({fn.handler_path}) unavailable: {e}")
+                    continue
+                self._classes[fn.handler_path] = handler_class
+                entries[fn.function_code] = HandlerEntry(
+                    function_code=fn.function_code,
+                    function_name=fn.function_name,
+                    handler_path=fn.handler_path,
+                    handler_class=handler_class,
+                    resource_spec=fn.resource_spec or {}
+                )
+
+            self._entries = entries
+            self.errors = errors
+            self.fingerprint = catalog_fingerprint(self._catalog_rows(db))
+            self._loaded_at = self._checked_at = time.monotonic()
+            self._dirty = False
+        logger.info(f"[Registry] {len(entries)} handlers loaded ({len(errors)} unavailable).")
+        return entries
+
+    def _refresh_if_changed(self, db: Session):
+        self._checked_at = time.monotonic()
+        if catalog_fingerprint(self._catalog_rows(db)) != self.fingerprint:
+            self.preload(db)
+
+    def get(self, db: Session, function_code: str) -> Optional[HandlerEntry]:
+        if self._dirty or self._loaded_at is None:
+            self.preload(db)
+        elif time.monotonic() - self._checked_at >= self.refresh_sec:
+            self._refresh_if_changed(db)
+
+        entry = self._entries.get(function_code)
+        if entry is None and function_code not in self.errors \
+                and time.monotonic() - self._checked_at >= MISS_RELOAD_MIN_SEC:
+            # 방금 등록된 함수일 수 있으므로 1회 재확인
+            self._refresh_if_changed(db)
+            entry = self._entries.get(function_code)
+        return entry
+
+
+class BillingEligibilityCache:
+    """user_id → 과금 자격 여부 (짧은 TTL, 사용자/구독 변경 시 무효화)"""
+
+    def __init__(self, ttl_sec: float = BILLING_CACHE_TTL_SEC):
+        self.ttl_sec = ttl_sec
+        self._lock = threading.Lock()
+        self._values: Dict[str, Tuple[bool, float]] = {}
+
+    def get(self, user_id: str) -> Optional[bool]:
+        cached = self._values.get(user_id)
+        if cached is None:
+            return None
+        eligible, expires_at = cached
+        if time.monotonic() >= expires_at:
+            with self._lock:
+                self._values.pop(user_id, None)
+            return None
+        return eligible
+
+    def set(self, user_id: str, eligible: bool):
+        with self._lock:
+            self._values[user_id] = (eligible, time.monotonic() + self.ttl_sec)
+
+    def invalidate(self, user_id: Optional[str] = None):
+        with self._lock:
+            if user_id is None:
+                self._values.clear()
+            else:
+                self._values.pop(user_id, None)
+
+
+# 싱글톤 인스턴스
+handler_registry = HandlerRegistry()
+billing_cache = BillingEligibilityCache()
+
+
+# 같은 프로세스에서의 변경은 커밋 전이라도 즉시 무효화 (다음 조회 시 재적재)
+@event.listens_for(FunctionCatalog, "after_insert")
+@event.listens_for(FunctionCatalog, "after_update")
+@event.listens_for(FunctionCatalog, "after_delete")
+def _on_catalog_change(mapper, connection, target):
+    handler_registry.invalidate()
+
+
+@event.listens_for(MasterUser, "after_update")
+@event.listens_for(MasterUser, "after_delete")
+@event.listens_for(Subscription, "after_insert")
+@event.listens_for(Subscription, "after_update")
+@event.listens_for(Subscription, "after_delete")
+def _on_billing_change(mapper, connection, target):
+    billing_cache.invalidate(target.user_id)
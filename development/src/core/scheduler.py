@@ -1,53 +1,289 @@
 import asyncio
+import os
+import socket
 import uuid
-from datetime import datetime
+import weakref
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import event, func, inspect, or_, select, text, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from src.database.engine import SessionLocal
+from src.database.listen import PgListener
 from src.core.database.v3_campaigns import Campaign
-from src.core.database.v3_schema import ExecutionRequest
+from src.core.database.v3_schema import ExecutionRequest, SchedulerLease
 from src.core.logger import logger
 
+# 리더 lease 이름 (인스턴스 간 공유)
+LEASE_NAME = "campaign_scheduler"
+
+# 리더 lease 유효시간. 리더는 LEADER_LEASE_SEC / 3 마다 연장하므로 리더가 죽으면 이 시간 안에 다른 인스턴스가 승계
+LEADER_LEASE_SEC = 30
+
+# 한 번에 발송 처리할 최대 캠페인 수
+CLAIM_BATCH_SIZE = 100
+
+# 캠페인 일정 변경 알림 채널 (PostgreSQL LISTEN/NOTIFY)
+SCHEDULE_CHANNEL = "campaign_schedule"
+
+SCHEDULED = "SCHEDULED"
+
+
+class LeaderLease:
+    """
+    DB 행 기반 리더 선출
+    만료되었거나 자신이 보유한 lease만 조건부 UPDATE로 가져오므로 동시에 한 인스턴스만 성공
+    """
+
+    def __init__(self, session_factory, name: str, holder: str, ttl_sec: float):
+        self.session_factory = session_factory
+        self.name = name
+        self.holder = holder
+        self.ttl_sec = ttl_sec
+
+    def acquire(self, now: Optional[datetime] = None) -> bool:
+        """lease 획득 또는 연장 (성공 시 True)"""
+        now = now or datetime.now()
+        expires_at = now + timedelta(seconds=self.ttl_sec)
+        db: Session = self.session_factory()
+        try:
+            taken = db.execute(
+                update(SchedulerLease)
+                .where(
+                    SchedulerLease.name == self.name,
+                    or_(
+                        SchedulerLease.holder == self.holder,
+                        SchedulerLease.expires_at.is_(None),
+                        SchedulerLease.expires_at < now
+                    )
+                )
+                .values(holder=self.holder, expires_at=expires_at)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            if not taken and db.get(SchedulerLease, self.name) is None:
+                db.add(SchedulerLease(name=self.name, holder=self.holder, expires_at=expires_at))
+                taken = 1
+            db.commit()
+            return bool(taken)
+        except IntegrityError:
+            # 다른 인스턴스가 먼저 행을 생성함
+            db.rollback()
+            return False
+        finally:
+            db.close()
+
+    def release(self):
+        """보유 중인 lease 반납 (다른 인스턴스가 즉시 승계할 수 있도록)"""
+        db: Session = self.session_factory()
+        try:
+            db.execute(
+                update(SchedulerLease)
+                .where(SchedulerLease.name == self.name, SchedulerLease.holder == self.holder)
+                .values(holder=None, expires_at=None)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+        finally:
+            db.close()
+
+
+def claim_due_campaigns(db: Session, now: datetime, limit: int = CLAIM_BATCH_SIZE) -> List[str]:
+    """
+    시작 시간이 지난 SCHEDULED 캠페인 발송 요청 생성
+    상태를 조건부 UPDATE로 바꾼 캠페인만 요청을 만들므로 리더가 겹치는 순간에도 중복 발송되지 않음
+    """
+    due = db.execute(
+        select(Campaign.campaign_id, Campaign.user_id, Campaign.name)
+        .where(Campaign.status == SCHEDULED, Campaign.scheduled_at <= now)
+        .order_by(Campaign.scheduled_at)
+        .limit(limit)
+    ).all()
+
+    fired = []
+    for campaign_id, user_id, name in due:
+        claimed = db.execute(
+            update(Campaign)
+            .where(Campaign.campaign_id == campaign_id, Campaign.status == SCHEDULED)
+            .values(status="PROCESSING")
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if not claimed:
+            continue
+
+        logger.info(f"[Scheduler] Triggering Campaign: {name} ({campaign_id})")
+        # Dispatcher 함수 실행 요청 생성
+        db.add(ExecutionRequest(
+            req_id=f"sch-{uuid.uuid4()}",
+            function_code="FN_CAMPAIGN_DISPATCH",
+            user_id=user_id,
+            input_payload={"campaign_id": campaign_id},
+            status="QUEUED"
+        ))
+        fired.append(campaign_id)
+
+    db.commit()
+    return fired
+
+
+def next_due_at(db: Session) -> Optional[datetime]:
+    return db.execute(
+        select(func.min(Campaign.scheduled_at)).where(Campaign.status == SCHEDULED)
+    ).scalar()
+
+
+def seconds_until(due: Optional[datetime], now: datetime) -> Optional[float]:
+    if due is None:
+        return None
+    if due.tzinfo is not None and now.tzinfo is None:
+        now = now.astimezone()
+    return max((due - now).total_seconds(), 0.0)
+
+
 async def scheduler_tick():
     """
-    주기적으로 실행되며 SCHEDULED 상태인 캠페인을 확인합니다.
+    시작 시간이 지난 SCHEDULED 캠페인을 1회 처리합니다. (리더 선출 없이 단발 실행용)
     """
     logger.debug("[Scheduler] Tick...")
     db: Session = SessionLocal()
     try:
-        now = datetime.now()
-        
-        # 시작 시간이 지난 'SCHEDULED' 캠페인 조회
-        pending_campaigns = db.query(Campaign).filter(
-            Campaign.status == "SCHEDULED",
-            Campaign.scheduled_at <= now
-        ).all()
-        
-        for campaign in pending_campaigns:
-            logger.info(f"[Scheduler] Triggering Campaign: {campaign.name} ({campaign.campaign_id})")
-            
-            # Dispatcher 함수 실행 요청 생성
-            req_id = f"sch-{uuid.uuid4()}"
-            exec_req = ExecutionRequest(
-                req_id=req_id,
-                function_code="FN_CAMPAIGN_DISPATCH",
-                user_id=campaign.user_id,
-                input_payload={"campaign_id": campaign.campaign_id},
-                status="QUEUED"
-            )
-            db.add(exec_req)
-            
-            # 중복 실행 방지를 위해 상태 변경
-            campaign.status = "PROCESSING" 
-            
-        db.commit()
-        
+        return claim_due_campaigns(db, datetime.now())
     except Exception as e:
         logger.error(f"[Scheduler] Error: {e}")
+        return []
     finally:
         db.close()
 
+
+class CampaignScheduler:
+    """
+    캠페인 스케줄러
+
+    - 리더 lease를 보유한 인스턴스 하나만 동작 (uvicorn 워커가 여러 개여도 조회/상태 변경은 1곳)
+    - 고정 주기 대신 가장 이른 scheduled_at까지 대기하며, 캠페인 추가/변경 시 즉시 깨어나 재계산
+      (같은 프로세스는 커밋 이벤트, 다른 프로세스는 PostgreSQL NOTIFY)
+    - 대기 시간은 lease 연장 주기를 넘지 않으므로 NOTIFY가 없는 DB에서도 최대 그 주기 안에 반영
+    """
+
+    def __init__(self, session_factory=SessionLocal, lease_sec: float = LEADER_LEASE_SEC, instance_id: Optional[str] = None):
+        self.session_factory = session_factory
+        self.instance_id = instance_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.lease = LeaderLease(session_factory, LEASE_NAME, self.instance_id, lease_sec)
+        self.renew_interval_sec = lease_sec / 3
+        self.is_leader = False
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopping = False
+
+    def wake(self, payload: str = ""):
+        """일정 변경 알림 (임의 스레드에서 호출 가능)"""
+        if self._loop is not None and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def _tick(self) -> Optional[datetime]:
+        """기한이 된 캠페인 처리 후 다음 기한 반환"""
+        db: Session = self.session_factory()
+        try:
+            claim_due_campaigns(db, datetime.now())
+            return next_due_at(db)
+        finally:
+            db.close()
+
+    def _start_listener(self) -> Optional[PgListener]:
+        bind = self.session_factory.kw.get("bind")
+        if bind is not None and bind.dialect.name == "postgresql":
+            listener = PgListener(bind, SCHEDULE_CHANNEL, self.wake)
+            listener.start()
+            return listener
+        return None
+
+    async def run(self):
+        logger.info(f"[Scheduler] Service Started ({self.instance_id}).")
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        _running_schedulers.add(self)
+        listener = self._start_listener()
+        try:
+            while not self._stopping:
+                self._wakeup.clear()
+                try:
+                    leader = await asyncio.to_thread(self.lease.acquire)
+                except Exception as e:
+                    logger.error(f"[Scheduler] Leader lease error: {e}")
+                    leader = False
+                if leader != self.is_leader:
+                    logger.info(f"[Scheduler] {'Acquired' if leader else 'Lost'} leadership ({self.instance_id}).")
+                    self.is_leader = leader
+
+                timeout = self.renew_interval_sec
+                if leader:
+                    try:
+                        wait = seconds_until(await asyncio.to_thread(self._tick), datetime.now())
+                    except Exception as e:
+                        logger.error(f"[Scheduler] Error: {e}")
+                        wait = None
+                    if wait is not None:
+                        timeout = min(timeout, wait)
+
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            _running_schedulers.discard(self)
+            if listener is not None:
+                listener.stop()
+            if self.is_leader:
+                try:
+                    self.lease.release()
+                except Exception as e:
+                    logger.error(f"[Scheduler] Lease release failed: {e}")
+                self.is_leader = False
+            logger.info(f"[Scheduler] Service Stopped ({self.instance_id}).")
+
+    def stop(self):
+        self._stopping = True
+        self.wake()
+
+
 async def run_scheduler():
-    logger.info("[Scheduler] Service Started.")
-    while True:
-        await scheduler_tick()
-        await asyncio.sleep(60) # 1분 주기
\ No newline at end of file
+    await campaign_scheduler.run()
+
+
+# 싱글톤 인스턴스
+campaign_scheduler = CampaignScheduler()
+
+# 같은 프로세스에서 실행 중인 스케줄러 (커밋 이벤트로 깨움)
+_running_schedulers: "weakref.WeakSet[CampaignScheduler]" = weakref.WeakSet()
+
+_SCHEDULE_CHANGED = "campaign_schedule_changed"
+
+
+def _schedule_changed(obj) -> bool:
+    attrs = inspect(obj).attrs
+    return attrs.status.history.has_changes() or attrs.scheduled_at.history.has_changes()
+
+
+@event.listens_for(Session, "after_flush")
+def _on_flush(session, flush_context):
+    # after_flush 시점의 new/dirty와 속성 이력은 아직 flush 이전 상태
+    if not any(isinstance(obj, Campaign) for obj in session.new) \
+            and not any(isinstance(obj, Campaign) and _schedule_changed(obj) for obj in session.dirty):
+        return
+    session.info[_SCHEDULE_CHANGED] = True
+    if session.get_bind().dialect.name == "postgresql":
+        # 트랜잭션 커밋 시점에 다른 인스턴스로 전달됨
+        session.connection().execute(text("SELECT pg_notify(:channel, '')"), {"channel": SCHEDULE_CHANNEL})
+
+
+@event.listens_for(Session, "after_commit")
+def _on_commit(session):
+    if session.info.pop(_SCHEDULE_CHANGED, False):
+        for scheduler in list(_running_schedulers):
+            scheduler.wake()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _on_rollback(session, previous_transaction):
+    session.info.pop(_SCHEDULE_CHANGED, None)
@@ -1,6 +1,8 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Coroutine
 from src.core.database.v3_schema import AuditLog
+from src.core.serverless.runtime import handler_runtime
 
 class ServerlessContext:
     """
@@ -15,7 +17,18 @@ class BaseFunction(ABC):
     """
     모든 TG 서비스 함수가 상속받아야 할 기본 클래스.
     설계의 'TG_Serverless_Architecture'를 준수합니다.
+
+    handle은 `def` 또는 `async def` 중 하나로 구현합니다.
+    - async def: 커널이 공용 이벤트 루프에서 await (권장)
+    - def: 스레드 풀에서 실행. 내부 코루틴은 new_event_loop() 대신 run_coroutine()으로 실행
     """
+
+    # handle이 코루틴 함수인지 여부 (하위 클래스 정의 시 자동 설정)
+    is_async: bool = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.is_async = asyncio.iscoroutinefunction(cls.handle)
     
     def __init__(self, context: ServerlessContext):
         self.context = context
@@ -29,6 +42,13 @@ class BaseFunction(ABC):
         """
         pass
 
+    def run_coroutine(self, coro: Coroutine) -> Any:
+        """
+        [이전 호환] 동기 handle 안에서 코루틴 실행
+        호출마다 루프를 새로 만드는 대신 공용 핸들러 루프에 제출하고 결과를 기다립니다.
+        """
+        return handler_runtime.submit(coro)
+
     def audit(self, action: str, details: str):
         """법적 증빙 로그 기록 (DB 직렬화는 별도 처리)"""
         print(f"[AUDIT] Req: {self.context.req_id} | User: {self.context.user_id} | Action: {action} | {details}")
\ No newline at end of file
@@ -0,0 +1,87 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Coroutine, Dict, Optional
+
+from src.core.logger import logger
+
+# 동기 핸들러 실행 스레드 수
+SYNC_POOL_SIZE = 8
+
+
+class HandlerRuntime:
+    """
+    서버리스 핸들러 공용 실행 환경
+
+    - async handle: 전용 스레드에서 계속 도는 공용 이벤트 루프 1개에서 실행
+      (호출마다 루프를 만들고 닫지 않으므로 클라이언트/커넥션을 핸들러 간에 공유할 수 있음)
+    - sync handle: 공용 루프를 막지 않도록 스레드 풀에서 실행
+    """
+
+    def __init__(self, sync_pool_size: int = SYNC_POOL_SIZE):
+        self.sync_pool_size = sync_pool_size
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None or not self._thread.is_alive():
+            with self._lock:
+                if self._loop is None or not self._thread.is_alive():
+                    self._start()
+        return self._loop
+
+    def _start(self):
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def _run():
+            asyncio.set_event_loop(loop)
+            loop.call_soon(ready.set)
+            loop.run_forever()
+
+        self._pool = ThreadPoolExecutor(max_workers=self.sync_pool_size, thread_name_prefix="handler-sync")
+        self._thread = threading.Thread(target=_run, name="handler-loop", daemon=True)
+        self._thread.start()
+        ready.wait()
+        self._loop = loop
+        logger.info(f"[Runtime] Shared handler loop started (sync pool={self.sync_pool_size}).")
+
+    def in_loop_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    async def call(self, handler, event: Dict[str, Any]) -> Dict[str, Any]:
+        """공용 루프 안에서 핸들러 실행 (async는 await, sync는 스레드 풀로 위임)"""
+        if handler.is_async:
+            return await handler.handle(event)
+        return await asyncio.get_running_loop().run_in_executor(self._pool, handler.handle, event)
+
+    def run(self, handler, event: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """동기 코드(커널 등)에서 핸들러 실행 후 결과 대기"""
+        return self.submit(self.call(handler, event), timeout)
+
+    def submit(self, coro: Coroutine, timeout: Optional[float] = None) -> Any:
+        """코루틴을 공용 루프에서 실행하고 결과 대기 (공용 루프 스레드에서 호출하면 교착되므로 거부)"""
+        loop = self.loop
+        if self.in_loop_thread():
+            coro.close()
+            raise RuntimeError("Blocking call from the shared handler loop; await the coroutine instead")
+        return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout)
+
+    def shutdown(self):
+        with self._lock:
+            loop, thread, pool = self._loop, self._thread, self._pool
+            self._loop = self._thread = self._pool = None
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+        loop.close()
+        pool.shutdown(wait=True)
+        logger.info("[Runtime] Shared handler loop stopped.")
+
+
+# 싱글톤 인스턴스
+handler_runtime = HandlerRuntime()
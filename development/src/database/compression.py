@@ -0,0 +1,59 @@
+import base64
+import zlib
+
+from sqlalchemy.types import Text, TypeDecorator
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성 (미설치 시 zlib 사용)
+    zstandard = None
+
+# 이 길이(바이트) 미만의 값은 압축 이득이 없으므로 원문 저장
+COMPRESS_MIN_BYTES = 256
+
+ZLIB_PREFIX = "z:"
+ZSTD_PREFIX = "zs:"
+
+
+def compress_text(value: str) -> str:
+    """문자열 압축 → 접두어 + base64 (Text 컬럼에 그대로 저장 가능)"""
+    raw = value.encode("utf-8")
+    if len(raw) < COMPRESS_MIN_BYTES:
+        return value
+    if zstandard is not None:
+        return ZSTD_PREFIX + base64.b64encode(zstandard.ZstdCompressor(level=3).compress(raw)).decode("ascii")
+    return ZLIB_PREFIX + base64.b64encode(zlib.compress(raw, 6)).decode("ascii")
+
+
+def decompress_text(value: str) -> str:
+    """compress_text 역변환 (접두어가 없으면 기존 평문 데이터로 간주)"""
+    if value.startswith(ZLIB_PREFIX):
+        return zlib.decompress(base64.b64decode(value[len(ZLIB_PREFIX):])).decode("utf-8")
+    if value.startswith(ZSTD_PREFIX):
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read zstd-compressed values")
+        return zstandard.ZstdDecompressor().decompress(base64.b64decode(value[len(ZSTD_PREFIX):])).decode("utf-8")
+    return value
+
+
+def is_compressed(value: str) -> bool:
+    return value.startswith(ZLIB_PREFIX) or value.startswith(ZSTD_PREFIX)
+
+
+class CompressedText(TypeDecorator):
+    """
+    저장 시 압축, 조회 시 해제되는 Text 컬럼
+    기존 평문 행과 혼재해도 읽을 수 있으므로 컬럼 타입 변경 없이 적용 가능합니다.
+    """
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None or is_compressed(value):
+            return value
+        return compress_text(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return value
+        return decompress_text(value)
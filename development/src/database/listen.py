@@ -0,0 +1,60 @@
+import select
+import threading
+from typing import Callable, Optional
+
+from sqlalchemy.engine import Engine
+
+from src.core.logger import logger
+
+# LISTEN 연결 끊김 시 재연결 대기 (초)
+LISTEN_RECONNECT_SEC = 5
+
+
+class PgListener:
+    """
+    PostgreSQL LISTEN 전용 스레드
+    대기 중에는 select()로 소켓만 감시하므로 쿼리를 보내지 않음
+    """
+
+    def __init__(self, engine: Engine, channel: str, callback: Callable[[str], None]):
+        self.engine = engine
+        self.channel = channel
+        self.callback = callback
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name=f"listen-{self.channel}", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout=LISTEN_RECONNECT_SEC)
+
+    def _run(self):
+        while not self._stopped.is_set():
+            raw = None
+            try:
+                raw = self.engine.raw_connection()
+                conn = raw.driver_connection
+                conn.autocommit = True
+                conn.cursor().execute(f"LISTEN {self.channel}")
+                logger.info(f"[Listen] Listening on '{self.channel}'.")
+                # 재연결 사이에 발생한 알림을 놓치지 않도록 연결 직후 1회 깨움
+                self.callback("")
+                while not self._stopped.is_set():
+                    if select.select([conn], [], [], 1.0) == ([], [], []):
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        self.callback(conn.notifies.pop(0).payload)
+            except Exception as e:
+                logger.error(f"[Listen] LISTEN connection lost: {e}")
+                self._stopped.wait(LISTEN_RECONNECT_SEC)
+            finally:
+                if raw is not None:
+                    try:
+                        raw.close()
+                    except Exception:
+                        pass
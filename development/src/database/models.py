@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Optional, List
-from sqlalchemy import String, Integer, DateTime, ForeignKey, Boolean, Text, JSON
+from sqlalchemy import String, Integer, DateTime, ForeignKey, Boolean, Text, JSON, Index
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -57,10 +57,18 @@ class Deployment(TimeStampedModel):
     instance_config: Mapped[dict] = mapped_column(JSON) # 실제 적용된 설정 (API Key 등)
     resource_id: Mapped[Optional[str]] = mapped_column(String(100)) # Docker Container ID or Process ID
     
+    # 워커 점유 정보 (claim & lease)
+    claimed_by: Mapped[Optional[str]] = mapped_column(String(64))
+    lease_expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    
     owner: Mapped["User"] = relationship(back_populates="deployments")
     service: Mapped["ServiceCatalog"] = relationship(back_populates="deployments")
     logs: Mapped[List["SystemLog"]] = relationship(back_populates="deployment")
 
+    __table_args__ = (
+        Index("ix_deployments_status_created", "status", "created_at"),
+    )
+
 # ---------------------------------------------------------
 # 4. ERP & Billing (TG_ERP_Architecture)
 # ---------------------------------------------------------
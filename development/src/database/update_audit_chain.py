@@ -0,0 +1,23 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import inspect, text
+from src.database.engine import engine
+
+def update_audit_chain():
+    print("[*] Applying Audit Log Hash Chain Schema...")
+    try:
+        columns = [c["name"] for c in inspect(engine).get_columns("audit_logs")]
+        with engine.begin() as conn:
+            for name, ddl in [("chain_id", "VARCHAR(16)"), ("prev_hash", "VARCHAR(64)"), ("entry_hash", "VARCHAR(64)")]:
+                if name not in columns:
+                    conn.execute(text(f"ALTER TABLE audit_logs ADD COLUMN {name} {ddl}"))
+                    print(f"    [+] Added audit_logs.{name}")
+            conn.execute(text("CREATE INDEX IF NOT EXISTS ix_audit_logs_chain_id ON audit_logs (chain_id)"))
+        print("[SUCCESS] Audit Log Hash Chain Schema Ready.")
+    except Exception as e:
+        print(f"[ERROR] {e}")
+
+if __name__ == "__main__":
+    update_audit_chain()
@@ -0,0 +1,54 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from datetime import datetime
+from sqlalchemy import inspect, text
+from sqlalchemy.orm import Session
+from src.database.engine import engine
+from src.commerce.domain.models_phase2 import Reservation, BookingResource, ReservationSlot
+from src.commerce.services.booking_engine import ACTIVE_STATUSES, STORE_LEVEL_RESOURCE, slot_starts
+
+def update_booking_resources():
+    print("[*] Applying Booking Resource Schema (Resources, Slot Claims)...")
+    try:
+        BookingResource.__table__.create(bind=engine, checkfirst=True)
+        ReservationSlot.__table__.create(bind=engine, checkfirst=True)
+
+        # 기존 예약 테이블에 resource_id 컬럼 추가
+        columns = [c["name"] for c in inspect(engine).get_columns(Reservation.__tablename__)]
+        if "resource_id" not in columns:
+            with engine.begin() as conn:
+                conn.execute(text(f"ALTER TABLE {Reservation.__tablename__} ADD COLUMN resource_id INTEGER"))
+            print("    [+] Column Added: com_reservations.resource_id")
+
+        # 향후 활성 예약의 슬롯 점유 백필
+        session = Session(engine)
+        try:
+            claimed = {
+                (row.store_id, row.resource_id, row.slot_start)
+                for row in session.query(ReservationSlot.store_id, ReservationSlot.resource_id, ReservationSlot.slot_start)
+            }
+            upcoming = session.query(Reservation).filter(
+                Reservation.status.in_(ACTIVE_STATUSES),
+                Reservation.end_at > datetime.now()
+            ).order_by(Reservation.reserved_at).all()
+
+            for r in upcoming:
+                key = r.resource_id or STORE_LEVEL_RESOURCE
+                for slot in slot_starts(r.reserved_at, r.end_at):
+                    if (r.store_id, key, slot) in claimed:
+                        continue
+                    claimed.add((r.store_id, key, slot))
+                    session.add(ReservationSlot(reservation_id=r.id, store_id=r.store_id, resource_id=key, slot_start=slot))
+            session.commit()
+            print(f"    [+] Slot claims backfilled for {len(upcoming)} reservations")
+        finally:
+            session.close()
+
+        print("[SUCCESS] Booking Resource Tables Ready.")
+    except Exception as e:
+        print(f"[ERROR] {e}")
+
+if __name__ == "__main__":
+    update_booking_resources()
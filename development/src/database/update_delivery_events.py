@@ -0,0 +1,40 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import inspect, text
+from src.database.engine import engine
+from src.commerce.domain.models_gap_v2 import DeliveryEvent, DeliverySlaStat
+
+def update_delivery_events():
+    print("[*] Applying Delivery Tracking Schema (event log, SLA stats)...")
+    try:
+        DeliveryEvent.__table__.create(bind=engine, checkfirst=True)
+        DeliverySlaStat.__table__.create(bind=engine, checkfirst=True)
+        print("    [+] Tables created")
+
+        inspector = inspect(engine)
+        columns = [c["name"] for c in inspector.get_columns("com_deliveries")]
+        with engine.begin() as conn:
+            for name, ddl in [
+                ("store_id", "INTEGER"),
+                ("assigned_at", "TIMESTAMP"),
+                ("picked_up_at", "TIMESTAMP"),
+            ]:
+                if name not in columns:
+                    conn.execute(text(f"ALTER TABLE com_deliveries ADD COLUMN {name} {ddl}"))
+                    print(f"    [+] Added com_deliveries.{name}")
+
+            # 기존 배달 건의 매장 정보 채우기
+            conn.execute(text(
+                "UPDATE com_deliveries SET store_id = "
+                "(SELECT store_id FROM com_orders WHERE com_orders.id = com_deliveries.order_id) "
+                "WHERE store_id IS NULL"
+            ))
+            conn.execute(text("CREATE INDEX IF NOT EXISTS ix_com_deliveries_store_id ON com_deliveries (store_id)"))
+        print("[SUCCESS] Delivery Tracking Schema Ready.")
+    except Exception as e:
+        print(f"[ERROR] {e}")
+
+if __name__ == "__main__":
+    update_delivery_events()
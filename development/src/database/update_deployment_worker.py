@@ -0,0 +1,27 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import inspect, text
+from src.database.engine import engine
+
+def update_deployment_worker():
+    print("[*] Applying Deployment Worker Schema (claim/lease columns)...")
+    try:
+        columns = [c["name"] for c in inspect(engine).get_columns("deployments")]
+        timestamp_type = "TIMESTAMP" if engine.dialect.name == "postgresql" else "DATETIME"
+        with engine.begin() as conn:
+            for name, ddl in [("claimed_by", "VARCHAR(64)"), ("lease_expires_at", timestamp_type)]:
+                if name not in columns:
+                    conn.execute(text(f"ALTER TABLE deployments ADD COLUMN {name} {ddl}"))
+                    print(f"    [+] Added deployments.{name}")
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_deployments_status_created "
+                "ON deployments (status, created_at)"
+            ))
+        print("[SUCCESS] Deployment Worker Schema Ready.")
+    except Exception as e:
+        print(f"[ERROR] {e}")
+
+if __name__ == "__main__":
+    update_deployment_worker()
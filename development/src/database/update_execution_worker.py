@@ -0,0 +1,28 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import inspect, text
+from src.database.engine import engine
+
+def update_execution_worker():
+    print("[*] Applying Execution Worker Schema (claim/lease columns)...")
+    try:
+        columns = [c["name"] for c in inspect(engine).get_columns("execution_requests")]
+        with engine.begin() as conn:
+            for name, ddl in [("claimed_by", "VARCHAR(64)"), ("lease_expires_at", "DATETIME"), ("attempts", "INTEGER DEFAULT 0")]:
+                if name not in columns:
+                    if engine.dialect.name == "postgresql" and ddl == "DATETIME":
+                        ddl = "TIMESTAMP"
+                    conn.execute(text(f"ALTER TABLE execution_requests ADD COLUMN {name} {ddl}"))
+                    print(f"    [+] Added execution_requests.{name}")
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_execution_requests_status_created "
+                "ON execution_requests (status, created_at)"
+            ))
+        print("[SUCCESS] Execution Worker Schema Ready.")
+    except Exception as e:
+        print(f"[ERROR] {e}")
+
+if __name__ == "__main__":
+    update_execution_worker()
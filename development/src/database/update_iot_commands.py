@@ -0,0 +1,17 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from src.database.engine import engine
+from src.commerce.domain.models_phase2 import IoTCommand
+
+def update_iot_commands():
+    print("[*] Applying IoT Command Schema...")
+    try:
+        IoTCommand.__table__.create(bind=engine, checkfirst=True)
+        print("[SUCCESS] IoT Command table created.")
+    except Exception as e:
+        print(f"[ERROR] {e}")
+
+if __name__ == "__main__":
+    update_iot_commands()
@@ -0,0 +1,21 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import inspect, text
+from src.database.engine import engine
+
+def update_iot_telemetry():
+    print("[*] Applying IoT Telemetry Schema...")
+    try:
+        columns = [c["name"] for c in inspect(engine).get_columns("com_iot_devices")]
+        if "telemetry" not in columns:
+            with engine.begin() as conn:
+                conn.execute(text("ALTER TABLE com_iot_devices ADD COLUMN telemetry TEXT"))
+            print("    [+] Added com_iot_devices.telemetry")
+        print("[SUCCESS] IoT Telemetry Schema Ready.")
+    except Exception as e:
+        print(f"[ERROR] {e}")
+
+if __name__ == "__main__":
+    update_iot_telemetry()
@@ -0,0 +1,48 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session
+from src.database.engine import engine
+from src.commerce.domain.models_gap_v2 import MemberPoint, PointHistory
+
+def update_membership_points():
+    print("[*] Applying Membership Upsert Schema (unique store/phone)...")
+    session = Session(engine)
+    try:
+        # 1. 중복 회원 병합 (가장 오래된 행으로 포인트/이력 이관)
+        duplicates = session.query(
+            MemberPoint.store_id, MemberPoint.user_phone, func.min(MemberPoint.id)
+        ).group_by(MemberPoint.store_id, MemberPoint.user_phone).having(func.count(MemberPoint.id) > 1).all()
+
+        for store_id, phone, keep_id in duplicates:
+            rows = session.query(MemberPoint).filter_by(store_id=store_id, user_phone=phone).all()
+            keeper = next(r for r in rows if r.id == keep_id)
+            for r in rows:
+                if r.id == keep_id:
+                    continue
+                keeper.current_points += r.current_points or 0
+                keeper.total_accumulated += r.total_accumulated or 0
+                if r.last_visit and (not keeper.last_visit or r.last_visit > keeper.last_visit):
+                    keeper.last_visit = r.last_visit
+                session.query(PointHistory).filter_by(member_id=r.id).update({"member_id": keep_id})
+                session.delete(r)
+        session.commit()
+        print(f"    [+] Merged {len(duplicates)} duplicated members")
+
+        # 2. 유니크 인덱스 생성 (ON CONFLICT 대상)
+        with engine.begin() as conn:
+            conn.execute(text(
+                "CREATE UNIQUE INDEX IF NOT EXISTS uq_member_store_phone "
+                "ON com_member_points (store_id, user_phone)"
+            ))
+        print("[SUCCESS] Membership Upsert Schema Ready.")
+    except Exception as e:
+        session.rollback()
+        print(f"[ERROR] {e}")
+    finally:
+        session.close()
+
+if __name__ == "__main__":
+    update_membership_points()
@@ -0,0 +1,22 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import text
+from src.database.engine import engine
+
+def update_point_expiry():
+    print("[*] Applying Point Expiry Schema (ledger index)...")
+    try:
+        # 회원별 원장 집계용 복합 인덱스
+        with engine.begin() as conn:
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_point_history_member_created "
+                "ON com_point_history (member_id, created_at)"
+            ))
+        print("[SUCCESS] Point Expiry Schema Ready.")
+    except Exception as e:
+        print(f"[ERROR] {e}")
+
+if __name__ == "__main__":
+    update_point_expiry()
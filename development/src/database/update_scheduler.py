@@ -0,0 +1,25 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import text
+from src.database.engine import engine
+from src.core.database.v3_schema import SchedulerLease
+from src.core.database import v3_extensions, v3_campaigns
+
+def update_scheduler():
+    print("[*] Applying Scheduler Schema (leader lease, due index)...")
+    try:
+        SchedulerLease.__table__.create(bind=engine, checkfirst=True)
+        print("    [+] scheduler_leases table ready")
+        with engine.begin() as conn:
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_campaigns_status_scheduled "
+                "ON campaigns (status, scheduled_at)"
+            ))
+        print("[SUCCESS] Scheduler Schema Ready.")
+    except Exception as e:
+        print(f"[ERROR] {e}")
+
+if __name__ == "__main__":
+    update_scheduler()
@@ -0,0 +1,27 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import text
+from src.database.engine import engine
+
+INDEXES = [
+    "CREATE INDEX IF NOT EXISTS ix_orders_store_created ON com_orders (store_id, created_at)",
+    "CREATE INDEX IF NOT EXISTS ix_orders_store_status ON com_orders (store_id, status)",
+    "CREATE INDEX IF NOT EXISTS ix_payments_paid_at ON com_payments (paid_at)",
+    "CREATE INDEX IF NOT EXISTS ix_payments_order ON com_payments (order_id)",
+]
+
+def update_stats_indexes():
+    print("[*] Applying Dashboard Stats Indexes (orders, payments)...")
+    try:
+        with engine.begin() as conn:
+            for ddl in INDEXES:
+                conn.execute(text(ddl))
+                print(f"    [+] {ddl.split(' ')[5]}")
+        print("[SUCCESS] Dashboard Stats Indexes Ready.")
+    except Exception as e:
+        print(f"[ERROR] {e}")
+
+if __name__ == "__main__":
+    update_stats_indexes()
@@ -0,0 +1,37 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from src.database.engine import engine
+from src.commerce.domain.models_gap import SurveyStat, SurveyDailyStat, SurveyTag, SurveyTagStat
+from src.commerce.services.survey_stats import SurveyStatsService
+
+def update_survey_stats():
+    print("[*] Applying Survey Aggregate Schema (stats, daily, tag index)...")
+    session = Session(engine)
+    try:
+        SurveyStat.__table__.create(bind=engine, checkfirst=True)
+        SurveyDailyStat.__table__.create(bind=engine, checkfirst=True)
+        SurveyTag.__table__.create(bind=engine, checkfirst=True)
+        SurveyTagStat.__table__.create(bind=engine, checkfirst=True)
+        with engine.begin() as conn:
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_survey_store_created "
+                "ON com_customer_surveys (store_id, created_at)"
+            ))
+        print("    [+] Tables created")
+
+        # 기존 설문으로 집계 백필
+        processed = SurveyStatsService(session).rebuild()
+        print(f"    [+] Backfilled {processed} surveys")
+        print("[SUCCESS] Survey Aggregate Schema Ready.")
+    except Exception as e:
+        session.rollback()
+        print(f"[ERROR] {e}")
+    finally:
+        session.close()
+
+if __name__ == "__main__":
+    update_survey_stats()
@@ -0,0 +1,28 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import text
+from src.database.engine import engine
+from src.commerce.services.sync_log_retention import SyncLogRetention
+
+def update_sync_log_retention():
+    print("[*] Applying Sync Log Retention Schema (created_at index, payload compression)...")
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("CREATE INDEX IF NOT EXISTS ix_sync_logs_created_at ON sync_logs (created_at)"))
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_sync_logs_event_created "
+                "ON sync_logs (event_type, created_at)"
+            ))
+        print("    [+] Indexes created")
+
+        # 기존 평문 로그 압축 (짧은 값은 평문 유지)
+        converted = SyncLogRetention().compress_legacy()
+        print(f"    [+] Compressed {converted} legacy rows")
+        print("[SUCCESS] Sync Log Retention Schema Ready.")
+    except Exception as e:
+        print(f"[ERROR] {e}")
+
+if __name__ == "__main__":
+    update_sync_log_retention()
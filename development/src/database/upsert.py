@@ -0,0 +1,15 @@
+from sqlalchemy.orm import Session
+
+def dialect_insert(db: Session, model):
+    """
+    현재 연결된 DB 방언의 INSERT 구문 생성
+    (on_conflict_do_nothing / on_conflict_do_update 사용 가능 - SQLite, PostgreSQL)
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f"ON CONFLICT upsert is not supported for dialect: {dialect}")
+    return insert(model)
@@ -17,7 +17,7 @@ class ContentType(str, Enum):
 class Recipient(BaseModel):
     """수신자 정보"""
     name: Optional[str] = None
-    email: EmailStr
+    email: Optional[EmailStr] = None  # SMS 등 전화번호 기반 채널은 생략 가능
     phone: Optional[str] = None
 
 class MessageRequest(BaseModel):
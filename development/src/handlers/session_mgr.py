@@ -1,4 +1,3 @@
-import asyncio
 import os
 from datetime import datetime
 from typing import Dict, Any
@@ -32,10 +31,8 @@ class SessionValidateFunction(BaseFunction):
             if proxy_url:
                 tg_session.proxy_url = proxy_url
             
-            # 비동기 검증 실행
-            loop = asyncio.new_event_loop()
-            result = loop.run_until_complete(self._check_telegram(tg_session))
-            loop.close()
+            # 비동기 검증 실행 (동기 DB 작업이 섞여 있으므로 handle은 sync 유지, 검증만 공용 루프에서)
+            result = self.run_coroutine(self._check_telegram(tg_session))
             
             # DB 업데이트
             tg_session.status = result["status"]
@@ -1,4 +1,3 @@
-import asyncio
 from typing import Dict, Any
 from telethon import TelegramClient
 from src.core.serverless.handler import BaseFunction
@@ -10,7 +9,7 @@ class MainFunction(BaseFunction):
     Description: 단발성 텔레그램 메시지 전송 함수
     """
     
-    def handle(self, event: Dict[str, Any]) -> Dict[str, Any]:
+    async def handle(self, event: Dict[str, Any]) -> Dict[str, Any]:
         """
         Event Payload:
         {
@@ -25,14 +24,7 @@ class MainFunction(BaseFunction):
         
         self.audit("EXECUTE_START", f"Sending to {target}")
         
-        # 비동기 실행을 위한 래퍼
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(self._send_async(session_file, target, message))
-            return result
-        finally:
-            loop.close()
+        return await self._send_async(session_file, target, message)
 
     async def _send_async(self, session_file, target, message):
         # API ID/HASH는 환경변수 또는 보안 저장소(Vault)에서 가져와야 함
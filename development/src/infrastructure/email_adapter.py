@@ -1,24 +1,71 @@
-import smtplib
+import asyncio
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import List
+from typing import List, Optional
+
+import aiosmtplib
 
 from src.core.config import settings
 from src.core.logger import logger
 from src.domain.schemas import MessageRequest, SendResult, ContentType
 from src.application.interfaces import ISenderService
+from src.infrastructure.smtp_pool import SMTPConnectionPool
+
+# 재시도 대상 오류 (일시적 장애). 인증 실패/영구 거부(5xx)는 재시도하지 않음
+TRANSIENT_ERRORS = (
+    aiosmtplib.SMTPConnectError,
+    aiosmtplib.SMTPServerDisconnected,
+    aiosmtplib.SMTPTimeoutError,
+    OSError,
+)
+
+
+def _is_transient(error: Exception) -> bool:
+    if isinstance(error, aiosmtplib.SMTPAuthenticationError):
+        return False
+    if isinstance(error, aiosmtplib.SMTPRecipientsRefused):
+        return all(400 <= e.code < 500 for e in error.recipients)
+    if isinstance(error, aiosmtplib.SMTPResponseException):
+        return 400 <= error.code < 500
+    return isinstance(error, TRANSIENT_ERRORS)
+
 
 class EmailAdapter(ISenderService):
     """
     SMTP 프로토콜을 이용한 이메일 전송 구현체
+
+    인증된 연결을 풀(SMTPConnectionPool)에서 재사용하고, 수신자별 메시지를 풀 크기만큼 동시에 전송합니다.
+    일시적 오류(연결 끊김, 4xx 응답)는 지수 백오프로 재시도합니다.
     """
 
-    def __init__(self):
-        self.host = settings.SMTP_HOST
-        self.port = settings.SMTP_PORT
-        self.user = settings.SMTP_USER
-        self.password = settings.SMTP_PASSWORD
+    def __init__(
+        self,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        user: Optional[str] = None,
+        password: Optional[str] = None,
+        pool_size: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        retry_backoff_sec: Optional[float] = None
+    ):
+        self.host = host or settings.SMTP_HOST
+        self.port = port or settings.SMTP_PORT
+        self.user = settings.SMTP_USER if user is None else user
+        self.password = settings.SMTP_PASSWORD if password is None else password
         self.default_sender = settings.DEFAULT_SENDER
+        self.max_retries = settings.SMTP_MAX_RETRIES if max_retries is None else max_retries
+        self.retry_backoff_sec = settings.SMTP_RETRY_BACKOFF_SEC if retry_backoff_sec is None else retry_backoff_sec
+
+        self.pool = SMTPConnectionPool(
+            self.host,
+            self.port,
+            username=self.user,
+            password=self.password,
+            size=pool_size or settings.SMTP_POOL_SIZE,
+            timeout=settings.SMTP_TIMEOUT_SEC,
+            use_tls=self.port == 465,
+            start_tls=self.port == 587
+        )
 
     def _create_mime_message(self, request: MessageRequest, to_email: str) -> MIMEMultipart:
         """이메일 메시지 객체 생성"""
@@ -31,65 +78,84 @@ class EmailAdapter(ISenderService):
         charset = "utf-8"
         part = MIMEText(request.body, "html" if request.content_type == ContentType.HTML else "plain", charset)
         msg.attach(part)
-        
+
         return msg
 
+    async def _deliver(self, request: MessageRequest, to_email: str):
+        """수신자 1명 전송 (일시적 오류는 백오프 재시도)"""
+        msg = self._create_mime_message(request, to_email)
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                async with self.pool.connection() as smtp:
+                    await smtp.send_message(msg, sender=msg["From"], recipients=[to_email])
+                return
+            except Exception as e:
+                if attempt == self.max_retries or not _is_transient(e):
+                    raise
+                delay = self.retry_backoff_sec * (2 ** (attempt - 1))
+                logger.warning(f"SMTP send to {to_email} failed ({e}), retry {attempt}/{self.max_retries - 1} in {delay:.2f}s")
+                await asyncio.sleep(delay)
+
     async def send(self, message: MessageRequest) -> SendResult:
         logger.info(f"Attempting to send email via SMTP: {self.host}:{self.port} | Request ID: {message.request_id}")
-        
+
         # 수신자 목록 추출
-        recipient_emails = [r.email for r in message.recipients]
-        
+        recipient_emails = [r.email for r in message.recipients if r.email]
+
         if not recipient_emails:
             logger.warning(f"No recipients found for Request ID: {message.request_id}")
             return SendResult(success=False, request_id=message.request_id, error_code="NO_RECIPIENTS", message="Recipient list is empty")
 
-        try:
-            # SMTP 연결 설정 (동기 방식, 향후 aiosmtplib으로 비동기 전환 가능)
-            # 여기서는 편의상 표준 smtplib 사용 (블로킹 주의)
-            with smtplib.SMTP(self.host, self.port) as server:
-                server.ehlo()
-                # TLS 보안 시작
-                if self.port == 587:
-                    server.starttls()
-                    server.ehlo()
-                
-                # 로그인
-                if self.user and self.password:
-                    server.login(self.user, self.password)
-
-                # 개별 발송 (Bulk 발송 시 전략 변경 필요)
-                for to_email in recipient_emails:
-                    msg = self._create_mime_message(message, to_email)
-                    server.sendmail(msg["From"], to_email, msg.as_string())
-            
+        # 수신자별 개별 발송 (동시 전송 수는 연결 풀 크기로 제한)
+        outcomes = await asyncio.gather(
+            *(self._deliver(message, to_email) for to_email in recipient_emails),
+            return_exceptions=True
+        )
+        errors: List[Exception] = [o for o in outcomes if isinstance(o, BaseException)]
+
+        if not errors:
             logger.success(f"Email sent successfully. Request ID: {message.request_id}")
             return SendResult(success=True, request_id=message.request_id)
 
-        except smtplib.SMTPAuthenticationError:
+        first = errors[0]
+        failed = f"{len(errors)}/{len(recipient_emails)} recipients failed"
+        if isinstance(first, aiosmtplib.SMTPAuthenticationError):
             error_msg = "SMTP Authentication failed. Check credentials."
             logger.error(error_msg)
             return SendResult(success=False, request_id=message.request_id, error_code="AUTH_ERROR", message=error_msg)
-            
-        except smtplib.SMTPException as e:
-            error_msg = f"SMTP Error: {str(e)}"
+
+        if len(errors) < len(recipient_emails):
+            error_msg = f"{failed}: {first}"
+            logger.error(f"Partial email failure. Request ID: {message.request_id} | {error_msg}")
+            return SendResult(success=False, request_id=message.request_id, error_code="PARTIAL_FAILURE", message=error_msg)
+
+        if isinstance(first, (aiosmtplib.SMTPException, OSError)):
+            error_msg = f"SMTP Error: {str(first)}"
             logger.error(error_msg)
             return SendResult(success=False, request_id=message.request_id, error_code="SMTP_ERROR", message=error_msg)
 
-        except Exception as e:
-            error_msg = f"Unexpected error during email sending: {str(e)}"
-            logger.exception(error_msg)
-            return SendResult(success=False, request_id=message.request_id, error_code="UNKNOWN_ERROR", message=error_msg)
+        error_msg = f"Unexpected error during email sending: {str(first)}"
+        logger.opt(exception=first).error(error_msg)
+        return SendResult(success=False, request_id=message.request_id, error_code="UNKNOWN_ERROR", message=error_msg)
 
     async def validate_connection(self) -> bool:
+        smtp = aiosmtplib.SMTP(
+            hostname=self.host,
+            port=self.port,
+            username=self.user or None,
+            password=self.password or None,
+            timeout=5,
+            use_tls=self.port == 465,
+            start_tls=self.port == 587
+        )
         try:
-            with smtplib.SMTP(self.host, self.port, timeout=5) as server:
-                server.ehlo()
-                if self.port == 587:
-                    server.starttls()
-                if self.user and self.password:
-                    server.login(self.user, self.password)
+            await smtp.connect()
+            await smtp.quit()
             return True
         except Exception as e:
             logger.error(f"Connection validation failed: {e}")
-            return False
\ No newline at end of file
+            return False
+
+    async def close(self):
+        """풀에 남은 연결 정리"""
+        await self.pool.close()
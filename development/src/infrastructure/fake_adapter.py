@@ -0,0 +1,27 @@
+from typing import List, Optional, Set
+
+from src.core.logger import logger
+from src.domain.schemas import MessageRequest, SendResult
+from src.application.interfaces import ISenderService
+
+class FakeSenderAdapter(ISenderService):
+    """
+    실제 발송 없이 메시지를 메모리에 기록하는 테스트용 구현체
+    (기록이 계속 쌓이므로 운영 프로세스에서는 사용하지 않음)
+    """
+
+    def __init__(self, fail_phones: Optional[Set[str]] = None):
+        self.sent: List[MessageRequest] = []
+        self.fail_phones = fail_phones or set()
+
+    async def send(self, message: MessageRequest) -> SendResult:
+        if any(r.phone in self.fail_phones for r in message.recipients):
+            logger.warning(f"[FAKE] Simulated failure. Request ID: {message.request_id}")
+            return SendResult(success=False, request_id=message.request_id, error_code="FAKE_FAILURE", message="Simulated failure")
+
+        self.sent.append(message)
+        logger.info(f"[FAKE] {message.channel.value.upper()} → {[r.phone or r.email for r in message.recipients]} | {message.subject}")
+        return SendResult(success=True, request_id=message.request_id)
+
+    async def validate_connection(self) -> bool:
+        return True
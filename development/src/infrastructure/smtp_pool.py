@@ -0,0 +1,118 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import List, Optional
+
+import aiosmtplib
+
+from src.core.logger import logger
+
+# 이 시간 이상 쉬었던 연결은 재사용 전에 NOOP으로 살아있는지 확인 (초)
+IDLE_CHECK_SEC = 30
+
+
+class SMTPConnectionPool:
+    """
+    인증된 aiosmtplib 연결 풀
+
+    - 최대 size개의 연결을 유지하며 동시에 size건까지만 전송 (동시성 상한)
+    - 반납된 연결은 재사용하므로 연결/TLS/AUTH 비용은 연결당 1회
+    - 전송 중 연결 오류가 난 연결은 폐기하고 다음 요청에서 새로 연결
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        size: int = 4,
+        timeout: float = 10,
+        use_tls: bool = False,
+        start_tls: bool = False
+    ):
+        self.host = host
+        self.port = port
+        self.username = username or None
+        self.password = password or None
+        self.size = size
+        self.timeout = timeout
+        self.use_tls = use_tls
+        self.start_tls = start_tls
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._idle: List[tuple] = []  # (연결, 반납 시각)
+        self.opened = 0
+
+    def _bind_loop(self):
+        """연결과 세마포어는 이벤트 루프에 묶이므로 루프가 바뀌면 새로 구성"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._slots = asyncio.Semaphore(self.size)
+            self._idle = []
+
+    async def _open(self) -> aiosmtplib.SMTP:
+        smtp = aiosmtplib.SMTP(
+            hostname=self.host,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            timeout=self.timeout,
+            use_tls=self.use_tls,
+            start_tls=self.start_tls
+        )
+        await smtp.connect()  # username/password가 있으면 connect 중 로그인
+        self.opened += 1
+        return smtp
+
+    async def _checkout(self) -> aiosmtplib.SMTP:
+        while self._idle:
+            smtp, returned_at = self._idle.pop()
+            if not smtp.is_connected:
+                continue
+            if time.monotonic() - returned_at >= IDLE_CHECK_SEC:
+                try:
+                    await smtp.noop()
+                except aiosmtplib.SMTPException:
+                    await _close_quietly(smtp)
+                    continue
+            return smtp
+        return await self._open()
+
+    @asynccontextmanager
+    async def connection(self):
+        self._bind_loop()
+        async with self._slots:
+            smtp = await self._checkout()
+            try:
+                yield smtp
+            except (aiosmtplib.SMTPServerDisconnected, aiosmtplib.SMTPTimeoutError, OSError, asyncio.CancelledError):
+                # 응답 상태를 알 수 없는 연결은 폐기
+                await _close_quietly(smtp)
+                raise
+            except Exception:
+                # 명령 단위 오류(수신자 거부 등)는 연결 재사용 가능
+                if smtp.is_connected:
+                    self._idle.append((smtp, time.monotonic()))
+                raise
+            else:
+                self._idle.append((smtp, time.monotonic()))
+
+    async def close(self):
+        idle, self._idle = self._idle, []
+        for smtp, _ in idle:
+            try:
+                await smtp.quit()
+            except Exception:
+                await _close_quietly(smtp)
+        if idle:
+            logger.info(f"[SMTP] Closed {len(idle)} pooled connections to {self.host}:{self.port}")
+
+
+async def _close_quietly(smtp: aiosmtplib.SMTP):
+    try:
+        smtp.close()
+    except Exception:
+        pass
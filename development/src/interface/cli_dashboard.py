@@ -1,5 +1,6 @@
 import time
 import sys
+import requests
 from datetime import datetime
 from rich.console import Console
 from rich.layout import Layout
@@ -9,6 +10,7 @@ from rich.live import Live
 from rich.text import Text
 from sqlalchemy.orm import Session
 from src.database.engine import SessionLocal
+from src.core.config import settings
 from src.core.database.v3_schema import ExecutionRequest, AuditLog, MasterUser, FunctionCatalog
 from src.core.database.v3_campaigns import Campaign
 from src.core.database.v3_extensions import TgSession
@@ -41,6 +43,15 @@ def fetch_data():
     finally:
         db.close()
 
+def fetch_metrics():
+    """커널 실행 지표 요약 (API 프로세스 메모리 집계, 미기동 시 None)"""
+    try:
+        resp = requests.get(f"{settings.CORE_API_URL}/metrics/summary", timeout=0.5)
+        resp.raise_for_status()
+        return resp.json()
+    except Exception:
+        return None
+
 def make_layout():
     layout = Layout()
     layout.split(
@@ -56,6 +67,10 @@ def make_layout():
         Layout(name="jobs", ratio=1),
         Layout(name="campaigns", ratio=1)
     )
+    layout["right"].split(
+        Layout(name="logs", ratio=1),
+        Layout(name="metrics", ratio=1)
+    )
     return layout
 
 def generate_dashboard():
@@ -112,6 +127,30 @@ def generate_dashboard():
         progress = f"{camp.sent_count}/{camp.total_targets}"
         camp_table.add_row(camp.name, camp.status, progress)
 
+    # Function Metrics (실행 시간 점유율 순)
+    metric_table = Table(title="[bold]Function Metrics[/bold]", expand=True, border_style="magenta")
+    metric_table.add_column("Function", style="magenta")
+    metric_table.add_column("Runs", justify="right")
+    metric_table.add_column("Err%", justify="right")
+    metric_table.add_column("Avg/P95(ms)", justify="right")
+    metric_table.add_column("Wait(ms)", justify="right")
+    metric_table.add_column("Busy%", justify="right")
+
+    metrics = fetch_metrics()
+    if metrics is None:
+        metric_table.add_row("[dim]API offline[/dim]", "-", "-", "-", "-", "-")
+    else:
+        for fn in metrics["functions"][:8]:
+            err_color = "red" if fn["error_rate"] >= 0.1 else "green"
+            metric_table.add_row(
+                fn["function_code"],
+                str(fn["total"]),
+                f"[{err_color}]{fn['error_rate'] * 100:.1f}[/{err_color}]",
+                f"{fn['avg_ms'] or '-'}/{fn['p95_ms'] or '-'}",
+                str(fn["avg_queue_wait_ms"] or "-"),
+                f"{fn['busy_share'] * 100:.0f}"
+            )
+
     # Stats Panel
     stats_text = Text()
     stats_text.append(f"\n👥 Total Users: {user_cnt}\n", style="bold white")
@@ -124,7 +163,8 @@ def generate_dashboard():
     layout["header"].update(Panel(header_content, style="white on black"))
     layout["jobs"].update(Panel(job_table))
     layout["campaigns"].update(Panel(camp_table))
-    layout["right"].update(Panel(log_table))
+    layout["logs"].update(Panel(log_table))
+    layout["metrics"].update(Panel(metric_table))
     layout["footer"].update(stats_panel)
     
     return layout
@@ -2,6 +2,7 @@ import sys
 import os
 from pathlib import Path
 from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse
 from fastapi.templating import Jinja2Templates # 템플릿 엔진
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
@@ -17,17 +18,42 @@ from src.api.routes_v3 import router as v3_router
 from src.api.routes_dashboard import router as dashboard_router
 from src.api.routes_report import router as report_router
 from src.core.scheduler import run_scheduler
+from src.core.registry import handler_registry
+from src.core.serverless.runtime import handler_runtime
+from src.core.metrics import kernel_metrics
+from src.services.execution.executor import execution_executor
+from src.database.engine import SessionLocal
 
 # 템플릿 초기화
 templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
 
+def preload_handlers():
+    db = SessionLocal()
+    try:
+        handler_registry.preload(db)
+    finally:
+        db.close()
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # 함수 카탈로그 핸들러 사전 적재 (import 실패 항목은 기동 로그로 확인)
+    await asyncio.to_thread(preload_handlers)
+    recovery_task = None
+    if settings.EXECUTION_BACKEND != "worker":
+        execution_executor.start()
+        # 방치된 QUEUED 요청 주기적 재등록 (기동 직후 1회 포함)
+        recovery_task = asyncio.create_task(execution_executor.recovery_loop())
     scheduler_task = asyncio.create_task(run_scheduler())
     yield
-    scheduler_task.cancel()
-    try: await scheduler_task
-    except asyncio.CancelledError: pass
+    for task in (scheduler_task, recovery_task):
+        if task is None: continue
+        task.cancel()
+        try: await task
+        except asyncio.CancelledError: pass
+    # 실행 대기열 정리 (새 요청 차단 후 남은 요청 처리)
+    await asyncio.to_thread(execution_executor.shutdown)
+    # 공용 핸들러 루프/스레드 풀 정리
+    await asyncio.to_thread(handler_runtime.shutdown)
 
 app = FastAPI(title="TG-SYSTEM Enterprise", version="4.2.0", lifespan=lifespan)
 
@@ -43,6 +69,16 @@ app.include_router(v3_router)
 app.include_router(dashboard_router)
 app.include_router(report_router)
 
+# 커널 실행 지표 (Prometheus 텍스트 포맷)
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def metrics():
+    return PlainTextResponse(kernel_metrics.render_prometheus(), media_type="text/plain; version=0.0.4")
+
+# 커널 실행 지표 JSON 요약 (CLI 대시보드용)
+@app.get("/metrics/summary")
+def metrics_summary():
+    return kernel_metrics.summary()
+
 # [FIX] 루트 접속 시 JSON 대신 HTML 대시보드 반환
 @app.get("/")
 def home(request: Request):
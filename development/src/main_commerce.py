@@ -1,8 +1,11 @@
+import logging
 import sys
 from pathlib import Path
+from typing import Dict
 from fastapi import FastAPI, Request
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
 import uvicorn
 
 BASE_DIR = Path(__file__).resolve().parents[1]
@@ -12,10 +15,46 @@ TEMPLATES_DIR = BASE_DIR / "src" / "templates"
 # API Modules
 from src.commerce.api import products, orders, booking, iot, queue, crm, hr, delivery, membership, inventory, stats, store_config, sync, receipt
 from src.commerce.auth import routes as auth_routes
+from src.commerce.auth.signature import BodyDigestMiddleware
+from src.commerce.services.reminder_scheduler import reminder_scheduler
+from src.commerce.services.device_state import device_state
+from src.commerce.services.command_dispatcher import command_dispatcher
+from src.commerce.services.iot_transport import HttpDeviceTransport
+from src.application.interfaces import ISenderService
+from src.application.sending_service import SendingService
+from src.infrastructure.email_adapter import EmailAdapter
+from src.core.config import settings
+from src.domain.schemas import ChannelType
+
+logger = logging.getLogger(__name__)
 
 templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
 
-app = FastAPI(title="TG-COMMERCE Platform", version="4.3.0")
+def configured_sender_adapters() -> Dict[ChannelType, ISenderService]:
+    """설정값으로 구성된 실 발송 어댑터 (SMS/알림톡 어댑터는 아직 없음)"""
+    adapters: Dict[ChannelType, ISenderService] = {}
+    if settings.SMTP_USER:
+        adapters[ChannelType.EMAIL] = EmailAdapter()
+    return adapters
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 예약 리마인더 (발송 채널의 실 어댑터가 설정된 경우에만 기동, 미기동 시 예약은 미발송(is_notified=False)으로 유지)
+    sender_adapters = configured_sender_adapters()
+    if reminder_scheduler.channel in sender_adapters:
+        reminder_scheduler.start(SendingService(sender_adapters))
+    else:
+        logger.warning(f"[Reminder] No {reminder_scheduler.channel.value} adapter configured, reminder scheduler disabled.")
+    # IoT 장비 상태 (하트비트 write-behind, OFFLINE 감지)
+    device_state.start()
+    # IoT 명령 전송 (등록된 장비 IP로 HTTP 전송, 시뮬레이션 장비는 테스트 전용)
+    await command_dispatcher.start(HttpDeviceTransport())
+    yield
+    await command_dispatcher.stop()
+    await device_state.stop()
+    await reminder_scheduler.stop()
+
+app = FastAPI(title="TG-COMMERCE Platform", version="4.3.0", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -25,6 +64,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 외부 연동 요청 본문 해시 (서명 검증용, 수신 중 스트리밍 계산)
+app.add_middleware(BodyDigestMiddleware, prefixes=[sync.router.prefix])
+
 # API Routes
 app.include_router(auth_routes.router)
 app.include_router(products.router)
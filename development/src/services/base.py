@@ -1,13 +1,18 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Dict, Any
 from sqlalchemy.orm import Session
 from src.core.logger import logger
-from src.database.models import Deployment, SystemLog
+from src.database.models import Deployment
+from src.services.log_sink import SystemLogSink, system_log_sink
 
 class BaseTGService(ABC):
     """
     모든 TG 서비스(Bot, Crawler)의 기본 클래스
     """
+    # 로그 기록기 (서비스 세션과 분리된 버퍼 기록)
+    log_sink: SystemLogSink = system_log_sink
+
     def __init__(self, deployment_id: str, config: Dict[str, Any], db: Session):
         self.deployment_id = deployment_id
         self.config = config
@@ -15,15 +20,8 @@ class BaseTGService(ABC):
         self.logger = logger.bind(deployment_id=deployment_id)
 
     def log(self, message: str, level: str = "INFO"):
-        """DB에 로그를 남깁니다."""
-        new_log = SystemLog(
-            deployment_id=self.deployment_id,
-            level=level,
-            action_type=self.__class__.__name__,
-            message=message
-        )
-        self.db.add(new_log)
-        self.db.commit()
+        """DB에 로그를 남깁니다. (버퍼에 등록, 일괄 반영)"""
+        self.log_sink.append(self.deployment_id, level, self.__class__.__name__, message)
         # 콘솔에도 출력
         if level == "ERROR":
             self.logger.error(message)
@@ -59,4 +57,10 @@ class BaseTGService(ABC):
             self.log(f"Service Execution Failed: {str(e)}", level="ERROR")
             raise e
         finally:
-            await self.cleanup()
\ No newline at end of file
+            await self.cleanup()
+            # 이 서비스가 남긴 로그까지 반영 후 종료
+            # (반영 실패는 서비스 결과에 영향 없음. 싱크가 항목을 되돌리고 failed_flushes로 집계하며 다음 주기에 재시도)
+            try:
+                await asyncio.to_thread(self.log_sink.flush)
+            except Exception as e:
+                self.logger.warning(f"Log flush failed, will retry in background: {e}")
\ No newline at end of file
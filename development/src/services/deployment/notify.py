@@ -0,0 +1,48 @@
+import threading
+from typing import Callable, List
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+# 신규 배포 알림 채널 (PostgreSQL LISTEN/NOTIFY)
+DEPLOYMENT_CHANNEL = "deployment_pending"
+
+
+class LocalNotifier:
+    """같은 프로세스 내 배포 알림 (SQLite 등 NOTIFY가 없는 DB용)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: List[Callable[[str], None]] = []
+
+    def subscribe(self, callback: Callable[[str], None]):
+        with self._lock:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[str], None]):
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def notify(self, payload: str):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            callback(payload)
+
+
+def notify_deployment_pending(db: Session, deployment_id: str):
+    """
+    pending 배포 생성 알림 (커밋 후 호출)
+    PostgreSQL은 NOTIFY로 다른 프로세스의 워커까지 깨우고, 그 외 DB는 같은 프로세스의 워커만 깨움
+    (다른 프로세스의 워커는 LOCAL_POLL_INTERVAL_SEC 주기 조회로 확인)
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": DEPLOYMENT_CHANNEL, "payload": deployment_id})
+        db.commit()
+    else:
+        local_notifier.notify(deployment_id)
+
+
+# 싱글톤 인스턴스
+local_notifier = LocalNotifier()
@@ -1,14 +1,46 @@
+import argparse
 import asyncio
+import os
+import socket
 import traceback
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 from src.database.engine import SessionLocal
 from src.database.models import Deployment, ServiceCatalog
 from src.services.factory import ServiceFactory
+from src.services.deployment.notify import DEPLOYMENT_CHANNEL, local_notifier
+from src.database.listen import PgListener
 from src.core.logger import logger
 
-async def process_deployment(deployment_id: str):
+# 동시에 실행할 배포 수 (워커 프로세스당)
+MAX_CONCURRENCY = 4
+
+# 한 번에 점유할 최대 배포 수
+BATCH_SIZE = 8
+
+# 점유 유효시간. 실행 중에는 LEASE_SEC / 3 마다 연장
+LEASE_SEC = 60
+
+# 알림 누락(LISTEN 재연결 중 삽입) 대비 안전 조회 주기
+SWEEP_INTERVAL_SEC = 30
+
+# NOTIFY가 없는 DB(SQLite 등)의 조회 주기. 프로세스 내 알림은 API와 워커가 다른 프로세스면 전달되지 않으므로
+# 이 주기로 pending 배포를 확인 (이전 폴링 루프와 같은 1초)
+LOCAL_POLL_INTERVAL_SEC = 1.0
+
+PENDING = "pending"
+CLAIMED = "claimed"
+RUNNING = "running"
+
+
+async def process_deployment(deployment_id: str, session_factory=SessionLocal):
     """개별 배포 작업 처리"""
-    db: Session = SessionLocal()
+    db: Session = session_factory()
+    deployment = None
     try:
         # 1. 배포 정보 로드
         deployment = db.get(Deployment, deployment_id)
@@ -16,61 +48,256 @@ async def process_deployment(deployment_id: str):
             return
 
         # 상태 변경: running
-        deployment.status = "running"
+        deployment.status = RUNNING
         db.commit()
 
         # 2. 서비스 클래스 로드
         service_code = deployment.service.service_code
         ServiceClass = ServiceFactory.get_service_class(service_code)
-        
+
         # 3. 서비스 인스턴스화 및 실행
         service_instance = ServiceClass(
             deployment_id=deployment.id,
             config=deployment.instance_config,
             db=db
         )
-        
+
         logger.info(f"[Worker] Starting Deployment {deployment_id} ({service_code})")
         await service_instance.execute()
-        
+
         # 4. 성공 처리
         deployment.status = "completed"
+        deployment.lease_expires_at = None
         db.commit()
         logger.success(f"[Worker] Deployment {deployment_id} Completed.")
 
     except Exception as e:
         logger.error(f"[Worker] Deployment {deployment_id} Failed: {e}")
         traceback.print_exc()
-        
+
         # 실패 처리
-        deployment.status = "failed"
-        db.commit()
+        if deployment is not None:
+            db.rollback()
+            deployment.status = "failed"
+            deployment.lease_expires_at = None
+            db.commit()
     finally:
         db.close()
 
-async def worker_loop():
-    """메인 워커 루프"""
-    logger.info("[Worker] Service Execution Worker Started.")
-    
-    while True:
-        db: Session = SessionLocal()
+
+class DeploymentWorker:
+    """
+    배포 실행 워커 (claim & lease)
+
+    - pending 배포를 FOR UPDATE SKIP LOCKED + 조건부 UPDATE(status=pending)로 점유한 뒤 실행하므로
+      같은 배포가 두 번 시작되지 않음
+    - 동시 실행 수(max_concurrency)와 점유 단위(batch_size) 제한
+    - PostgreSQL은 대기 중 DB를 조회하지 않고 LISTEN/NOTIFY로 깨어남
+    - 그 외 DB는 프로세스 내 알림으로 깨어나고, 다른 프로세스에서 생성된 배포는 poll_interval_sec 주기로 확인
+    - 만료된 claimed 배포는 pending으로 되돌리고, 만료된 running 배포는 이미 외부 작업이 진행됐을 수 있으므로 failed 처리
+    """
+
+    def __init__(
+        self,
+        session_factory=SessionLocal,
+        max_concurrency: int = MAX_CONCURRENCY,
+        batch_size: int = BATCH_SIZE,
+        lease_sec: int = LEASE_SEC,
+        sweep_interval_sec: float = SWEEP_INTERVAL_SEC,
+        poll_interval_sec: float = LOCAL_POLL_INTERVAL_SEC,
+        worker_id: Optional[str] = None
+    ):
+        self.session_factory = session_factory
+        self.max_concurrency = max_concurrency
+        self.batch_size = batch_size
+        self.lease_sec = lease_sec
+        self.sweep_interval_sec = sweep_interval_sec
+        self.poll_interval_sec = poll_interval_sec
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopping = False
+
+    # -------------------------------------------------
+    # 점유 / lease
+    # -------------------------------------------------
+
+    def claim(self, limit: int) -> List[str]:
+        """pending 배포 점유 → [deployment_id]"""
+        if limit <= 0:
+            return []
+        db: Session = self.session_factory()
         try:
-            # Pending 상태의 작업 조회 (한 번에 하나씩 처리)
-            # 동시성을 높이려면 여기서 여러 개를 가져와 asyncio.gather 사용
-            deployment = db.query(Deployment).filter(Deployment.status == "pending").first()
-            
-            if deployment:
-                # 즉시 처리 (비동기 Task로 넘김)
-                asyncio.create_task(process_deployment(deployment.id))
-            
-        except Exception as e:
-            logger.error(f"[Worker] Loop Error: {e}")
+            candidates = db.execute(
+                select(Deployment.id)
+                .where(Deployment.status == PENDING)
+                .order_by(Deployment.created_at)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            ).scalars().all()
+            if not candidates:
+                db.rollback()
+                return []
+
+            token = f"{self.worker_id}:{uuid.uuid4().hex[:8]}"
+            db.execute(
+                update(Deployment)
+                .where(Deployment.id.in_(candidates), Deployment.status == PENDING)
+                .values(
+                    status=CLAIMED,
+                    claimed_by=token,
+                    lease_expires_at=datetime.now() + timedelta(seconds=self.lease_sec)
+                )
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+            return db.execute(
+                select(Deployment.id).where(Deployment.claimed_by == token).order_by(Deployment.created_at)
+            ).scalars().all()
         finally:
             db.close()
-            
-        # 1초 대기 (폴링 간격)
-        await asyncio.sleep(1)
+
+    def renew_leases(self, deployment_ids: List[str]) -> int:
+        if not deployment_ids:
+            return 0
+        db: Session = self.session_factory()
+        try:
+            renewed = db.execute(
+                update(Deployment)
+                .where(
+                    Deployment.id.in_(deployment_ids),
+                    Deployment.claimed_by.like(f"{self.worker_id}:%"),
+                    Deployment.status.in_([CLAIMED, RUNNING])
+                )
+                .values(lease_expires_at=datetime.now() + timedelta(seconds=self.lease_sec))
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            db.commit()
+            return renewed
+        finally:
+            db.close()
+
+    def reap_expired(self, now: Optional[datetime] = None) -> dict:
+        """lease가 만료된 배포 회수 (다른 워커가 죽은 경우)"""
+        now = now or datetime.now()
+        db: Session = self.session_factory()
+        try:
+            requeued = db.execute(
+                update(Deployment)
+                .where(Deployment.status == CLAIMED, Deployment.lease_expires_at < now)
+                .values(status=PENDING, claimed_by=None, lease_expires_at=None)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            failed = db.execute(
+                update(Deployment)
+                .where(Deployment.status == RUNNING, Deployment.lease_expires_at < now)
+                .values(status="failed", lease_expires_at=None)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            db.commit()
+        finally:
+            db.close()
+        if requeued or failed:
+            logger.warning(f"[Worker] Reaped expired leases: {requeued} requeued, {failed} failed")
+        return {"requeued": requeued, "failed": failed}
+
+    # -------------------------------------------------
+    # 디스패처
+    # -------------------------------------------------
+
+    def wake(self, payload: str = ""):
+        """알림 수신 (임의 스레드에서 호출 가능)"""
+        if self._loop is not None and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def _on_done(self, deployment_id: str):
+        self._inflight.pop(deployment_id, None)
+        # 빈 슬롯이 생겼으므로 남은 pending 배포 확인
+        self._wakeup.set()
+
+    async def _lease_keeper(self):
+        while True:
+            await asyncio.sleep(self.lease_sec / 3)
+            try:
+                await asyncio.to_thread(self.renew_leases, list(self._inflight))
+                if (await asyncio.to_thread(self.reap_expired))["requeued"]:
+                    self._wakeup.set()
+            except Exception as e:
+                logger.error(f"[Worker] Lease maintenance error: {e}")
+
+    def _start_listener(self) -> Optional[PgListener]:
+        bind = self.session_factory.kw.get("bind")
+        if bind is not None and bind.dialect.name == "postgresql":
+            listener = PgListener(bind, DEPLOYMENT_CHANNEL, self.wake)
+            listener.start()
+            return listener
+        local_notifier.subscribe(self.wake)
+        return None
+
+    async def run(self):
+        logger.info(
+            f"[Worker] Service Execution Worker {self.worker_id} Started "
+            f"(concurrency={self.max_concurrency}, batch={self.batch_size})."
+        )
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._wakeup.set()  # 기동 시 밀린 배포부터 처리
+        listener = self._start_listener()
+        # NOTIFY가 없으면 다른 프로세스의 배포 생성을 알 수 없으므로 짧은 주기로 조회
+        interval = self.sweep_interval_sec if listener is not None else min(self.sweep_interval_sec, self.poll_interval_sec)
+        keeper = asyncio.create_task(self._lease_keeper())
+        try:
+            await asyncio.to_thread(self.reap_expired)
+            while not self._stopping:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+                if self._stopping:
+                    break
+
+                capacity = self.max_concurrency - len(self._inflight)
+                limit = min(capacity, self.batch_size)
+                try:
+                    claimed = await asyncio.to_thread(self.claim, limit)
+                except Exception as e:
+                    logger.error(f"[Worker] Claim failed: {e}")
+                    continue
+
+                for deployment_id in claimed:
+                    task = asyncio.create_task(process_deployment(deployment_id, self.session_factory))
+                    self._inflight[deployment_id] = task
+                    task.add_done_callback(lambda _, d=deployment_id: self._on_done(d))
+
+                if limit and len(claimed) == limit:
+                    # 가득 점유했으면 남은 pending이 있을 수 있으므로 바로 재확인
+                    self._wakeup.set()
+        finally:
+            keeper.cancel()
+            if listener is not None:
+                listener.stop()
+            else:
+                local_notifier.unsubscribe(self.wake)
+            if self._inflight:
+                await asyncio.gather(*self._inflight.values(), return_exceptions=True)
+            logger.info(f"[Worker] Worker {self.worker_id} stopped.")
+
+    def stop(self):
+        self._stopping = True
+        self.wake()
+
+
+async def worker_loop(max_concurrency: int = MAX_CONCURRENCY, batch_size: int = BATCH_SIZE):
+    """메인 워커 루프"""
+    await DeploymentWorker(max_concurrency=max_concurrency, batch_size=batch_size).run()
 
 if __name__ == "__main__":
     # 워커 단독 실행 모드
-    asyncio.run(worker_loop())
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Deployment worker")
+    parser.add_argument("--concurrency", type=int, default=MAX_CONCURRENCY, help="concurrent deployments per process")
+    parser.add_argument("--batch", type=int, default=BATCH_SIZE, help="max deployments claimed per wakeup")
+    args = parser.parse_args()
+    asyncio.run(worker_loop(args.concurrency, args.batch))
@@ -0,0 +1,232 @@
+import asyncio
+import os
+import queue
+import socket
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from src.database.engine import SessionLocal
+from src.core.config import settings
+from src.core.kernel import SystemKernel
+from src.core.database.v3_schema import ExecutionRequest
+from src.core.metrics import QUEUE_WAIT_BUCKETS, KernelMetrics, kernel_metrics
+from src.core.logger import logger
+
+_STOP = object()
+
+# 실행 직전 점유 후 커널이 PROCESSING으로 바꾸기 전까지의 유효시간 (만료 시 점유한 프로세스가 죽은 것으로 보고 회수)
+CLAIM_LEASE_SEC = 300
+
+# 점유되지 않은 QUEUED 요청 재등록 주기 / 대상 최소 대기 시간
+# (살아있는 다른 API 프로세스의 대기열에 있는 요청은 재등록하지 않도록 생성 직후 요청은 제외)
+RECOVER_INTERVAL_SEC = 60
+RECOVER_MIN_AGE_SEC = 60
+
+
+class ExecutorFull(Exception):
+    """실행 대기열이 가득 참 (API는 429로 응답)"""
+
+
+class ExecutorStopped(Exception):
+    """종료 중이라 새 실행을 받지 않음"""
+
+
+class InProcessExecutor:
+    """
+    API 프로세스 내 실행기 (EXECUTION_BACKEND=background)
+
+    - 요청 세션과 분리된 전용 세션으로 커널 실행 (응답 후 닫힌 세션을 쓰지 않음)
+    - API 스레드풀과 분리된 고정 개수의 실행 스레드
+    - 대기열 상한 초과 시 ExecutorFull (백프레셔)
+    - 종료 시 새 요청을 막고 대기열을 drain_timeout_sec 동안 비움
+    - 실행 직전 claimed_by 조건부 UPDATE로 점유하므로 같은 요청이 여러 프로세스에서 실행되지 않음
+    - 기동 시와 RECOVER_INTERVAL_SEC 주기로 방치된 QUEUED 요청을 대기열 여유만큼 재등록 (recover_queued)
+      여유가 없으면 QUEUED로 두고 다음 주기에 다시 시도하며, 죽은 프로세스가 점유만 하고 남긴 요청은 점유를 해제
+    """
+
+    def __init__(
+        self,
+        session_factory=SessionLocal,
+        workers: int = settings.EXECUTOR_WORKERS,
+        max_queue: int = settings.EXECUTOR_MAX_QUEUE,
+        drain_timeout_sec: float = settings.EXECUTOR_DRAIN_TIMEOUT_SEC,
+        metrics: KernelMetrics = kernel_metrics
+    ):
+        self.session_factory = session_factory
+        self.workers = workers
+        self.max_queue = max_queue
+        self.drain_timeout_sec = drain_timeout_sec
+        self.metrics = metrics
+        self.executor_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+        self._queue: "queue.Queue[Tuple[str, float]]" = queue.Queue(maxsize=max_queue)
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._accepting = True
+        self._active = 0
+        self.rejected = 0
+
+        metrics.register_gauge("tg_executor_queue_depth", "Executions waiting in the in-process queue.", self.queue_depth)
+        metrics.register_gauge("tg_executor_active", "Executions currently running in the in-process executor.", lambda: self._active)
+        metrics.register_gauge("tg_executor_rejected", "Submissions rejected because the queue was full.", lambda: self.rejected)
+        metrics.register_histogram("tg_executor_queue_wait_seconds", "Time spent in the in-process queue.", QUEUE_WAIT_BUCKETS)
+
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def is_full(self) -> bool:
+        return self._queue.full()
+
+    def start(self):
+        with self._lock:
+            self._accepting = True
+            self._threads = [t for t in self._threads if t.is_alive()]
+            for i in range(len(self._threads), self.workers):
+                thread = threading.Thread(target=self._run, name=f"executor-{i}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def submit(self, req_id: str):
+        if not self._accepting:
+            raise ExecutorStopped("Executor is shutting down")
+        if not self._threads:
+            self.start()
+        try:
+            self._queue.put_nowait((req_id, time.monotonic()))
+        except queue.Full:
+            with self._lock:
+                self.rejected += 1
+            raise ExecutorFull(f"Execution queue is full ({self.max_queue})")
+
+    def execute(self, req_id: str):
+        db: Session = self.session_factory()
+        try:
+            claimed = db.execute(
+                update(ExecutionRequest)
+                .where(
+                    ExecutionRequest.req_id == req_id,
+                    ExecutionRequest.status == "QUEUED",
+                    ExecutionRequest.claimed_by.is_(None)
+                )
+                .values(claimed_by=self.executor_id, lease_expires_at=datetime.now() + timedelta(seconds=CLAIM_LEASE_SEC))
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            db.commit()
+            if not claimed:
+                logger.debug(f"[Executor] {req_id} already taken, skipping")
+                return
+            SystemKernel(db).invoke_function(req_id)
+        finally:
+            db.close()
+
+    def recover_queued(self, min_age_sec: float = RECOVER_MIN_AGE_SEC) -> dict:
+        """
+        방치된 QUEUED 요청 복구
+        - 점유 lease가 만료된 QUEUED 요청(점유 후 실행 전에 프로세스 종료)은 점유 해제
+        - min_age_sec 이상 대기한 미점유 요청을 오래된 순으로 대기열 여유만큼 재등록
+          (다른 프로세스가 이미 대기열에 넣은 요청이어도 실행 직전 점유로 한 번만 실행됨)
+        """
+        db: Session = self.session_factory()
+        try:
+            released = db.execute(
+                update(ExecutionRequest)
+                .where(
+                    ExecutionRequest.status == "QUEUED",
+                    ExecutionRequest.claimed_by.isnot(None),
+                    (ExecutionRequest.lease_expires_at.is_(None)) | (ExecutionRequest.lease_expires_at < datetime.now())
+                )
+                .values(claimed_by=None, lease_expires_at=None)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            db.commit()
+
+            room = self.max_queue - self.queue_depth()
+            cutoff = datetime.now() - timedelta(seconds=min_age_sec)
+            pending = db.execute(
+                select(ExecutionRequest.req_id)
+                .where(
+                    ExecutionRequest.status == "QUEUED",
+                    ExecutionRequest.claimed_by.is_(None),
+                    ExecutionRequest.created_at <= cutoff
+                )
+                .order_by(ExecutionRequest.created_at)
+                .limit(room)
+            ).scalars().all() if room > 0 else []
+        finally:
+            db.close()
+
+        resubmitted = 0
+        for req_id in pending:
+            try:
+                self.submit(req_id)
+                resubmitted += 1
+            except (ExecutorFull, ExecutorStopped):
+                break  # 남은 요청은 QUEUED로 두고 다음 주기에 재시도
+
+        if released or resubmitted:
+            logger.warning(f"[Executor] Recovered QUEUED requests: {released} stale claims released, {resubmitted} resubmitted")
+        return {"released": released, "resubmitted": resubmitted}
+
+    async def recovery_loop(self, interval_sec: float = RECOVER_INTERVAL_SEC):
+        """기동 직후 1회 + 주기적 복구 (lifespan 태스크로 실행)"""
+        while True:
+            try:
+                await asyncio.to_thread(self.recover_queued)
+            except Exception as e:
+                logger.error(f"[Executor] Recovery failed: {e}")
+            await asyncio.sleep(interval_sec)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                req_id, enqueued_at = item
+                self.metrics.observe("tg_executor_queue_wait_seconds", time.monotonic() - enqueued_at)
+                with self._lock:
+                    self._active += 1
+                try:
+                    self.execute(req_id)
+                except Exception:
+                    logger.exception(f"[Executor] {req_id} crashed")
+                finally:
+                    with self._lock:
+                        self._active -= 1
+            finally:
+                self._queue.task_done()
+
+    def shutdown(self, timeout: Optional[float] = None) -> int:
+        """
+        새 요청 차단 후 대기열 처리 완료까지 대기
+        반환: 시간 내 시작하지 못한 요청 수 (DB에 QUEUED로 남아 recover_queued로 재등록)
+        """
+        timeout = self.drain_timeout_sec if timeout is None else timeout
+        self._accepting = False
+        deadline = time.monotonic() + timeout
+
+        # 대기열이 비면 스레드별 종료 신호 (가득 찬 경우에도 막히지 않도록 남은 시간 동안만 시도)
+        for _ in self._threads:
+            try:
+                self._queue.put(_STOP, timeout=max(deadline - time.monotonic(), 0.001))
+            except queue.Full:
+                break
+        for thread in self._threads:
+            thread.join(timeout=max(deadline - time.monotonic(), 0))
+
+        remaining = sum(1 for item in list(self._queue.queue) if item is not _STOP)
+        if remaining:
+            logger.warning(f"[Executor] Drain timed out, {remaining} requests left QUEUED.")
+        self._threads = [t for t in self._threads if t.is_alive()]
+        logger.info("[Executor] Stopped.")
+        return remaining
+
+
+# 싱글톤 인스턴스
+execution_executor = InProcessExecutor()
@@ -0,0 +1,271 @@
+import argparse
+import asyncio
+import os
+import socket
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import and_, select, update
+from sqlalchemy.orm import Session
+
+from src.database.engine import SessionLocal
+from src.core.database.v3_schema import ExecutionRequest
+from src.core.kernel import SystemKernel
+from src.core.registry import handler_registry
+from src.core.logger import logger
+
+# 동시에 실행할 요청 수 (워커 프로세스당)
+POOL_SIZE = 8
+
+# 한 번에 점유할 최대 요청 수
+BATCH_SIZE = 16
+
+# 함수별 동시 실행 기본 상한 (FunctionCatalog.resource_spec["max_concurrency"]로 재정의)
+DEFAULT_FUNCTION_CONCURRENCY = 4
+
+# 점유 유효시간. 실행 중에는 LEASE_SEC / 3 마다 연장하므로 워커가 죽으면 이 시간 안에 회수됨
+LEASE_SEC = 60
+
+# 대기 요청이 없을 때 재조회 간격
+POLL_INTERVAL_SEC = 1.0
+
+# 점유 후 실행 전에 워커가 죽은 경우 재시도 횟수
+MAX_ATTEMPTS = 3
+
+QUEUED = "QUEUED"
+CLAIMED = "CLAIMED"
+PROCESSING = "PROCESSING"
+
+
+class ExecutionWorker:
+    """
+    ExecutionRequest 실행 워커 (API 프로세스와 분리된 단독 실행용)
+
+    - QUEUED 요청을 FOR UPDATE SKIP LOCKED로 잠근 뒤 조건부 UPDATE(status=QUEUED)로 점유
+      (SQLite는 SKIP LOCKED가 없으므로 조건부 UPDATE만으로 중복 점유를 막음)
+    - 점유 시 함수별 동시 실행 상한을 지키며, 실행은 크기가 고정된 스레드 풀에서 수행
+    - 실행 중인 요청의 lease를 주기적으로 연장. 만료된 CLAIMED 요청은 재대기, 만료된 PROCESSING 요청은
+      부분 실행 여부를 알 수 없으므로 FAILED 처리 (과금/외부 발송 중복 방지)
+    - 워커 프로세스를 더 띄우는 것만으로 수평 확장
+    """
+
+    def __init__(
+        self,
+        session_factory=SessionLocal,
+        pool_size: int = POOL_SIZE,
+        batch_size: int = BATCH_SIZE,
+        lease_sec: int = LEASE_SEC,
+        poll_interval_sec: float = POLL_INTERVAL_SEC,
+        default_function_concurrency: int = DEFAULT_FUNCTION_CONCURRENCY,
+        worker_id: Optional[str] = None
+    ):
+        self.session_factory = session_factory
+        self.pool_size = pool_size
+        self.batch_size = batch_size
+        self.lease_sec = lease_sec
+        self.poll_interval_sec = poll_interval_sec
+        self.default_function_concurrency = default_function_concurrency
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._inflight: Dict[str, str] = {}  # req_id → function_code
+        self._tasks: Set[asyncio.Task] = set()
+        self._stopping = asyncio.Event()
+
+    # -------------------------------------------------
+    # 점유
+    # -------------------------------------------------
+
+    def function_limit(self, db: Session, function_code: str) -> int:
+        entry = handler_registry.get(db, function_code)
+        if entry and entry.resource_spec.get("max_concurrency"):
+            return int(entry.resource_spec["max_concurrency"])
+        return self.default_function_concurrency
+
+    def claim(self, capacity: int, running: Optional[Dict[str, int]] = None) -> List[Tuple[str, str]]:
+        """실행할 요청 점유 → [(req_id, function_code)]"""
+        running = Counter(running or {})
+        limit = min(capacity, self.batch_size)
+        if limit <= 0:
+            return []
+
+        db: Session = self.session_factory()
+        try:
+            now = datetime.now()
+            candidates = db.execute(
+                select(ExecutionRequest.req_id, ExecutionRequest.function_code)
+                .where(ExecutionRequest.status == QUEUED)
+                .order_by(ExecutionRequest.created_at)
+                .limit(limit * 4)
+                .with_for_update(skip_locked=True)
+            ).all()
+
+            chosen, limits = [], {}
+            for req_id, function_code in candidates:
+                if function_code not in limits:
+                    limits[function_code] = self.function_limit(db, function_code)
+                if running[function_code] >= limits[function_code]:
+                    continue
+                running[function_code] += 1
+                chosen.append(req_id)
+                if len(chosen) >= limit:
+                    break
+
+            if not chosen:
+                db.rollback()
+                return []
+
+            token = f"{self.worker_id}:{uuid.uuid4().hex[:8]}"
+            db.execute(
+                update(ExecutionRequest)
+                .where(ExecutionRequest.req_id.in_(chosen), ExecutionRequest.status == QUEUED)
+                .values(
+                    status=CLAIMED,
+                    claimed_by=token,
+                    lease_expires_at=now + timedelta(seconds=self.lease_sec),
+                    attempts=ExecutionRequest.attempts + 1
+                )
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+            return db.execute(
+                select(ExecutionRequest.req_id, ExecutionRequest.function_code)
+                .where(ExecutionRequest.claimed_by == token)
+                .order_by(ExecutionRequest.created_at)
+            ).all()
+        finally:
+            db.close()
+
+    def renew_leases(self, req_ids: List[str]) -> int:
+        if not req_ids:
+            return 0
+        db: Session = self.session_factory()
+        try:
+            renewed = db.execute(
+                update(ExecutionRequest)
+                .where(
+                    ExecutionRequest.req_id.in_(req_ids),
+                    ExecutionRequest.claimed_by.like(f"{self.worker_id}:%"),
+                    ExecutionRequest.status.in_([CLAIMED, PROCESSING])
+                )
+                .values(lease_expires_at=datetime.now() + timedelta(seconds=self.lease_sec))
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            db.commit()
+            return renewed
+        finally:
+            db.close()
+
+    def reap_expired(self, now: Optional[datetime] = None) -> dict:
+        """lease가 만료된 요청 회수 (다른 워커가 죽은 경우)"""
+        now = now or datetime.now()
+        expired = ExecutionRequest.lease_expires_at < now
+        db: Session = self.session_factory()
+        try:
+            requeued = db.execute(
+                update(ExecutionRequest)
+                .where(ExecutionRequest.status == CLAIMED, expired, ExecutionRequest.attempts < MAX_ATTEMPTS)
+                .values(status=QUEUED, claimed_by=None, lease_expires_at=None)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            failed = db.execute(
+                update(ExecutionRequest)
+                .where(
+                    expired,
+                    (ExecutionRequest.status == PROCESSING)
+                    | and_(ExecutionRequest.status == CLAIMED, ExecutionRequest.attempts >= MAX_ATTEMPTS)
+                )
+                .values(status="FAILED", lease_expires_at=None, result_output={"error": "Worker lease expired"})
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            db.commit()
+        finally:
+            db.close()
+        if requeued or failed:
+            logger.warning(f"[Execution] Reaped expired leases: {requeued} requeued, {failed} failed")
+        return {"requeued": requeued, "failed": failed}
+
+    # -------------------------------------------------
+    # 실행
+    # -------------------------------------------------
+
+    def execute(self, req_id: str):
+        """요청 1건 실행 (풀 스레드에서 호출, 전용 세션 사용)"""
+        db: Session = self.session_factory()
+        try:
+            SystemKernel(db).invoke_function(req_id)
+        finally:
+            db.close()
+
+    async def _run_one(self, req_id: str):
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(self._executor, self.execute, req_id)
+        except Exception as e:
+            logger.error(f"[Execution] {req_id} crashed: {e}")
+        finally:
+            self._inflight.pop(req_id, None)
+
+    async def _lease_keeper(self):
+        while True:
+            await asyncio.sleep(self.lease_sec / 3)
+            try:
+                await asyncio.to_thread(self.renew_leases, list(self._inflight))
+                await asyncio.to_thread(self.reap_expired)
+            except Exception as e:
+                logger.error(f"[Execution] Lease maintenance error: {e}")
+
+    async def run(self):
+        logger.info(f"[Execution] Worker {self.worker_id} started (pool={self.pool_size}, batch={self.batch_size}).")
+        self._executor = ThreadPoolExecutor(max_workers=self.pool_size, thread_name_prefix="execution")
+        keeper = asyncio.create_task(self._lease_keeper())
+        try:
+            await asyncio.to_thread(self.reap_expired)
+            while not self._stopping.is_set():
+                capacity = self.pool_size - len(self._inflight)
+                claimed = []
+                if capacity > 0:
+                    try:
+                        claimed = await asyncio.to_thread(self.claim, capacity, Counter(self._inflight.values()))
+                    except Exception as e:
+                        logger.error(f"[Execution] Claim failed: {e}")
+
+                for req_id, function_code in claimed:
+                    self._inflight[req_id] = function_code
+                    task = asyncio.create_task(self._run_one(req_id))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+
+                if not claimed or len(claimed) < capacity:
+                    try:
+                        await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_interval_sec)
+                    except asyncio.TimeoutError:
+                        pass
+        finally:
+            keeper.cancel()
+            # 점유한 요청은 끝까지 실행 (중단 시 PROCESSING lease 만료로 FAILED 처리되므로)
+            if self._tasks:
+                await asyncio.gather(*self._tasks, return_exceptions=True)
+            self._executor.shutdown(wait=True)
+            logger.info(f"[Execution] Worker {self.worker_id} stopped.")
+
+    def stop(self):
+        self._stopping.set()
+
+
+if __name__ == "__main__":
+    # 워커 단독 실행 모드 (프로세스를 여러 개 띄워 수평 확장)
+    parser = argparse.ArgumentParser(description="ExecutionRequest worker")
+    parser.add_argument("--pool", type=int, default=POOL_SIZE, help="concurrent executions per process")
+    parser.add_argument("--batch", type=int, default=BATCH_SIZE, help="max requests claimed per poll")
+    parser.add_argument("--lease", type=int, default=LEASE_SEC, help="lease seconds")
+    args = parser.parse_args()
+
+    worker = ExecutionWorker(pool_size=args.pool, batch_size=args.batch, lease_sec=args.lease)
+    try:
+        asyncio.run(worker.run())
+    except KeyboardInterrupt:
+        pass
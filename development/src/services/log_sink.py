@@ -0,0 +1,157 @@
+import atexit
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from typing import Deque, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from src.database.engine import SessionLocal
+from src.database.models import SystemLog
+from src.core.logger import logger
+
+# 버퍼가 이 건수에 도달하면 즉시 반영
+LOG_BATCH_SIZE = 500
+
+# 버퍼 최대 체류 시간 (초)
+LOG_FLUSH_INTERVAL_SEC = 1.0
+
+# 버퍼 상한. 초과분은 버리고 dropped로 집계 (DB 장애 시 메모리 보호)
+LOG_MAX_QUEUE = 20_000
+
+
+class SystemLogSink:
+    """
+    서비스 로그(SystemLog) 버퍼 기록기
+
+    log() 호출마다 서비스 세션으로 커밋하는 대신 메모리 큐에 모았다가 건수(batch_size) 또는
+    시간(flush_interval_sec) 기준으로 전용 세션에서 executemany INSERT 1회로 반영합니다.
+    """
+
+    def __init__(
+        self,
+        session_factory=SessionLocal,
+        batch_size: int = LOG_BATCH_SIZE,
+        flush_interval_sec: float = LOG_FLUSH_INTERVAL_SEC,
+        max_queue: int = LOG_MAX_QUEUE
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval_sec = flush_interval_sec
+        self.max_queue = max_queue
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._queue: Deque[dict] = deque()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed_flushes = 0
+
+    @property
+    def queued(self) -> int:
+        return len(self._queue)
+
+    def stats(self) -> dict:
+        return {
+            "queued": self.queued,
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed_flushes": self.failed_flushes,
+        }
+
+    def append(self, deployment_id: Optional[str], level: str, action_type: str, message: str,
+               ip_address: Optional[str] = None) -> bool:
+        """큐 등록 (버퍼가 가득 차면 False)"""
+        entry = {
+            "deployment_id": deployment_id,
+            "level": level,
+            "action_type": action_type,
+            "message": message,
+            "ip_address": ip_address,
+            "created_at": datetime.now(timezone.utc),
+        }
+        with self._lock:
+            if len(self._queue) >= self.max_queue:
+                self.dropped += 1
+                return False
+            self._queue.append(entry)
+            self.enqueued += 1
+            full = len(self._queue) >= self.batch_size
+
+        self._ensure_thread()
+        if full:
+            self._wakeup.set()
+        return True
+
+    def flush(self) -> int:
+        """버퍼 전체 반영 (반영 건수 반환). 실패 시 항목을 큐 앞쪽에 되돌리고 예외 전파"""
+        written = 0
+        with self._flush_lock:
+            while True:
+                with self._lock:
+                    batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+                if not batch:
+                    return written
+
+                db: Optional[Session] = None
+                try:
+                    db = self.session_factory()
+                    db.execute(insert(SystemLog), batch)
+                    db.commit()
+                except Exception:
+                    if db is not None:
+                        db.rollback()
+                    with self._lock:
+                        self.failed_flushes += 1
+                        room = max(self.max_queue - len(self._queue), 0)
+                        self.dropped += max(len(batch) - room, 0)
+                        self._queue.extendleft(reversed(batch[:room]))
+                    raise
+                finally:
+                    if db is not None:
+                        db.close()
+                written += len(batch)
+                with self._lock:
+                    self.written += len(batch)
+
+    # -------------------------------------------------
+    # 주기 반영 스레드
+    # -------------------------------------------------
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            with self._lock:
+                if self._thread is None or not self._thread.is_alive():
+                    self._stopped.clear()
+                    self._thread = threading.Thread(target=self._run, name="system-log-sink", daemon=True)
+                    self._thread.start()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.flush_interval_sec)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"[LogSink] Flush failed, will retry: {e}")
+
+    def close(self):
+        """종료 시 잔여 버퍼 반영"""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.flush()
+
+
+# 싱글톤 인스턴스
+system_log_sink = SystemLogSink()
+atexit.register(system_log_sink.close)
@@ -0,0 +1,43 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.core.database.v3_schema import Base
+from src.database import models as platform_models
+# Base.metadata가 모든 테이블을 인식하도록 모델 모듈 로드
+from src.core.database import v3_extensions, v3_campaigns
+from src.commerce.domain import models, models_phase2, models_gap, models_gap_v2
+
+
+@pytest.fixture
+def session_factory():
+    """테이블이 생성된 인메모리 SQLite 세션 팩토리"""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    engine.dispose()
+
+
+@pytest.fixture
+def db(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def deploy_factory():
+    """배포/서비스 모델(src.database.models) 전용 인메모리 SQLite 세션 팩토리"""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    platform_models.Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    engine.dispose()
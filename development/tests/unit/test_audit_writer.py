@@ -0,0 +1,79 @@
+from sqlalchemy import text
+
+from src.core import erp_service
+from src.core.audit_writer import AuditWriter, verify_chain
+from src.core.database.v3_schema import AuditLog, MasterUser
+from src.core.erp_service import LegalAuditService
+
+
+def _user(db):
+    db.add(MasterUser(user_id="u1", username="u1", email="u1@x"))
+    db.commit()
+
+
+def test_entries_are_buffered_until_critical_action(db, session_factory, monkeypatch):
+    _user(db)
+    writer = AuditWriter(session_factory, batch_size=100, flush_interval_sec=3600)
+    monkeypatch.setattr(erp_service, "audit_writer", writer)
+    legal = LegalAuditService(db)
+
+    legal.log_action(None, "u1", "EXECUTION_START", "Function: FN_A")
+    legal.log_action(None, "u1", "CUSTOM_NOTE", "step 1")
+    assert db.query(AuditLog).count() == 0
+
+    legal.log_action(None, "u1", "EXECUTION_END", "Status: COMPLETED")
+    assert [log.action for log in db.query(AuditLog).order_by(AuditLog.log_id)] == [
+        "EXECUTION_START", "CUSTOM_NOTE", "EXECUTION_END"
+    ]
+
+
+def test_batch_size_triggers_flush(db, session_factory):
+    _user(db)
+    writer = AuditWriter(session_factory, batch_size=3, flush_interval_sec=3600)
+    for i in range(7):
+        writer.append(None, "u1", "NOTE", f"n{i}")
+    assert db.query(AuditLog).count() == 6
+    writer.close()
+    assert db.query(AuditLog).count() == 7
+
+
+def test_hash_chain_detects_tampering(db, session_factory):
+    _user(db)
+    writer = AuditWriter(session_factory, flush_interval_sec=3600)
+    for i in range(5):
+        writer.append(None, "u1", "NOTE", f"n{i}", sync=(i == 4))
+
+    report = verify_chain(db)
+    assert report == {writer.chain_id: {"entries": 5, "valid": True, "broken_at": None}}
+
+    target = db.query(AuditLog).filter_by(snapshot_data="n2").one()
+    target.snapshot_data = "forged"
+    db.commit()
+    assert verify_chain(db, writer.chain_id)[writer.chain_id]["broken_at"] == target.log_id
+
+
+def test_constraint_violation_is_quarantined_not_retried(db, session_factory):
+    """FK 위반 항목만 격리하고 나머지와 이후 기록은 정상 반영"""
+    _user(db)
+    db.execute(text("PRAGMA foreign_keys=ON"))
+    writer = AuditWriter(session_factory, flush_interval_sec=3600)
+
+    writer.append(None, "u1", "NOTE", "ok-1")
+    writer.append(None, "ghost", "EXECUTION_DENIED", "unknown user")
+    writer.append(None, "u1", "NOTE", "ok-2", sync=True)
+
+    assert [log.snapshot_data for log in db.query(AuditLog).order_by(AuditLog.log_id)] == ["ok-1", "ok-2"]
+    assert writer.quarantined == 1
+    assert writer.quarantine[0]["actor_id"] == "ghost"
+
+    writer.append(None, "u1", "EXECUTION_END", "next", sync=True)  # 이후 동기 반영도 막히지 않음
+    assert db.query(AuditLog).count() == 3
+
+
+def test_buffer_is_capped(session_factory):
+    writer = AuditWriter(session_factory, batch_size=100, flush_interval_sec=3600, max_buffer=5)
+    writer._ensure_thread = lambda: None
+    for i in range(8):
+        writer.append(None, "u1", "NOTE", f"n{i}")
+    assert [e["snapshot_data"] for e in writer._buffer] == ["n3", "n4", "n5", "n6", "n7"]
+    assert writer.dropped == 3
@@ -0,0 +1,102 @@
+import pytest
+from datetime import datetime, date, time, timedelta
+
+from src.commerce.domain.models_phase2 import BookingResource
+from src.commerce.services.booking_engine import (
+    IntervalIndex, BookingEngine, SlotConflictError, InvalidBookingTimeError, ResourceNotFoundError, ResourceCapacityError
+)
+
+DAY = date(2025, 3, 1)
+
+
+def at(hour, minute=0):
+    return datetime.combine(DAY, time(hour, minute))
+
+
+def test_interval_index_merges_and_detects_overlap():
+    """겹치는 구간 병합 및 경계 조건"""
+    index = IntervalIndex([(at(10), at(11)), (at(10, 30), at(12)), (at(14), at(15))])
+
+    assert len(index) == 2
+    assert index.overlaps(at(11, 30), at(13))
+    assert not index.overlaps(at(12), at(14))  # 종료 시각과 시작 시각이 맞닿는 것은 허용
+    assert not index.overlaps(at(9), at(10))
+
+
+def test_interval_index_free_windows_and_starts():
+    """영업 시간 내 빈 구간 및 예약 가능 시작 시각"""
+    index = IntervalIndex([(at(10), at(12))])
+    index.add(at(13), at(14))
+
+    assert index.free_windows(at(9), at(15)) == [(at(9), at(10)), (at(12), at(13)), (at(14), at(15))]
+    starts = index.available_starts(at(9), at(15), timedelta(hours=1), timedelta(minutes=30))
+    assert starts == [at(9), at(12), at(14)]
+
+
+def test_reserve_assigns_free_resource_and_blocks_double_booking(db):
+    """자원 자동 배정 후 모든 자원이 차면 409 대상"""
+    db.add_all([
+        BookingResource(store_id=1, name="Room A", resource_type="room", capacity=4, is_active=True),
+        BookingResource(store_id=1, name="Room B", resource_type="room", capacity=4, is_active=True),
+    ])
+    db.commit()
+    engine = BookingEngine(db)
+
+    first = engine.reserve(1, "Kim", "010", 2, at(18), 60)
+    second = engine.reserve(1, "Lee", "011", 2, at(18, 30), 60)
+    assert {first.resource_id, second.resource_id} == {1, 2}
+
+    with pytest.raises(SlotConflictError):
+        engine.reserve(1, "Park", "012", 2, at(18, 30), 30)
+
+
+def test_slot_claim_rejects_stale_index(db):
+    """인덱스 조회 이후 다른 요청이 먼저 슬롯을 점유해도 이중 예약되지 않음"""
+    engine = BookingEngine(db)
+    engine.reserve(1, "Kim", "010", 2, at(12), 60)
+
+    # 다른 워커가 이미 점유한 상황을 재현: 빈 인덱스로 강제
+    engine.load_indexes = lambda *args, **kwargs: {}
+    with pytest.raises(SlotConflictError):
+        engine.reserve(1, "Lee", "011", 2, at(12, 15), 30)
+
+
+def test_availability_excludes_booked_slots(db):
+    """매장 단위 예약 시 하루 가용 시간 계산"""
+    engine = BookingEngine(db)
+    engine.reserve(1, "Kim", "010", 2, at(10), 60)
+
+    result = engine.availability(1, DAY, 60, time(9), time(12))
+    assert len(result) == 1
+    assert result[0]["resource_id"] is None
+    assert result[0]["available_starts"] == ["09:00", "11:00"]
+
+
+def test_reserve_rejects_off_grid_times(db):
+    """슬롯 격자에 맞지 않는 예약은 맞닿은 예약과 오충돌하므로 400 대상"""
+    engine = BookingEngine(db)
+    with pytest.raises(InvalidBookingTimeError):
+        engine.reserve(1, "Kim", "010", 2, at(10), 10)
+    with pytest.raises(InvalidBookingTimeError):
+        engine.reserve(1, "Kim", "010", 2, at(10, 10), 15)
+
+    engine.reserve(1, "Kim", "010", 2, at(10), 15)
+    engine.reserve(1, "Lee", "011", 2, at(10, 15), 15)  # 맞닿은 예약은 허용
+
+
+def test_reserve_validates_explicit_resource(db):
+    """지정 자원의 매장/활성 여부와 수용 인원 검사"""
+    db.add_all([
+        BookingResource(store_id=1, name="Table", resource_type="table", capacity=2, is_active=True),
+        BookingResource(store_id=2, name="Other", resource_type="table", capacity=8, is_active=True),
+        BookingResource(store_id=1, name="Closed", resource_type="table", capacity=8, is_active=False),
+    ])
+    db.commit()
+    engine = BookingEngine(db)
+
+    for resource_id in (2, 3, 99):
+        with pytest.raises(ResourceNotFoundError):
+            engine.reserve(1, "Kim", "010", 2, at(18), 60, resource_id=resource_id)
+    with pytest.raises(ResourceCapacityError):
+        engine.reserve(1, "Kim", "010", 4, at(18), 60, resource_id=1)
+    assert engine.reserve(1, "Kim", "010", 2, at(18), 60, resource_id=1).resource_id == 1
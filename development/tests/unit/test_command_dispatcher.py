@@ -0,0 +1,137 @@
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.core.database.v3_schema import Base
+from src.commerce.domain.models_phase2 import IoTDevice, IoTCommand
+from src.commerce.services.command_dispatcher import CommandDispatcher, create_command
+from src.commerce.services.device_state import DeviceStateStore
+from src.commerce.services.iot_transport import SimulatedDeviceTransport, create_simulated_device_app
+
+
+async def _wait_status(session_factory, command_id, statuses, timeout=2.0):
+    for _ in range(int(timeout / 0.02)):
+        db = session_factory()
+        try:
+            status = db.get(IoTCommand, command_id).status
+        finally:
+            db.close()
+        if status in statuses:
+            return status
+        await asyncio.sleep(0.02)
+    return status
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    """파일 SQLite 세션 팩토리 (디스패처는 여러 스레드에서 동시에 커밋하므로 연결을 공유하지 않음)"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'iot.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    engine.dispose()
+
+
+@pytest.fixture
+def devices(db):
+    db.add_all([
+        IoTDevice(id="door", store_id=1, name="Door", status="ONLINE"),
+        IoTDevice(id="dead", store_id=1, name="Dead", status="ONLINE"),
+    ])
+    db.commit()
+
+
+@pytest.mark.asyncio
+async def test_commands_ack_in_order_and_timeout(db, session_factory, devices):
+    """장비별 순번대로 전송, 응답 시 장비 상태 갱신, 무응답 장비는 TIMEOUT"""
+    app = create_simulated_device_app(latency_sec=0.01, offline_devices={"dead"})
+    dispatcher = CommandDispatcher(
+        session_factory=session_factory, ack_timeout=0.2, state_store=DeviceStateStore(session_factory=session_factory)
+    )
+    await dispatcher.start(SimulatedDeviceTransport(app))
+    try:
+        door = db.get(IoTDevice, "door")
+        first = create_command(db, door, "OPEN")
+        second = create_command(db, door, "CLOSE")
+        stuck = create_command(db, db.get(IoTDevice, "dead"), "OPEN")
+        assert (first.seq, second.seq, stuck.seq) == (1, 2, 1)
+
+        for cmd in (first, second, stuck):
+            dispatcher.submit(cmd.device_id, cmd.id)
+
+        assert await _wait_status(session_factory, second.id, {"ACKED"}) == "ACKED"
+        assert await _wait_status(session_factory, stuck.id, {"TIMEOUT"}) == "TIMEOUT"
+        assert app.state.received == [("door", 1, "OPEN"), ("door", 2, "CLOSE")]
+
+        db.expire_all()
+        assert db.get(IoTDevice, "door").status == "LOCKED"
+        assert db.get(IoTDevice, "dead").status == "OFFLINE"
+    finally:
+        await dispatcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_restart_recovers_queued_and_expires_stale(db, session_factory, devices):
+    """재기동 시 대기 명령 복구, 유효시간 지난 명령은 전송하지 않음"""
+    door = db.get(IoTDevice, "door")
+    stale = create_command(db, door, "OPEN")
+    stale.created_at = datetime.now() - timedelta(minutes=5)
+    db.commit()
+    fresh = create_command(db, door, "ON")
+
+    app = create_simulated_device_app(latency_sec=0)
+    dispatcher = CommandDispatcher(session_factory=session_factory, state_store=DeviceStateStore(session_factory=session_factory))
+    await dispatcher.start(SimulatedDeviceTransport(app))
+    try:
+        assert await _wait_status(session_factory, fresh.id, {"ACKED"}) == "ACKED"
+        assert await _wait_status(session_factory, stale.id, {"EXPIRED"}) == "EXPIRED"
+        assert app.state.received == [("door", 2, "ON")]
+    finally:
+        await dispatcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_timeout_offline_recovers_on_heartbeat(db, session_factory, devices):
+    """명령 시간초과로 OFFLINE 된 장비도 다음 하트비트에 ONLINE으로 복구"""
+    store = DeviceStateStore(session_factory=session_factory)
+    store.warm()
+    app = create_simulated_device_app(latency_sec=0, offline_devices={"dead"})
+    dispatcher = CommandDispatcher(session_factory=session_factory, ack_timeout=0.1, state_store=store)
+    await dispatcher.start(SimulatedDeviceTransport(app))
+    try:
+        stuck = create_command(db, db.get(IoTDevice, "dead"), "OPEN")
+        dispatcher.submit(stuck.device_id, stuck.id)
+        assert await _wait_status(session_factory, stuck.id, {"TIMEOUT"}) == "TIMEOUT"
+    finally:
+        await dispatcher.stop()
+
+    db.expire_all()
+    assert db.get(IoTDevice, "dead").status == "OFFLINE"
+    assert {d["device_id"]: d["status"] for d in store.snapshot(1)}["dead"] == "OFFLINE"
+
+    assert store.ingest(db, 1, [{"device_id": "dead"}])["accepted"] == 1
+    store.flush()
+    db.expire_all()
+    assert db.get(IoTDevice, "dead").status == "ONLINE"
+
+
+class ListAckTransport(SimulatedDeviceTransport):
+    async def send(self, device, payload):
+        return ["ok"]
+
+
+@pytest.mark.asyncio
+async def test_non_dict_ack_fails_command(db, session_factory, devices):
+    """규격 외(dict 아님) 응답은 SENT로 남지 않고 FAILED"""
+    dispatcher = CommandDispatcher(session_factory=session_factory, state_store=DeviceStateStore(session_factory=session_factory))
+    await dispatcher.start(ListAckTransport())
+    try:
+        cmd = create_command(db, db.get(IoTDevice, "door"), "OPEN")
+        dispatcher.submit(cmd.device_id, cmd.id)
+        assert await _wait_status(session_factory, cmd.id, {"FAILED"}) == "FAILED"
+        db.expire_all()
+        assert "Invalid ack payload" in db.get(IoTCommand, cmd.id).error
+        assert db.get(IoTDevice, "door").status == "ONLINE"
+    finally:
+        await dispatcher.stop()
@@ -0,0 +1,65 @@
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+
+from src.commerce.domain.models_gap_v2 import DeliveryCall, DeliveryEvent
+from src.commerce.services.delivery_tracker import DeliveryTracker, percentile_from_histogram, bucket_of
+from src.commerce.services.event_broker import EventBroker
+
+T0 = datetime(2025, 3, 1, 12, 0)
+
+
+def _delivery(db, call_id):
+    delivery = DeliveryCall(id=call_id, store_id=1, status="REQUESTED", requested_at=T0)
+    db.add(delivery)
+    db.flush()
+    return delivery
+
+
+def test_percentile_interpolates_within_bucket():
+    counts = {bucket_of(12): 10}  # 10~15분 구간
+    assert percentile_from_histogram(counts, 0.5) == 12.5
+    assert percentile_from_histogram({}, 0.5) is None
+
+
+def test_events_are_appended_and_sla_counted_once(db):
+    """중복/역순 웹훅에도 이력은 모두 남고 SLA는 최초 도달 시 1회만 집계"""
+    tracker = DeliveryTracker(db)
+    for i, deliver_min in enumerate([20, 30, 40]):
+        d = _delivery(db, f"d{i}")
+        tracker.record(d, "ASSIGNED", rider_name="Kim", occurred_at=T0 + timedelta(minutes=4))
+        tracker.record(d, "DELIVERED", occurred_at=T0 + timedelta(minutes=deliver_min))
+    d0 = db.get(DeliveryCall, "d0")
+    tracker.record(d0, "DELIVERED", occurred_at=T0 + timedelta(minutes=99))
+    tracker.record(d0, "PICKED_UP", occurred_at=T0 + timedelta(minutes=10))
+    db.commit()
+
+    assert d0.status == "DELIVERED"
+    assert d0.delivered_at == T0 + timedelta(minutes=20)
+    assert db.query(DeliveryEvent).filter_by(delivery_id="d0").count() == 4
+
+    sla = tracker.sla(1)
+    assert sla["overall"]["assign"]["count"] == 3
+    assert sla["overall"]["deliver"]["count"] == 3
+    assert sla["overall"]["deliver"]["avg_min"] == 30.0
+    assert sla["by_hour"][0]["hour"] == 12
+
+
+@pytest.mark.asyncio
+async def test_broker_replays_then_streams_live_events():
+    broker = EventBroker()
+
+    async def replay():
+        return [{"id": 1, "status": "REQUESTED"}]
+
+    stream = broker.stream(1, "delivery", replay=replay, heartbeat_sec=0.05)
+    first = await stream.__anext__()
+    assert first.startswith("id: 1\nevent: delivery\n")
+
+    broker.publish(1, {"id": 1, "status": "REQUESTED"})  # replay와 중복 → 건너뜀
+    broker.publish(1, {"id": 2, "status": "ASSIGNED"})
+    second = await asyncio.wait_for(stream.__anext__(), timeout=1)
+    assert second.startswith("id: 2\n")
+
+    await stream.aclose()
+    assert broker.subscriber_count(1) == 0
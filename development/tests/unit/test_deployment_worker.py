@@ -0,0 +1,152 @@
+import asyncio
+import sys
+import textwrap
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.database import models as platform_models
+from src.database.models import Deployment
+from src.services.deployment import worker as worker_module
+from src.services.deployment.notify import notify_deployment_pending
+from src.services.deployment.worker import DeploymentWorker
+
+
+def _pending(factory, count, start=0):
+    db = factory()
+    base = datetime.now() - timedelta(minutes=5)
+    db.add_all([
+        Deployment(id=f"dep-{i}", user_id=1, service_id=1, status="pending", instance_config={},
+                   created_at=base + timedelta(seconds=i))
+        for i in range(start, start + count)
+    ])
+    db.commit()
+    db.close()
+
+
+def _statuses(factory):
+    db = factory()
+    try:
+        return {d.id: d.status for d in db.query(Deployment).all()}
+    finally:
+        db.close()
+
+
+def test_claim_is_exclusive_and_batched(deploy_factory):
+    _pending(deploy_factory, 5)
+    a = DeploymentWorker(deploy_factory, worker_id="a")
+    b = DeploymentWorker(deploy_factory, worker_id="b")
+
+    assert a.claim(3) == ["dep-0", "dep-1", "dep-2"]
+    assert b.claim(10) == ["dep-3", "dep-4"]
+    assert a.claim(10) == []
+    assert set(_statuses(deploy_factory).values()) == {"claimed"}
+
+
+def test_reap_requeues_claimed_and_fails_running(deploy_factory):
+    _pending(deploy_factory, 2)
+    worker = DeploymentWorker(deploy_factory, lease_sec=30, worker_id="dead")
+    worker.claim(2)
+    db = deploy_factory()
+    db.get(Deployment, "dep-1").status = "running"
+    db.commit()
+    db.close()
+
+    assert worker.reap_expired(now=datetime.now() + timedelta(seconds=31)) == {"requeued": 1, "failed": 1}
+    assert _statuses(deploy_factory) == {"dep-0": "pending", "dep-1": "failed"}
+
+
+@pytest.mark.asyncio
+async def test_run_wakes_on_notification_with_bounded_concurrency(deploy_factory, monkeypatch):
+    release = asyncio.Event()
+    started, peak = [], [0, 0]  # [현재, 최대]
+
+    async def fake_process(deployment_id, session_factory):
+        started.append(deployment_id)
+        peak[0] += 1
+        peak[1] = max(peak)
+        await release.wait()
+        peak[0] -= 1
+        db = session_factory()
+        db.get(Deployment, deployment_id).status = "completed"
+        db.commit()
+        db.close()
+
+    monkeypatch.setattr(worker_module, "process_deployment", fake_process)
+    worker = DeploymentWorker(deploy_factory, max_concurrency=2, batch_size=2, sweep_interval_sec=60, poll_interval_sec=60)
+    task = asyncio.create_task(worker.run())
+    await asyncio.sleep(0.05)
+    assert started == []
+
+    # 폴링 없이 알림만으로 즉시 시작
+    _pending(deploy_factory, 3)
+    db = deploy_factory()
+    notify_deployment_pending(db, "dep-0")
+    db.close()
+    for _ in range(100):
+        if len(started) == 2:
+            break
+        await asyncio.sleep(0.01)
+    assert started == ["dep-0", "dep-1"]
+
+    release.set()
+    for _ in range(100):
+        if len(started) == 3:
+            break
+        await asyncio.sleep(0.01)
+    worker.stop()
+    await task
+
+    assert started == ["dep-0", "dep-1", "dep-2"] and peak[1] == 2
+    assert set(_statuses(deploy_factory).values()) == {"completed"}
+
+
+# 다른 프로세스(API)에서 배포 생성 + 알림
+_API_PROCESS = textwrap.dedent("""
+    import sys
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from src.database.models import Deployment
+    from src.services.deployment.notify import notify_deployment_pending
+
+    db = sessionmaker(bind=create_engine(sys.argv[1]))()
+    db.add(Deployment(id="remote", user_id=1, service_id=1, status="pending", instance_config={}))
+    db.commit()
+    notify_deployment_pending(db, "remote")
+    db.close()
+""")
+
+
+@pytest.mark.asyncio
+async def test_sqlite_worker_picks_up_deployment_from_other_process(tmp_path, monkeypatch):
+    """SQLite에서는 프로세스 내 알림이 전달되지 않으므로 짧은 주기 조회로 시작"""
+    url = f"sqlite:///{tmp_path / 'deploy.db'}"
+    engine = create_engine(url, connect_args={"check_same_thread": False})
+    platform_models.Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+    started = []
+
+    async def fake_process(deployment_id, session_factory):
+        started.append(deployment_id)
+
+    monkeypatch.setattr(worker_module, "process_deployment", fake_process)
+    worker = DeploymentWorker(factory, sweep_interval_sec=60, poll_interval_sec=0.1)
+    task = asyncio.create_task(worker.run())
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable, "-c", _API_PROCESS, url, cwd=str(Path(__file__).resolve().parents[2])
+        )
+        assert await proc.wait() == 0
+        for _ in range(100):
+            if started:
+                break
+            await asyncio.sleep(0.02)
+        assert started == ["remote"]
+    finally:
+        worker.stop()
+        await task
+        engine.dispose()
@@ -0,0 +1,46 @@
+from src.commerce.domain.models_phase2 import IoTDevice
+from src.commerce.services.device_state import DeviceStateStore, TimerWheel
+
+
+def test_timer_wheel_reschedule_and_multi_round():
+    wheel = TimerWheel(tick_sec=1.0, slots=8, now=0)
+    wheel.schedule("a", 3)
+    wheel.schedule("b", 20)  # 슬롯 수보다 먼 만료 (다음 바퀴)
+    wheel.schedule("a", 5)   # 재등록 → 3초 만료는 무시
+
+    assert wheel.advance(4) == []
+    assert wheel.advance(6) == ["a"]
+    assert wheel.advance(19) == []
+    assert wheel.advance(25) == ["b"]
+    assert len(wheel) == 0
+
+
+def test_ingest_flush_and_offline_timeout(db, session_factory):
+    db.add_all([
+        IoTDevice(id="door", store_id=1, name="Door", status="OFFLINE"),
+        IoTDevice(id="light", store_id=1, name="Light", status="OFFLINE", auth_token="secret"),
+        IoTDevice(id="other", store_id=2, name="Other", status="OFFLINE"),
+    ])
+    db.commit()
+    store = DeviceStateStore(session_factory=session_factory, timeout_sec=30)
+
+    result = store.ingest(db, 1, [
+        {"device_id": "door", "telemetry": {"entries": 3}},
+        {"device_id": "light", "token": "wrong"},
+        {"device_id": "other"},
+    ], now=store._wheel._current + 1)
+    assert result["accepted"] == 1
+    assert {r["reason"] for r in result["rejected"]} == {"INVALID_TOKEN", "UNKNOWN_DEVICE"}
+
+    assert store.flush() == 1
+    assert store.flush() == 0  # 변경 없으면 DB 접근 없음
+    db.expire_all()
+    door = db.get(IoTDevice, "door")
+    assert door.status == "ONLINE"
+    assert door.last_heartbeat is not None
+    assert door.telemetry == '{"entries": 3}'
+
+    assert store.expire(now=store._wheel._current + 40) == ["door"]
+    store.flush()
+    db.expire_all()
+    assert db.get(IoTDevice, "door").status == "OFFLINE"
@@ -1,11 +1,67 @@
+import socket
+
 import pytest
-from unittest.mock import MagicMock, patch
+
+pytest.importorskip("aiosmtpd")
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import AuthResult
+
+from src.application.sending_service import SendingService
 from src.infrastructure.email_adapter import EmailAdapter
 from src.domain.schemas import MessageRequest, Recipient, ChannelType
 
+
+class RecordingHandler:
+    """수신 메시지를 기록하고, fail_once 주소는 첫 시도에 4xx로 거부하는 SMTP 스탠드인"""
+
+    def __init__(self):
+        self.messages = []
+        self.sessions = set()
+        self.fail_once = set()
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address in self.fail_once:
+            self.fail_once.discard(address)
+            return "451 Try again later"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        self.sessions.add(id(session))
+        self.messages.append((envelope.rcpt_tos[0], envelope.content.decode("utf-8", "replace")))
+        return "250 Message accepted"
+
+
+def _authenticator(server, session, envelope, mechanism, auth_data):
+    ok = auth_data.login == b"user" and auth_data.password == b"secret"
+    return AuthResult(success=ok, handled=False)
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
 @pytest.fixture
-def email_adapter():
-    return EmailAdapter()
+def smtp_server():
+    handler = RecordingHandler()
+    controller = Controller(
+        handler, hostname="127.0.0.1", port=_free_port(),
+        authenticator=_authenticator, auth_require_tls=False
+    )
+    controller.start()
+    yield controller
+    controller.stop()
+
+
+@pytest.fixture
+def email_adapter(smtp_server):
+    return EmailAdapter(
+        host=smtp_server.hostname, port=smtp_server.port, user="user", password="secret",
+        pool_size=2, retry_backoff_sec=0.01
+    )
+
 
 @pytest.fixture
 def valid_message():
@@ -17,54 +73,75 @@ def valid_message():
         body="Test Body"
     )
 
+
 @pytest.mark.asyncio
-async def test_send_email_success(email_adapter, valid_message):
+async def test_send_email_success(email_adapter, valid_message, smtp_server):
     """SMTP 연결 및 전송 성공 시나리오 테스트"""
-    
-    # smtplib.SMTP 객체를 모킹
-    with patch("smtplib.SMTP") as mock_smtp:
-        mock_server = MagicMock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
-        
-        # 실행
-        result = await email_adapter.send(valid_message)
-        
-        # 검증
-        assert result.success is True
-        assert result.request_id == "test-001"
-        mock_server.sendmail.assert_called_once()  # sendmail이 호출되었는지 확인
+    result = await email_adapter.send(valid_message)
+
+    assert result.success is True
+    assert result.request_id == "test-001"
+    assert [to for to, _ in smtp_server.handler.messages] == ["test@example.com"]
+    await email_adapter.close()
+
+
+@pytest.mark.asyncio
+async def test_send_reuses_pooled_connections_and_retries(email_adapter, smtp_server):
+    """수신자별 발송이 풀 크기만큼의 연결을 재사용하고, 4xx는 재시도"""
+    recipients = [f"user{i}@example.com" for i in range(6)]
+    smtp_server.handler.fail_once.add("user3@example.com")
+    message = MessageRequest(
+        request_id="batch-001",
+        recipients=[Recipient(email=r) for r in recipients],
+        subject="Notice",
+        body="<b>Hi</b>"
+    )
+
+    result = await email_adapter.send(message)
+
+    assert result.success is True
+    assert sorted(to for to, _ in smtp_server.handler.messages) == recipients
+    assert email_adapter.pool.opened == 2
+    await email_adapter.close()
+
 
 @pytest.mark.asyncio
-async def test_send_email_auth_failure(email_adapter, valid_message):
-    """SMTP 인증 실패 시나리오 테스트"""
-    
-    import smtplib
-    
-    with patch("smtplib.SMTP") as mock_smtp:
-        mock_server = MagicMock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
-        
-        # 로그인 시 인증 에러 발생하도록 설정
-        mock_server.login.side_effect = smtplib.SMTPAuthenticationError(535, "Auth Failed")
-        
-        # 실행
-        result = await email_adapter.send(valid_message)
-        
-        # 검증
-        assert result.success is False
-        assert result.error_code == "AUTH_ERROR"
+async def test_send_email_auth_failure(smtp_server, valid_message):
+    """SMTP 인증 실패 시나리오 테스트 (재시도하지 않음)"""
+    adapter = EmailAdapter(host=smtp_server.hostname, port=smtp_server.port, user="user", password="wrong")
+
+    result = await adapter.send(valid_message)
+
+    assert result.success is False
+    assert result.error_code == "AUTH_ERROR"
+    assert adapter.pool.opened == 0
+
+
+@pytest.mark.asyncio
+async def test_dispatch_batch_fans_out(email_adapter, smtp_server):
+    service = SendingService({ChannelType.EMAIL: email_adapter})
+    requests = [
+        MessageRequest(request_id=f"r{i}", recipients=[Recipient(email=f"r{i}@example.com")], subject="S", body="B")
+        for i in range(5)
+    ] + [MessageRequest(request_id="sms", channel=ChannelType.SMS, recipients=[Recipient(phone="010")], subject="S", body="B")]
+
+    results = await service.dispatch_batch(requests, concurrency=3)
+
+    assert [r.request_id for r in results] == ["r0", "r1", "r2", "r3", "r4", "sms"]
+    assert all(r.success for r in results[:5])
+    assert results[5].error_code == "UNSUPPORTED_CHANNEL"
+    assert len(smtp_server.handler.messages) == 5
+    await email_adapter.close()
+
 
 @pytest.mark.asyncio
 async def test_validate_connection_success(email_adapter):
     """연결 확인 기능 테스트"""
-    with patch("smtplib.SMTP") as mock_smtp:
-        mock_smtp.return_value.__enter__.return_value = MagicMock()
-        assert await email_adapter.validate_connection() is True
+    assert await email_adapter.validate_connection() is True
+
 
 @pytest.mark.asyncio
-async def test_validate_connection_failure(email_adapter):
+async def test_validate_connection_failure():
     """연결 실패 확인 기능 테스트"""
-    with patch("smtplib.SMTP") as mock_smtp:
-        # SMTP 연결 자체가 에러를 뱉음
-        mock_smtp.side_effect = Exception("Connection Timeout")
-        assert await email_adapter.validate_connection() is False
\ No newline at end of file
+    adapter = EmailAdapter(host="127.0.0.1", port=_free_port(), user="", password="")
+    assert await adapter.validate_connection() is False
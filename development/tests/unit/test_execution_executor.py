@@ -0,0 +1,131 @@
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.core.database.v3_schema import ExecutionRequest
+from src.core.metrics import KernelMetrics
+from src.services.execution import executor as executor_module
+from src.services.execution.executor import ExecutorFull, ExecutorStopped, InProcessExecutor
+
+
+def _executor(**kwargs):
+    metrics = KernelMetrics()
+    executor = InProcessExecutor(session_factory=None, metrics=metrics, **kwargs)
+    return executor, metrics
+
+
+def test_runs_submissions_and_records_queue_wait():
+    executor, metrics = _executor(workers=2, max_queue=10)
+    done = []
+    executor.execute = done.append
+
+    for i in range(5):
+        executor.submit(f"req-{i}")
+    assert executor.shutdown(timeout=5) == 0
+
+    assert sorted(done) == [f"req-{i}" for i in range(5)]
+    assert metrics.summary()["histograms"]["tg_executor_queue_wait_seconds"]["count"] == 5
+    text = metrics.render_prometheus()
+    assert "tg_executor_queue_depth 0.0" in text and 'tg_executor_queue_wait_seconds_bucket{le="+Inf"} 5' in text
+
+    with pytest.raises(ExecutorStopped):
+        executor.submit("late")
+
+
+def test_full_queue_rejects_and_crashes_do_not_kill_workers():
+    executor, metrics = _executor(workers=1, max_queue=2)
+    gate, done = threading.Event(), []
+
+    def execute(req_id):
+        gate.wait(5)
+        if req_id == "boom":
+            raise RuntimeError("handler bug")
+        done.append(req_id)
+
+    executor.execute = execute
+    executor.submit("boom")
+    # 첫 요청이 실행 스레드에 잡힐 때까지 대기
+    for _ in range(100):
+        if executor._active:
+            break
+        threading.Event().wait(0.01)
+    executor.submit("a")
+    executor.submit("b")
+    assert executor.is_full()
+    with pytest.raises(ExecutorFull):
+        executor.submit("c")
+    assert metrics.summary()["gauges"]["tg_executor_rejected"] == 1
+
+    gate.set()
+    assert executor.shutdown(timeout=5) == 0
+    assert done == ["a", "b"]
+
+
+def test_drain_timeout_leaves_remaining_requests():
+    executor, _ = _executor(workers=1, max_queue=10)
+    gate = threading.Event()
+    executor.execute = lambda req_id: gate.wait(5)
+
+    for i in range(3):
+        executor.submit(f"req-{i}")
+    assert executor.shutdown(timeout=0.1) == 2
+    gate.set()
+
+
+
+def test_recover_requeues_leftover_requests_up_to_capacity(db, session_factory):
+    """방치된 QUEUED 요청을 대기열 여유만큼 재등록하고 나머지는 QUEUED로 유지"""
+    base = datetime.now() - timedelta(minutes=5)
+    db.add_all([
+        ExecutionRequest(req_id=f"req-{i}", function_code="FN", user_id="u1", status="QUEUED",
+                         created_at=base + timedelta(seconds=i))
+        for i in range(3)
+    ] + [
+        # 죽은 프로세스가 점유만 하고 남긴 요청 → 점유 해제 후 재등록 대상
+        ExecutionRequest(req_id="dead", function_code="FN", user_id="u1", status="QUEUED", claimed_by="dead",
+                         lease_expires_at=datetime.now() - timedelta(seconds=1), created_at=base - timedelta(seconds=1)),
+        # 살아있는 프로세스가 점유 중인 요청
+        ExecutionRequest(req_id="taken", function_code="FN", user_id="u1", status="QUEUED", claimed_by="other",
+                         lease_expires_at=datetime.now() + timedelta(minutes=5), created_at=base),
+        # 방금 생성되어 다른 프로세스 대기열에 있을 수 있는 요청
+        ExecutionRequest(req_id="fresh", function_code="FN", user_id="u1", status="QUEUED"),
+    ])
+    db.commit()
+
+    executor = InProcessExecutor(session_factory=session_factory, workers=0, max_queue=2, metrics=KernelMetrics())
+    assert executor.recover_queued() == {"released": 1, "resubmitted": 2}
+    assert [req_id for req_id, _ in executor._queue.queue] == ["dead", "req-0"]
+    # 대기열이 차 있으면 아무것도 실패 처리하지 않고 다음 주기로 미룸
+    assert executor.recover_queued() == {"released": 0, "resubmitted": 0}
+
+    db.expire_all()
+    rows = {r.req_id: r for r in db.query(ExecutionRequest)}
+    assert {req_id: r.status for req_id, r in rows.items()} == dict.fromkeys(rows, "QUEUED")
+    assert rows["dead"].claimed_by is None and rows["taken"].claimed_by == "other"
+
+
+def test_execute_claims_request_once(db, session_factory, monkeypatch):
+    """다른 프로세스가 이미 점유한 요청은 실행하지 않음"""
+    db.add_all([
+        ExecutionRequest(req_id="mine", function_code="FN", user_id="u1", status="QUEUED"),
+        ExecutionRequest(req_id="theirs", function_code="FN", user_id="u1", status="QUEUED", claimed_by="other"),
+    ])
+    db.commit()
+    invoked = []
+
+    class FakeKernel:
+        def __init__(self, db):
+            pass
+
+        def invoke_function(self, req_id):
+            invoked.append(req_id)
+
+    monkeypatch.setattr(executor_module, "SystemKernel", FakeKernel)
+    executor = InProcessExecutor(session_factory=session_factory, workers=0, metrics=KernelMetrics())
+    for req_id in ("mine", "theirs", "mine"):
+        executor.execute(req_id)
+
+    assert invoked == ["mine"]
+    db.expire_all()
+    assert db.get(ExecutionRequest, "mine").claimed_by == executor.executor_id
@@ -0,0 +1,88 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.core.database.v3_schema import ExecutionRequest, FunctionCatalog, MasterUser
+from src.core.registry import HandlerRegistry
+from src.services.execution.worker import ExecutionWorker
+
+
+@pytest.fixture
+def queued(db, monkeypatch):
+    monkeypatch.setattr("src.services.execution.worker.handler_registry", HandlerRegistry())
+    db.add(MasterUser(user_id="u1", username="u1", email="u1@x"))
+    db.add_all([
+        FunctionCatalog(function_code="FN_SLOW", function_name="slow", handler_path="src.handlers.data_mgr.DataImportFunction",
+                        resource_spec={"max_concurrency": 2}),
+        FunctionCatalog(function_code="FN_FAST", function_name="fast", handler_path="src.handlers.data_mgr.DataImportFunction",
+                        resource_spec={}),
+    ])
+    base = datetime.now() - timedelta(minutes=10)
+    db.add_all([
+        ExecutionRequest(req_id=f"slow-{i}", function_code="FN_SLOW", user_id="u1", input_payload={},
+                         status="QUEUED", created_at=base + timedelta(seconds=i))
+        for i in range(4)
+    ] + [
+        ExecutionRequest(req_id=f"fast-{i}", function_code="FN_FAST", user_id="u1", input_payload={},
+                         status="QUEUED", created_at=base + timedelta(seconds=10 + i))
+        for i in range(2)
+    ])
+    db.commit()
+    return db
+
+
+def test_claim_respects_function_limits_and_is_exclusive(queued, session_factory):
+    a = ExecutionWorker(session_factory, batch_size=10, worker_id="a")
+    b = ExecutionWorker(session_factory, batch_size=10, worker_id="b")
+
+    claimed_a = a.claim(capacity=10)
+    assert sorted(r for r, _ in claimed_a) == ["fast-0", "fast-1", "slow-0", "slow-1"]
+
+    # 다른 워커는 남은 요청만 점유, 같은 요청을 두 번 점유하지 않음
+    claimed_b = b.claim(capacity=10)
+    assert sorted(r for r, _ in claimed_b) == ["slow-2", "slow-3"]
+    assert b.claim(capacity=10) == []
+
+    queued.expire_all()
+    row = queued.get(ExecutionRequest, "slow-0")
+    assert row.status == "CLAIMED" and row.claimed_by.startswith("a:") and row.attempts == 1
+
+
+def test_expired_leases_are_reaped(queued, session_factory):
+    worker = ExecutionWorker(session_factory, batch_size=10, lease_sec=30, worker_id="dead")
+    worker.claim(capacity=10)
+    queued.get(ExecutionRequest, "fast-0").status = "PROCESSING"
+    queued.commit()
+
+    assert worker.reap_expired(now=datetime.now()) == {"requeued": 0, "failed": 0}
+    report = worker.reap_expired(now=datetime.now() + timedelta(seconds=31))
+    assert report == {"requeued": 3, "failed": 1}
+
+    queued.expire_all()
+    assert queued.get(ExecutionRequest, "fast-0").status == "FAILED"
+    assert queued.get(ExecutionRequest, "slow-0").status == "QUEUED"
+
+
+@pytest.mark.asyncio
+async def test_run_executes_claimed_requests_on_pool(queued, session_factory):
+    executed = []
+    worker = ExecutionWorker(session_factory, pool_size=3, batch_size=10, poll_interval_sec=0.01, worker_id="w")
+
+    def execute(req_id):
+        executed.append(req_id)
+        db = session_factory()
+        db.get(ExecutionRequest, req_id).status = "COMPLETED"
+        db.commit()
+        db.close()
+
+    worker.execute = execute
+    task = asyncio.create_task(worker.run())
+    for _ in range(500):
+        if len(executed) == 6:
+            break
+        await asyncio.sleep(0.01)
+    worker.stop()
+    await task
+
+    assert sorted(executed) == sorted([f"slow-{i}" for i in range(4)] + ["fast-0", "fast-1"])
@@ -0,0 +1,79 @@
+from src.core import erp_service, kernel as kernel_module
+from src.core.audit_writer import AuditWriter
+from src.core.database.v3_schema import ExecutionRequest, FunctionCatalog, MasterUser, Subscription
+from src.core.erp_service import ERPService
+from src.core.kernel import SystemKernel
+from src.core.registry import HandlerRegistry, billing_cache
+from src.core.serverless.handler import BaseFunction
+
+
+class EchoFunction(BaseFunction):
+    def handle(self, event):
+        return {"echo": event, "user": self.context.user_id}
+
+
+class NotAFunction:
+    pass
+
+
+def _catalog(db, code, handler, active=True):
+    db.add(FunctionCatalog(function_code=code, function_name=code, handler_path=handler, resource_spec={}, is_active=active))
+    db.commit()
+
+
+def test_preload_resolves_and_validates_catalog(db):
+    _catalog(db, "FN_ECHO", f"{__name__}.EchoFunction")
+    _catalog(db, "FN_BAD_CLASS", f"{__name__}.NotAFunction")
+    _catalog(db, "FN_MISSING", "src.handlers.no_such_module.Handler")
+    _catalog(db, "FN_OFF", f"{__name__}.EchoFunction", active=False)
+
+    registry = HandlerRegistry()
+    entries = registry.preload(db)
+
+    assert set(entries) == {"FN_ECHO"}
+    assert entries["FN_ECHO"].handler_class is EchoFunction
+    assert set(registry.errors) == {"FN_BAD_CLASS", "FN_MISSING"}
+    assert registry.get(db, "FN_OFF") is None
+
+
+def test_catalog_change_invalidates_registry(db):
+    registry = HandlerRegistry()
+    registry.preload(db)
+    first = registry.fingerprint
+
+    # 다른 프로세스 변경 → 주기 확인 시 지문 비교로 반영
+    _catalog(db, "FN_ECHO", f"{__name__}.EchoFunction")
+    registry.refresh_sec = 0
+    assert registry.get(db, "FN_ECHO") is not None
+    assert registry.fingerprint != first
+
+    fn = db.get(FunctionCatalog, "FN_ECHO")
+    fn.is_active = False
+    db.commit()
+    registry.invalidate()
+    assert registry.get(db, "FN_ECHO") is None
+
+
+def test_kernel_uses_registry_and_cached_billing(db, session_factory, monkeypatch):
+    registry = HandlerRegistry()
+    monkeypatch.setattr(kernel_module, "handler_registry", registry)
+    monkeypatch.setattr(erp_service, "audit_writer", AuditWriter(session_factory))
+    billing_cache.invalidate()
+
+    db.add(MasterUser(user_id="u1", username="u1", email="u1@x", tier_level="STARTER"))
+    db.add(Subscription(sub_id="s1", user_id="u1", plan_type="PRO", status="ACTIVE"))
+    _catalog(db, "FN_ECHO", f"{__name__}.EchoFunction")
+    db.add(ExecutionRequest(req_id="r1", function_code="FN_ECHO", user_id="u1", input_payload={"a": 1}))
+    db.commit()
+
+    SystemKernel(db).invoke_function("r1")
+    request = db.get(ExecutionRequest, "r1")
+    assert request.status == "COMPLETED"
+    assert request.result_output == {"echo": {"a": 1}, "user": "u1"}
+    assert billing_cache.get("u1") is True
+
+    # 구독 변경 시 캐시 무효화
+    db.get(Subscription, "s1").status = "CANCELED"
+    db.commit()
+    assert billing_cache.get("u1") is None
+    assert ERPService(db).check_billing_eligibility("u1", service_cost=100) is False
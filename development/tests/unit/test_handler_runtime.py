@@ -0,0 +1,63 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.core.serverless.handler import BaseFunction, ServerlessContext
+from src.core.serverless.runtime import HandlerRuntime
+
+
+class AsyncEcho(BaseFunction):
+    async def handle(self, event):
+        await asyncio.sleep(0)
+        return {"loop": id(asyncio.get_running_loop()), "thread": threading.current_thread().name, **event}
+
+
+class SyncEcho(BaseFunction):
+    def handle(self, event):
+        return {"thread": threading.current_thread().name, **event}
+
+
+class LegacyFunction(BaseFunction):
+    """이전 방식: sync handle 안에서 코루틴 실행"""
+
+    def handle(self, event):
+        async def _run():
+            return id(asyncio.get_running_loop())
+        return {"loop": self.run_coroutine(_run())}
+
+
+@pytest.fixture
+def runtime(monkeypatch):
+    rt = HandlerRuntime(sync_pool_size=2)
+    monkeypatch.setattr("src.core.serverless.handler.handler_runtime", rt)
+    yield rt
+    rt.shutdown()
+
+
+def _ctx():
+    return ServerlessContext(req_id="r1", user_id="u1")
+
+
+def test_async_handlers_share_one_long_lived_loop(runtime):
+    assert AsyncEcho.is_async and not SyncEcho.is_async
+
+    first = runtime.run(AsyncEcho(_ctx()), {"n": 1})
+    second = runtime.run(AsyncEcho(_ctx()), {"n": 2})
+
+    assert first["loop"] == second["loop"] == id(runtime.loop)
+    assert first["thread"] == "handler-loop" and second["n"] == 2
+
+
+def test_sync_handlers_run_on_pool_and_legacy_coroutines_use_shared_loop(runtime):
+    assert runtime.run(SyncEcho(_ctx()), {"n": 1})["thread"].startswith("handler-sync")
+    assert runtime.run(LegacyFunction(_ctx()), {})["loop"] == id(runtime.loop)
+
+
+def test_blocking_submit_from_loop_thread_is_rejected(runtime):
+    class Nested(BaseFunction):
+        async def handle(self, event):
+            return self.run_coroutine(asyncio.sleep(0))
+
+    with pytest.raises(RuntimeError):
+        runtime.run(Nested(_ctx()), {})
@@ -0,0 +1,47 @@
+from datetime import datetime, timedelta, timezone
+
+from src.core.metrics import KernelMetrics, queue_wait_seconds
+
+
+def test_summary_orders_functions_by_busy_time():
+    metrics = KernelMetrics()
+    for duration, status in [(0.2, "COMPLETED"), (0.4, "COMPLETED"), (3.0, "FAILED")]:
+        metrics.execution_started("FN_SLOW", queue_wait_sec=1.5)
+        metrics.execution_finished("FN_SLOW", status, duration)
+    metrics.execution_started("FN_FAST", queue_wait_sec=0.01)
+    metrics.execution_finished("FN_FAST", "COMPLETED", 0.01)
+    metrics.execution_rejected("FN_FAST", "DENIED_BILLING")
+    metrics.execution_started("FN_FAST")
+
+    summary = metrics.summary()
+    slow, fast = summary["functions"]
+    assert slow["function_code"] == "FN_SLOW"
+    assert slow["total"] == 3 and slow["statuses"] == {"COMPLETED": 2, "FAILED": 1}
+    assert slow["error_rate"] == round(1 / 3, 4)
+    assert slow["busy_sec"] == 3.6 and slow["avg_queue_wait_ms"] == 1500.0
+    assert slow["p95_ms"] == 5000
+    assert fast["in_progress"] == 1 and fast["error_rate"] == 0.5
+    assert slow["busy_share"] > 0.99
+
+
+def test_prometheus_rendering():
+    metrics = KernelMetrics()
+    metrics.execution_started("FN_A", queue_wait_sec=0.2)
+    metrics.execution_finished("FN_A", "COMPLETED", 0.3)
+    metrics.register_gauge("tg_test_queue_depth", "Queued requests.", lambda: 7)
+
+    text = metrics.render_prometheus()
+    assert 'tg_kernel_executions_total{function="FN_A",status="COMPLETED"} 1' in text
+    assert 'tg_kernel_execution_duration_seconds_bucket{function="FN_A",le="0.25"} 0' in text
+    assert 'tg_kernel_execution_duration_seconds_bucket{function="FN_A",le="0.5"} 1' in text
+    assert 'tg_kernel_execution_duration_seconds_bucket{function="FN_A",le="+Inf"} 1' in text
+    assert 'tg_kernel_queue_wait_seconds_count{function="FN_A"} 1' in text
+    assert 'tg_kernel_executions_in_progress{function="FN_A"} 0' in text
+    assert "tg_test_queue_depth 7.0" in text
+
+
+def test_queue_wait_treats_naive_db_timestamps_as_utc():
+    started = datetime.now(timezone.utc)
+    assert queue_wait_seconds(started.replace(tzinfo=None) - timedelta(seconds=2), started) == 2.0
+    assert queue_wait_seconds(started + timedelta(seconds=5), started) == 0.0
+    assert queue_wait_seconds(None, started) is None
@@ -0,0 +1,94 @@
+import pytest
+
+from src.database.models import SystemLog
+from src.services.base import BaseTGService
+from src.services.log_sink import SystemLogSink
+
+
+class ChattyService(BaseTGService):
+    async def setup(self):
+        self.log("setup")
+
+    async def run(self):
+        for i in range(25):
+            self.log(f"line {i}")
+
+    async def cleanup(self):
+        self.log("cleanup", level="WARNING")
+
+
+def _count(factory):
+    db = factory()
+    try:
+        return db.query(SystemLog).count()
+    finally:
+        db.close()
+
+
+def test_sink_batches_and_counts(deploy_factory):
+    sink = SystemLogSink(deploy_factory, batch_size=10, flush_interval_sec=60, max_queue=15)
+    for i in range(18):
+        sink.append("dep-1", "INFO", "Test", f"line {i}")
+
+    # 상한 초과분은 버리고 집계
+    assert sink.stats()["dropped"] == 3
+    assert sink.flush() == 15
+    assert sink.stats() == {"queued": 0, "enqueued": 15, "written": 15, "dropped": 3, "failed_flushes": 0}
+    assert _count(deploy_factory) == 15
+    sink.close()
+
+
+def test_failed_flush_requeues_entries(deploy_factory):
+    sink = SystemLogSink(deploy_factory, batch_size=10, flush_interval_sec=60)
+    sink.append("dep-1", "INFO", "Test", "kept")
+
+    def broken():
+        raise RuntimeError("db down")
+
+    sink.session_factory, good = broken, sink.session_factory
+    with pytest.raises(RuntimeError):
+        sink.flush()
+    assert sink.queued == 1 and sink.failed_flushes == 1
+
+    sink.session_factory = good
+    assert sink.flush() == 1
+    sink.close()
+
+
+@pytest.mark.asyncio
+async def test_service_logs_are_flushed_after_cleanup(deploy_factory):
+    sink = SystemLogSink(deploy_factory, batch_size=1000, flush_interval_sec=60)
+    service = ChattyService("dep-1", {}, db=None)
+    service.log_sink = sink
+
+    await service.execute()
+
+    # setup/run/cleanup 27건 + execute의 진행 로그 3건
+    assert sink.queued == 0 and _count(deploy_factory) == 30
+    sink.close()
+
+
+class FailingService(ChattyService):
+    async def run(self):
+        raise ValueError("boom")
+
+
+@pytest.mark.asyncio
+async def test_log_flush_failure_does_not_mask_service_result(deploy_factory):
+    """로그 반영 실패가 서비스 예외를 가리거나 성공한 서비스를 실패로 만들지 않음"""
+    def broken():
+        raise RuntimeError("db down")
+
+    sink = SystemLogSink(broken, batch_size=1000, flush_interval_sec=60)
+    service = ChattyService("dep-1", {}, db=None)
+    service.log_sink = sink
+    await service.execute()
+
+    failing = FailingService("dep-2", {}, db=None)
+    failing.log_sink = sink
+    with pytest.raises(ValueError, match="boom"):
+        await failing.execute()
+
+    assert sink.failed_flushes == 2 and sink.queued > 0
+    sink.session_factory = deploy_factory
+    sink.close()
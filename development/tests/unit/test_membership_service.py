@@ -0,0 +1,67 @@
+import pytest
+from datetime import datetime
+from sqlalchemy.exc import IntegrityError
+
+from src.commerce.domain.models_gap_v2 import MemberPoint, PointHistory
+from src.commerce.services.membership_service import MembershipService, DuplicateBatchError
+
+
+def test_earn_upserts_single_member(db):
+    """같은 전화번호로 반복 적립 시 회원 1건에 누적"""
+    service = MembershipService(db)
+
+    first = service.earn(1, "010-1234-5678", 10000)
+    second = service.earn(1, "010-1234-5678", 20000)
+
+    assert first["is_new_member"] is True
+    assert second["is_new_member"] is False
+    assert second["total"] == 900
+    assert db.query(MemberPoint).count() == 1
+    assert db.query(PointHistory).count() == 2
+
+
+def test_earn_bulk_aggregates_and_writes_ledger(db):
+    """일괄 적립: 회원별 합산 잔액 + 거래별 원장"""
+    service = MembershipService(db)
+    service.earn(1, "010-0000-0001", 10000)
+
+    summary = service.earn_bulk([
+        {"store_id": 1, "user_phone": "010-0000-0001", "amount": 10000, "occurred_at": datetime(2025, 1, 1, 10)},
+        {"store_id": 1, "user_phone": "010-0000-0002", "amount": 5000},
+        {"store_id": 1, "user_phone": "010-0000-0002", "amount": 5000},
+    ], idempotency_key="terminal-1-20250101")
+
+    assert summary["members"] == 2
+    assert summary["earned"] == 600
+    assert [m["phone"] for m in summary["new_members"]] == ["010-0000-0002"]
+
+    db.expire_all()
+    points = {m.user_phone: m.current_points for m in db.query(MemberPoint)}
+    assert points == {"010-0000-0001": 600, "010-0000-0002": 300}
+    assert db.query(PointHistory).count() == 4
+
+
+def test_earn_bulk_rejects_replayed_batch(db):
+    """같은 idempotency_key 재전송 시 중복 적립하지 않음"""
+    service = MembershipService(db)
+    entries = [{"store_id": 1, "user_phone": "010-0000-0003", "amount": 10000}]
+
+    service.earn_bulk(entries, idempotency_key="batch-1")
+    with pytest.raises(DuplicateBatchError):
+        service.earn_bulk(entries, idempotency_key="batch-1")
+
+    db.expire_all()
+    assert db.query(MemberPoint).one().current_points == 300
+
+
+def test_earn_bulk_other_integrity_error_is_not_duplicate(db, monkeypatch):
+    """idempotency_key가 있어도 기록된 키가 없으면 중복이 아닌 원래 오류 전파"""
+    service = MembershipService(db)
+
+    def broken(rows):
+        raise IntegrityError("INSERT", {}, Exception("FOREIGN KEY constraint failed"))
+
+    monkeypatch.setattr(service, "_write_ledger", broken)
+    with pytest.raises(IntegrityError):
+        service.earn_bulk([{"store_id": 99, "user_phone": "010-0000-0004", "amount": 10000}], idempotency_key="batch-2")
+    assert db.query(MemberPoint).count() == 0
@@ -0,0 +1,47 @@
+from datetime import date, datetime
+
+import numpy as np
+
+from src.commerce.services.payroll_engine import PayrollEngine, month_range
+
+
+def _cols(shifts):
+    """[(store_id, user_id, clock_in, clock_out), ...] → 열 배열"""
+    store_id, user_id, clock_in, clock_out = zip(*shifts)
+    return {
+        "store_id": np.array(store_id), "user_id": np.array(user_id),
+        "clock_in": np.array(clock_in, dtype="datetime64[s]"),
+        "clock_out": np.array(clock_out, dtype="datetime64[s]")
+    }
+
+
+def test_overtime_night_holiday_and_late():
+    """연장/야간/휴일 시간과 지각 건수 계산"""
+    engine = PayrollEngine(hourly_wage=10000, holidays=[date(2025, 3, 1)])
+    rows = engine.compute(_cols([
+        # 3/1(휴일) 20:00 ~ 3/2 04:00 : 8시간, 야간 6시간, 휴일 4시간, 지각
+        (1, 7, datetime(2025, 3, 1, 20), datetime(2025, 3, 2, 4)),
+        # 3/3 09:00~14:00 + 15:00~20:00 : 하루 10시간 → 연장 2시간
+        (1, 7, datetime(2025, 3, 3, 9), datetime(2025, 3, 3, 14)),
+        (1, 7, datetime(2025, 3, 3, 15), datetime(2025, 3, 3, 20)),
+        # 다른 매장 근무는 별도 행
+        (2, 7, datetime(2025, 3, 4, 5), datetime(2025, 3, 4, 7)),
+    ]))
+
+    by_store = {r["store_id"]: r for r in rows}
+    first = by_store[1]
+    assert first["shifts"] == 3
+    assert first["days_worked"] == 2
+    assert first["total_hours"] == 18.0
+    assert first["overtime_hours"] == 2.0
+    assert first["night_hours"] == 6.0
+    assert first["holiday_hours"] == 4.0
+    assert first["late_count"] == 1  # 3/1 20:00 출근 (3/3 15:00은 휴게 후 재출근)
+    assert first["gross_pay"] == 180000 + 10000 + 30000 + 20000
+
+    assert by_store[2]["night_hours"] == 1.0
+    assert by_store[2]["late_count"] == 0
+
+
+def test_month_range_wraps_year():
+    assert month_range("2025-12") == (datetime(2025, 12, 1), datetime(2026, 1, 1))
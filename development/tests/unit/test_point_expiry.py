@@ -0,0 +1,45 @@
+from datetime import datetime, timedelta
+
+from src.commerce.domain.models_gap_v2 import MemberPoint, PointHistory
+from src.commerce.services.point_expiry import PointExpiryJob
+
+NOW = datetime(2025, 6, 1, 3, 0)
+
+
+def _member(db, phone, history):
+    member = MemberPoint(store_id=1, user_phone=phone, current_points=sum(a for a, _ in history), total_accumulated=0)
+    db.add(member)
+    db.flush()
+    db.add_all([
+        PointHistory(member_id=member.id, amount=amount, reason="ORDER_REWARD" if amount > 0 else "USE_POINT",
+                     created_at=NOW - timedelta(days=days_ago))
+        for amount, days_ago in history
+    ])
+    db.commit()
+    return member.id
+
+
+def test_fifo_expiry_and_idempotent_rerun(db, session_factory):
+    """사용분은 오래된 적립부터 차감하고, 재실행 시 중복 소멸 없음"""
+    old_unused = _member(db, "010-1", [(500, 400), (300, 10)])
+    partly_used = _member(db, "010-2", [(500, 400), (-200, 100), (100, 5)])
+    fully_used = _member(db, "010-3", [(500, 400), (-500, 30), (200, 20)])
+    job = PointExpiryJob(session_factory=session_factory, chunk_size=2)
+
+    report = job.run(dry_run=True, now=NOW)
+    assert report["members_expired"] == 2
+    assert report["points_expired"] == 800
+    db.expire_all()
+    assert db.get(MemberPoint, old_unused).current_points == 800  # 드라이런은 변경 없음
+
+    report = job.run(now=NOW)
+    assert report["chunks"] == 2
+    assert report["points_expired"] == 800
+
+    db.expire_all()
+    assert db.get(MemberPoint, old_unused).current_points == 300
+    assert db.get(MemberPoint, partly_used).current_points == 100
+    assert db.get(MemberPoint, fully_used).current_points == 200
+    assert db.query(PointHistory).filter_by(reason="EXPIRE").count() == 2
+
+    assert job.run(now=NOW)["points_expired"] == 0
@@ -0,0 +1,47 @@
+from datetime import datetime, timedelta
+
+from src.commerce.services.queue_estimator import QueueWaitEstimator
+
+
+def _feed_calls(estimator, store_id, start, gap_min, count, wait_min=20, head_count=2):
+    """gap_min 간격으로 호출 이벤트를 count건 주입"""
+    for i in range(count):
+        called_at = start + timedelta(minutes=gap_min * i)
+        estimator.observe_call(store_id, called_at - timedelta(minutes=wait_min), called_at, head_count)
+
+
+def test_no_history_returns_none():
+    """학습 데이터가 없으면 추정하지 않음"""
+    estimator = QueueWaitEstimator()
+    assert estimator.estimate_wait_min(1, ahead_teams=3) is None
+    assert estimator.service_rate(1) is None
+
+
+def test_estimate_scales_with_ahead_teams():
+    """앞 팀 수에 비례하여 예상 대기시간 증가"""
+    estimator = QueueWaitEstimator()
+    _feed_calls(estimator, 1, datetime(2025, 1, 1, 12, 0), gap_min=5, count=10)
+
+    assert estimator.service_rate(1) == 1 / 5
+    at = datetime(2025, 1, 1, 12, 30)
+    assert estimator.estimate_wait_min(1, ahead_teams=0, head_count=2, at=at) == 5
+    assert estimator.estimate_wait_min(1, ahead_teams=3, head_count=2, at=at) == 20
+
+
+def test_idle_gap_is_ignored():
+    """영업 공백(최대 간격 초과)은 처리 속도 학습에서 제외"""
+    estimator = QueueWaitEstimator(max_gap_min=60)
+    start = datetime(2025, 1, 1, 12, 0)
+    _feed_calls(estimator, 1, start, gap_min=4, count=3)
+    _feed_calls(estimator, 1, start + timedelta(hours=5), gap_min=4, count=3)
+
+    assert estimator.service_rate(1) == 1 / 4
+
+
+def test_stores_are_isolated():
+    """매장별 통계는 서로 영향을 주지 않음"""
+    estimator = QueueWaitEstimator()
+    _feed_calls(estimator, 1, datetime(2025, 1, 1, 12, 0), gap_min=3, count=5)
+
+    assert estimator.service_rate(1) is not None
+    assert estimator.service_rate(2) is None
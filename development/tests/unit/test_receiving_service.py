@@ -0,0 +1,54 @@
+from datetime import datetime
+
+import pytest
+
+from src.commerce.domain.models import ExpectedDelivery, ExpectedDeliveryItem, ExpectedDeliveryStatus
+from src.commerce.domain.models_gap_v2 import InventoryItem
+from src.commerce.services.receiving_service import ReceivingService, AlreadyReceivedError
+
+NOW = datetime(2025, 3, 1, 10, 0)
+
+
+def _delivery(db):
+    delivery = ExpectedDelivery(store_id=1, po_number="PO-1", vendor_name="V", status=ExpectedDeliveryStatus.PENDING)
+    db.add(delivery)
+    db.flush()
+    db.add_all([
+        ExpectedDeliveryItem(delivery_id=delivery.id, item_code="A", item_name="원두(kg)", quantity=5, unit="KG"),
+        ExpectedDeliveryItem(delivery_id=delivery.id, item_code="A2", item_name="원두(kg)", quantity=3, unit="KG"),
+        ExpectedDeliveryItem(delivery_id=delivery.id, item_code="B", item_name="우유(L)", quantity=12, unit="L"),
+    ])
+    db.add_all([
+        InventoryItem(store_id=1, item_name="원두(kg)", current_qty=2.0, unit="kg"),
+        InventoryItem(store_id=2, item_name="원두(kg)", current_qty=7.0, unit="kg"),  # 다른 매장
+    ])
+    db.commit()
+    return delivery
+
+
+def test_receive_updates_items_and_stock_in_bulk(db):
+    delivery = _delivery(db)
+
+    items = ReceivingService(db).receive(delivery, now=NOW)
+    assert [i["quantity"] for i in items] == [5, 3, 12]
+
+    db.expire_all()
+    assert db.get(ExpectedDelivery, delivery.id).status == ExpectedDeliveryStatus.RECEIVED
+    assert db.get(ExpectedDelivery, delivery.id).received_at == NOW
+    stock = {(i.store_id, i.item_name): i for i in db.query(InventoryItem)}
+    assert stock[(1, "원두(kg)")].current_qty == 10.0
+    assert stock[(2, "원두(kg)")].current_qty == 7.0
+    # 재고 마스터에 없던 품목은 신규 등록
+    assert stock[(1, "우유(L)")].current_qty == 12.0
+    assert stock[(1, "우유(L)")].unit == "l"
+
+
+def test_receive_twice_is_rejected_without_double_stock(db):
+    delivery = _delivery(db)
+    ReceivingService(db).receive(delivery, now=NOW)
+
+    with pytest.raises(AlreadyReceivedError):
+        ReceivingService(db).receive(delivery, now=NOW)
+
+    db.expire_all()
+    assert db.query(InventoryItem).filter_by(store_id=1, item_name="원두(kg)").one().current_qty == 10.0
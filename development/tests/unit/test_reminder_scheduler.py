@@ -0,0 +1,125 @@
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+
+from src.application.sending_service import SendingService
+from src.commerce.domain.models_phase2 import Reservation, ReservationStatus
+from src.commerce.services.reminder_scheduler import MAX_SEND_ATTEMPTS, RETRY_BACKOFF, ReminderScheduler
+from src.domain.schemas import ChannelType
+from src.infrastructure.fake_adapter import FakeSenderAdapter
+
+
+def _add_reservation(db, res_id, reserved_at, phone="010-1111-2222", status=ReservationStatus.CONFIRMED):
+    db.add(Reservation(
+        id=res_id, store_id=1, guest_name="Kim", guest_phone=phone, guest_count=2,
+        reserved_at=reserved_at, end_at=reserved_at + timedelta(hours=1), status=status
+    ))
+    db.commit()
+
+
+@pytest.fixture
+def fake_adapter():
+    return FakeSenderAdapter(fail_phones={"010-9999-9999"})
+
+
+@pytest.fixture
+def scheduler(session_factory, fake_adapter):
+    return ReminderScheduler(
+        sending_service=SendingService({ChannelType.SMS: fake_adapter}),
+        session_factory=session_factory,
+        lead=timedelta(hours=1)
+    )
+
+
+@pytest.mark.asyncio
+async def test_window_load_and_batch_mark(db, scheduler, fake_adapter):
+    """재기동 시 24시간 구간만 적재하고, 발송 성공 건만 is_notified 처리"""
+    now = datetime.now()
+    _add_reservation(db, "due-1", now + timedelta(minutes=30))
+    _add_reservation(db, "due-2", now + timedelta(minutes=50))
+    _add_reservation(db, "fail", now + timedelta(minutes=40), phone="010-9999-9999")
+    _add_reservation(db, "later", now + timedelta(hours=5))
+    _add_reservation(db, "far", now + timedelta(days=3))
+    _add_reservation(db, "canceled", now + timedelta(minutes=20), status=ReservationStatus.CANCELED)
+
+    assert await scheduler.load_window(now) == 4
+
+    sent = await scheduler.fire_due(now)
+    assert sent == 2
+    assert sorted(m.metadata["reservation_id"] for m in fake_adapter.sent) == ["due-1", "due-2"]
+
+    db.expire_all()
+    notified = {r.id for r in db.query(Reservation).filter_by(is_notified=True)}
+    assert notified == {"due-1", "due-2"}
+
+
+@pytest.mark.asyncio
+async def test_failed_send_retried_with_backoff(db, scheduler, fake_adapter):
+    """발송 실패 건은 다음 적재를 기다리지 않고 백오프 후 재시도, 최대 횟수 후 포기"""
+    now = datetime.now()
+    _add_reservation(db, "flaky", now + timedelta(minutes=50), phone="010-9999-9999")
+    await scheduler.load_window(now)
+
+    assert await scheduler.fire_due(now) == 0
+    assert await scheduler.fire_due(now + RETRY_BACKOFF / 2) == 0
+    assert scheduler._attempts == {"flaky": 1}  # 백오프 전에는 재발송하지 않음
+
+    fake_adapter.fail_phones.clear()
+    assert await scheduler.fire_due(now + RETRY_BACKOFF) == 1
+    assert scheduler._attempts == {}
+    db.expire_all()
+    assert db.get(Reservation, "flaky").is_notified is True
+
+    _add_reservation(db, "dead", now + timedelta(hours=3), phone="010-0000-0000")
+    fake_adapter.fail_phones.add("010-0000-0000")
+    await scheduler.load_window(now)
+    t = now + timedelta(hours=2)
+    for attempt in range(1, MAX_SEND_ATTEMPTS + 1):
+        await scheduler.fire_due(t)
+        assert scheduler._attempts.get("dead") == (attempt if attempt < MAX_SEND_ATTEMPTS else None)
+        t += timedelta(minutes=10)
+    assert scheduler._heap == []
+
+
+@pytest.mark.asyncio
+async def test_run_wakes_at_next_due_time(db, scheduler, fake_adapter):
+    """신규 예약을 schedule()하면 다음 due 시각에 맞춰 깨어나 발송"""
+    task = scheduler.start()
+    try:
+        await asyncio.sleep(0.05)
+        reserved_at = datetime.now() + scheduler.lead + timedelta(milliseconds=300)
+        _add_reservation(db, "new", reserved_at)
+        scheduler.schedule("new", reserved_at)
+
+        await asyncio.sleep(0.1)
+        assert fake_adapter.sent == []
+
+        for _ in range(20):
+            await asyncio.sleep(0.1)
+            if fake_adapter.sent:
+                break
+        assert [m.metadata["reservation_id"] for m in fake_adapter.sent] == ["new"]
+    finally:
+        await scheduler.stop()
+        assert task.done()
+
+
+@pytest.mark.asyncio
+async def test_schedule_ignored_when_not_running_or_outside_window(scheduler):
+    """미기동 상태의 schedule()은 힙에 쌓이지 않고, 기동 후에도 적재 구간 밖 예약은 제외"""
+    far = datetime.now() + timedelta(days=30)
+    for i in range(100):
+        scheduler.schedule(f"r{i}", far)
+    assert scheduler._heap == [] and scheduler._scheduled == {}
+
+    scheduler.start()
+    try:
+        for _ in range(50):
+            if scheduler._horizon:
+                break
+            await asyncio.sleep(0.01)
+        scheduler.schedule("far", far)
+        scheduler.schedule("soon", datetime.now() + timedelta(hours=3))
+        assert set(scheduler._scheduled) == {"soon"}
+    finally:
+        await scheduler.stop()
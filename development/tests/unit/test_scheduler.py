@@ -0,0 +1,82 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.core.database.v3_campaigns import Campaign
+from src.core.database.v3_schema import ExecutionRequest
+from src.core.scheduler import CampaignScheduler, LeaderLease, claim_due_campaigns, next_due_at
+
+
+def _campaign(db, campaign_id, scheduled_at, status="SCHEDULED"):
+    db.add(Campaign(campaign_id=campaign_id, user_id="u1", name=campaign_id, status=status, scheduled_at=scheduled_at))
+    db.commit()
+
+
+def test_leader_lease_allows_one_holder_and_fails_over(session_factory):
+    now = datetime.now()
+    a = LeaderLease(session_factory, "test", "a", ttl_sec=30)
+    b = LeaderLease(session_factory, "test", "b", ttl_sec=30)
+
+    assert a.acquire(now) is True
+    assert b.acquire(now) is False
+    assert a.acquire(now + timedelta(seconds=10)) is True  # 연장
+
+    # a가 연장하지 못하고 만료되면 b가 승계
+    assert b.acquire(now + timedelta(seconds=41)) is True
+    assert a.acquire(now + timedelta(seconds=42)) is False
+
+    b.release()
+    assert a.acquire(now + timedelta(seconds=43)) is True
+
+
+def test_claim_due_campaigns_fires_once(db):
+    now = datetime.now()
+    _campaign(db, "due", now - timedelta(minutes=1))
+    _campaign(db, "later", now + timedelta(hours=1))
+    _campaign(db, "draft", now - timedelta(hours=1), status="DRAFT")
+
+    assert claim_due_campaigns(db, now) == ["due"]
+    assert claim_due_campaigns(db, now) == []
+
+    db.expire_all()
+    assert db.get(Campaign, "due").status == "PROCESSING"
+    request = db.query(ExecutionRequest).one()
+    assert request.function_code == "FN_CAMPAIGN_DISPATCH" and request.input_payload == {"campaign_id": "due"}
+    assert next_due_at(db).replace(tzinfo=None) == (now + timedelta(hours=1)).replace(tzinfo=None)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_sleeps_until_due_and_wakes_on_commit(session_factory):
+    leader = CampaignScheduler(session_factory, lease_sec=30, instance_id="leader")
+    standby = CampaignScheduler(session_factory, lease_sec=30, instance_id="standby")
+    tasks = [asyncio.create_task(leader.run())]
+    await asyncio.sleep(0.05)
+    tasks.append(asyncio.create_task(standby.run()))
+    await asyncio.sleep(0.05)
+    assert leader.is_leader and not standby.is_leader
+
+    # 커밋 이벤트로 깨어나 기한까지만 대기 (고정 주기 없음)
+    db = session_factory()
+    _campaign(db, "soon", datetime.now() + timedelta(seconds=0.2))
+    for _ in range(100):
+        db.expire_all()
+        if db.get(Campaign, "soon").status == "PROCESSING":
+            break
+        await asyncio.sleep(0.02)
+    assert db.get(Campaign, "soon").status == "PROCESSING"
+    assert db.query(ExecutionRequest).count() == 1
+    db.close()
+
+    # 리더 종료 시 lease 반납 → 대기 인스턴스 승계
+    leader.stop()
+    await tasks[0]
+    standby.wake()
+    for _ in range(100):
+        if standby.is_leader:
+            break
+        await asyncio.sleep(0.01)
+    assert standby.is_leader
+
+    standby.stop()
+    await tasks[1]
@@ -0,0 +1,69 @@
+import hashlib
+import json
+import time
+
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from src.commerce.auth import signature
+from src.commerce.auth.signature import BodyDigestMiddleware, SignatureVerifier, compute_signature, require_signature
+
+
+class Payload(BaseModel):
+    po_number: str
+
+
+def _client(monkeypatch):
+    monkeypatch.setattr(signature, "signature_verifier", SignatureVerifier(api_key="key", secret_key="secret", enabled=True))
+    router = APIRouter(prefix="/api/v1/sync", dependencies=[Depends(require_signature)])
+
+    @router.post("/purchase-order")
+    def receive(req: Payload):
+        return {"po": req.po_number}
+
+    app = FastAPI()
+    app.include_router(router)
+    app.add_middleware(BodyDigestMiddleware, prefixes=["/api/v1/sync"])
+    return TestClient(app)
+
+
+def _headers(body: bytes, timestamp=None, secret="secret"):
+    timestamp = timestamp or str(int(time.time()))
+    sig = compute_signature(secret, "POST", "/api/v1/sync/purchase-order", timestamp, hashlib.sha256(body).hexdigest())
+    return {"Content-Type": "application/json", "X-API-Key": "key", "X-Timestamp": timestamp, "X-Signature": sig}
+
+
+def test_valid_signature_accepted_once(monkeypatch):
+    client = _client(monkeypatch)
+    body = json.dumps({"po_number": "PO-1"}).encode()
+    headers = _headers(body)
+
+    response = client.post("/api/v1/sync/purchase-order", content=body, headers=headers)
+    assert response.status_code == 200 and response.json() == {"po": "PO-1"}
+
+    replay = client.post("/api/v1/sync/purchase-order", content=body, headers=headers)
+    assert replay.status_code == 401 and replay.json()["detail"] == "Replayed request"
+
+
+def test_rejects_tampered_body_wrong_secret_and_stale_timestamp(monkeypatch):
+    client = _client(monkeypatch)
+    body = json.dumps({"po_number": "PO-1"}).encode()
+    url = "/api/v1/sync/purchase-order"
+
+    tampered = client.post(url, content=json.dumps({"po_number": "PO-2"}).encode(), headers=_headers(body))
+    assert tampered.json()["detail"] == "Invalid signature"
+    assert client.post(url, content=body, headers=_headers(body, secret="other")).status_code == 401
+    stale = client.post(url, content=body, headers=_headers(body, timestamp=str(int(time.time()) - 3600)))
+    assert stale.json()["detail"] == "Timestamp outside allowed window"
+    assert client.post(url, content=body).json()["detail"] == "Missing signature headers"
+
+
+def test_iso_timestamp_and_disabled_verifier():
+    verifier = SignatureVerifier(api_key="key", secret_key="secret", enabled=True)
+    now = 1_740_000_000.0
+    iso = "2025-02-19T21:20:00Z"  # now
+    body_hash = hashlib.sha256(b"{}").hexdigest()
+    sig = compute_signature("secret", "POST", "/p", iso, body_hash)
+    assert verifier.verify("POST", "/p", "key", sig, iso, body_hash, now=now) is None
+    assert SignatureVerifier(enabled=False).enabled is False
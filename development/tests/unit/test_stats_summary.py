@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from src.commerce.api.stats import get_dashboard_summary, get_multi_store_summary
+from src.commerce.domain.models import Order, Payment, OrderStatus, Store, UserStoreAccess, UserRole
+
+
+def _order(db, oid, store_id, status, amount, created_at, paid_at=None):
+    db.add(Order(id=oid, store_id=store_id, total_amount=amount, status=status, created_at=created_at))
+    if paid_at:
+        db.add(Payment(id=f"pay-{oid}", order_id=oid, amount=amount, status="PAID", paid_at=paid_at))
+
+
+@pytest.fixture
+def owner(db):
+    now = datetime.now().replace(hour=12, minute=0, second=0, microsecond=0)
+    yesterday = now - timedelta(days=1)
+    db.add_all([Store(id=1, name="강남점"), Store(id=2, name="홍대점"), Store(id=3, name="타인 매장")])
+    db.add_all([
+        UserStoreAccess(user_id=7, store_id=1, role=UserRole.OWNER),
+        UserStoreAccess(user_id=7, store_id=2, role=UserRole.OWNER),
+    ])
+    _order(db, "o1", 1, OrderStatus.PAID, 10000, now, now)
+    _order(db, "o2", 1, OrderStatus.COMPLETED, 5000, now, now)
+    _order(db, "o3", 1, OrderStatus.COMPLETED, 10000, yesterday, yesterday)
+    _order(db, "o4", 1, OrderStatus.PENDING, 3000, now)
+    _order(db, "o5", 2, OrderStatus.PAID, 8000, now, now)
+    _order(db, "o6", 2, OrderStatus.PREPARING, 4000, yesterday)
+    _order(db, "o7", 3, OrderStatus.PAID, 99000, now, now)
+    db.commit()
+    return {"id": 7, "username": "owner", "role": "owner", "store_id": 1}
+
+
+def test_multi_store_summary_per_store_and_total(db, owner):
+    result = get_multi_store_summary(store_ids=None, db=db, user=owner)
+    stores = {s["store_id"]: s for s in result["stores"]}
+
+    assert set(stores) == {1, 2}
+    assert stores[1]["store_name"] == "강남점"
+    assert (stores[1]["today_revenue"], stores[1]["yesterday_revenue"]) == (15000, 10000)
+    assert (stores[1]["today_orders"], stores[1]["pending_orders"]) == (2, 1)
+    assert stores[1]["growth_rate"] == 50.0
+    assert stores[2]["pending_orders"] == 1
+
+    total = result["total"]
+    assert total["today_revenue"] == 23000
+    assert total["today_orders"] == 3
+    assert total["average_order"] == 23000 // 3
+
+
+def test_single_summary_matches_and_access_is_checked(db, owner):
+    summary = get_dashboard_summary(store_id=2, db=db, user=owner)
+    assert summary["today_revenue"] == 8000 and summary["growth_rate"] == 0
+    assert summary["system_status"] == "ONLINE"
+
+    with pytest.raises(HTTPException) as exc:
+        get_multi_store_summary(store_ids=[1, 3], db=db, user=owner)
+    assert exc.value.status_code == 403
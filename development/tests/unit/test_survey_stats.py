@@ -0,0 +1,43 @@
+from datetime import date, datetime
+
+from src.commerce.domain.models_gap import CustomerSurvey, SurveyStat
+from src.commerce.services.survey_stats import SurveyStatsService, parse_tags
+
+
+def _submit(db, rating, tags=None, created_at=datetime(2025, 3, 1, 12, 0), store_id=1):
+    survey = CustomerSurvey(store_id=store_id, rating=rating, tags=tags, created_at=created_at)
+    db.add(survey)
+    db.flush()
+    SurveyStatsService(db).record(survey)
+    db.commit()
+
+
+def test_parse_tags_normalizes_csv():
+    assert parse_tags(" 친절해요, 맛있어요 ,,친절해요 ") == ["친절해요", "맛있어요"]
+    assert parse_tags(None) == []
+
+
+def test_incremental_aggregates_match_rebuild(db):
+    """증분 집계 결과가 원본 재집계 결과와 동일"""
+    _submit(db, 5.0, "친절해요,맛있어요")
+    _submit(db, 4.0, "맛있어요", created_at=datetime(2025, 3, 2, 9, 0))
+    _submit(db, 1.0, "느려요", created_at=datetime(2025, 3, 2, 20, 0))
+    _submit(db, 3.0, store_id=2)
+    service = SurveyStatsService(db)
+
+    summary = service.summary(1)
+    assert summary["total_reviews"] == 3
+    assert summary["average_rating"] == 3.3
+    assert summary["distribution"] == {"1": 1, "2": 0, "3": 0, "4": 1, "5": 1}
+
+    trend = service.trend(1, days=3, today=date(2025, 3, 2))
+    assert [(d["reviews"], d["average_rating"]) for d in trend] == [(0, None), (1, 5.0), (2, 2.5)]
+
+    assert service.top_tags(1)[0] == {"tag": "맛있어요", "count": 2, "average_rating": 4.5}
+    assert service.rating_by_tag(1, "맛있어요", since=datetime(2025, 3, 2))["count"] == 1
+
+    before = {(s.store_id, s.review_count, s.rating_sum, s.rating_5) for s in db.query(SurveyStat)}
+    assert service.rebuild() == 4
+    after = {(s.store_id, s.review_count, s.rating_sum, s.rating_5) for s in db.query(SurveyStat)}
+    assert before == after
+    assert service.top_tags(1)[0]["count"] == 2
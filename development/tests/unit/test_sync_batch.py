@@ -0,0 +1,54 @@
+from src.commerce.domain.models import Vendor, Product, Category, ExpectedDelivery, ExpectedDeliveryItem, SyncLog
+from src.commerce.services.sync_batch import BulkSyncService
+
+
+def _vendor(key, vendor_id, name):
+    return {"idempotency_key": key, "vendor": {"vendor_id": vendor_id, "vendor_name": name}}
+
+
+def test_vendor_batch_upserts_and_skips_processed_keys(db):
+    db.add(Vendor(store_id=1, external_id=10, name="Old"))
+    db.commit()
+    service = BulkSyncService(db, 1, "TgMain")
+
+    results = service.sync_vendors([_vendor("k1", 10, "Renamed"), _vendor("k2", 11, "New"), _vendor("k2", 11, "New")])
+    assert [r["status"] for r in results] == ["processed", "processed", "already_processed"]
+    assert {r.get("action") for r in results} == {None, "updated", "created"}
+    assert {v.external_id: v.name for v in db.query(Vendor)} == {10: "Renamed", 11: "New"}
+
+    again = service.sync_vendors([_vendor("k1", 10, "X"), _vendor("k3", 12, "Third")])
+    assert [r["status"] for r in again] == ["already_processed", "processed"]
+    assert db.query(SyncLog).count() == 3
+
+
+def test_item_batch_creates_categories_once_and_updates_prices(db):
+    db.add(Category(id=5, store_id=1, name="원두", display_order=0))
+    db.add(Product(category_id=5, name="에티오피아", price=1000))
+    db.commit()
+    service = BulkSyncService(db, 1, "TgMain")
+
+    results = service.sync_items([
+        {"idempotency_key": "i1", "item": {"item_code": "A1", "item_name": "에티오피아", "category_name": "원두", "unit_price": 1500}},
+        {"idempotency_key": "i2", "item": {"item_code": "B1", "item_name": "우유", "category_name": "유제품", "unit_price": 2000}},
+        {"idempotency_key": "i3", "item": {"item_code": "B2", "item_name": "크림", "category_name": "유제품", "unit_price": 3000}},
+        {"idempotency_key": "i4", "item": {"item_code": "C1", "item_name": "컵", "unit_price": 50}},
+    ])
+    assert [r["action"] for r in results] == ["updated", "created", "created", "created"]
+    assert db.query(Category).filter_by(name="유제품").count() == 1
+    assert db.query(Product).filter_by(name="에티오피아").one().price == 1500
+
+
+def test_purchase_order_batch_skips_registered_po(db):
+    db.add(ExpectedDelivery(store_id=1, po_number="PO-1", vendor_name="V"))
+    db.commit()
+    po = lambda n: {"po_number": n, "vendor": {"vendor_id": 1, "vendor_name": "V"}, "delivery_date": "2025-03-01",
+                    "items": [{"item_code": "A", "item_name": "A", "quantity": 2}, {"item_code": "B", "item_name": "B", "quantity": 1}]}
+
+    results = BulkSyncService(db, 1, "TgMain").sync_purchase_orders([
+        {"idempotency_key": "p1", "purchase_order": po("PO-1")},
+        {"idempotency_key": "p2", "purchase_order": po("PO-2")},
+        {"idempotency_key": "p3", "purchase_order": po("PO-3")},
+    ])
+    assert [r["status"] for r in results] == ["skipped", "processed", "processed"]
+    assert db.query(ExpectedDeliveryItem).count() == 4
+    assert db.query(SyncLog).count() == 2
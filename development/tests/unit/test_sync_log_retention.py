@@ -0,0 +1,74 @@
+import json
+from datetime import datetime, timedelta
+
+from sqlalchemy import Text, inspect, select, text, type_coerce
+
+from src.commerce.domain.models import SyncLog
+from src.commerce.services.sync_log_retention import SyncLogRetention, archive_table
+from src.database.compression import compress_text, decompress_text, is_compressed
+
+NOW = datetime(2025, 6, 1, 3, 0)
+
+
+def _log(key, days_ago, status="SUCCESS", payload=None):
+    return SyncLog(
+        idempotency_key=key, direction="IN", event_type="PURCHASE_ORDER", status=status,
+        payload=json.dumps(payload or {"items": [{"code": f"ITEM-{i}", "qty": i} for i in range(50)]}),
+        created_at=NOW - timedelta(days=days_ago)
+    )
+
+
+def test_payload_is_stored_compressed_and_read_transparently(db):
+    payload = {"items": [{"code": f"ITEM-{i}", "qty": i} for i in range(50)]}
+    db.add(_log("po-1", 0, payload=payload))
+    db.commit()
+
+    raw = db.execute(select(type_coerce(SyncLog.__table__.c.payload, Text))).scalar()
+    assert is_compressed(raw) and len(raw) < len(json.dumps(payload))
+
+    db.expire_all()
+    assert json.loads(db.query(SyncLog).one().payload) == payload
+    # 짧은 값과 기존 평문 행은 그대로
+    assert compress_text('{"a": 1}') == '{"a": 1}'
+    assert decompress_text('{"a": 1}') == '{"a": 1}'
+
+
+def test_retention_archives_old_rows_by_month(db, session_factory):
+    db.add_all([
+        _log("old-apr", 50), _log("old-mar", 80), _log("old-mar-2", 81),
+        _log("old-pending", 80, status="PENDING"),
+        _log("recent", 5)
+    ])
+    db.commit()
+    job = SyncLogRetention(session_factory=session_factory, retention_days=30, batch_size=2, mode="ARCHIVE")
+
+    assert job.run(dry_run=True, now=NOW)["removed"] == 3
+    report = job.run(now=NOW)
+    assert report["removed"] == 3 and report["batches"] == 2
+    assert report["archived"] == {"202504": 1, "202503": 2}
+
+    db.expire_all()
+    # 보존기간 내 로그와 처리 중 로그는 라이브 테이블에 남아 idempotency 체크 가능
+    assert {log.idempotency_key for log in db.query(SyncLog)} == {"old-pending", "recent"}
+
+    march = archive_table("202503")
+    assert inspect(db.get_bind()).has_table(march.name)
+    raw = db.execute(select(march.c.payload).where(march.c.idempotency_key == "old-mar")).scalar()
+    assert is_compressed(raw)
+    assert json.loads(decompress_text(raw))["items"][0]["code"] == "ITEM-0"
+
+
+def test_compress_legacy_rows(db, session_factory):
+    long_json = json.dumps({"note": "x" * 1000})
+    db.execute(text(
+        "INSERT INTO sync_logs (idempotency_key, direction, event_type, payload, status) "
+        "VALUES ('legacy', 'IN', 'ORDER_PAID', :payload, 'SUCCESS'), ('short', 'IN', 'ORDER_PAID', '{}', 'SUCCESS')"
+    ), {"payload": long_json})
+    db.commit()
+
+    job = SyncLogRetention(session_factory=session_factory, mode="DELETE")
+    assert job.compress_legacy() == 1
+    assert job.compress_legacy() == 0
+
+    db.expire_all()
+    assert db.query(SyncLog).filter_by(idempotency_key="legacy").one().payload == long_json